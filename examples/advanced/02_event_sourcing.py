@@ -66,6 +66,20 @@ async def main():
                 print(f"   Applied: {event.topic}")
 
         print(f"\n✅ Final state: {account}")
+
+        # A projection rebuilds state at any point in time, from periodic
+        # checkpoints instead of the beginning of the history
+        def balance(state: float, event: Event) -> float:
+            if event.topic == "account.created":
+                return event.data["initial_balance"]
+            if event.topic == "account.deposited":
+                return state + event.data["amount"]
+            return state - event.data["amount"]
+
+        await bus.temporal.register_projection(
+            "balance", balance, "account.*", 0.0, checkpoint_interval=100
+        )
+        print(f"   Projected balance now: ${await bus.temporal.state_at('balance'):.2f}")
         print("\n💡 This is Event Sourcing!")
         print("   - All changes stored as events")
         print("   - State rebuilt by replaying events")
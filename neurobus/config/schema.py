@@ -25,6 +25,64 @@ class CoreConfig(BaseModel):
     max_concurrent_handlers: int = Field(
         default=100, ge=1, description="Maximum concurrent handler executions"
     )
+    match_cache_size: int = Field(
+        default=1024, ge=0, description="Topics kept in the resolved-match cache (0 = disabled)"
+    )
+    enable_publish_queue: bool = Field(
+        default=False, description="Enqueue published events and dispatch them from workers"
+    )
+    publish_queue_size: int = Field(default=10000, ge=1, description="Publish queue capacity")
+    publish_workers: int = Field(default=4, ge=1, description="Publish queue worker tasks")
+    queue_overflow_policy: str = Field(
+        default="block",
+        description="Full-queue behaviour (block, drop_oldest, drop_newest, raise)",
+    )
+
+    dispatch_mode: str = Field(
+        default="direct",
+        description="Dispatch mode (direct, mailbox = per-subscription FIFO mailboxes)",
+    )
+    mailbox_size: int = Field(default=1000, ge=1, description="Per-subscription mailbox capacity")
+    mailbox_overflow_policy: str = Field(
+        default="block", description="Full-mailbox behaviour (block, drop_oldest, drop_newest)"
+    )
+    thread_pool_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Worker threads for executor='thread' handlers (None = stdlib default)",
+    )
+    process_pool_size: int | None = Field(
+        default=None,
+        ge=1,
+        description="Worker processes for executor='process' handlers (None = CPU count)",
+    )
+
+    @field_validator("queue_overflow_policy")
+    @classmethod
+    def validate_overflow_policy(cls, v: str) -> str:
+        """Validate publish queue overflow policy."""
+        valid_policies = {"block", "drop_oldest", "drop_newest", "raise"}
+        if v not in valid_policies:
+            raise ValueError(f"Invalid overflow policy. Must be one of: {valid_policies}")
+        return v
+
+    @field_validator("dispatch_mode")
+    @classmethod
+    def validate_dispatch_mode(cls, v: str) -> str:
+        """Validate dispatch mode."""
+        valid_modes = {"direct", "mailbox"}
+        if v not in valid_modes:
+            raise ValueError(f"Invalid dispatch mode. Must be one of: {valid_modes}")
+        return v
+
+    @field_validator("mailbox_overflow_policy")
+    @classmethod
+    def validate_mailbox_overflow_policy(cls, v: str) -> str:
+        """Validate mailbox overflow policy."""
+        valid_policies = {"block", "drop_oldest", "drop_newest"}
+        if v not in valid_policies:
+            raise ValueError(f"Invalid mailbox overflow policy. Must be one of: {valid_policies}")
+        return v
 
 
 class SemanticConfig(BaseModel):
@@ -40,6 +98,18 @@ class SemanticConfig(BaseModel):
     )
     cache_size: int = Field(default=1000, ge=0, description="Embedding cache size (0 = no cache)")
     cache_ttl: int = Field(default=3600, ge=0, description="Cache TTL in seconds (0 = no expiry)")
+    cache_quantization: str = Field(
+        default="none", description="Cached embedding storage (none, float16, int8)"
+    )
+
+    @field_validator("cache_quantization")
+    @classmethod
+    def validate_cache_quantization(cls, v: str) -> str:
+        """Validate cache quantization."""
+        valid_modes = {"none", "float16", "int8"}
+        if v not in valid_modes:
+            raise ValueError(f"Invalid cache quantization. Must be one of: {valid_modes}")
+        return v
 
 
 class ContextConfig(BaseModel):
@@ -65,13 +135,94 @@ class TemporalConfig(BaseModel):
     )
     auto_cleanup: bool = Field(default=True, description="Automatically cleanup old events")
     retention_days: int = Field(default=30, ge=1, description="Event retention period in days")
+    write_mode: str = Field(
+        default="sync", description="Write mode (sync, write_behind = buffered group commit)"
+    )
+    durability: str = Field(
+        default="flush",
+        description="Write-behind durability (none = fire-and-forget, flush, fsync)",
+    )
+    flush_batch_size: int = Field(default=500, ge=1, description="Rows per write-behind batch")
+    flush_interval_ms: float = Field(
+        default=50.0, gt=0, description="Maximum time a row waits in the write-behind buffer"
+    )
+    read_pool_size: int = Field(
+        default=4, ge=1, description="Reader threads for event store queries"
+    )
+    retention_interval: float = Field(
+        default=1.0, gt=0, description="Seconds between background retention passes"
+    )
+    retention_batch_size: int = Field(
+        default=10_000, ge=1, description="Maximum rows deleted per retention transaction"
+    )
+    partition_by: str = Field(
+        default="none", description="Event store partitioning (none, hour, day)"
+    )
+    max_open_partitions: int = Field(
+        default=8, ge=1, description="Partition files kept open at once"
+    )
+    row_format: str = Field(
+        default="text",
+        description="Events table layout (text, compact = blob ids and one packed record)",
+    )
+    compression: str = Field(
+        default="none", description="Compact record compression (none, zlib, zstd)"
+    )
+    compression_threshold: int = Field(
+        default=64, ge=0, description="Smallest packed record in bytes to compress"
+    )
+
+    @field_validator("write_mode")
+    @classmethod
+    def validate_write_mode(cls, v: str) -> str:
+        """Validate temporal write mode."""
+        valid_modes = {"sync", "write_behind"}
+        if v not in valid_modes:
+            raise ValueError(f"Invalid write mode. Must be one of: {valid_modes}")
+        return v
+
+    @field_validator("partition_by")
+    @classmethod
+    def validate_partition_by(cls, v: str) -> str:
+        """Validate event store partitioning."""
+        valid_modes = {"none", "hour", "day"}
+        if v not in valid_modes:
+            raise ValueError(f"Invalid partition_by. Must be one of: {valid_modes}")
+        return v
+
+    @field_validator("row_format")
+    @classmethod
+    def validate_row_format(cls, v: str) -> str:
+        """Validate events table row format."""
+        valid_formats = {"text", "compact"}
+        if v not in valid_formats:
+            raise ValueError(f"Invalid row_format. Must be one of: {valid_formats}")
+        return v
+
+    @field_validator("compression")
+    @classmethod
+    def validate_compression(cls, v: str) -> str:
+        """Validate compact record compression."""
+        valid_codecs = {"none", "zlib", "zstd"}
+        if v not in valid_codecs:
+            raise ValueError(f"Invalid compression. Must be one of: {valid_codecs}")
+        return v
+
+    @field_validator("durability")
+    @classmethod
+    def validate_durability(cls, v: str) -> str:
+        """Validate write-behind durability."""
+        valid_modes = {"none", "flush", "fsync"}
+        if v not in valid_modes:
+            raise ValueError(f"Invalid durability. Must be one of: {valid_modes}")
+        return v
 
 
 class MemoryConfig(BaseModel):
     """Memory integration configuration."""
 
     enabled: bool = Field(default=False, description="Enable memory integration")
-    adapter: str = Field(default="qdrant", description="Memory adapter (qdrant, lancedb)")
+    adapter: str = Field(default="qdrant", description="Memory adapter (qdrant, lancedb, ivf)")
     connection_string: str = Field(
         default="http://localhost:6333", description="Memory store connection string"
     )
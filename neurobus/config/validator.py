@@ -46,7 +46,7 @@ def validate_config(config: NeuroBusConfig) -> None:
                 "memory.adapter", "Adapter required when memory integration enabled"
             )
 
-        valid_adapters = ["qdrant", "lancedb"]
+        valid_adapters = ["qdrant", "lancedb", "ivf"]
         if config.memory.adapter not in valid_adapters:
             raise ConfigurationError("memory.adapter", f"Must be one of: {valid_adapters}")
 
@@ -117,6 +117,11 @@ def check_dependencies(config: NeuroBusConfig) -> list[str]:
                 import lancedb  # noqa
             except ImportError:
                 missing.append("lancedb")
+        elif config.memory.adapter == "ivf":
+            try:
+                import numpy  # noqa
+            except ImportError:
+                missing.append("numpy")
 
     if config.llm.enabled:
         if config.llm.provider == "anthropic":
@@ -130,6 +135,12 @@ def check_dependencies(config: NeuroBusConfig) -> list[str]:
             except ImportError:
                 missing.append("openai")
 
+    if config.temporal.enabled and config.temporal.compression == "zstd":
+        try:
+            import zstandard  # noqa
+        except ImportError:
+            missing.append("zstandard")
+
     if config.monitoring.prometheus_enabled:
         try:
             import prometheus_client  # noqa
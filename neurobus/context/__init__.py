@@ -3,12 +3,13 @@
 from neurobus.context.dsl import FilterDSL, parse_filter
 from neurobus.context.engine import ContextEngine
 from neurobus.context.filter import FilterEngine
-from neurobus.context.store import ContextEntry, ContextScope, ContextStore
+from neurobus.context.store import ContextEntry, ContextScope, ContextStore, ScopeSnapshot
 
 __all__ = [
     "ContextEngine",
     "ContextStore",
     "ContextEntry",
+    "ScopeSnapshot",
     "ContextScope",
     "FilterDSL",
     "parse_filter",
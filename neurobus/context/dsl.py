@@ -9,6 +9,7 @@ Parses filter expressions like:
 import ast
 import operator
 import re
+from collections.abc import Mapping
 from typing import Any
 
 
@@ -248,7 +249,7 @@ class FilterDSL:
         value = context
 
         for part in parts:
-            if isinstance(value, dict):
+            if isinstance(value, Mapping):
                 value = value[part]
             else:
                 value = getattr(value, part)
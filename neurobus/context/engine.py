@@ -4,14 +4,16 @@ Context engine for hierarchical context management.
 Provides high-level API for managing and querying contextual state.
 """
 
+import copy
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from neurobus.context.store import ContextStore
 from neurobus.core.event import Event
 from neurobus.types.context import ContextData, ContextScope
 from neurobus.utils.helpers import deep_merge
+from neurobus.utils.layered import LayeredContext
 
 logger = logging.getLogger(__name__)
 
@@ -246,25 +248,45 @@ class ContextEngine:
         Merges context from global → session → user → event scopes
         and updates the event's context.
 
+        The enriched context is a LayeredContext over store snapshots and
+        a copy of the event's own context rather than a merged copy, so
+        enrichment cost does not grow with how much context is stored,
+        and later changes to the source event's context never reach it.
+        Handlers still see a plain dict: the event flattens the view on
+        first read of event.context. Nested dicts follow deep_merge
+        semantics.
+
         Args:
             event: Event to enrich
 
         Returns:
             Event with enriched context
         """
-        # Extract identifiers from event context
-        session_id = event.context.get("session_id", "")
-        user_id = event.context.get("user_id", "")
-        event_id = str(event.id)
+        context = copy.deepcopy(event.context)
 
-        # Get merged context
-        merged = self.get_merged_context(session_id, user_id, event_id)
-
-        # Merge with event's existing context (event context takes precedence)
-        enriched_context = deep_merge(merged, event.context)
+        # Extract identifiers from event context
+        session_id = context.get("session_id", "")
+        user_id = context.get("user_id", "")
 
-        # Return event with enriched context
-        return event.with_context(**enriched_context)
+        # Event context takes precedence, then event → user → session → global
+        layers: list[Mapping[str, Any]] = [context]
+        if self.store.has_entries(ContextScope.EVENT):
+            layers.append(self.store.snapshot(ContextScope.EVENT, str(event.id)))
+        if user_id:
+            layers.append(self.store.snapshot(ContextScope.USER, user_id))
+        if session_id:
+            layers.append(self.store.snapshot(ContextScope.SESSION, session_id))
+        layers.append(self.store.snapshot(ContextScope.GLOBAL))
+
+        return Event(
+            id=event.id,
+            topic=event.topic,
+            data=event.data,
+            timestamp=event.timestamp,
+            context=LayeredContext(*(layer for layer in layers if layer)),
+            metadata=event.metadata,
+            parent_id=event.parent_id,
+        )
 
     def query_context(
         self,
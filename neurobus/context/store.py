@@ -5,7 +5,7 @@ Provides thread-safe, TTL-based context storage with scope-aware access.
 """
 
 import time
-from collections import defaultdict
+from collections.abc import Iterator, Mapping
 from threading import RLock
 from typing import Any
 
@@ -60,6 +60,47 @@ class ContextEntry:
         )
 
 
+class ScopeSnapshot(Mapping[str, Any]):
+    """
+    Read-only view of one scope's entries at a point in time.
+
+    Entries that expire after the snapshot was taken read as missing.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries: dict[str, ContextEntry]) -> None:
+        """
+        Initialize snapshot.
+
+        Args:
+            entries: Entry dict that the store will never mutate again
+        """
+        self._entries = entries
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a live (non-expired) value."""
+        entry = self._entries[key]
+        if entry.is_expired():
+            raise KeyError(key)
+        return entry.value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys of non-expired entries."""
+        return (key for key, entry in self._entries.items() if not entry.is_expired())
+
+    def __len__(self) -> int:
+        """Number of non-expired entries."""
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        """True if the scope had any entries when the snapshot was taken."""
+        return bool(self._entries)
+
+
+_EMPTY_SNAPSHOT = ScopeSnapshot({})
+
+
 class ContextStore:
     """
     Thread-safe hierarchical context storage.
@@ -72,8 +113,13 @@ class ContextStore:
     - TTL-based automatic expiration
     - Thread-safe operations
     - Efficient lookups with scope resolution
+    - O(1) point-in-time scope snapshots
     - Statistics tracking
 
+    Each scope's entry dict is copy-on-write: writes replace the dict
+    instead of mutating it, so snapshot() can hand out the current dict
+    without copying. Writes cost O(entries in that scope identifier).
+
     Example:
         >>> store = ContextStore()
         >>> store.set("user_id", "alice", scope=ContextScope.SESSION, ttl=3600)
@@ -94,11 +140,9 @@ class ContextStore:
         # For SESSION: identifier is session_id
         # For USER: identifier is user_id
         # For EVENT: identifier is event_id
+        # Entry dicts are replaced, never mutated in place (see snapshot)
         self._storage: dict[ContextScope, dict[str, dict[str, ContextEntry]]] = {
-            ContextScope.GLOBAL: defaultdict(dict),
-            ContextScope.SESSION: defaultdict(dict),
-            ContextScope.USER: defaultdict(dict),
-            ContextScope.EVENT: defaultdict(dict),
+            scope: {} for scope in ContextScope
         }
 
         # Thread safety
@@ -138,9 +182,29 @@ class ContextStore:
             if scope == ContextScope.GLOBAL:
                 identifier = ""  # Global uses empty identifier
 
-            self._storage[scope][identifier][key] = entry
+            entries = dict(self._storage[scope].get(identifier, {}))
+            entries[key] = entry
+            self._storage[scope][identifier] = entries
             self._stats["sets"] += 1
 
+    def _remove_keys(self, scope: ContextScope, identifier: str, keys: list[str]) -> None:
+        """
+        Remove keys from a scope by replacing its entry dict.
+
+        Args:
+            scope: Context scope
+            identifier: Scope identifier
+            keys: Keys to remove
+        """
+        entries = dict(self._storage[scope][identifier])
+        for key in keys:
+            del entries[key]
+
+        if entries:
+            self._storage[scope][identifier] = entries
+        else:
+            del self._storage[scope][identifier]
+
     def get(
         self,
         key: str,
@@ -182,7 +246,7 @@ class ContextStore:
 
             # Check expiration
             if entry.is_expired():
-                del scope_storage[key]
+                self._remove_keys(scope, identifier, [key])
                 self._stats["expirations"] += 1
                 self._stats["misses"] += 1
                 return default
@@ -275,10 +339,8 @@ class ContextStore:
             if identifier not in self._storage[scope]:
                 return False
 
-            scope_storage = self._storage[scope][identifier]
-
-            if key in scope_storage:
-                del scope_storage[key]
+            if key in self._storage[scope][identifier]:
+                self._remove_keys(scope, identifier, [key])
                 return True
 
             return False
@@ -322,16 +384,12 @@ class ContextStore:
             for scope in ContextScope:
                 for identifier in list(self._storage[scope].keys()):
                     scope_storage = self._storage[scope][identifier]
+                    expired = [key for key, entry in scope_storage.items() if entry.is_expired()]
 
-                    for key in list(scope_storage.keys()):
-                        entry = scope_storage[key]
-                        if entry.is_expired():
-                            del scope_storage[key]
-                            count += 1
-
-                    # Remove empty scope storage
-                    if not scope_storage:
-                        del self._storage[scope][identifier]
+                    if expired:
+                        # Removes the identifier once it is empty
+                        self._remove_keys(scope, identifier, expired)
+                        count += len(expired)
 
             self._stats["cleanups"] += 1
             self._stats["expirations"] += count
@@ -363,15 +421,55 @@ class ContextStore:
 
             # Filter out expired entries
             result: ContextData = {}
-            for key, entry in list(scope_storage.items()):
+            expired = []
+            for key, entry in scope_storage.items():
                 if entry.is_expired():
-                    del scope_storage[key]
-                    self._stats["expirations"] += 1
+                    expired.append(key)
                 else:
                     result[key] = entry.value
 
+            if expired:
+                self._remove_keys(scope, identifier, expired)
+                self._stats["expirations"] += len(expired)
+
             return result
 
+    def snapshot(
+        self,
+        scope: ContextScope,
+        identifier: str = "",
+    ) -> Mapping[str, Any]:
+        """
+        Get a read-only point-in-time view of a scope without copying it.
+
+        Later writes to the store are not visible through the snapshot.
+
+        Args:
+            scope: Context scope
+            identifier: Scope identifier
+
+        Returns:
+            Read-only mapping of key to value (empty if scope has no entries)
+        """
+        with self._lock:
+            if scope == ContextScope.GLOBAL:
+                identifier = ""
+
+            entries = self._storage[scope].get(identifier)
+            return ScopeSnapshot(entries) if entries else _EMPTY_SNAPSHOT
+
+    def has_entries(self, scope: ContextScope) -> bool:
+        """
+        Check whether any identifier in a scope has entries.
+
+        Args:
+            scope: Context scope
+
+        Returns:
+            True if the scope is non-empty
+        """
+        return bool(self._storage[scope])
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get store statistics.
@@ -3,8 +3,10 @@
 from neurobus.core.bus import NeuroBus
 from neurobus.core.dispatcher import EventDispatcher
 from neurobus.core.event import Event
+from neurobus.core.executors import HandlerExecutors
 from neurobus.core.lifecycle import LifecycleManager
-from neurobus.core.registry import SubscriptionRegistry
+from neurobus.core.queue import PublishQueue
+from neurobus.core.registry import SubscriptionRegistry, TopicTrie
 from neurobus.core.subscription import Subscription
 
 __all__ = [
@@ -12,6 +14,9 @@ __all__ = [
     "Event",
     "Subscription",
     "EventDispatcher",
+    "HandlerExecutors",
     "SubscriptionRegistry",
+    "TopicTrie",
     "LifecycleManager",
+    "PublishQueue",
 ]
@@ -7,7 +7,7 @@ in cognitive AI systems.
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Callable, Iterable
 from typing import Any
 from uuid import UUID
 
@@ -15,6 +15,7 @@ from neurobus.config.schema import NeuroBusConfig
 from neurobus.core.dispatcher import EventDispatcher
 from neurobus.core.event import Event
 from neurobus.core.lifecycle import LifecycleManager
+from neurobus.core.queue import PublishQueue
 from neurobus.core.registry import SubscriptionRegistry
 from neurobus.core.subscription import EventHandler, Subscription
 from neurobus.exceptions.core import BusNotStartedError
@@ -67,15 +68,28 @@ class NeuroBus:
         self.config = config or get_default_config()
 
         # Core components
-        self._registry = SubscriptionRegistry(max_size=self.config.core.max_subscriptions)
+        self._registry = SubscriptionRegistry(
+            max_size=self.config.core.max_subscriptions,
+            cache_size=self.config.core.match_cache_size,
+        )
         self._dispatcher = EventDispatcher(
             enable_parallel=self.config.core.enable_parallel_dispatch,
             enable_error_isolation=self.config.core.enable_error_isolation,
             handler_timeout=self.config.core.handler_timeout,
             max_concurrent=self.config.core.max_concurrent_handlers,
+            mode=self.config.core.dispatch_mode,
+            mailbox_size=self.config.core.mailbox_size,
+            mailbox_overflow_policy=self.config.core.mailbox_overflow_policy,
+            thread_pool_size=self.config.core.thread_pool_size,
+            process_pool_size=self.config.core.process_pool_size,
         )
         self._lifecycle = LifecycleManager()
 
+        # Publish queue (optional, decouples producers from dispatch)
+        self._publish_queue: PublishQueue | None = None
+        if self.config.core.enable_publish_queue:
+            self._init_publish_queue()
+
         # Semantic router (lazy-loaded)
         self._semantic_router: Any = None
 
@@ -152,20 +166,48 @@ class NeuroBus:
         if self._cluster_manager is not None:
             await self._cluster_manager.start()
 
+        # Start publish workers if enabled
+        if self._publish_queue is not None:
+            await self._publish_queue.start()
+
         logger.info("NeuroBUS ready for events")
 
     async def stop(self, timeout: float = 10.0) -> None:
         """
         Stop the event bus gracefully.
 
+        The bus stops accepting publishes first; queued events are then
+        drained before components are shut down. All stages share one
+        timeout.
+
         Args:
             timeout: Maximum time to wait for shutdown
         """
+        if not await self._lifecycle.begin_stop():
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        def remaining() -> float:
+            return max(0.0, deadline - loop.time())
+
+        # Drain publish queue if enabled
+        if self._publish_queue is not None:
+            await self._publish_queue.stop(remaining())
+
+        # Drain subscription mailboxes (mailbox dispatch mode)
+        await self._dispatcher.stop(remaining())
+
+        # Flush buffered writes and close the event store
+        if self._temporal_engine is not None:
+            await self._temporal_engine.close()
+
         # Stop cluster manager if enabled
         if self._cluster_manager is not None:
             await self._cluster_manager.stop()
 
-        await self._lifecycle.stop(timeout)
+        await self._lifecycle.stop(remaining())
         logger.info("NeuroBUS stopped")
 
     async def publish(self, event: Event) -> None:
@@ -175,12 +217,18 @@ class NeuroBus:
         The event will be dispatched to all matching subscriptions.
         Handlers are executed asynchronously with error isolation.
 
+        When the publish queue is enabled (core.enable_publish_queue),
+        the event is enqueued and this call returns once it is accepted;
+        dispatch happens on the queue's worker tasks.
+
         Args:
             event: Event to publish
 
         Raises:
             BusNotStartedError: If bus is not running
             ValidationError: If event is invalid
+            PublishQueueFullError: If the queue is full and the overflow
+                policy is "raise"
 
         Example:
             >>> await bus.publish(Event(
@@ -194,6 +242,19 @@ class NeuroBus:
         # Validate event topic
         validate_topic(event.topic)
 
+        if self._publish_queue is not None:
+            await self._publish_queue.put(event)
+            return
+
+        await self._process_event(event)
+
+    async def _process_event(self, event: Event) -> None:
+        """
+        Run an event through the bus pipeline and dispatch it.
+
+        Args:
+            event: Validated event to process
+        """
         # Enrich event with hierarchical context if enabled
         if self._context_engine is not None:
             event = self._context_engine.enrich_event(event)
@@ -210,56 +271,175 @@ class NeuroBus:
         if self._cluster_manager is not None:
             await self._cluster_manager.broadcast_event(event)
 
-        logger.debug(
-            "Publishing event",
-            extra={
-                "event_id": str(event.id),
-                "topic": event.topic,
-            },
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Publishing event",
+                extra={
+                    "event_id": str(event.id),
+                    "topic": event.topic,
+                },
+            )
 
         # Find matching subscriptions (pattern-based)
         pattern_matches = self._registry.find_matches(event)
 
         # Add semantic matches if enabled
-        semantic_matches: list[tuple[Subscription, float]] = []
-        if self.config.semantic.enabled and self._semantic_router is not None:
-            try:
-                semantic_matches = self._semantic_router.find_semantic_matches(
-                    event,
-                    self._registry.get_all(),
-                    threshold=self.config.semantic.similarity_threshold,
-                )
-            except Exception as e:
-                logger.warning(f"Semantic matching failed: {e}", exc_info=True)
+        semantic_matches = self._find_semantic_matches(event)
 
         # Combine matches (pattern + semantic)
         # Remove duplicates and sort by priority/similarity
-        all_subscriptions = self._merge_matches(pattern_matches, semantic_matches)
+        if semantic_matches:
+            all_subscriptions = self._merge_matches(pattern_matches, semantic_matches)
+        else:
+            # Pattern matches are already unique and priority-sorted
+            all_subscriptions = pattern_matches
 
         if not all_subscriptions:
+            if debug:
+                logger.debug(
+                    "No subscribers for event",
+                    extra={
+                        "event_id": str(event.id),
+                        "topic": event.topic,
+                    },
+                )
+            return
+
+        if debug:
             logger.debug(
-                "No subscribers for event",
+                f"Dispatching to {len(all_subscriptions)} subscription(s)",
                 extra={
                     "event_id": str(event.id),
                     "topic": event.topic,
+                    "subscription_count": len(all_subscriptions),
+                    "pattern_matches": len(pattern_matches),
+                    "semantic_matches": len(semantic_matches),
                 },
             )
-            return
+
+        # Dispatch to handlers
+        await self._dispatcher.dispatch(event, all_subscriptions)
+
+    async def publish_many(self, events: Iterable[Event]) -> int:
+        """
+        Publish a batch of events.
+
+        Behaves like calling publish() for each event in order, but
+        subscriptions are resolved once per distinct topic, events are
+        persisted in a single transaction and broadcast to the cluster in
+        one pipelined call. Each subscription receives the events in
+        publish order. Batches are always dispatched inline, even when
+        the publish queue is enabled.
+
+        Args:
+            events: Events to publish
+
+        Returns:
+            Number of events published
+
+        Raises:
+            BusNotStartedError: If bus is not running
+            ValidationError: If any event is invalid (nothing is published)
+
+        Example:
+            >>> await bus.publish_many(
+            ...     Event(topic="metrics.cpu", data={"value": v}) for v in samples
+            ... )
+        """
+        if not self.is_running:
+            raise BusNotStartedError()
+
+        batch = list(events)
+        if not batch:
+            return 0
+
+        # Validate the whole batch before any side effects
+        for event in batch:
+            validate_topic(event.topic)
+
+        # Enrich events with hierarchical context if enabled
+        if self._context_engine is not None:
+            batch = [self._context_engine.enrich_event(event) for event in batch]
+
+        # Persist events in one transaction if temporal engine enabled
+        if self._temporal_engine is not None:
+            await self._temporal_engine.store_events(batch)
+
+        # Remember events in memory if enabled
+        if self._memory_engine is not None:
+            for event in batch:
+                await self._memory_engine.remember_event(event)
+
+        # Broadcast to cluster in one pipeline if enabled
+        if self._cluster_manager is not None:
+            await self._cluster_manager.broadcast_events(batch)
+
+        # Resolve candidates once per distinct topic; filters still run per event
+        candidates_by_topic: dict[str, list[Subscription]] = {}
+        deliveries: list[tuple[Event, list[Subscription]]] = []
+
+        for event in batch:
+            candidates = candidates_by_topic.get(event.topic)
+            if candidates is None:
+                candidates = self._registry.resolve(event.topic)
+                candidates_by_topic[event.topic] = candidates
+
+            matches = [sub for sub in candidates if sub.should_handle(event)]
+
+            semantic_matches = self._find_semantic_matches(event)
+            if semantic_matches:
+                matches = self._merge_matches(matches, semantic_matches)
+
+            deliveries.append((event, matches))
 
         logger.debug(
-            f"Dispatching to {len(all_subscriptions)} subscription(s)",
-            extra={
-                "event_id": str(event.id),
-                "topic": event.topic,
-                "subscription_count": len(all_subscriptions),
-                "pattern_matches": len(pattern_matches),
-                "semantic_matches": len(semantic_matches),
-            },
+            f"Dispatching batch of {len(batch)} event(s)",
+            extra={"topics": len(candidates_by_topic)},
         )
 
-        # Dispatch to handlers
-        await self._dispatcher.dispatch(event, all_subscriptions)
+        await self._dispatcher.dispatch_many(deliveries)
+
+        return len(batch)
+
+    async def publish_stream(
+        self,
+        events: AsyncIterable[Event],
+        batch_size: int = 100,
+    ) -> int:
+        """
+        Publish events from an async iterable in batches.
+
+        Events are buffered up to batch_size and handed to publish_many,
+        so ordering guarantees are the same.
+
+        Args:
+            events: Async iterable of events
+            batch_size: Maximum events per batch
+
+        Returns:
+            Number of events published
+
+        Raises:
+            BusNotStartedError: If bus is not running
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        published = 0
+        buffer: list[Event] = []
+
+        async for event in events:
+            buffer.append(event)
+            if len(buffer) >= batch_size:
+                published += await self.publish_many(buffer)
+                buffer = []
+
+        if buffer:
+            published += await self.publish_many(buffer)
+
+        return published
 
     def subscribe(
         self,
@@ -269,6 +449,7 @@ class NeuroBus:
         filter: Callable[[Event], bool] | None = None,
         semantic: bool = False,
         threshold: float | None = None,
+        executor: str | None = None,
     ) -> Callable[[EventHandler], EventHandler] | Subscription:
         """
         Subscribe to events matching a pattern.
@@ -282,6 +463,10 @@ class NeuroBus:
             filter: Optional filter function to gate events
             semantic: Enable semantic similarity matching
             threshold: Similarity threshold for semantic matching (0-1)
+            executor: Run the handler off the event loop on the bus's shared
+                "thread" or "process" pool. Use for sync, blocking or
+                CPU-heavy handlers. Process handlers must be module-level
+                functions and receive a copy of the event.
 
         Returns:
             Decorator function if handler is None, otherwise Subscription
@@ -309,6 +494,11 @@ class NeuroBus:
             >>> async def handle_urgent(event: Event):
             ...     # Only receives urgent messages
             ...     pass
+
+            Blocking handler on the thread pool:
+            >>> @bus.subscribe("image.uploaded", executor="thread")
+            >>> def extract_features(event: Event):
+            ...     model.predict(event.data["path"])
         """
         if handler is not None:
             # Direct call
@@ -319,6 +509,7 @@ class NeuroBus:
                 filter_func=filter,
                 semantic=semantic,
                 threshold=threshold,
+                executor=executor,
             )
             self._registry.add(subscription)
 
@@ -342,6 +533,7 @@ class NeuroBus:
                 filter_func=filter,
                 semantic=semantic,
                 threshold=threshold,
+                executor=executor,
             )
             self._registry.add(subscription)
 
@@ -383,6 +575,9 @@ class NeuroBus:
         removed = self._registry.remove(subscription_id)
 
         if removed:
+            if self._dispatcher.mode == "mailbox":
+                self._dispatcher.release(subscription_id)
+
             logger.info(
                 "Handler unsubscribed",
                 extra={"subscription_id": str(subscription_id)},
@@ -419,7 +614,13 @@ class NeuroBus:
 
         Warning: This will remove ALL handlers.
         """
+        subscriptions = self._registry.get_all()
         self._registry.clear()
+
+        if self._dispatcher.mode == "mailbox":
+            for subscription in subscriptions:
+                self._dispatcher.release(subscription.id)
+
         logger.warning("All subscriptions cleared")
 
     def enable_semantic(
@@ -446,6 +647,7 @@ class NeuroBus:
                 device=device,
                 cache_size=self.config.semantic.cache_size,
                 cache_ttl=self.config.semantic.cache_ttl,
+                cache_quantization=self.config.semantic.cache_quantization,
                 default_threshold=self.config.semantic.similarity_threshold,
             )
 
@@ -459,6 +661,20 @@ class NeuroBus:
             )
             raise
 
+    def _init_publish_queue(self) -> None:
+        """Initialize publish queue."""
+        from neurobus.monitoring.metrics import get_metrics
+
+        self._publish_queue = PublishQueue(
+            self._process_event,
+            max_size=self.config.core.publish_queue_size,
+            num_workers=self.config.core.publish_workers,
+            overflow_policy=self.config.core.queue_overflow_policy,
+            metrics=get_metrics() if self.config.monitoring.enabled else None,
+        )
+
+        logger.info("Publish queue initialized")
+
     def _init_context_engine(self) -> None:
         """Initialize context engine."""
         from neurobus.context.engine import ContextEngine
@@ -470,10 +686,46 @@ class NeuroBus:
     def _init_temporal_engine(self) -> None:
         """Initialize temporal engine."""
         from neurobus.temporal.engine import TemporalEngine
+        from neurobus.temporal.partitioned import PartitionedEventStore
+        from neurobus.temporal.store import EventStore
+
+        config = self.config.temporal
+        retention_days = config.retention_days if config.auto_cleanup else None
+        if config.partition_by != "none":
+            self._temporal_engine = TemporalEngine(
+                store=PartitionedEventStore(
+                    directory=config.store_path / "events",
+                    partition_by=config.partition_by,
+                    max_events=config.max_events,
+                    retention_days=retention_days,
+                    max_open_partitions=config.max_open_partitions,
+                    write_mode=config.write_mode,
+                    durability=config.durability,
+                    flush_batch_size=config.flush_batch_size,
+                    flush_interval_ms=config.flush_interval_ms,
+                    row_format=config.row_format,
+                    compression=config.compression,
+                )
+            )
+            logger.info(f"Temporal engine initialized ({config.partition_by} partitions)")
+            return
 
-        self._temporal_engine = TemporalEngine(
-            db_path=str(self.config.temporal.store_path / "events.db"),
+        store = EventStore(
+            db_path=config.store_path / "events.db",
+            max_events=config.max_events,
+            write_mode=config.write_mode,
+            durability=config.durability,
+            flush_batch_size=config.flush_batch_size,
+            flush_interval_ms=config.flush_interval_ms,
+            read_pool_size=config.read_pool_size,
+            retention_days=retention_days,
+            retention_interval=config.retention_interval,
+            retention_batch_size=config.retention_batch_size,
+            row_format=config.row_format,
+            compression=config.compression,
+            compression_threshold=config.compression_threshold,
         )
+        self._temporal_engine = TemporalEngine(store=store)
 
         logger.info("Temporal engine initialized")
 
@@ -638,6 +890,30 @@ class NeuroBus:
             )
         return self._cluster_manager
 
+    def _find_semantic_matches(self, event: Event) -> list[tuple[Subscription, float]]:
+        """
+        Find semantic matches for an event if semantic routing is enabled.
+
+        Args:
+            event: Event to match
+
+        Returns:
+            Subscriptions with similarity scores (empty if disabled or failed)
+        """
+        if not self.config.semantic.enabled or self._semantic_router is None:
+            return []
+
+        try:
+            matches: list[tuple[Subscription, float]] = self._semantic_router.find_semantic_matches(
+                event,
+                self._registry.get_all(),
+                threshold=self.config.semantic.similarity_threshold,
+            )
+        except Exception as e:
+            logger.warning(f"Semantic matching failed: {e}", exc_info=True)
+            return []
+        return matches
+
     def _merge_matches(
         self,
         pattern_matches: list[Subscription],
@@ -693,6 +969,10 @@ class NeuroBus:
             "lifecycle": self._lifecycle.get_info(),
         }
 
+        # Add publish queue stats if enabled
+        if self._publish_queue is not None:
+            stats["queue"] = self._publish_queue.get_stats()
+
         # Add semantic stats if enabled
         if self._semantic_router is not None:
             stats["semantic"] = self._semantic_router.get_stats()
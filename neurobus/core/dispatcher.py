@@ -8,12 +8,14 @@ isolation to prevent handler failures from crashing the bus.
 import asyncio
 import logging
 from typing import Any
+from uuid import UUID
 
 from neurobus.core.event import Event
+from neurobus.core.executors import HandlerExecutors
+from neurobus.core.queue import PublishQueue
 from neurobus.core.subscription import Subscription
 from neurobus.exceptions.core import HandlerError
 from neurobus.utils.helpers import get_function_name
-from neurobus.utils.timing import with_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +30,24 @@ class EventDispatcher:
     - Per-handler timeout support
     - Concurrency limiting
     - Comprehensive error logging
+    - Optional per-subscription mailboxes (FIFO delivery, isolated backpressure)
+    - Thread/process pools for subscriptions with an executor
+
+    Dispatch modes:
+    - direct: handlers run inside dispatch() (parallel or sequential)
+    - mailbox: dispatch() enqueues into one bounded mailbox per
+      subscription, each drained in order by its own consumer task.
+      Handler errors are logged by the consumer and never reach the
+      publisher.
 
     Attributes:
         enable_parallel: Whether to execute handlers in parallel
         enable_error_isolation: Whether to isolate handler errors
         handler_timeout: Default timeout for handlers
         max_concurrent: Maximum concurrent handler executions
+        mode: Dispatch mode ("direct" or "mailbox")
+        mailbox_size: Capacity of each subscription mailbox
+        mailbox_overflow_policy: Full-mailbox behaviour
 
     Example:
         >>> dispatcher = EventDispatcher(
@@ -50,6 +64,11 @@ class EventDispatcher:
         enable_error_isolation: bool = True,
         handler_timeout: float = 10.0,
         max_concurrent: int = 100,
+        mode: str = "direct",
+        mailbox_size: int = 1000,
+        mailbox_overflow_policy: str = "block",
+        thread_pool_size: int | None = None,
+        process_pool_size: int | None = None,
     ) -> None:
         """
         Initialize dispatcher.
@@ -59,11 +78,41 @@ class EventDispatcher:
             enable_error_isolation: Isolate handler errors
             handler_timeout: Timeout for individual handlers
             max_concurrent: Maximum concurrent handlers
+            mode: Dispatch mode ("direct" or "mailbox")
+            mailbox_size: Capacity of each subscription mailbox
+            mailbox_overflow_policy: One of "block", "drop_oldest", "drop_newest"
+            thread_pool_size: Worker threads for executor="thread" handlers
+            process_pool_size: Worker processes for executor="process" handlers
+
+        Raises:
+            ValueError: If mode or mailbox_overflow_policy is unknown
         """
+        if mode not in ("direct", "mailbox"):
+            raise ValueError(f"Unknown dispatch mode: {mode}. Must be 'direct' or 'mailbox'")
+
+        if mailbox_overflow_policy not in ("block", "drop_oldest", "drop_newest"):
+            raise ValueError(
+                f"Unknown mailbox overflow policy: {mailbox_overflow_policy}. "
+                "Must be one of: ['block', 'drop_oldest', 'drop_newest']"
+            )
+
         self.enable_parallel = enable_parallel
         self.enable_error_isolation = enable_error_isolation
         self.handler_timeout = handler_timeout
         self.max_concurrent = max_concurrent
+        self.mode = mode
+        self.mailbox_size = mailbox_size
+        self.mailbox_overflow_policy = mailbox_overflow_policy
+
+        # Mailboxes by subscription ID (mailbox mode only)
+        self._mailboxes: dict[UUID, PublishQueue] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+
+        # Pools for sync/CPU-bound handlers, started on first use
+        self._executors = HandlerExecutors(
+            thread_pool_size=thread_pool_size,
+            process_pool_size=process_pool_size,
+        )
 
         # Semaphore for concurrency control
         self._semaphore = asyncio.Semaphore(max_concurrent)
@@ -84,7 +133,8 @@ class EventDispatcher:
 
         Executes handlers in parallel (if enabled) with error isolation.
         Each handler gets its own timeout and failures are logged but
-        don't prevent other handlers from executing.
+        don't prevent other handlers from executing. A single matching
+        subscription is awaited directly, without creating tasks.
 
         Args:
             event: Event to dispatch
@@ -98,13 +148,157 @@ class EventDispatcher:
 
         self._total_dispatched += 1
 
-        if self.enable_parallel:
+        if self.mode == "mailbox":
+            for subscription in subscriptions:
+                mailbox = self._mailboxes.get(subscription.id)
+                if mailbox is None:
+                    mailbox = await self._open_mailbox(subscription)
+                await mailbox.put(event)
+        elif len(subscriptions) == 1:
+            # Fast path: no task list, no gather
+            subscription = subscriptions[0]
+            try:
+                await self._execute_handler(event, subscription)
+            except Exception as e:
+                self._log_handler_error(event, subscription, e)
+
+                # Parallel dispatch never propagates handler errors
+                if not self.enable_parallel:
+                    raise
+        elif self.enable_parallel:
             # Execute all handlers in parallel
             await self._dispatch_parallel(event, subscriptions)
         else:
             # Execute handlers sequentially
             await self._dispatch_sequential(event, subscriptions)
 
+    async def dispatch_many(
+        self,
+        deliveries: list[tuple[Event, list[Subscription]]],
+    ) -> None:
+        """
+        Dispatch a batch of events, preserving per-subscription order.
+
+        In parallel mode each subscription drains its own events in
+        publish order while different subscriptions run concurrently.
+        In sequential mode events are dispatched one after another.
+
+        Args:
+            deliveries: (event, subscriptions) pairs, in publish order
+
+        Raises:
+            DispatchError: Only if error_isolation is disabled, sequential
+                dispatch is used and a handler fails
+        """
+        if self.mode == "mailbox" or not self.enable_parallel:
+            for event, subscriptions in deliveries:
+                await self.dispatch(event, subscriptions)
+            return
+
+        # Group events per subscription, keeping publish order
+        queues: dict[UUID, tuple[Subscription, list[Event]]] = {}
+        for event, subscriptions in deliveries:
+            if not subscriptions:
+                continue
+
+            self._total_dispatched += 1
+            for subscription in subscriptions:
+                queue = queues.get(subscription.id)
+                if queue is None:
+                    queue = queues[subscription.id] = (subscription, [])
+                queue[1].append(event)
+
+        await asyncio.gather(
+            *(self._drain(subscription, events) for subscription, events in queues.values())
+        )
+
+    async def _open_mailbox(self, subscription: Subscription) -> PublishQueue:
+        """
+        Create and start the mailbox for a subscription.
+
+        Args:
+            subscription: Subscription that will own the mailbox
+
+        Returns:
+            Started mailbox
+        """
+
+        async def deliver(event: Event) -> None:
+            try:
+                await self._execute_handler(event, subscription)
+            except Exception as e:
+                self._log_handler_error(event, subscription, e)
+
+        mailbox = PublishQueue(
+            deliver,
+            max_size=self.mailbox_size,
+            num_workers=1,
+            overflow_policy=self.mailbox_overflow_policy,
+        )
+        await mailbox.start()
+        self._mailboxes[subscription.id] = mailbox
+
+        return mailbox
+
+    def release(self, subscription_id: UUID) -> None:
+        """
+        Close the mailbox of a removed subscription.
+
+        Already queued events are still delivered; the consumer task
+        stops once the mailbox is drained.
+
+        Args:
+            subscription_id: ID of the removed subscription
+        """
+        mailbox = self._mailboxes.pop(subscription_id, None)
+        if mailbox is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop left to drain on; the consumer died with its loop
+            return
+
+        task = loop.create_task(mailbox.stop(self.handler_timeout))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Drain and close all mailboxes, then shut down executor pools.
+
+        Args:
+            timeout: Maximum time to wait for queued events to be delivered
+                and running pool handlers to finish
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        mailboxes = list(self._mailboxes.values())
+        self._mailboxes.clear()
+
+        await asyncio.gather(
+            *(mailbox.stop(timeout) for mailbox in mailboxes),
+            *self._closing,
+            return_exceptions=True,
+        )
+
+        await self._executors.shutdown(max(0.0, deadline - loop.time()))
+
+    async def _drain(self, subscription: Subscription, events: list[Event]) -> None:
+        """
+        Deliver events to one subscription in order.
+
+        Args:
+            subscription: Subscription to notify
+            events: Events to deliver, in order
+        """
+        for event in events:
+            try:
+                await self._execute_handler(event, subscription)
+            except Exception as e:
+                self._log_handler_error(event, subscription, e)
+
     async def _dispatch_parallel(
         self,
         event: Event,
@@ -156,6 +350,10 @@ class EventDispatcher:
         """
         Execute a single handler with timeout and error handling.
 
+        The timeout is a cancellation scope on the current task rather
+        than asyncio.wait_for, so no extra task is created per handler.
+        Error context is only formatted when a handler fails.
+
         Args:
             event: Event to handle
             subscription: Subscription with handler
@@ -166,14 +364,13 @@ class EventDispatcher:
         async with self._semaphore:
             try:
                 # Execute with timeout
-                await with_timeout(
-                    subscription.handle_event(event),
-                    timeout=self.handler_timeout,
-                    error_context={
-                        "event_id": str(event.id),
-                        "subscription_id": str(subscription.id),
-                    },
-                )
+                async with asyncio.timeout(self.handler_timeout):
+                    if subscription.executor is None:
+                        await subscription.handle_event(event)
+                    else:
+                        await self._executors.run(
+                            subscription.executor, subscription.handler, event
+                        )
 
                 self._total_succeeded += 1
 
@@ -268,14 +465,49 @@ class EventDispatcher:
             "total_failed": self._total_failed,
             "total_timeout": self._total_timeout,
             "success_rate": (self._total_succeeded / max(self._total_dispatched, 1)),
+            "mailboxes": self._get_mailbox_stats(),
+            "executors": self._executors.get_stats(),
             "config": {
                 "parallel": self.enable_parallel,
                 "error_isolation": self.enable_error_isolation,
                 "handler_timeout": self.handler_timeout,
                 "max_concurrent": self.max_concurrent,
+                "mode": self.mode,
+                "mailbox_size": self.mailbox_size,
+                "mailbox_overflow_policy": self.mailbox_overflow_policy,
             },
         }
 
+    def _get_mailbox_stats(self) -> dict[str, Any]:
+        """
+        Get mailbox depth and drop counters.
+
+        Returns:
+            Aggregate counters plus per-subscription depth and drops
+        """
+        per_subscription: dict[str, dict[str, int]] = {}
+        total_depth = 0
+        total_dropped = 0
+
+        for subscription_id, mailbox in self._mailboxes.items():
+            stats = mailbox.get_stats()
+            dropped = stats["dropped_oldest"] + stats["dropped_newest"]
+            per_subscription[str(subscription_id)] = {
+                "depth": stats["depth"],
+                "max_depth": stats["max_depth"],
+                "delivered": stats["processed"],
+                "dropped": dropped,
+            }
+            total_depth += stats["depth"]
+            total_dropped += dropped
+
+        return {
+            "count": len(self._mailboxes),
+            "total_depth": total_depth,
+            "total_dropped": total_dropped,
+            "subscriptions": per_subscription,
+        }
+
     def reset_stats(self) -> None:
         """Reset statistics counters."""
         self._total_dispatched = 0
@@ -5,13 +5,21 @@ Events are the fundamental unit of communication in NeuroBUS, carrying
 both data and semantic meaning.
 """
 
-from dataclasses import dataclass, field
+import copy
+import threading
+import time
+from collections.abc import MutableMapping
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+from neurobus.utils.layered import to_plain_dict
+
+# Guards the first materialization of lazy fields, so handlers running on
+# worker threads agree on an event's id and share its dicts
+_materialize_lock = threading.Lock()
+
 
-@dataclass
 class Event:
     """
     Represents a single event in the NeuroBUS system.
@@ -19,6 +27,15 @@ class Event:
     Events carry data, metadata, and context through the event bus.
     They are immutable after creation to ensure consistency.
 
+    The class uses __slots__ and materializes defaults lazily: the id is
+    generated on first access, the timestamp is captured as a float and
+    converted to a datetime on first access, and empty data/context/
+    metadata dicts are only allocated when read. An event that is
+    published and handled without touching these fields never pays for
+    them. A layered context is flattened to a dict on first read, the same
+    way. Materialization is locked, so threads racing on a fresh event
+    still see one id and one dict per field.
+
     Attributes:
         id: Unique identifier for the event
         topic: Topic/channel name (e.g., "user.login", "system.error")
@@ -36,26 +53,142 @@ class Event:
         ... )
     """
 
-    topic: str
-    data: dict[str, Any] = field(default_factory=dict)
-    id: UUID = field(default_factory=uuid4)
-    timestamp: datetime = field(default_factory=datetime.now)
-    context: dict[str, Any] = field(default_factory=dict)
-    metadata: dict[str, Any] = field(default_factory=dict)
-    parent_id: UUID | None = None
-
-    def __post_init__(self) -> None:
-        """Validate event after initialization."""
-        if not self.topic:
+    __slots__ = (
+        "topic",
+        "_data",
+        "_id",
+        "_timestamp",
+        "_created",
+        "_context",
+        "_metadata",
+        "parent_id",
+    )
+
+    def __init__(
+        self,
+        topic: str,
+        data: dict[str, Any] | None = None,
+        id: UUID | None = None,
+        timestamp: datetime | None = None,
+        context: MutableMapping[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+        parent_id: UUID | None = None,
+    ) -> None:
+        """
+        Initialize event.
+
+        Args:
+            topic: Topic/channel name
+            data: Event payload
+            id: Event ID (generated on first access if omitted)
+            timestamp: Creation time (defaults to now)
+            context: Contextual information
+            metadata: Additional metadata
+            parent_id: Parent event ID for causality tracking
+
+        Raises:
+            ValueError: If topic is empty
+            TypeError: If topic is not a string
+        """
+        if not topic:
             raise ValueError("Event topic cannot be empty")
 
-        if not isinstance(self.topic, str):
-            raise TypeError(f"Event topic must be str, got {type(self.topic)}")
+        if not isinstance(topic, str):
+            raise TypeError(f"Event topic must be str, got {type(topic)}")
+
+        self.topic = topic
+        self._data = data
+        self._id = id
+        self._timestamp = timestamp
+        self._created = time.time() if timestamp is None else 0.0
+        self._context = context
+        self._metadata = metadata
+        self.parent_id = parent_id
+
+    @property
+    def id(self) -> UUID:
+        """Unique event identifier."""
+        if self._id is None:
+            with _materialize_lock:
+                if self._id is None:
+                    self._id = uuid4()
+        return self._id
+
+    @id.setter
+    def id(self, value: UUID) -> None:
+        self._id = value
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the event was created (naive local time)."""
+        if self._timestamp is None:
+            with _materialize_lock:
+                if self._timestamp is None:
+                    self._timestamp = datetime.fromtimestamp(self._created)
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Event payload."""
+        if self._data is None:
+            with _materialize_lock:
+                if self._data is None:
+                    self._data = {}
+        return self._data
+
+    @data.setter
+    def data(self, value: dict[str, Any]) -> None:
+        self._data = value
+
+    @property
+    def context(self) -> dict[str, Any]:
+        """
+        Contextual information.
+
+        Always a plain dict. Events from context enrichment hold a
+        LayeredContext until first read, when it is flattened once and
+        cached.
+        """
+        context = self._context
+        if not isinstance(context, dict):
+            with _materialize_lock:
+                context = self._context
+                if context is None:
+                    context = self._context = {}
+                elif not isinstance(context, dict):
+                    context = self._context = to_plain_dict(context)
+        return context
+
+    @context.setter
+    def context(self, value: MutableMapping[str, Any]) -> None:
+        self._context = value
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Additional metadata."""
+        if self._metadata is None:
+            with _materialize_lock:
+                if self._metadata is None:
+                    self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: dict[str, Any]) -> None:
+        self._metadata = value
 
     def with_context(self, **context: Any) -> "Event":
         """
         Create a new event with merged context.
 
+        The new context is a deep copy of this event's context updated
+        with the given keys, so later changes to either event's context
+        never reach the other. Like dict.update, given keys replace
+        existing values wholesale.
+
         Args:
             **context: Additional context to merge
 
@@ -65,18 +198,16 @@ class Event:
         Example:
             >>> new_event = event.with_context(user_id="123", mood="happy")
         """
-        from copy import deepcopy
-
-        new_context = deepcopy(self.context)
+        new_context = copy.deepcopy(self.context) if self._context else {}
         new_context.update(context)
 
         return Event(
             id=self.id,
             topic=self.topic,
-            data=self.data,
+            data=self._data,
             timestamp=self.timestamp,
             context=new_context,
-            metadata=self.metadata,
+            metadata=self._metadata,
             parent_id=self.parent_id,
         )
 
@@ -96,9 +227,9 @@ class Event:
         """
         return Event(
             topic=topic,
-            data=data or {},
-            context=self.context.copy(),
-            metadata=self.metadata.copy(),
+            data=data,
+            context=self.context.copy() if self._context else None,
+            metadata=self._metadata.copy() if self._metadata else None,
             parent_id=self.id,
         )
 
@@ -112,10 +243,10 @@ class Event:
         return {
             "id": str(self.id),
             "topic": self.topic,
-            "data": self.data,
+            "data": self._data if self._data is not None else {},
             "timestamp": self.timestamp.isoformat(),
-            "context": self.context,
-            "metadata": self.metadata,
+            "context": to_plain_dict(self._context) if self._context is not None else {},
+            "metadata": self._metadata if self._metadata is not None else {},
             "parent_id": str(self.parent_id) if self.parent_id else None,
         }
 
@@ -134,17 +265,48 @@ class Event:
             ValueError: If required fields are missing
         """
         return cls(
-            id=UUID(data["id"]) if "id" in data else uuid4(),
+            id=UUID(data["id"]) if "id" in data else None,
             topic=data["topic"],
-            data=data.get("data", {}),
-            timestamp=(
-                datetime.fromisoformat(data["timestamp"]) if "timestamp" in data else datetime.now()
-            ),
-            context=data.get("context", {}),
-            metadata=data.get("metadata", {}),
+            data=data.get("data"),
+            timestamp=datetime.fromisoformat(data["timestamp"]) if "timestamp" in data else None,
+            context=data.get("context"),
+            metadata=data.get("metadata"),
             parent_id=UUID(data["parent_id"]) if data.get("parent_id") else None,
         )
 
+    def __eq__(self, other: object) -> bool:
+        """Field-wise equality, as for the former dataclass."""
+        if not isinstance(other, Event):
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.topic == other.topic
+            and self.data == other.data
+            and self.timestamp == other.timestamp
+            and self.context == other.context
+            and self.metadata == other.metadata
+            and self.parent_id == other.parent_id
+        )
+
+    # Mutable and compared by value, so not hashable (as before)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Materialize id and timestamp so copies and pickles keep them."""
+        return {
+            "topic": self.topic,
+            "data": self._data,
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "context": self._context,
+            "metadata": self._metadata,
+            "parent_id": self.parent_id,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore from __getstate__."""
+        self.__init__(**state)  # type: ignore[misc]
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (
@@ -0,0 +1,259 @@
+"""
+Executor pools for synchronous and CPU-bound event handlers.
+
+Subscriptions created with executor="thread" or executor="process" run
+their handler off the event loop, on a pool shared by all subscriptions
+of that kind and owned by the dispatcher (and so by the bus lifecycle).
+"""
+
+import asyncio
+import inspect
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from neurobus.core.event import Event
+from neurobus.utils.serialization import bytes_to_event, event_to_bytes
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_KINDS = ("thread", "process")
+
+# Worker processes must not be forked from a process running store and
+# worker threads (a child can inherit a lock held mid-operation)
+_PROCESS_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _call_handler(handler: Callable[[Event], Any], event: Event) -> None:
+    """
+    Call a handler inside a pool worker.
+
+    Coroutine handlers are run to completion on a private event loop.
+
+    Args:
+        handler: Sync or async handler
+        event: Event to handle
+    """
+    result = handler(event)
+    if inspect.iscoroutine(result):
+        asyncio.run(result)
+
+
+def _call_handler_serialized(handler: Callable[[Event], Any], payload: bytes) -> None:
+    """
+    Rebuild an event from msgpack bytes and call the handler.
+
+    Runs in a worker process; the event crosses the process boundary
+    in serialized form rather than as a pickled Event.
+
+    Args:
+        handler: Picklable (module-level) sync or async handler
+        payload: Event serialized with event_to_bytes
+    """
+    _call_handler(handler, Event.from_dict(bytes_to_event(payload)))
+
+
+class _PoolStats:
+    """Counters for one executor pool."""
+
+    __slots__ = ("submitted", "completed", "failed", "active", "peak_active")
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.active = 0
+        self.peak_active = 0
+
+
+class HandlerExecutors:
+    """
+    Lazily created thread and process pools for handler execution.
+
+    Pools are started on first use and shut down by shutdown(). Saturation
+    is reported as in-flight handlers over pool size; values above 1.0
+    mean calls are queueing inside the pool.
+
+    Attributes:
+        thread_pool_size: Maximum worker threads (None for the stdlib default)
+        process_pool_size: Maximum worker processes (None for CPU count)
+
+    Example:
+        >>> executors = HandlerExecutors(thread_pool_size=8)
+        >>> await executors.run("thread", blocking_handler, event)
+        >>> await executors.shutdown()
+    """
+
+    def __init__(
+        self,
+        thread_pool_size: int | None = None,
+        process_pool_size: int | None = None,
+    ) -> None:
+        """
+        Initialize executor pools.
+
+        Args:
+            thread_pool_size: Maximum worker threads
+            process_pool_size: Maximum worker processes
+        """
+        self.thread_pool_size = thread_pool_size
+        self.process_pool_size = process_pool_size
+
+        self._pools: dict[str, Executor] = {}
+        self._stats = {kind: _PoolStats() for kind in EXECUTOR_KINDS}
+
+        # Handler calls whose work has not finished, including timed-out ones
+        self._running: set[asyncio.Future[None]] = set()
+
+    def _get_pool(self, kind: str) -> Executor:
+        """
+        Get the pool for an executor kind, creating it on first use.
+
+        Args:
+            kind: "thread" or "process"
+
+        Returns:
+            Executor instance
+
+        Raises:
+            ValueError: If kind is unknown
+        """
+        pool = self._pools.get(kind)
+        if pool is not None:
+            return pool
+
+        if kind == "thread":
+            pool = ThreadPoolExecutor(
+                max_workers=self.thread_pool_size,
+                thread_name_prefix="neurobus-handler",
+            )
+        elif kind == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=self.process_pool_size,
+                mp_context=multiprocessing.get_context(_PROCESS_START_METHOD),
+            )
+        else:
+            raise ValueError(f"Unknown executor: {kind}. Must be one of: {list(EXECUTOR_KINDS)}")
+
+        self._pools[kind] = pool
+        logger.debug(f"Started {kind} handler pool")
+        return pool
+
+    async def run(self, kind: str, handler: Callable[[Event], Any], event: Event) -> None:
+        """
+        Run a handler on the given pool and wait for it to finish.
+
+        Process-pool handlers receive the event serialized with msgpack and
+        must be importable module-level callables.
+
+        If the caller is cancelled (e.g. a handler timeout), the handler
+        keeps its pool slot and counts as active until it actually returns.
+
+        Args:
+            kind: "thread" or "process"
+            handler: Sync or async handler
+            event: Event to handle
+
+        Raises:
+            ValueError: If kind is unknown
+            Exception: Any exception raised by the handler
+        """
+        pool = self._get_pool(kind)
+        stats = self._stats[kind]
+        loop = asyncio.get_running_loop()
+
+        if kind == "process":
+            payload = event_to_bytes(event)
+            future = loop.run_in_executor(pool, _call_handler_serialized, handler, payload)
+        else:
+            future = loop.run_in_executor(pool, _call_handler, handler, event)
+
+        stats.submitted += 1
+        stats.active += 1
+        if stats.active > stats.peak_active:
+            stats.peak_active = stats.active
+
+        def finished(done: asyncio.Future[None]) -> None:
+            self._running.discard(done)
+            stats.active -= 1
+            if done.cancelled() or done.exception() is not None:
+                stats.failed += 1
+            else:
+                stats.completed += 1
+
+        self._running.add(future)
+        future.add_done_callback(finished)
+
+        # Shielded, so cancelling the caller does not mark unfinished work done
+        await asyncio.shield(future)
+
+    async def shutdown(self, timeout: float | None = None) -> None:
+        """
+        Shut down all started pools.
+
+        Queued calls are cancelled and running handlers are awaited for at
+        most timeout seconds; handlers still running after that are left
+        to finish in the background.
+
+        Args:
+            timeout: Maximum time to wait for running handlers (None = no limit)
+        """
+        pools = list(self._pools.items())
+        self._pools.clear()
+        if not pools:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        for _, pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if self._running:
+            _, pending = await asyncio.wait(self._running, timeout=timeout)
+            if pending:
+                logger.warning(
+                    f"{len(pending)} handlers still running after executor shutdown timeout"
+                )
+                return
+
+        for kind, pool in pools:
+            # Joining workers blocks, so do it off the event loop
+            remaining = max(0.0, deadline - loop.time()) if deadline is not None else None
+            try:
+                await asyncio.wait_for(asyncio.to_thread(pool.shutdown, True), remaining)
+            except TimeoutError:
+                logger.warning(f"Timed out joining {kind} handler pool workers")
+                continue
+            logger.debug(f"Stopped {kind} handler pool")
+
+    def _pool_size(self, kind: str) -> int | None:
+        """Return the effective worker limit of a started pool."""
+        pool = self._pools.get(kind)
+        return getattr(pool, "_max_workers", None) if pool is not None else None
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get executor pool statistics.
+
+        Returns:
+            Dictionary of per-pool counters and saturation
+        """
+        result: dict[str, Any] = {}
+        for kind in EXECUTOR_KINDS:
+            stats = self._stats[kind]
+            size = self._pool_size(kind)
+            result[kind] = {
+                "started": kind in self._pools,
+                "max_workers": size,
+                "active": stats.active,
+                "peak_active": stats.peak_active,
+                "submitted": stats.submitted,
+                "completed": stats.completed,
+                "failed": stats.failed,
+                "saturation": stats.active / size if size else 0.0,
+            }
+        return result
@@ -131,32 +131,47 @@ class LifecycleManager:
                 logger.error("Failed to start NeuroBUS", exc_info=True)
                 raise
 
+    async def begin_stop(self) -> bool:
+        """
+        Move a running bus to STOPPING, so it stops accepting work.
+
+        Returns:
+            True if the bus was running, False otherwise
+        """
+        async with self._lock:
+            if self._state != BusState.RUNNING:
+                logger.warning(f"Stop called but bus is not running (state: {self._state})")
+                return False
+
+            logger.info("Stopping NeuroBUS...")
+            self._state = BusState.STOPPING
+            return True
+
     async def stop(self, timeout: float = 10.0) -> None:
         """
         Stop the bus gracefully.
 
         Transitions to STOPPED state and executes all shutdown hooks
-        in reverse order.
+        in reverse order. A bus already moved to STOPPING by
+        begin_stop() is finished off.
 
         Args:
-            timeout: Maximum time to wait for shutdown
-
-        Raises:
-            RuntimeError: If bus is not in RUNNING state
+            timeout: Maximum time to wait for all shutdown hooks together
         """
+        if self._state != BusState.STOPPING and not await self.begin_stop():
+            return
+
         async with self._lock:
-            if self._state != BusState.RUNNING:
-                logger.warning(f"Stop called but bus is not running (state: {self._state})")
+            if self._state != BusState.STOPPING:
                 return
 
-            logger.info("Stopping NeuroBUS...")
-            self._state = BusState.STOPPING
-
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
             try:
                 # Execute shutdown hooks in reverse order
                 for hook in reversed(self._shutdown_hooks):
                     try:
-                        await asyncio.wait_for(hook(), timeout=timeout)
+                        await asyncio.wait_for(hook(), timeout=max(0.0, deadline - loop.time()))
                     except TimeoutError:
                         logger.warning(f"Shutdown hook timed out: {hook.__name__}")
                     except Exception:
@@ -0,0 +1,295 @@
+"""
+Bounded publish queue for asynchronous publishing.
+
+Decouples producers from handler execution: publish() enqueues events
+and a pool of worker tasks drains the queue through the bus pipeline.
+The dispatcher also uses single-worker queues as per-subscription
+mailboxes.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from neurobus.core.event import Event
+from neurobus.exceptions.core import BusShutdownError, PublishQueueFullError
+from neurobus.monitoring.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest", "raise")
+
+
+class PublishQueue:
+    """
+    Bounded event queue drained by a pool of worker tasks.
+
+    Overflow policies (applied when the queue is full):
+    - block: wait until space is available (backpressure on producer)
+    - drop_oldest: discard the oldest queued event
+    - drop_newest: discard the event being published
+    - raise: raise PublishQueueFullError
+
+    With more than one worker, events are processed concurrently and
+    global ordering is not guaranteed; use a single worker when
+    cross-event ordering matters.
+
+    Attributes:
+        max_size: Queue capacity
+        num_workers: Number of worker tasks
+        overflow_policy: Behaviour when the queue is full
+
+    Example:
+        >>> queue = PublishQueue(process_event, max_size=1000, num_workers=4)
+        >>> await queue.start()
+        >>> await queue.put(event)
+        >>> await queue.stop(timeout=5.0)
+    """
+
+    def __init__(
+        self,
+        processor: Callable[[Event], Awaitable[None]],
+        max_size: int = 10000,
+        num_workers: int = 4,
+        overflow_policy: str = "block",
+        metrics: MetricsCollector | None = None,
+    ) -> None:
+        """
+        Initialize publish queue.
+
+        Args:
+            processor: Coroutine function that processes a dequeued event
+            max_size: Queue capacity
+            num_workers: Number of worker tasks
+            overflow_policy: One of "block", "drop_oldest", "drop_newest", "raise"
+            metrics: Optional collector fed with queue depth and latency
+
+        Raises:
+            ValueError: If overflow_policy is unknown
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy: {overflow_policy}. "
+                f"Must be one of: {list(OVERFLOW_POLICIES)}"
+            )
+
+        self.max_size = max_size
+        self.num_workers = num_workers
+        self.overflow_policy = overflow_policy
+
+        self._processor = processor
+        self._metrics = metrics
+        self._queue: asyncio.Queue[tuple[Event, float]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._accepting = False
+
+        # Puts of producers waiting for space under the "block" policy
+        self._blocked_puts: set[asyncio.Future[None]] = set()
+
+        # Statistics
+        self._stats = {
+            "enqueued": 0,
+            "processed": 0,
+            "failed": 0,
+            "dropped_oldest": 0,
+            "dropped_newest": 0,
+            "rejected": 0,
+            "max_depth": 0,
+        }
+        self._total_latency = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Get the number of queued events."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the queue accepts events."""
+        return self._accepting
+
+    async def start(self) -> None:
+        """Create the queue and start worker tasks."""
+        if self._accepting:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"neurobus-publish-worker-{i}")
+            for i in range(self.num_workers)
+        ]
+        self._accepting = True
+
+        logger.debug(
+            f"PublishQueue started (max_size={self.max_size}, workers={self.num_workers}, "
+            f"overflow_policy={self.overflow_policy})"
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop accepting events, drain the queue and stop workers.
+
+        Producers still waiting for space under the "block" policy when
+        the workers stop get BusShutdownError.
+
+        Args:
+            timeout: Maximum time to wait for queued events to be processed
+        """
+        if self._queue is None:
+            return
+
+        self._accepting = False
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except TimeoutError:
+            logger.warning(
+                f"PublishQueue drain timed out after {timeout}s, "
+                f"{self._queue.qsize()} event(s) discarded"
+            )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+        for put in self._blocked_puts:
+            put.cancel()
+
+        self._workers = []
+        self._queue = None
+        self._update_depth()
+
+        logger.debug("PublishQueue stopped")
+
+    async def put(self, event: Event) -> bool:
+        """
+        Enqueue an event according to the overflow policy.
+
+        Args:
+            event: Event to enqueue
+
+        Returns:
+            True if enqueued, False if dropped by the drop_newest policy
+
+        Raises:
+            BusShutdownError: If the queue is not accepting events, or stops
+                while the producer waits for space
+            PublishQueueFullError: If full and the policy is "raise"
+        """
+        if not self._accepting or self._queue is None:
+            raise BusShutdownError()
+
+        queue = self._queue
+        item = (event, time.perf_counter())
+
+        if queue.full():
+            if self.overflow_policy == "block":
+                await self._put_blocking(queue, item)
+                self._record_enqueue()
+                return True
+
+            if self.overflow_policy == "drop_newest":
+                self._stats["dropped_newest"] += 1
+                return False
+
+            if self.overflow_policy == "raise":
+                self._stats["rejected"] += 1
+                raise PublishQueueFullError(self.max_size)
+
+            # drop_oldest
+            queue.get_nowait()
+            queue.task_done()
+            self._stats["dropped_oldest"] += 1
+
+        queue.put_nowait(item)
+        self._record_enqueue()
+        return True
+
+    async def _put_blocking(
+        self, queue: asyncio.Queue[tuple[Event, float]], item: tuple[Event, float]
+    ) -> None:
+        """
+        Wait for space and enqueue item; stop() cancels the wait.
+
+        Raises:
+            BusShutdownError: If the queue stopped before space was available
+        """
+        put = asyncio.ensure_future(queue.put(item))
+        self._blocked_puts.add(put)
+        try:
+            await asyncio.wait([put])
+        except asyncio.CancelledError:
+            put.cancel()
+            raise
+        finally:
+            self._blocked_puts.discard(put)
+
+        if put.cancelled():
+            raise BusShutdownError()
+
+    async def _worker(self, worker_id: int) -> None:
+        """Drain the queue until cancelled."""
+        assert self._queue is not None
+        queue = self._queue
+
+        while True:
+            event, enqueued_at = await queue.get()
+            try:
+                latency = time.perf_counter() - enqueued_at
+                self._total_latency += latency
+                if self._metrics is not None:
+                    self._metrics.record_latency("enqueue_to_dispatch", latency)
+
+                await self._processor(event)
+                self._stats["processed"] += 1
+
+            except Exception as e:
+                self._stats["failed"] += 1
+                logger.error(
+                    f"Publish worker {worker_id} failed to process event: {e}",
+                    extra={"event_id": str(event.id), "topic": event.topic},
+                    exc_info=True,
+                )
+
+            finally:
+                queue.task_done()
+                self._update_depth()
+
+    def _record_enqueue(self) -> None:
+        """Update counters after an event is enqueued."""
+        self._stats["enqueued"] += 1
+        depth = self.depth
+        if depth > self._stats["max_depth"]:
+            self._stats["max_depth"] = depth
+        self._update_depth()
+
+    def _update_depth(self) -> None:
+        """Feed the current depth to the metrics collector."""
+        if self._metrics is not None:
+            self._metrics.set_queue_depth(self.depth)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        processed = self._stats["processed"] + self._stats["failed"]
+        return {
+            **self._stats,
+            "depth": self.depth,
+            "max_size": self.max_size,
+            "workers": self.num_workers,
+            "overflow_policy": self.overflow_policy,
+            "avg_latency_ms": (self._total_latency / processed * 1000 if processed else 0.0),
+        }
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        return (
+            f"PublishQueue(depth={self.depth}/{self.max_size}, "
+            f"workers={self.num_workers}, policy={self.overflow_policy})"
+        )
@@ -6,7 +6,7 @@ and provides efficient lookup by topic pattern.
 """
 
 import threading
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from typing import Any
 from uuid import UUID
 
@@ -20,16 +20,220 @@ from neurobus.exceptions.core import (
 from neurobus.utils.patterns import is_wildcard_pattern, wildcard_match
 
 
+class _TrieNode:
+    """Single segment node in a TopicTrie."""
+
+    __slots__ = ("children", "star", "hash", "pattern", "is_hash")
+
+    def __init__(self, is_hash: bool = False) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.star: _TrieNode | None = None
+        self.hash: _TrieNode | None = None
+        self.pattern: str | None = None
+        self.is_hash = is_hash
+
+    def is_empty(self) -> bool:
+        """Check if the node holds no pattern and no children."""
+        return (
+            self.pattern is None and not self.children and self.star is None and self.hash is None
+        )
+
+
+class TopicTrie:
+    """
+    Segment trie indexing wildcard patterns by their "."-separated segments.
+
+    Whole-segment wildcards get dedicated child nodes: "*" matches exactly
+    one non-empty segment and "#" matches one or more segments. Lookup walks
+    the topic once, keeping the set of live nodes, so its cost depends on the
+    topic depth rather than on the number of indexed patterns.
+
+    Patterns mixing wildcards with literal text inside a segment
+    (e.g. "user*.login") cannot be expressed as trie edges and are matched
+    with wildcard_match instead. Results are identical to wildcard_match.
+
+    Example:
+        >>> trie = TopicTrie()
+        >>> trie.insert("agent.*.status")
+        >>> trie.insert("tenant.#")
+        >>> trie.match("agent.42.status")
+        ['agent.*.status']
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root = _TrieNode()
+
+        # Insertion sequence per pattern, used to return matches in a stable order
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+
+        # Patterns with partial-segment wildcards, matched linearly
+        self._fallback: set[str] = set()
+
+    def insert(self, pattern: str) -> None:
+        """
+        Index a pattern.
+
+        Args:
+            pattern: Wildcard pattern to index
+        """
+        if pattern in self._order:
+            return
+
+        self._order[pattern] = self._next_order
+        self._next_order += 1
+
+        segments = pattern.split(".")
+        if not all(self._is_trie_segment(segment) for segment in segments):
+            self._fallback.add(pattern)
+            return
+
+        node = self._root
+        for segment in segments:
+            if segment == "*":
+                if node.star is None:
+                    node.star = _TrieNode()
+                node = node.star
+            elif segment == "#":
+                if node.hash is None:
+                    node.hash = _TrieNode(is_hash=True)
+                node = node.hash
+            else:
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = _TrieNode()
+                node = child
+        node.pattern = pattern
+
+    def remove(self, pattern: str) -> bool:
+        """
+        Remove a pattern from the index.
+
+        Args:
+            pattern: Pattern to remove
+
+        Returns:
+            True if removed, False if the pattern was not indexed
+        """
+        if self._order.pop(pattern, None) is None:
+            return False
+
+        if pattern in self._fallback:
+            self._fallback.discard(pattern)
+            return True
+
+        # Walk down recording the path so empty nodes can be pruned
+        path: list[tuple[_TrieNode, str]] = []
+        node = self._root
+        for segment in pattern.split("."):
+            path.append((node, segment))
+            if segment == "*":
+                next_node = node.star
+            elif segment == "#":
+                next_node = node.hash
+            else:
+                next_node = node.children.get(segment)
+            assert next_node is not None
+            node = next_node
+        node.pattern = None
+
+        for parent, segment in reversed(path):
+            if not node.is_empty():
+                break
+            if segment == "*":
+                parent.star = None
+            elif segment == "#":
+                parent.hash = None
+            else:
+                del parent.children[segment]
+            node = parent
+
+        return True
+
+    def match(self, topic: str) -> list[str]:
+        """
+        Find all indexed patterns matching a topic.
+
+        Args:
+            topic: Topic to match
+
+        Returns:
+            Matching patterns, in insertion order
+        """
+        # Regex anchors treat newlines specially; defer to the reference matcher
+        if "\n" in topic:
+            return [pattern for pattern in self._order if wildcard_match(pattern, topic)]
+
+        states = [self._root]
+        for segment in topic.split("."):
+            next_states: list[_TrieNode] = []
+            seen: set[int] = set()
+
+            for node in states:
+                child = node.children.get(segment)
+                if child is not None and id(child) not in seen:
+                    seen.add(id(child))
+                    next_states.append(child)
+                if segment and node.star is not None and id(node.star) not in seen:
+                    seen.add(id(node.star))
+                    next_states.append(node.star)
+                if node.hash is not None and id(node.hash) not in seen:
+                    seen.add(id(node.hash))
+                    next_states.append(node.hash)
+                # "#" keeps consuming segments
+                if node.is_hash and id(node) not in seen:
+                    seen.add(id(node))
+                    next_states.append(node)
+
+            states = next_states
+            if not states:
+                break
+
+        matches = [node.pattern for node in states if node.pattern is not None]
+        if self._fallback:
+            matches.extend(p for p in self._fallback if wildcard_match(p, topic))
+
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+    def clear(self) -> None:
+        """Remove all patterns."""
+        self._root = _TrieNode()
+        self._order.clear()
+        self._fallback.clear()
+
+    @staticmethod
+    def _is_trie_segment(segment: str) -> bool:
+        """Check if a segment is a literal or a whole-segment wildcard."""
+        return segment in ("*", "#") or ("*" not in segment and "#" not in segment)
+
+    def __len__(self) -> int:
+        """Get the number of indexed patterns."""
+        return len(self._order)
+
+    def __contains__(self, pattern: str) -> bool:
+        """Check if a pattern is indexed."""
+        return pattern in self._order
+
+
 class SubscriptionRegistry:
     """
     Thread-safe registry for event subscriptions.
 
-    Provides efficient O(1) lookup for exact matches and O(n) for
-    wildcard patterns. Subscriptions are organized by topic for fast
-    matching.
+    Provides O(1) lookup for exact matches and a segment trie for
+    wildcard patterns, so matching cost depends on topic depth rather
+    than on the number of patterns.
+
+    Resolved, priority-sorted candidate lists are cached per topic in a
+    bounded LRU. Any add/remove/clear bumps a generation counter, which
+    invalidates every cached entry. Subscription filters still run on
+    every event.
 
     Attributes:
         max_size: Maximum number of subscriptions allowed
+        cache_size: Maximum number of cached topics (0 = disabled)
 
     Example:
         >>> registry = SubscriptionRegistry(max_size=1000)
@@ -37,14 +241,16 @@ class SubscriptionRegistry:
         >>> matches = registry.find_matches(event)
     """
 
-    def __init__(self, max_size: int = 10000) -> None:
+    def __init__(self, max_size: int = 10000, cache_size: int = 1024) -> None:
         """
         Initialize registry.
 
         Args:
             max_size: Maximum subscriptions allowed (0 = unlimited)
+            cache_size: Maximum topics in the resolved-match cache (0 = disabled)
         """
         self.max_size = max_size
+        self.cache_size = cache_size
 
         # Exact topic matches: topic -> list of subscriptions
         self._exact_matches: dict[str, list[Subscription]] = defaultdict(list)
@@ -52,9 +258,18 @@ class SubscriptionRegistry:
         # Wildcard patterns: pattern -> list of subscriptions
         self._wildcard_patterns: dict[str, list[Subscription]] = defaultdict(list)
 
+        # Segment trie over wildcard patterns for lookup
+        self._trie = TopicTrie()
+
         # All subscriptions by ID for fast lookup
         self._by_id: dict[UUID, Subscription] = {}
 
+        # Resolved candidates: topic -> (generation, priority-sorted subscriptions)
+        self._resolved: OrderedDict[str, tuple[int, list[Subscription]]] = OrderedDict()
+        self._generation = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         # Thread safety
         self._lock = threading.RLock()
 
@@ -81,11 +296,13 @@ class SubscriptionRegistry:
             # Add to appropriate index
             if is_wildcard_pattern(subscription.pattern):
                 self._wildcard_patterns[subscription.pattern].append(subscription)
+                self._trie.insert(subscription.pattern)
             else:
                 self._exact_matches[subscription.pattern].append(subscription)
 
             # Add to ID index
             self._by_id[subscription.id] = subscription
+            self._generation += 1
 
     def remove(self, subscription_id: UUID | str) -> bool:
         """
@@ -111,6 +328,7 @@ class SubscriptionRegistry:
                 pattern_subs.remove(subscription)
                 if not pattern_subs:
                     del self._wildcard_patterns[subscription.pattern]
+                    self._trie.remove(subscription.pattern)
             else:
                 exact_subs = self._exact_matches[subscription.pattern]
                 exact_subs.remove(subscription)
@@ -119,6 +337,7 @@ class SubscriptionRegistry:
 
             # Remove from ID index
             del self._by_id[subscription_id]
+            self._generation += 1
 
             return True
 
@@ -157,25 +376,54 @@ class SubscriptionRegistry:
         Returns:
             List of matching subscriptions, sorted by priority
         """
+        candidates = self.resolve(event.topic)
+
+        # Filter by context if subscription has filters
+        return [sub for sub in candidates if sub.should_handle(event)]
+
+    def resolve(self, topic: str) -> list[Subscription]:
+        """
+        Resolve the subscriptions whose pattern matches a topic.
+
+        Unlike find_matches, subscription filters are not applied.
+        Results come from the per-topic cache when still valid.
+
+        Args:
+            topic: Topic to resolve
+
+        Returns:
+            Candidate subscriptions, sorted by priority. The list is shared
+            with the cache and must not be mutated.
+        """
         with self._lock:
-            matches: list[Subscription] = []
+            cached = self._resolved.get(topic)
+            if cached is not None and cached[0] == self._generation:
+                self._resolved.move_to_end(topic)
+                self._cache_hits += 1
+                return cached[1]
+
+            self._cache_misses += 1
+            candidates: list[Subscription] = []
 
             # Find exact matches (O(1))
-            if event.topic in self._exact_matches:
-                exact_subs = self._exact_matches[event.topic]
-                # Filter by context if subscription has filters
-                matches.extend([sub for sub in exact_subs if sub.should_handle(event)])
+            exact_subs = self._exact_matches.get(topic)
+            if exact_subs:
+                candidates.extend(exact_subs)
 
-            # Find wildcard matches (O(n) where n = number of patterns)
-            for pattern, pattern_subs in self._wildcard_patterns.items():
-                if wildcard_match(pattern, event.topic):
-                    # Filter by context if subscription has filters
-                    matches.extend([sub for sub in pattern_subs if sub.should_handle(event)])
+            # Find wildcard matches (O(depth) via the segment trie)
+            for pattern in self._trie.match(topic):
+                candidates.extend(self._wildcard_patterns[pattern])
 
             # Sort by priority (higher priority first)
-            matches.sort(key=lambda sub: sub.priority, reverse=True)
+            candidates.sort(key=lambda sub: sub.priority, reverse=True)
+
+            if self.cache_size > 0:
+                self._resolved[topic] = (self._generation, candidates)
+                self._resolved.move_to_end(topic)
+                if len(self._resolved) > self.cache_size:
+                    self._resolved.popitem(last=False)
 
-            return matches
+            return candidates
 
     def find_by_pattern(self, pattern: str) -> list[Subscription]:
         """
@@ -218,7 +466,10 @@ class SubscriptionRegistry:
         with self._lock:
             self._exact_matches.clear()
             self._wildcard_patterns.clear()
+            self._trie.clear()
             self._by_id.clear()
+            self._resolved.clear()
+            self._generation += 1
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -228,12 +479,21 @@ class SubscriptionRegistry:
             Dictionary of statistics
         """
         with self._lock:
+            lookups = self._cache_hits + self._cache_misses
             return {
                 "total_subscriptions": len(self._by_id),
                 "exact_patterns": len(self._exact_matches),
                 "wildcard_patterns": len(self._wildcard_patterns),
                 "capacity": self.max_size,
                 "utilization": (len(self._by_id) / self.max_size if self.max_size > 0 else 0.0),
+                "match_cache": {
+                    "size": len(self._resolved),
+                    "max_size": self.cache_size,
+                    "hits": self._cache_hits,
+                    "misses": self._cache_misses,
+                    "hit_rate": self._cache_hits / lookups if lookups > 0 else 0.0,
+                    "generation": self._generation,
+                },
             }
 
     def __len__(self) -> int:
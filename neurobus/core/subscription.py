@@ -33,6 +33,8 @@ class Subscription:
         filter_expr: Optional filter DSL expression string
         priority: Handler execution priority (higher = earlier)
         metadata: Additional subscription metadata
+        executor: Run the handler on a shared "thread" or "process" pool
+            instead of the event loop (None for async handlers)
 
     Example:
         >>> async def handle_login(event: Event):
@@ -54,6 +56,7 @@ class Subscription:
     filter_expr: str | None = None
     priority: int = 0
     metadata: dict[str, Any] = field(default_factory=dict)
+    executor: str | None = None
 
     def __post_init__(self) -> None:
         """Validate subscription after initialization."""
@@ -63,6 +66,11 @@ class Subscription:
         if not callable(self.handler):
             raise TypeError("Subscription handler must be callable")
 
+        if self.executor not in (None, "thread", "process"):
+            raise ValueError(
+                f"Unknown executor: {self.executor}. Must be one of: [None, 'thread', 'process']"
+            )
+
         # Validate threshold only if provided (None is allowed for non-semantic subscriptions)
         if self.threshold is not None:
             if not 0.0 <= self.threshold <= 1.0:
@@ -141,16 +141,59 @@ class ClusterManager:
             raise RuntimeError("Cluster manager not running")
 
         # Check for duplicate
-        if self.enable_deduplication:
-            event_key = f"{event.id}"
-            if event_key in self._seen_events:
-                logger.debug(f"Skipping duplicate event: {event.id}")
-                return 0
+        if self._is_duplicate(event):
+            logger.debug(f"Skipping duplicate event: {event.id}")
+            return 0
+
+        # Broadcast via Redis
+        receivers = await self.backend.publish_event(event.topic, self._serialize_event(event))
+
+        logger.debug(f"Broadcast event {event.id} to {receivers} nodes")
+
+        return receivers
+
+    async def broadcast_events(self, events: list[Event]) -> int:
+        """
+        Broadcast a batch of events in one pipelined round trip.
+
+        Args:
+            events: Events to broadcast, in publish order
+
+        Returns:
+            Total number of deliveries across all events
+        """
+        if not self._running:
+            raise RuntimeError("Cluster manager not running")
 
-            self._seen_events.add(event_key)
+        messages = [
+            (event.topic, self._serialize_event(event))
+            for event in events
+            if not self._is_duplicate(event)
+        ]
+        if not messages:
+            return 0
 
-        # Serialize event
-        event_data = {
+        receivers = await self.backend.publish_events(messages)
+
+        logger.debug(f"Broadcast {len(messages)} events in one pipeline")
+
+        return receivers
+
+    def _is_duplicate(self, event: Event) -> bool:
+        """Check and record an outgoing event for deduplication."""
+        if not self.enable_deduplication:
+            return False
+
+        event_key = f"{event.id}"
+        if event_key in self._seen_events:
+            return True
+
+        self._seen_events.add(event_key)
+        return False
+
+    def _serialize_event(self, event: Event) -> dict[str, Any]:
+        """Serialize an event for the wire."""
+        return {
             "id": str(event.id),
             "topic": event.topic,
             "data": serialize(event.data).hex(),
@@ -160,13 +203,6 @@ class ClusterManager:
             "parent_id": str(event.parent_id) if event.parent_id else None,
         }
 
-        # Broadcast via Redis
-        receivers = await self.backend.publish_event(event.topic, event_data)
-
-        logger.debug(f"Broadcast event {event.id} to {receivers} nodes")
-
-        return receivers
-
     def register_event_handler(self, handler: Any) -> None:
         """
         Register handler for cluster events.
@@ -191,6 +191,42 @@ class RedisBackend:
             logger.error(f"Failed to publish event: {e}", exc_info=True)
             raise
 
+    async def publish_events(
+        self,
+        events: list[tuple[str, dict[str, Any]]],
+    ) -> int:
+        """
+        Publish several events using a single Redis pipeline.
+
+        Args:
+            events: (topic, event_data) pairs, in publish order
+
+        Returns:
+            Total number of subscribers that received the events
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to Redis")
+
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            for topic, event_data in events:
+                message = {
+                    "node_id": self.node_id,
+                    "topic": topic,
+                    "data": event_data,
+                }
+                pipe.publish(f"{self.channel_prefix}:events:{topic}", json.dumps(message))
+
+            results = await pipe.execute()
+
+            self._stats["events_published"] += len(events)
+
+            return sum(results)
+
+        except Exception as e:
+            logger.error(f"Failed to publish event batch: {e}", exc_info=True)
+            raise
+
     async def subscribe_pattern(
         self,
         pattern: str,
@@ -128,6 +128,22 @@ class DispatchTimeoutError(DispatchError):
         )
 
 
+class PublishQueueFullError(DispatchError):
+    """Raised when the publish queue is full and the overflow policy is "raise"."""
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize with queue capacity.
+
+        Args:
+            max_size: Publish queue capacity
+        """
+        super().__init__(
+            f"Publish queue is full (max: {max_size})",
+            {"max_size": max_size, "suggestion": "Slow down producers or raise queue size"},
+        )
+
+
 class HandlerError(NeuroBusError):
     """Wrapper for errors that occur in event handlers."""
 
@@ -11,6 +11,7 @@ from typing import Any
 
 from neurobus.core.event import Event
 from neurobus.llm.connector import LLMConnector
+from neurobus.utils.patterns import wildcard_match
 
 logger = logging.getLogger(__name__)
 
@@ -51,20 +52,16 @@ class LLMHook:
         """
         Check if event topic matches pattern.
 
+        Uses the bus topic wildcard rules (* and #) via the shared
+        compiled-matcher cache.
+
         Args:
             topic: Event topic
 
         Returns:
             True if matches
         """
-        # Simple wildcard matching
-        if "*" in self.pattern:
-            import re
-
-            regex_pattern = self.pattern.replace("*", ".*")
-            return bool(re.match(f"^{regex_pattern}$", topic))
-
-        return self.pattern == topic
+        return wildcard_match(self.pattern, topic)
 
     def format_prompt(self, event: Event) -> str:
         """
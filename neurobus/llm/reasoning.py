@@ -10,6 +10,7 @@ from typing import Any
 
 from neurobus.core.event import Event
 from neurobus.llm.connector import LLMConnector
+from neurobus.utils.layered import to_plain_dict
 
 logger = logging.getLogger(__name__)
 
@@ -266,7 +267,7 @@ class ReasoningEngine:
         ]
 
         if event.context:
-            lines.append(f"Context: {json.dumps(event.context, indent=2)}")
+            lines.append(f"Context: {json.dumps(to_plain_dict(event.context), indent=2)}")
 
         if context:
             lines.append(f"Additional Context: {json.dumps(context, indent=2)}")
@@ -2,6 +2,7 @@
 
 from neurobus.memory.adapter import BaseMemoryAdapter, MemoryAdapter, VectorSearchResult
 from neurobus.memory.engine import MemoryEngine
+from neurobus.memory.ivf_adapter import IVFAdapter
 from neurobus.memory.lancedb_adapter import LanceDBAdapter
 from neurobus.memory.qdrant_adapter import QdrantAdapter
 from neurobus.memory.store import MemoryEntry, MemoryStore
@@ -15,4 +16,5 @@ __all__ = [
     "VectorSearchResult",
     "QdrantAdapter",
     "LanceDBAdapter",
+    "IVFAdapter",
 ]
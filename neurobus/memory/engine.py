@@ -12,6 +12,7 @@ from typing import Any
 
 from neurobus.core.event import Event
 from neurobus.memory.store import MemoryEntry, MemoryStore
+from neurobus.utils.layered import to_plain_dict
 
 logger = logging.getLogger(__name__)
 
@@ -123,10 +124,11 @@ class MemoryEngine:
         # Convert event to memory content
         content = self._event_to_content(event)
 
-        # Generate embedding if semantic enabled
+        # Generate embedding if semantic enabled; the store copies it
+        # into its float32 matrix
         embedding = None
         if self.enable_semantic and self._encoder:
-            embedding = self._encoder.encode(content).tolist()
+            embedding = self._encoder.encode(content)
 
         # Create memory entry
         entry = MemoryEntry(
@@ -168,7 +170,7 @@ class MemoryEngine:
 
         # Add context if available
         if event.context:
-            context_str = json.dumps(event.context, default=str)
+            context_str = json.dumps(to_plain_dict(event.context), default=str)
             parts.append(f"Context: {context_str}")
 
         return " | ".join(parts)
@@ -192,32 +194,20 @@ class MemoryEngine:
         """
         if not self.enable_semantic or not self._encoder:
             logger.warning("Semantic search not enabled, falling back to topic search")
-            return self.store.search_by_topic(f"*{query}*", limit=limit)
+            return self.store.search_by_topic_substring(query, limit=limit)
 
         # Generate query embedding
         query_embedding = self._encoder.encode(query)
 
-        # Find similar memories
-        results: list[tuple[MemoryEntry, float]] = []
-
-        for entry in self.store._memories.values():
-            if entry.embedding is None:
-                continue
-
-            # Compute similarity
-            similarity = self._encoder.similarity(query_embedding, entry.embedding)
-
-            if similarity >= threshold:
-                results.append((entry, similarity))
-
-        # Sort by similarity
-        results.sort(key=lambda x: x[1], reverse=True)
-
-        # Record access
-        for entry, _ in results[:limit]:
-            entry.access()
+        # One matrix-vector product over all embeddings, then top-k.
+        # Similarities are clamped at 0, so a threshold <= 0 admits all.
+        results = self.store.search_similar(
+            query_embedding,
+            limit=limit,
+            threshold=threshold if threshold > 0 else None,
+        )
 
-        return [entry for entry, _ in results[:limit]]
+        return [entry for entry, _ in results]
 
     def search_by_topic(
         self,
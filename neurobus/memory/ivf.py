@@ -0,0 +1,483 @@
+"""
+Inverted-file (IVF) approximate nearest-neighbour index on NumPy.
+
+Vectors are clustered around coarse centroids found with spherical
+k-means, and each cluster's vectors are kept in one contiguous block (an
+inverted list). A search scores the query against the centroids, then
+scans only the nprobe closest lists, so its cost is roughly
+nprobe / nlist of a brute-force scan. Raising nprobe trades speed for
+recall; nprobe = nlist is an exact search.
+"""
+
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# k-means sample size per centroid and iterations
+_TRAIN_POINTS_PER_LIST = 64
+_TRAIN_ITERATIONS = 10
+
+# Rows scored per matrix product while assigning vectors to lists
+_ASSIGN_CHUNK = 16_384
+
+_FILE_FORMAT = "neurobus-ivf"
+_FILE_VERSION = 1
+
+
+class _InvertedList:
+    """Vectors and IDs of one cluster, packed at the front of a growable block."""
+
+    __slots__ = ("vectors", "ids", "size")
+
+    def __init__(self, dim: int, capacity: int = 16) -> None:
+        self.vectors = np.empty((capacity, dim), dtype=np.float32)
+        self.ids: list[UUID] = []
+        self.size = 0
+
+    def extend(self, ids: list[UUID], vectors: np.ndarray) -> int:
+        """Append vectors; returns the position of the first one."""
+        start = self.size
+        end = start + len(ids)
+        if end > self.vectors.shape[0]:
+            capacity = max(end, 2 * self.vectors.shape[0])
+            grown = np.empty((capacity, self.vectors.shape[1]), dtype=np.float32)
+            grown[:start] = self.vectors[:start]
+            self.vectors = grown
+        self.vectors[start:end] = vectors
+        self.ids.extend(ids)
+        self.size = end
+        return start
+
+    def remove(self, position: int) -> UUID | None:
+        """Remove the vector at position by moving the last one into it."""
+        last = self.size - 1
+        moved = None
+        if position != last:
+            self.vectors[position] = self.vectors[last]
+            moved = self.ids[position] = self.ids[last]
+        self.ids.pop()
+        self.size = last
+        return moved
+
+
+class IVFIndex:
+    """
+    Approximate nearest-neighbour index by inner product.
+
+    Until it holds train_threshold vectors the index has a single list,
+    which makes searches exact. It then trains nlist centroids (by
+    default about sqrt(n)) and distributes the vectors. With an automatic
+    nlist it retrains whenever it has grown retrain_factor times since
+    the last training, so lists stay short.
+
+    Vectors are normalized on add and queries on search when normalize
+    is set, making scores cosine similarities.
+
+    Example:
+        >>> index = IVFIndex(dim=384, nprobe=8)
+        >>> index.add(ids, vectors)
+        >>> for vector_id, score in index.search(query, k=10):
+        ...     print(vector_id, score)
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        nlist: int | None = None,
+        nprobe: int = 8,
+        train_threshold: int = 4096,
+        retrain_factor: float = 4.0,
+        normalize: bool = True,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            dim: Vector dimension
+            nlist: Number of lists once trained (None = about sqrt(n))
+            nprobe: Lists scanned per search by default
+            train_threshold: Vectors to collect before training
+            retrain_factor: Growth since the last training that triggers
+                a retraining (automatic nlist only; 0 = never)
+            normalize: Normalize vectors and queries to unit length
+            seed: Random seed for k-means
+
+        Raises:
+            ValueError: If a size parameter is not positive
+        """
+        if dim < 1 or nprobe < 1 or train_threshold < 1 or (nlist is not None and nlist < 1):
+            raise ValueError("dim, nlist, nprobe and train_threshold must be positive")
+
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.retrain_factor = retrain_factor
+        self.normalize = normalize
+        self._rng = np.random.default_rng(seed)
+
+        self._centroids: np.ndarray | None = None
+        self._lists = [_InvertedList(dim)]
+
+        # Vector ID -> (list number, position in list)
+        self._where: dict[UUID, tuple[int, int]] = {}
+        self._trained_size = 0
+
+        self._stats = {"trainings": 0, "searches": 0, "vectors_scanned": 0}
+
+    def __len__(self) -> int:
+        """Number of stored vectors."""
+        return len(self._where)
+
+    def __contains__(self, vector_id: object) -> bool:
+        """Whether a vector is stored under vector_id."""
+        return vector_id in self._where
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether centroids have been trained."""
+        return self._centroids is not None
+
+    def _prepare(self, vectors: Any) -> np.ndarray:
+        array = np.array(vectors, dtype=np.float32, ndmin=2)
+        if array.shape[1] != self.dim:
+            raise ValueError(f"Vectors have {array.shape[1]} dimensions, expected {self.dim}")
+        if self.normalize:
+            norms = np.linalg.norm(array, axis=1, keepdims=True)
+            np.divide(array, norms, out=array, where=norms > 0)
+        return array
+
+    def add(self, ids: list[UUID], vectors: Any) -> None:
+        """
+        Add or replace vectors.
+
+        Args:
+            ids: Vector IDs
+            vectors: Matrix with one row per ID
+
+        Raises:
+            ValueError: If the shapes do not match
+        """
+        array = self._prepare(vectors)
+        if len(ids) != array.shape[0]:
+            raise ValueError(f"{len(ids)} ids for {array.shape[0]} vectors")
+
+        replaced = [vector_id for vector_id in ids if vector_id in self._where]
+        if replaced:
+            self.remove(replaced)
+        if len(set(ids)) != len(ids):
+            # Keep the last vector of each ID
+            last = {vector_id: i for i, vector_id in enumerate(ids)}
+            keep = sorted(last.values())
+            ids, array = [ids[i] for i in keep], array[keep]
+
+        self._insert(ids, array)
+
+        if not self.is_trained:
+            if len(self) >= self.train_threshold:
+                self.train()
+        elif self.nlist is None and self.retrain_factor:
+            if len(self) >= self.retrain_factor * self._trained_size:
+                self.train()
+
+    def _insert(
+        self,
+        ids: list[UUID],
+        array: np.ndarray,
+        assignment: np.ndarray | None = None,
+    ) -> None:
+        """Append vectors to their lists and record their positions."""
+        where = self._where
+        if self._centroids is None:
+            start = self._lists[0].extend(ids, array)
+            for offset, vector_id in enumerate(ids):
+                where[vector_id] = (0, start + offset)
+            return
+
+        if assignment is None:
+            assignment = self._assign(array)
+        order = np.argsort(assignment, kind="stable")
+        sorted_lists = assignment[order]
+        bounds = np.flatnonzero(np.diff(sorted_lists)) + 1
+        for group in np.split(order, bounds):
+            list_no = int(assignment[group[0]])
+            group_ids = [ids[i] for i in group.tolist()]
+            start = self._lists[list_no].extend(group_ids, array[group])
+            for offset, vector_id in enumerate(group_ids):
+                where[vector_id] = (list_no, start + offset)
+
+    def _assign(self, array: np.ndarray) -> np.ndarray:
+        """Nearest centroid of each row, in chunks."""
+        centroids = self._centroids
+        assert centroids is not None
+        assignment = np.empty(array.shape[0], dtype=np.int64)
+        for start in range(0, array.shape[0], _ASSIGN_CHUNK):
+            chunk = array[start : start + _ASSIGN_CHUNK]
+            assignment[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+        return assignment
+
+    def remove(self, ids: list[UUID]) -> int:
+        """
+        Remove vectors.
+
+        Args:
+            ids: Vector IDs; unknown IDs are ignored
+
+        Returns:
+            Number of vectors removed
+        """
+        removed = 0
+        where = self._where
+        for vector_id in ids:
+            location = where.pop(vector_id, None)
+            if location is None:
+                continue
+            list_no, position = location
+            moved = self._lists[list_no].remove(position)
+            if moved is not None:
+                where[moved] = (list_no, position)
+            removed += 1
+        return removed
+
+    def get(self, vector_id: UUID) -> np.ndarray | None:
+        """
+        Get a stored vector.
+
+        Args:
+            vector_id: Vector ID
+
+        Returns:
+            Copy of the vector (normalized if the index normalizes), or None
+        """
+        location = self._where.get(vector_id)
+        if location is None:
+            return None
+        list_no, position = location
+        vector: np.ndarray = self._lists[list_no].vectors[position].copy()
+        return vector
+
+    def train(self, nlist: int | None = None) -> None:
+        """
+        Cluster the stored vectors and redistribute them.
+
+        Runs spherical k-means on a sample of about 64 vectors per
+        centroid, then moves the vectors to their nearest centroid's
+        list one old list at a time, so memory never holds a second copy
+        of the whole index.
+
+        Args:
+            nlist: Number of lists (default: the index's nlist, or about
+                sqrt(n))
+        """
+        count = len(self)
+        if count == 0:
+            return
+        nlist = nlist or self.nlist or max(1, round(math.sqrt(count)))
+        nlist = min(nlist, count)
+
+        fraction = nlist * _TRAIN_POINTS_PER_LIST / count
+        sample = np.concatenate(
+            [
+                inverted.vectors[: inverted.size][self._rng.random(inverted.size) < fraction]
+                for inverted in self._lists
+            ]
+        )
+        if len(sample) < nlist:
+            sample = np.concatenate([inv.vectors[: inv.size] for inv in self._lists])
+        self._centroids = self._kmeans(sample, nlist)
+        del sample
+
+        # Size each new list exactly, so training leaves no growth slack
+        old_lists: list[_InvertedList | None] = list(self._lists)
+        assignments = [self._assign(inv.vectors[: inv.size]) for inv in self._lists]
+        counts = np.bincount(np.concatenate(assignments), minlength=nlist)
+        self._lists = [_InvertedList(self.dim, max(int(size), 16)) for size in counts]
+        self._where.clear()
+        for i, assignment in enumerate(assignments):
+            inverted = old_lists[i]
+            assert inverted is not None
+            if inverted.size:
+                self._insert(inverted.ids, inverted.vectors[: inverted.size], assignment)
+            old_lists[i] = None  # Free each old block as soon as it is moved
+        self._trained_size = count
+        self._stats["trainings"] += 1
+        logger.debug(f"IVF index trained: {nlist} lists over {count} vectors")
+
+    def _kmeans(self, sample: np.ndarray, k: int) -> np.ndarray:
+        """Spherical k-means: unit centroids maximizing inner product."""
+        centroids = sample[self._rng.choice(len(sample), k, replace=False)].copy()
+        for _ in range(_TRAIN_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assignment, kind="stable")
+            counts = np.bincount(assignment, minlength=k)
+            filled = np.flatnonzero(counts)
+            starts = np.concatenate(([0], np.cumsum(counts[filled])[:-1]))
+            sums = np.add.reduceat(sample[order], starts, axis=0)
+            centroids[filled] = sums
+            empty = np.flatnonzero(counts == 0)
+            if len(empty):
+                # Reseed empty clusters with random sample points
+                centroids[empty] = sample[self._rng.choice(len(sample), len(empty))]
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            np.divide(centroids, norms, out=centroids, where=norms > 0)
+        return centroids
+
+    def search(
+        self,
+        query: Any,
+        k: int = 10,
+        nprobe: int | None = None,
+    ) -> list[tuple[UUID, float]]:
+        """
+        Find the vectors with the largest inner product with query.
+
+        Args:
+            query: Query vector
+            k: Maximum results
+            nprobe: Lists to scan (default: the index's nprobe)
+
+        Returns:
+            (vector ID, score) pairs, best first
+        """
+        if not self._where or k <= 0:
+            return []
+        self._stats["searches"] += 1
+
+        vector = self._prepare(query)[0]
+        if self._centroids is None:
+            probed = [self._lists[0]]
+        else:
+            nprobe = min(nprobe or self.nprobe, len(self._lists))
+            centroid_scores = self._centroids @ vector
+            if nprobe < len(self._lists):
+                nearest = np.argpartition(centroid_scores, -nprobe)[-nprobe:]
+            else:
+                nearest = np.arange(len(self._lists))
+            probed = [self._lists[i] for i in nearest.tolist() if self._lists[i].size]
+
+        if not probed:
+            return []
+        scores = np.concatenate([inv.vectors[: inv.size] @ vector for inv in probed])
+        self._stats["vectors_scanned"] += len(scores)
+
+        k = min(k, len(scores))
+        top = np.argpartition(scores, len(scores) - k)[len(scores) - k :]
+        top = top[np.argsort(scores[top])[::-1]]
+
+        # Map positions in the concatenated scores back to lists
+        ends = np.cumsum([inv.size for inv in probed])
+        owners = np.searchsorted(ends, top, side="right")
+        results = []
+        for position, owner in zip(top.tolist(), owners.tolist(), strict=True):
+            inverted = probed[owner]
+            offset = position - (int(ends[owner - 1]) if owner else 0)
+            results.append((inverted.ids[offset], float(scores[position])))
+        return results
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the index to an .npz file, one pair of arrays per list.
+
+        The file is written under a temporary name and renamed once
+        complete.
+
+        Args:
+            path: File to write
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: dict[str, Any] = {
+            "header": np.array([_FILE_FORMAT, str(_FILE_VERSION)]),
+            "settings": np.array([self.dim, self.nlist or 0, self._trained_size]),
+            "centroids": (
+                self._centroids
+                if self._centroids is not None
+                else np.empty((0, self.dim), dtype=np.float32)
+            ),
+        }
+        for list_no, inverted in enumerate(self._lists):
+            raw_ids = b"".join(vector_id.bytes for vector_id in inverted.ids)
+            arrays[f"ids_{list_no}"] = np.frombuffer(raw_ids, dtype=np.uint8).reshape(-1, 16)
+            arrays[f"vectors_{list_no}"] = inverted.vectors[: inverted.size]
+
+        partial = path.with_name(path.name + ".tmp")
+        with open(partial, "wb") as file:
+            np.savez(file, **arrays)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(partial, path)
+
+    @classmethod
+    def load(cls, path: str | Path, **options: Any) -> "IVFIndex":
+        """
+        Read an index written by save().
+
+        Args:
+            path: File to read
+            **options: Constructor options (nprobe, train_threshold, ...);
+                dim and nlist come from the file
+
+        Returns:
+            The loaded index
+
+        Raises:
+            ValueError: If the file is not an IVF index file
+        """
+        with np.load(path) as data:
+            if "header" not in data or data["header"].tolist() != [
+                _FILE_FORMAT,
+                str(_FILE_VERSION),
+            ]:
+                raise ValueError(f"Not an IVF index file: {path}")
+            dim, nlist, trained_size = (int(x) for x in data["settings"])
+            index = cls(dim=dim, nlist=nlist or None, **options)
+            centroids = data["centroids"]
+            if len(centroids):
+                index._centroids = centroids
+            index._trained_size = trained_size
+
+            lists = []
+            for list_no in range(max(1, len(centroids))):
+                inverted = _InvertedList.__new__(_InvertedList)
+                # The loaded block becomes the list's storage as is
+                inverted.vectors = data[f"vectors_{list_no}"]
+                inverted.ids = [UUID(bytes=row.tobytes()) for row in data[f"ids_{list_no}"]]
+                inverted.size = len(inverted.ids)
+                if not inverted.size:
+                    inverted.vectors = np.empty((16, dim), dtype=np.float32)
+                for position, vector_id in enumerate(inverted.ids):
+                    index._where[vector_id] = (list_no, position)
+                lists.append(inverted)
+            index._lists = lists
+        return index
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        sizes = [inverted.size for inverted in self._lists]
+        return {
+            "vectors": len(self),
+            "dim": self.dim,
+            "trained": self.is_trained,
+            "lists": len(self._lists),
+            "nprobe": self.nprobe,
+            "largest_list": max(sizes),
+            "bytes": sum(inverted.vectors.nbytes for inverted in self._lists),
+            **self._stats,
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"IVFIndex(vectors={len(self)}, lists={len(self._lists)}, nprobe={self.nprobe})"
@@ -0,0 +1,281 @@
+"""
+In-process vector memory adapter for NeuroBUS.
+
+Keeps event vectors in an IVFIndex and their payloads in a dictionary,
+so semantic memory needs no vector database service, only NumPy.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from neurobus.core.event import Event
+from neurobus.memory.adapter import BaseMemoryAdapter, VectorSearchResult
+from neurobus.utils.layered import to_plain_dict
+from neurobus.utils.serialization import deserialize_compact, serialize_compact
+from neurobus.utils.workers import SerialWorker
+
+logger = logging.getLogger(__name__)
+
+# Over-fetch factor when a filter discards search results
+_FILTER_OVERFETCH = 4
+
+
+class IVFAdapter(BaseMemoryAdapter):
+    """
+    NumPy IVF index adapter.
+
+    Vectors are searched by cosine similarity through an inverted-file
+    index; nprobe trades recall for speed. With a path, the index and
+    payloads are loaded on initialize() and written by save() and
+    close(); without one the adapter is memory-only.
+
+    Index operations run on one worker thread, so searches and saves
+    never see a half-applied update.
+
+    Example:
+        >>> adapter = IVFAdapter(path="./data/ivf", vector_size=384)
+        >>> await adapter.initialize()
+        >>>
+        >>> # Store event with embedding
+        >>> await adapter.store_event(event, embedding)
+        >>>
+        >>> # Search similar events
+        >>> results = await adapter.search_similar(query_embedding, k=5)
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        collection_name: str = "neurobus_events",
+        vector_size: int = 384,
+        nlist: int | None = None,
+        nprobe: int = 8,
+        train_threshold: int = 4096,
+    ):
+        """
+        Initialize IVF adapter.
+
+        Args:
+            path: Directory for the index files (None = memory only)
+            collection_name: File name prefix
+            vector_size: Vector dimension size
+            nlist: Number of index lists (None = about sqrt(n))
+            nprobe: Lists scanned per search
+            train_threshold: Vectors stored before the index is trained
+        """
+        super().__init__(collection_name)
+
+        self.path = Path(path) if path is not None else None
+        self.vector_size = vector_size
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+
+        self._index: Any = None
+        self._payloads: dict[UUID, dict[str, Any]] = {}
+        self._worker = SerialWorker("neurobus-ivf")
+        self._initialized = False
+
+    @property
+    def index_path(self) -> Path | None:
+        """File holding the vectors."""
+        return self.path / f"{self.collection_name}.ivf.npz" if self.path else None
+
+    @property
+    def payload_path(self) -> Path | None:
+        """File holding the event payloads."""
+        return self.path / f"{self.collection_name}.payloads" if self.path else None
+
+    async def initialize(self) -> None:
+        """Create the index, loading it from disk if saved before."""
+        if self._initialized:
+            return
+
+        try:
+            from neurobus.memory.ivf import IVFIndex
+        except ImportError:
+            raise ImportError("numpy not installed. " "Install with: pip install numpy")
+
+        self._worker.start()
+        options: dict[str, Any] = {"nprobe": self.nprobe, "train_threshold": self.train_threshold}
+
+        if self.index_path is not None and self.index_path.exists():
+            self._index, self._payloads = await self._worker.run(self._load_sync, IVFIndex, options)
+            if self._index.dim != self.vector_size:
+                raise ValueError(
+                    f"Saved index has {self._index.dim} dimensions, expected {self.vector_size}"
+                )
+            logger.info(f"Loaded IVF index: {len(self._index)} vectors from {self.path}")
+        else:
+            self._index = IVFIndex(dim=self.vector_size, nlist=self.nlist, **options)
+
+        self._initialized = True
+        logger.info(f"IVF adapter initialized (path={self.path})")
+
+    def _load_sync(
+        self, index_class: Any, options: dict[str, Any]
+    ) -> tuple[Any, dict[UUID, dict[str, Any]]]:
+        index_path, payload_path = self.index_path, self.payload_path
+        assert index_path is not None and payload_path is not None
+        index = index_class.load(index_path, **options)
+        payloads = {}
+        if payload_path.exists():
+            payloads = dict(deserialize_compact(payload_path.read_bytes()))
+        return index, payloads
+
+    def _payload(self, event: Event) -> dict[str, Any]:
+        return {
+            "event_id": str(event.id),
+            "topic": event.topic,
+            "timestamp": event.timestamp.isoformat(),
+            "data": event.data,
+            "context": to_plain_dict(event.context),
+            "metadata": event.metadata or {},
+            "parent_id": str(event.parent_id) if event.parent_id else None,
+        }
+
+    async def store_event(
+        self,
+        event: Event,
+        embedding: list[float],
+    ) -> None:
+        """Store event with embedding in the index."""
+        await self.store_events([event], [embedding])
+
+    async def store_events(
+        self,
+        events: list[Event],
+        embeddings: list[list[float]] | Any,
+    ) -> None:
+        """
+        Store several events in one index update.
+
+        Args:
+            events: Events to store
+            embeddings: One embedding per event (list of lists or matrix)
+        """
+        if not self._initialized:
+            raise RuntimeError("Adapter not initialized")
+
+        ids = [event.id for event in events]
+        await self._worker.run(self._index.add, ids, embeddings)
+        for event in events:
+            self._payloads[event.id] = self._payload(event)
+
+        self._stats["events_stored"] += len(events)
+        logger.debug(f"Stored {len(events)} events in IVF index")
+
+    async def search_similar(
+        self,
+        embedding: list[float],
+        k: int = 5,
+        filter_dict: dict[str, Any] | None = None,
+    ) -> list[VectorSearchResult]:
+        """
+        Search for similar events in the index.
+
+        Filters match payload fields by equality and are applied to the
+        index results, fetching more candidates until k events pass or
+        the index is exhausted.
+        """
+        if not self._initialized:
+            raise RuntimeError("Adapter not initialized")
+
+        fetch = k
+        while True:
+            hits = await self._worker.run(self._index.search, embedding, fetch)
+            results = []
+            for event_id, score in hits:
+                payload = self._payloads.get(event_id)
+                if payload is None:
+                    continue
+                if filter_dict and any(payload.get(f) != v for f, v in filter_dict.items()):
+                    continue
+                results.append(VectorSearchResult(event_id=event_id, score=score, payload=payload))
+            if len(results) >= k or len(hits) < fetch or not filter_dict:
+                break
+            fetch *= _FILTER_OVERFETCH
+
+        self._stats["searches_performed"] += 1
+        logger.debug(f"Found {len(results[:k])} similar events")
+        return results[:k]
+
+    async def get_event(self, event_id: UUID) -> dict[str, Any] | None:
+        """Get event payload by ID."""
+        if not self._initialized:
+            raise RuntimeError("Adapter not initialized")
+
+        payload = self._payloads.get(event_id)
+        if payload is not None:
+            self._stats["events_retrieved"] += 1
+        return payload
+
+    async def delete_event(self, event_id: UUID) -> bool:
+        """Delete event from the index."""
+        if not self._initialized:
+            raise RuntimeError("Adapter not initialized")
+
+        removed: int = await self._worker.run(self._index.remove, [event_id])
+        self._payloads.pop(event_id, None)
+        return removed > 0
+
+    async def clear(self) -> None:
+        """Clear all events, keeping the index settings."""
+        if not self._initialized:
+            return
+
+        await self._worker.run(self._clear_sync)
+        self._payloads.clear()
+        self._stats["events_stored"] = 0
+        logger.info(f"Cleared IVF collection: {self.collection_name}")
+
+    def _clear_sync(self) -> None:
+        index = self._index
+        self._index = type(index)(
+            dim=index.dim,
+            nlist=self.nlist,
+            nprobe=self.nprobe,
+            train_threshold=self.train_threshold,
+        )
+
+    async def save(self) -> None:
+        """
+        Write the index and payloads to the adapter's path.
+
+        Both files are replaced atomically; without a path this does
+        nothing.
+        """
+        if not self._initialized or self.path is None:
+            return
+        await self._worker.run(self._save_sync, dict(self._payloads))
+        logger.debug(f"Saved IVF index: {len(self._index)} vectors to {self.path}")
+
+    def _save_sync(self, payloads: dict[UUID, dict[str, Any]]) -> None:
+        index_path, payload_path = self.index_path, self.payload_path
+        assert index_path is not None and payload_path is not None
+        self._index.save(index_path)
+        partial = payload_path.with_name(payload_path.name + ".tmp")
+        with open(partial, "wb") as file:
+            file.write(serialize_compact(list(payloads.items())))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(partial, payload_path)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get adapter statistics, including the index's."""
+        stats = super().get_stats()
+        if self._index is not None:
+            stats["index"] = self._index.get_stats()
+        return stats
+
+    async def close(self) -> None:
+        """Save (with a path) and release the worker thread."""
+        if self._initialized:
+            await self.save()
+            self._initialized = False
+        await self._worker.stop()
+
+        await super().close()
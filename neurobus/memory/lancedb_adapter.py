@@ -10,6 +10,7 @@ from uuid import UUID
 
 from neurobus.core.event import Event
 from neurobus.memory.adapter import BaseMemoryAdapter, VectorSearchResult
+from neurobus.utils.layered import to_plain_dict
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +123,7 @@ class LanceDBAdapter(BaseMemoryAdapter):
             "topic": event.topic,
             "timestamp": event.timestamp.isoformat(),
             "data": json.dumps(event.data),
-            "context": json.dumps(event.context or {}),
+            "context": json.dumps(to_plain_dict(event.context)),
             "metadata": json.dumps(event.metadata or {}),
             "parent_id": str(event.parent_id) if event.parent_id else "",
             "vector": embedding,
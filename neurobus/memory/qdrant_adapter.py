@@ -10,6 +10,7 @@ from uuid import UUID
 
 from neurobus.core.event import Event
 from neurobus.memory.adapter import BaseMemoryAdapter, VectorSearchResult
+from neurobus.utils.layered import to_plain_dict
 
 logger = logging.getLogger(__name__)
 
@@ -131,7 +132,7 @@ class QdrantAdapter(BaseMemoryAdapter):
                 "topic": event.topic,
                 "timestamp": event.timestamp.isoformat(),
                 "data": event.data,
-                "context": event.context or {},
+                "context": to_plain_dict(event.context),
                 "metadata": event.metadata or {},
                 "parent_id": str(event.parent_id) if event.parent_id else None,
             },
@@ -6,10 +6,14 @@ Provides vector database integration for semantic memory storage and retrieval.
 
 import logging
 import time
+from collections.abc import Callable
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
+from neurobus.utils.patterns import get_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,7 +26,8 @@ class MemoryEntry:
         event_id: Original event ID
         topic: Event topic
         content: Memory content (text representation)
-        embedding: Vector embedding
+        embedding: Vector embedding; once the entry is added to a
+            MemoryStore, a read-only float32 row of the store's matrix
         timestamp: When memory was created
         metadata: Additional metadata
         access_count: Number of times accessed
@@ -54,13 +59,44 @@ class MemoryEntry:
         self.event_id = event_id
         self.topic = topic
         self.content = content
-        self.embedding = embedding
+        self._embedding = embedding
+        self._vectors: Any = None
         self.timestamp = datetime.now()
         self.metadata = metadata or {}
         self.access_count = 0
         self.last_access = time.time()
         self.importance = importance
 
+    @property
+    def embedding(self) -> Any:
+        """Vector embedding, or None."""
+        if self._vectors is not None:
+            return self._vectors.get(self.id)
+        return self._embedding
+
+    @embedding.setter
+    def embedding(self, value: Any) -> None:
+        if self._vectors is not None:
+            if value is not None:
+                self._vectors.add(self.id, value)
+                return
+            self._vectors.remove(self.id)
+            self._vectors = None
+        self._embedding = value
+
+    def _attach(self, vectors: Any) -> None:
+        """Move the embedding into a store's matrix."""
+        vectors.add(self.id, self._embedding)
+        self._vectors = vectors
+        self._embedding = None
+
+    def _detach(self) -> None:
+        """Take the embedding back out of the store's matrix."""
+        if self._vectors is not None:
+            self._embedding = self._vectors.get(self.id).copy()
+            self._vectors.remove(self.id)
+            self._vectors = None
+
     def access(self) -> None:
         """Record an access to this memory."""
         self.access_count += 1
@@ -112,6 +148,12 @@ class MemoryStore:
     Provides basic memory storage with importance tracking and decay.
     Can be extended with vector database backends for semantic search.
 
+    Embeddings are kept as rows of one contiguous float32 matrix (see
+    EmbeddingMatrix, which needs numpy), so search_similar() scores every
+    memory with a single matrix-vector product. The rows can be quantized
+    to float16 or int8, optionally reranking the best candidates at full
+    precision.
+
     Features:
     - Memory storage and retrieval
     - Importance scoring
@@ -119,6 +161,7 @@ class MemoryStore:
     - Memory decay
     - Topic-based filtering
     - Time-based queries
+    - Vectorized similarity search
 
     Example:
         >>> store = MemoryStore(max_memories=1000)
@@ -132,6 +175,9 @@ class MemoryStore:
         max_memories: int = 10000,
         decay_enabled: bool = True,
         decay_rate: float = 0.01,
+        quantization: str = "none",
+        rerank: int = 0,
+        originals_path: str | Path | None = None,
     ) -> None:
         """
         Initialize memory store.
@@ -140,10 +186,22 @@ class MemoryStore:
             max_memories: Maximum memories to store
             decay_enabled: Whether to enable importance decay
             decay_rate: Decay rate for importance
+            quantization: Embedding storage: "none" (float32), "float16"
+                or "int8" (per-vector scale)
+            rerank: Re-score the best limit * rerank search candidates at
+                full precision (0 = off; quantized storage only)
+            originals_path: Scratch file holding the full-precision
+                embeddings kept for reranking (None = in memory)
+
+        Raises:
+            ValueError: If quantization is unknown
         """
         self.max_memories = max_memories
         self.decay_enabled = decay_enabled
         self.decay_rate = decay_rate
+        self.quantization = quantization
+        self.rerank = rerank
+        self.originals_path = originals_path
 
         # Storage: memory_id -> MemoryEntry
         self._memories: dict[UUID, MemoryEntry] = {}
@@ -151,6 +209,11 @@ class MemoryStore:
         # Index: topic -> set of memory_ids
         self._topic_index: dict[str, set[UUID]] = {}
 
+        # Embeddings of stored entries (created with the first one)
+        self._vectors: Any = None
+        if quantization != "none" or rerank:
+            self._embedding_matrix()  # Validate the options now
+
         # Statistics
         self._stats = {
             "memories_added": 0,
@@ -172,7 +235,9 @@ class MemoryStore:
         if len(self._memories) >= self.max_memories:
             self._prune_least_important()
 
-        # Store memory
+        # Store memory; the embedding moves into the matrix
+        if entry._vectors is None and entry.embedding is not None:
+            entry._attach(self._embedding_matrix())
         self._memories[entry.id] = entry
 
         # Index by topic
@@ -184,6 +249,20 @@ class MemoryStore:
 
         logger.debug(f"Added memory: {entry.id} (topic={entry.topic})")
 
+    def _embedding_matrix(self) -> Any:
+        """The embedding matrix, created on first use."""
+        if self._vectors is None:
+            try:
+                from neurobus.memory.vectors import EmbeddingMatrix
+            except ImportError:
+                raise ImportError("numpy not installed. " "Install with: pip install numpy")
+            self._vectors = EmbeddingMatrix(
+                quantization=self.quantization,
+                rerank=self.rerank,
+                originals_path=self.originals_path,
+            )
+        return self._vectors
+
     def get(self, memory_id: UUID) -> MemoryEntry | None:
         """
         Get a memory by ID.
@@ -211,21 +290,40 @@ class MemoryStore:
         Search memories by topic pattern.
 
         Args:
-            topic_pattern: Topic pattern (supports * wildcard)
+            topic_pattern: Topic pattern (supports * and # wildcards)
             limit: Maximum memories to return
 
         Returns:
             List of memory entries, sorted by importance
         """
-        self._stats["searches"] += 1
+        matcher = get_matcher(topic_pattern)
+        return self._search_topics(matcher, limit)
+
+    def search_by_topic_substring(
+        self,
+        text: str,
+        limit: int = 10,
+    ) -> list[MemoryEntry]:
+        """
+        Search memories whose topic contains text.
+
+        Args:
+            text: Substring to look for in topics (no wildcards)
+            limit: Maximum memories to return
+
+        Returns:
+            List of memory entries, sorted by importance
+        """
+        return self._search_topics(lambda topic: text in topic, limit)
 
-        # Simple pattern matching (replace * with any chars)
-        import fnmatch
+    def _search_topics(self, matcher: Callable[[str], bool], limit: int) -> list[MemoryEntry]:
+        """Entries of the topics matcher accepts, most important first."""
+        self._stats["searches"] += 1
 
         matching_memories: list[MemoryEntry] = []
 
         for topic, memory_ids in self._topic_index.items():
-            if fnmatch.fnmatch(topic, topic_pattern):
+            if matcher(topic):
                 for memory_id in memory_ids:
                     entry = self._memories.get(memory_id)
                     if entry:
@@ -241,6 +339,40 @@ class MemoryStore:
 
         return matching_memories[:limit]
 
+    def search_similar(
+        self,
+        query_embedding: Any,
+        limit: int = 10,
+        threshold: float | None = None,
+    ) -> list[tuple[MemoryEntry, float]]:
+        """
+        Find the memories whose embeddings are most similar to a query.
+
+        Scores are dot products, i.e. cosine similarities for the unit
+        vectors SemanticEncoder produces. Memories without an embedding
+        are never returned.
+
+        Args:
+            query_embedding: Query vector
+            limit: Maximum memories to return
+            threshold: Optional minimum score
+
+        Returns:
+            (memory entry, score) pairs, most similar first
+        """
+        self._stats["searches"] += 1
+
+        if self._vectors is None:
+            return []
+
+        results = []
+        for memory_id, score in self._vectors.search(query_embedding, limit, threshold):
+            entry = self._memories[memory_id]
+            entry.access()
+            self._stats["memories_accessed"] += 1
+            results.append((entry, score))
+        return results
+
     def search_by_time(
         self,
         start_time: datetime | None = None,
@@ -320,21 +452,25 @@ class MemoryStore:
 
         pruned = 0
         for entry in sorted_memories[:count]:
-            # Remove from storage
-            del self._memories[entry.id]
-
-            # Remove from index
-            if entry.topic in self._topic_index:
-                self._topic_index[entry.topic].discard(entry.id)
-                if not self._topic_index[entry.topic]:
-                    del self._topic_index[entry.topic]
-
+            self._remove(entry)
             pruned += 1
             self._stats["memories_pruned"] += 1
 
         logger.debug(f"Pruned {pruned} memories")
         return pruned
 
+    def _remove(self, entry: MemoryEntry) -> None:
+        """Remove an entry from storage, the topic index and the matrix."""
+        del self._memories[entry.id]
+
+        if entry.topic in self._topic_index:
+            self._topic_index[entry.topic].discard(entry.id)
+            if not self._topic_index[entry.topic]:
+                del self._topic_index[entry.topic]
+
+        # Frees its row for reuse; the entry keeps a copy of its embedding
+        entry._detach()
+
     def decay_all(self) -> None:
         """Apply importance decay to all memories."""
         if not self.decay_enabled:
@@ -356,9 +492,7 @@ class MemoryStore:
         to_prune = [entry for entry in self._memories.values() if entry.importance < 0.1]
 
         for entry in to_prune:
-            del self._memories[entry.id]
-            if entry.topic in self._topic_index:
-                self._topic_index[entry.topic].discard(entry.id)
+            self._remove(entry)
             self._stats["memories_pruned"] += 1
 
         logger.info(f"Consolidated: pruned {len(to_prune)} low-importance memories")
@@ -369,8 +503,16 @@ class MemoryStore:
 
     def clear(self) -> None:
         """Clear all memories."""
+        # Entries still referenced elsewhere keep reading the old matrix,
+        # except that a scratch file is reused, so they take copies first
+        if self._vectors is not None and self.originals_path is not None:
+            for entry in self._memories.values():
+                if entry._vectors is self._vectors:
+                    entry._detach()
+            self._vectors.clear()
         self._memories.clear()
         self._topic_index.clear()
+        self._vectors = None
         logger.info("All memories cleared")
 
     def get_stats(self) -> dict[str, Any]:
@@ -390,6 +532,7 @@ class MemoryStore:
             "searches": self._stats["searches"],
             "decay_enabled": self.decay_enabled,
             "decay_rate": self.decay_rate,
+            "embeddings": self._vectors.get_stats() if self._vectors is not None else None,
         }
 
     def __repr__(self) -> str:
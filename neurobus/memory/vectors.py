@@ -0,0 +1,349 @@
+"""
+Contiguous embedding storage for memory search.
+
+Keeps every embedding of a MemoryStore as a row of one float32 matrix,
+so a similarity search is a single matrix-vector product instead of a
+Python loop over entries. Rows can be scalar-quantized to float16 or
+int8 (see neurobus.utils.quantization) to cut memory two or four times.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+from neurobus.utils.quantization import (
+    bytes_per_vector,
+    code_dtype,
+    dequantize,
+    quantize,
+    quantized_scores,
+    validate_quantization,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows allocated on first add; the matrix doubles when full
+_INITIAL_CAPACITY = 1024
+
+
+class EmbeddingMatrix:
+    """
+    Growable float32 matrix of embeddings keyed by memory ID.
+
+    Rows are assigned on add and handed back on remove; freed rows are
+    reused before the matrix grows, and are masked out of searches.
+    The dimension is fixed by the first embedding added.
+
+    With quantization, rows hold float16 or int8 codes and searches score
+    the codes. A rerank factor keeps float32 originals as well and
+    re-scores the best k * rerank candidates with them. With
+    originals_path the originals live in a memory-mapped scratch file
+    instead of RAM, so only the codes stay resident.
+
+    Example:
+        >>> matrix = EmbeddingMatrix()
+        >>> matrix.add(memory_id, embedding)
+        >>> for memory_id, score in matrix.search(query, k=10):
+        ...     print(memory_id, score)
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = _INITIAL_CAPACITY,
+        quantization: str = "none",
+        rerank: int = 0,
+        originals_path: str | Path | None = None,
+    ) -> None:
+        """
+        Initialize an empty matrix.
+
+        Args:
+            initial_capacity: Rows allocated on first add
+            quantization: Row storage: "none" (float32), "float16" or "int8"
+            rerank: Re-score the best k * rerank candidates of a search
+                at full precision (0 = off; quantized matrices only)
+            originals_path: Scratch file for the full-precision originals
+                kept for reranking (None = keep them in memory); it is
+                overwritten
+
+        Raises:
+            ValueError: If quantization is unknown or rerank negative
+        """
+        if rerank < 0:
+            raise ValueError("rerank must be 0 or positive")
+        self.initial_capacity = max(1, initial_capacity)
+        self.quantization = validate_quantization(quantization)
+        self.rerank = rerank if quantization != "none" else 0
+        self.originals_path = Path(originals_path) if originals_path is not None else None
+        self.dim: int | None = None
+
+        self._matrix = np.empty((0, 0), dtype=code_dtype(quantization))
+        self._live = np.zeros(0, dtype=bool)
+
+        # Per-row int8 scales, and float32 originals kept for reranking
+        self._scales: np.ndarray | None = None
+        self._originals: np.ndarray | None = None
+
+        # Row <-> ID maps; rows past _size have never been used
+        self._ids: list[UUID | None] = []
+        self._rows: dict[UUID, int] = {}
+        self._free: list[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of stored embeddings."""
+        return len(self._rows)
+
+    def __contains__(self, memory_id: object) -> bool:
+        """Whether an embedding is stored for memory_id."""
+        return memory_id in self._rows
+
+    @property
+    def capacity(self) -> int:
+        """Allocated rows."""
+        return int(self._matrix.shape[0])
+
+    def add(self, memory_id: UUID, embedding: Any) -> int:
+        """
+        Store or replace the embedding of a memory.
+
+        Args:
+            memory_id: Memory ID
+            embedding: Vector (list or array) of the matrix's dimension
+
+        Returns:
+            Row index of the embedding
+
+        Raises:
+            ValueError: If the embedding's dimension does not match
+        """
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        if self.dim is None:
+            self.dim = vector.shape[0]
+            self._allocate(self.initial_capacity)
+        elif vector.shape[0] != self.dim:
+            raise ValueError(f"Embedding has {vector.shape[0]} dimensions, expected {self.dim}")
+
+        row = self._rows.get(memory_id)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+                self._ids[row] = memory_id
+            else:
+                if self._size == self.capacity:
+                    self._grow()
+                row = self._size
+                self._size += 1
+                self._ids.append(memory_id)
+            self._rows[memory_id] = row
+            self._live[row] = True
+
+        if self.quantization == "none":
+            self._matrix[row] = vector
+        else:
+            codes, scales = quantize(vector, self.quantization)
+            self._matrix[row] = codes
+            if scales is not None:
+                assert self._scales is not None
+                self._scales[row] = scales
+            if self._originals is not None:
+                self._originals[row] = vector
+        return row
+
+    def _allocate(self, capacity: int) -> None:
+        """Allocate capacity rows, keeping the rows in use."""
+        assert self.dim is not None
+        size = self._size
+        matrix = np.empty((capacity, self.dim), dtype=code_dtype(self.quantization))
+        live = np.zeros(capacity, dtype=bool)
+        if size:
+            matrix[:size] = self._matrix[:size]
+            live[:size] = self._live[:size]
+        self._matrix, self._live = matrix, live
+
+        if self.quantization == "int8":
+            scales = np.empty(capacity, dtype=np.float32)
+            if self._scales is not None:
+                scales[:size] = self._scales[:size]
+            self._scales = scales
+
+        if self.rerank:
+            self._originals = self._allocate_originals(capacity)
+
+    def _allocate_originals(self, capacity: int) -> np.ndarray:
+        """Grow the float32 originals, in memory or in the scratch file."""
+        assert self.dim is not None
+        shape = (capacity, self.dim)
+        old = self._originals
+        if self.originals_path is None:
+            originals = np.empty(shape, dtype=np.float32)
+            if old is not None:
+                originals[: self._size] = old[: self._size]
+            return originals
+
+        if old is None:
+            return np.memmap(self.originals_path, dtype=np.float32, mode="w+", shape=shape)
+        # Extending the file keeps the rows already written
+        assert isinstance(old, np.memmap)
+        old.flush()
+        del old
+        self._originals = None
+        with open(self.originals_path, "r+b") as file:
+            file.truncate(capacity * self.dim * 4)
+        return np.memmap(self.originals_path, dtype=np.float32, mode="r+", shape=shape)
+
+    def _grow(self) -> None:
+        """Double the allocated rows."""
+        capacity = self.capacity * 2
+        self._allocate(capacity)
+        logger.debug(f"Embedding matrix grown to {capacity} rows")
+
+    def remove(self, memory_id: UUID) -> bool:
+        """
+        Remove the embedding of a memory, freeing its row for reuse.
+
+        Args:
+            memory_id: Memory ID
+
+        Returns:
+            True if an embedding was removed
+        """
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return False
+        self._ids[row] = None
+        self._live[row] = False
+        self._free.append(row)
+        return True
+
+    def get(self, memory_id: UUID) -> np.ndarray | None:
+        """
+        Get the embedding of a memory.
+
+        Args:
+            memory_id: Memory ID
+
+        Returns:
+            Read-only float32 vector, or None. Unquantized rows are views
+            (copy them to keep them past later adds and removes);
+            quantized rows are the originals when kept, and otherwise
+            dequantized approximations
+        """
+        row = self._rows.get(memory_id)
+        if row is None:
+            return None
+        vector: np.ndarray
+        if self.quantization == "none":
+            vector = self._matrix[row].view()
+        elif self._originals is not None:
+            vector = np.array(self._originals[row])
+        else:
+            scale = self._scales[row] if self._scales is not None else None
+            vector = dequantize(self._matrix[row], scale, self.quantization)
+        vector.flags.writeable = False
+        return vector
+
+    def search(
+        self,
+        query: Any,
+        k: int = 10,
+        threshold: float | None = None,
+    ) -> list[tuple[UUID, float]]:
+        """
+        Find the embeddings with the largest dot product with query.
+
+        For unit vectors the dot product is the cosine similarity. On a
+        quantized matrix the scores are computed from the codes, then
+        re-scored at full precision for the best k * rerank candidates
+        when reranking.
+
+        Args:
+            query: Query vector
+            k: Maximum results
+            threshold: Optional minimum score
+
+        Returns:
+            (memory ID, score) pairs, best first
+        """
+        if not self._rows or k <= 0:
+            return []
+
+        size = self._size
+        vector = np.asarray(query, dtype=np.float32).ravel()
+        scales = self._scales[:size] if self._scales is not None else None
+        scores = quantized_scores(self._matrix[:size], scales, vector, self.quantization)
+        if len(self._rows) < size:
+            scores[~self._live[:size]] = -np.inf
+
+        k = min(k, len(self._rows))
+        if self._originals is not None:
+            # Re-score the best candidates against the originals, reading
+            # them in row order (sequential in a memory-mapped file)
+            top = np.sort(self._top(scores, min(k * self.rerank, len(self._rows))))
+            exact = self._originals[top] @ vector
+            order = np.argsort(exact)[::-1][:k]
+            top, top_scores = top[order], exact[order]
+        else:
+            top = self._top(scores, k)
+            top = top[np.argsort(scores[top])[::-1]]
+            top_scores = scores[top]
+
+        results = []
+        ids = self._ids
+        for row, score in zip(top.tolist(), top_scores.tolist(), strict=True):
+            if score == -np.inf or (threshold is not None and score < threshold):
+                break
+            results.append((ids[row], score))
+        return results
+
+    @staticmethod
+    def _top(scores: np.ndarray, k: int) -> np.ndarray:
+        """Rows of the k largest scores, unordered."""
+        if k < len(scores):
+            return np.argpartition(scores, len(scores) - k)[len(scores) - k :]
+        return np.arange(len(scores))
+
+    def clear(self) -> None:
+        """Remove every embedding and release the matrix."""
+        self.dim = None
+        self._matrix = np.empty((0, 0), dtype=code_dtype(self.quantization))
+        self._live = np.zeros(0, dtype=bool)
+        self._scales = None
+        if self._originals is not None:
+            self._originals = None
+            if self.originals_path is not None:
+                self.originals_path.unlink(missing_ok=True)
+        self._ids.clear()
+        self._rows.clear()
+        self._free.clear()
+        self._size = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get matrix statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        resident = self._matrix.nbytes
+        if self._scales is not None:
+            resident += self._scales.nbytes
+        if self._originals is not None and not isinstance(self._originals, np.memmap):
+            resident += self._originals.nbytes
+        return {
+            "embeddings": len(self._rows),
+            "dim": self.dim,
+            "capacity": self.capacity,
+            "free_rows": len(self._free),
+            "quantization": self.quantization,
+            "rerank": self.rerank,
+            "bytes_per_vector": bytes_per_vector(self.dim, self.quantization) if self.dim else 0,
+            "bytes": resident,
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"EmbeddingMatrix(embeddings={len(self._rows)}, dim={self.dim})"
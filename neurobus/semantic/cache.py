@@ -11,6 +11,14 @@ from typing import Any
 
 import numpy as np
 
+from neurobus.utils.quantization import dequantize, quantize, validate_quantization
+
+
+def _nbytes(codes: Any, scale: Any) -> int:
+    """Bytes of a cached embedding and its scale."""
+    size = getattr(codes, "nbytes", 0)
+    return size + 4 if scale is not None else size
+
 
 class EmbeddingCache:
     """
@@ -20,12 +28,17 @@ class EmbeddingCache:
     - LRU eviction policy
     - TTL-based expiration
     - Thread-safe operations
-    - Memory-efficient storage
+    - Memory-efficient storage (optional float16/int8 quantization)
     - Hit/miss statistics
 
+    With quantization, embeddings are stored as float16 or int8 codes
+    (int8 with one scale per embedding) and get() returns float32
+    approximations of them.
+
     Attributes:
         max_size: Maximum number of cached embeddings
         ttl: Time-to-live in seconds (0 = no expiration)
+        quantization: Storage: "none", "float16" or "int8"
 
     Example:
         >>> cache = EmbeddingCache(max_size=1000, ttl=3600)
@@ -33,21 +46,35 @@ class EmbeddingCache:
         >>> embedding = cache.get("hello world")
     """
 
-    def __init__(self, max_size: int = 10000, ttl: float = 3600.0) -> None:
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: float = 3600.0,
+        quantization: str = "none",
+    ) -> None:
         """
         Initialize embedding cache.
 
         Args:
             max_size: Maximum cache entries (0 = unlimited)
             ttl: Time-to-live in seconds (0 = no expiration)
+            quantization: Embedding storage: "none" (as given), "float16"
+                or "int8" (per-embedding scale)
+
+        Raises:
+            ValueError: If quantization is unknown
         """
         self.max_size = max_size
         self.ttl = ttl
+        self.quantization = validate_quantization(quantization)
 
-        # OrderedDict for LRU behavior
-        self._cache: OrderedDict[str, tuple[np.ndarray, float]] = OrderedDict()
+        # OrderedDict for LRU behavior: text -> (codes, scale, timestamp)
+        self._cache: OrderedDict[str, tuple[np.ndarray, Any, float]] = OrderedDict()
         self._lock = RLock()
 
+        # Bytes held by cached embeddings
+        self._bytes = 0
+
         # Statistics
         self._hits = 0
         self._misses = 0
@@ -68,11 +95,11 @@ class EmbeddingCache:
                 self._misses += 1
                 return None
 
-            embedding, timestamp = self._cache[text]
+            codes, scale, timestamp = self._cache[text]
 
             # Check TTL
             if self.ttl > 0 and (time.time() - timestamp) > self.ttl:
-                del self._cache[text]
+                self._remove(text)
                 self._misses += 1
                 return None
 
@@ -80,7 +107,9 @@ class EmbeddingCache:
             self._cache.move_to_end(text)
             self._hits += 1
 
-            return embedding
+        if self.quantization == "none":
+            return codes
+        return dequantize(codes, scale, self.quantization)
 
     def set(self, text: str, embedding: np.ndarray) -> None:
         """
@@ -90,23 +119,34 @@ class EmbeddingCache:
             text: Text key
             embedding: Numpy array embedding
         """
+        if self.quantization == "none":
+            codes, scale = embedding, None
+        else:
+            codes, scale = quantize(embedding, self.quantization)
+
         with self._lock:
             # Remove if already exists (to update timestamp)
             if text in self._cache:
-                del self._cache[text]
+                self._remove(text)
 
             # Add new entry
-            self._cache[text] = (embedding, time.time())
+            self._cache[text] = (codes, scale, time.time())
+            self._bytes += _nbytes(codes, scale)
 
             # Evict oldest if over capacity
             if self.max_size > 0 and len(self._cache) > self.max_size:
-                self._cache.popitem(last=False)  # Remove oldest (FIFO)
+                self._remove(next(iter(self._cache)))  # Remove oldest (FIFO)
                 self._evictions += 1
 
+    def _remove(self, text: str) -> None:
+        codes, scale, _ = self._cache.pop(text)
+        self._bytes -= _nbytes(codes, scale)
+
     def clear(self) -> None:
         """Clear all cached embeddings."""
         with self._lock:
             self._cache.clear()
+            self._bytes = 0
 
     def size(self) -> int:
         """Get current cache size."""
@@ -132,6 +172,9 @@ class EmbeddingCache:
                 "evictions": self._evictions,
                 "hit_rate": hit_rate,
                 "total_requests": total_requests,
+                "quantization": self.quantization,
+                "bytes": self._bytes,
+                "bytes_per_vector": self._bytes / len(self._cache) if self._cache else 0,
             }
 
     def reset_stats(self) -> None:
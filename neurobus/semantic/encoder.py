@@ -43,6 +43,7 @@ class SemanticEncoder:
         device: str | None = None,
         cache_size: int = 10000,
         cache_ttl: float = 3600.0,
+        cache_quantization: str = "none",
     ) -> None:
         """
         Initialize semantic encoder.
@@ -52,6 +53,8 @@ class SemanticEncoder:
             device: Device to use (None = auto-detect)
             cache_size: Maximum cache entries
             cache_ttl: Cache TTL in seconds
+            cache_quantization: Cached embedding storage ("none",
+                "float16" or "int8")
         """
         self.model_name = model_name
         self.device = device
@@ -61,7 +64,9 @@ class SemanticEncoder:
         self._model_loaded = False
 
         # Embedding cache
-        self.cache = EmbeddingCache(max_size=cache_size, ttl=cache_ttl)
+        self.cache = EmbeddingCache(
+            max_size=cache_size, ttl=cache_ttl, quantization=cache_quantization
+        )
 
         logger.info(f"SemanticEncoder initialized with model={model_name}, device={device}")
 
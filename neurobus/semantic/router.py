@@ -50,6 +50,7 @@ class SemanticRouter:
         device: str | None = None,
         cache_size: int = 10000,
         cache_ttl: float = 3600.0,
+        cache_quantization: str = "none",
         default_threshold: float = 0.75,
     ) -> None:
         """
@@ -60,6 +61,8 @@ class SemanticRouter:
             device: Device to use (None = auto-detect)
             cache_size: Embedding cache size
             cache_ttl: Cache TTL in seconds
+            cache_quantization: Cached embedding storage ("none",
+                "float16" or "int8")
             default_threshold: Default similarity threshold
         """
         self.encoder = SemanticEncoder(
@@ -67,6 +70,7 @@ class SemanticRouter:
             device=device,
             cache_size=cache_size,
             cache_ttl=cache_ttl,
+            cache_quantization=cache_quantization,
         )
 
         self.default_threshold = default_threshold
@@ -2,10 +2,18 @@
 
 from neurobus.temporal.causality import CausalityGraph
 from neurobus.temporal.engine import TemporalEngine
+from neurobus.temporal.partitioned import PartitionedEventStore
+from neurobus.temporal.projections import Projection
+from neurobus.temporal.segmented import SegmentedEventStore
+from neurobus.temporal.snapshots import Snapshot
 from neurobus.temporal.store import EventStore
 
 __all__ = [
     "TemporalEngine",
     "EventStore",
+    "PartitionedEventStore",
+    "SegmentedEventStore",
+    "Snapshot",
+    "Projection",
     "CausalityGraph",
 ]
@@ -5,14 +5,77 @@ Maintains parent-child relationships and enables causality analysis.
 """
 
 import logging
-from collections import defaultdict
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 from uuid import UUID
 
 from neurobus.core.event import Event
+from neurobus.temporal.store import MAX_CAUSAL_DEPTH, EventStore
 
 logger = logging.getLogger(__name__)
 
+# Measured memory per tracked event (node, index entry, share of children
+# lists; ids are shared with the events), used to turn memory_budget_mb
+# into an event limit
+_BYTES_PER_EVENT = 240
+
+
+class _Node:
+    """
+    One tracked event.
+
+    depth is the distance from the root of its tracked tree. jump is a
+    skew-binary jump pointer: an ancestor whose distance depends only on
+    depth, chosen so that any ancestor is reached in O(log depth) hops
+    (Myers' jump pointers; binary lifting with one pointer per node).
+    """
+
+    __slots__ = (
+        "id",
+        "parent_id",
+        "parent",
+        "jump",
+        "root",
+        "depth",
+        "children",
+        "topic",
+        "timestamp",
+    )
+
+    def __init__(self, event: Event) -> None:
+        self.id = event.id
+        self.parent_id = event.parent_id
+        self.parent: _Node | None = None
+        self.jump: _Node = self
+        self.root: _Node = self
+        self.depth = 0
+        self.children: list[_Node] | None = None
+        self.topic = event.topic
+        self.timestamp = event.timestamp
+
+    def attach(self, parent: "_Node") -> None:
+        """Link under parent and derive depth, root and jump pointer."""
+        self.parent = parent
+        self.depth = parent.depth + 1
+        self.root = parent.root
+        jump = parent.jump
+        if parent.depth - jump.depth == jump.depth - jump.jump.depth:
+            self.jump = jump.jump
+        else:
+            self.jump = parent
+
+
+class _Tree:
+    """Bookkeeping for one tracked tree, keyed by its root id in the LRU."""
+
+    __slots__ = ("size", "last_seen")
+
+    def __init__(self) -> None:
+        self.size = 1
+        self.last_seen = time.monotonic()
+
 
 class CausalityGraph:
     """
@@ -21,15 +84,33 @@ class CausalityGraph:
     Maintains parent-child relationships between events and enables
     querying of causal chains.
 
+    Every event caches its depth and tree root, plus a jump pointer, so
+    ancestry checks, level ancestors and lowest common ancestors take
+    O(log depth) steps instead of walking and copying whole chains.
+
+    With a store, the graph is a read-through cache in front of it:
+    load_causal_chain(), load_root() and load_descendants() answer from
+    memory when the tracked chain is complete, and otherwise query the
+    store's parent_id index and cache the ancestors they load. Events
+    added to the graph are expected to be stored as well.
+
+    The graph can be bounded by event count (max_events or
+    memory_budget_mb) and by age (max_age). Eviction drops whole causal
+    trees, least recently extended first, so cached depths and pointers
+    stay valid. An event whose parent is not tracked (never added, or
+    evicted) starts a new tree and keeps its parent_id; if the parent
+    is added later, the waiting trees are attached to it.
+
     Features:
     - Parent-child relationship tracking
     - Ancestor/descendant queries
     - Causal chain reconstruction
     - Root cause analysis
+    - Bounded memory with LRU/time-window eviction
     - Statistics tracking
 
     Example:
-        >>> graph = CausalityGraph()
+        >>> graph = CausalityGraph(max_events=100_000)
         >>>
         >>> # Add event with parent
         >>> graph.add_event(child_event)
@@ -38,24 +119,61 @@ class CausalityGraph:
         >>> ancestors = graph.get_ancestors(event_id)
         >>> descendants = graph.get_descendants(event_id)
         >>> chain = graph.get_causal_chain(event_id)
+        >>>
+        >>> # Fall back to the store for events not in memory
+        >>> cached = CausalityGraph(max_events=100_000, store=event_store)
+        >>> chain = await cached.load_causal_chain(event_id)
     """
 
-    def __init__(self):
-        """Initialize causality graph."""
-        # Event ID -> parent ID
-        self._parents: dict[UUID, UUID | None] = {}
+    def __init__(
+        self,
+        max_events: int = 0,
+        max_age: float | None = None,
+        memory_budget_mb: float | None = None,
+        store: EventStore | None = None,
+        max_depth: int = MAX_CAUSAL_DEPTH,
+    ) -> None:
+        """
+        Initialize causality graph.
+
+        Args:
+            max_events: Maximum tracked events (0 = unlimited)
+            max_age: Evict trees not extended for this many seconds
+                (None = keep)
+            memory_budget_mb: Approximate memory limit; lowers max_events
+                to fit (None = no limit)
+            store: Optional event store to load cold chains from
+            max_depth: Depth limit of store queries
+        """
+        if memory_budget_mb is not None:
+            budget_events = int(memory_budget_mb * 1024 * 1024 / _BYTES_PER_EVENT)
+            max_events = min(max_events, budget_events) if max_events else budget_events
+        self.max_events = max_events
+        self.max_age = max_age
+        self.store = store
+        self.max_depth = max_depth
+
+        # Event ID -> node
+        self._nodes: dict[UUID, _Node] = {}
+
+        # Root ID -> tree, least recently extended first
+        self._trees: OrderedDict[UUID, _Tree] = OrderedDict()
 
-        # Event ID -> list of child IDs
-        self._children: dict[UUID, list[UUID]] = defaultdict(list)
+        # Untracked parent ID -> roots of trees waiting for it
+        self._orphans: dict[UUID, list[_Node]] = {}
 
-        # Event ID -> event metadata
-        self._events: dict[UUID, dict[str, Any]] = {}
+        # Tracked events per depth, for max_depth without a scan
+        self._depth_counts: list[int] = []
 
         # Statistics
         self._stats = {
-            "events_tracked": 0,
-            "causal_chains": 0,
-            "root_events": 0,
+            "events_added": 0,
+            "events_evicted": 0,
+            "trees_evicted": 0,
+            "trees_adopted": 0,
+            "cache_hits": 0,
+            "store_lookups": 0,
+            "events_loaded": 0,
         }
 
         logger.info("CausalityGraph initialized")
@@ -67,28 +185,116 @@ class CausalityGraph:
         Args:
             event: Event to add
         """
-        event_id = event.id
-        parent_id = event.parent_id
-
-        # Store event metadata
-        self._events[event_id] = {
-            "topic": event.topic,
-            "timestamp": event.timestamp,
-            "parent_id": parent_id,
-        }
-
-        # Store parent relationship
-        self._parents[event_id] = parent_id
-
-        # Update children list
-        if parent_id:
-            self._children[parent_id].append(event_id)
+        node = _Node(event)
+        event_id = node.id
+        if self._nodes.setdefault(event_id, node) is not node:
+            return
+
+        parent = self._nodes.get(node.parent_id) if node.parent_id else None
+        if parent is not None:
+            node.attach(parent)
+            if parent.children is None:
+                parent.children = [node]
+            else:
+                parent.children.append(node)
+            root_id = node.root.id
+            tree = self._trees[root_id]
+            tree.size += 1
+            tree.last_seen = time.monotonic()
+            self._trees.move_to_end(root_id)
         else:
-            self._stats["root_events"] += 1
-
-        self._stats["events_tracked"] += 1
-
-        logger.debug(f"Added event {event_id} to causality graph (parent={parent_id})")
+            self._trees[event_id] = _Tree()
+            if node.parent_id:
+                self._orphans.setdefault(node.parent_id, []).append(node)
+        self._count_depth(node.depth, 1)
+
+        # Trees that arrived before this event attach under it
+        if self._orphans:
+            waiting = self._orphans.pop(event_id, None)
+            if waiting:
+                self._adopt(node, waiting)
+
+        self._stats["events_added"] += 1
+        self._evict(protect=node.root.id)
+
+    def _adopt(self, parent: _Node, roots: list[_Node]) -> None:
+        """Attach trees rooted at roots under parent, rebuilding their cached fields."""
+        tree = self._trees[parent.root.id]
+        for root in roots:
+            if self._nodes.get(root.id) is not root or root is parent.root:
+                continue  # Evicted while waiting, or a parent_id cycle
+            tree.size += self._trees.pop(root.id).size
+            if parent.children is None:
+                parent.children = []
+            parent.children.append(root)
+            for node in self._walk([root]):
+                self._count_depth(node.depth, -1)
+                # Below root every node keeps its parent; only root is re-parented
+                new_parent = node.parent if node is not root else parent
+                assert new_parent is not None
+                node.attach(new_parent)
+                self._count_depth(node.depth, 1)
+            self._stats["trees_adopted"] += 1
+        tree.last_seen = time.monotonic()
+        self._trees.move_to_end(parent.root.id)
+
+    def _count_depth(self, depth: int, delta: int) -> None:
+        counts = self._depth_counts
+        if depth >= len(counts):
+            counts.extend([0] * (depth + 1 - len(counts)))
+        counts[depth] += delta
+        while counts and not counts[-1]:
+            counts.pop()
+
+    def _evict(self, protect: UUID | None = None) -> None:
+        """Drop least recently extended trees over max_events or older than max_age."""
+        if self.max_age is not None:
+            cutoff = time.monotonic() - self.max_age
+            while self._trees:
+                root_id, tree = next(iter(self._trees.items()))
+                if tree.last_seen >= cutoff or root_id == protect:
+                    break
+                self._drop_tree(root_id)
+
+        if self.max_events:
+            while len(self._nodes) > self.max_events and self._trees:
+                root_id = next(iter(self._trees))
+                if root_id == protect and len(self._trees) == 1:
+                    # A single tree over the budget is dropped as well
+                    self._drop_tree(root_id)
+                    break
+                if root_id == protect:
+                    self._trees.move_to_end(root_id)
+                    continue
+                self._drop_tree(root_id)
+
+    def _drop_tree(self, root_id: UUID) -> None:
+        """Forget every event of one tree."""
+        self._trees.pop(root_id)
+        root = self._nodes[root_id]
+        if root.parent_id:
+            waiting = self._orphans.get(root.parent_id)
+            if waiting:
+                waiting[:] = [n for n in waiting if n is not root]
+                if not waiting:
+                    del self._orphans[root.parent_id]
+        count = 0
+        for node in self._walk([root]):
+            del self._nodes[node.id]
+            self._count_depth(node.depth, -1)
+            count += 1
+        self._stats["events_evicted"] += count
+        self._stats["trees_evicted"] += 1
+
+    @staticmethod
+    def _walk(roots: list[_Node]) -> Iterator[_Node]:
+        """Breadth-first walk over the subtrees of roots (roots included)."""
+        queue = deque(roots)
+        while queue:
+            node = queue.popleft()
+            yield node
+            if node.children:
+                queue.extend(node.children)
 
     def get_parent(self, event_id: UUID) -> UUID | None:
         """
@@ -100,7 +306,8 @@ class CausalityGraph:
         Returns:
             Parent event ID or None if no parent
         """
-        return self._parents.get(event_id)
+        node = self._nodes.get(event_id)
+        return node.parent_id if node else None
 
     def get_children(self, event_id: UUID) -> list[UUID]:
         """
@@ -112,29 +319,39 @@ class CausalityGraph:
         Returns:
             List of child event IDs
         """
-        return self._children.get(event_id, [])
+        return [child.id for child in self._child_nodes(event_id)]
+
+    def _child_nodes(self, event_id: UUID) -> list[_Node]:
+        """Children of a tracked event, or trees waiting for an untracked one."""
+        node = self._nodes.get(event_id)
+        if node is None:
+            return self._orphans.get(event_id, [])
+        return node.children or []
 
     def get_ancestors(self, event_id: UUID) -> list[UUID]:
         """
         Get all ancestor event IDs (parents, grandparents, etc.).
 
+        If the oldest tracked ancestor has an untracked parent, that
+        parent's ID ends the list.
+
         Args:
             event_id: Event ID
 
         Returns:
             List of ancestor event IDs in order (immediate parent first)
         """
-        ancestors = []
-        current = event_id
-
-        while True:
-            parent = self._parents.get(current)
-            if parent is None:
-                break
-
-            ancestors.append(parent)
-            current = parent
+        node = self._nodes.get(event_id)
+        if node is None:
+            return []
 
+        ancestors = []
+        parent = node.parent
+        while parent is not None:
+            ancestors.append(parent.id)
+            parent = parent.parent
+        if node.root.parent_id:
+            ancestors.append(node.root.parent_id)
         return ancestors
 
     def get_descendants(self, event_id: UUID) -> list[UUID]:
@@ -147,18 +364,7 @@ class CausalityGraph:
         Returns:
             List of descendant event IDs (breadth-first order)
         """
-        descendants = []
-        queue = [event_id]
-
-        while queue:
-            current = queue.pop(0)
-            children = self._children.get(current, [])
-
-            for child in children:
-                descendants.append(child)
-                queue.append(child)
-
-        return descendants
+        return [node.id for node in self._walk(self._child_nodes(event_id))]
 
     def get_root(self, event_id: UUID) -> UUID:
         """
@@ -168,15 +374,13 @@ class CausalityGraph:
             event_id: Event ID
 
         Returns:
-            Root event ID
+            Root event ID (the untracked parent of the oldest tracked
+            ancestor, if it has one)
         """
-        current = event_id
-
-        while True:
-            parent = self._parents.get(current)
-            if parent is None:
-                return current
-            current = parent
+        node = self._nodes.get(event_id)
+        if node is None:
+            return event_id
+        return node.root.parent_id or node.root.id
 
     def get_causal_chain(self, event_id: UUID) -> list[UUID]:
         """
@@ -202,11 +406,46 @@ class CausalityGraph:
             event_id: Event ID
 
         Returns:
-            List of event metadata dictionaries
+            List of event metadata dictionaries ({} for untracked events)
         """
-        chain = self.get_causal_chain(event_id)
-
-        return [self._events.get(eid, {}) for eid in chain]
+        return [self._metadata(eid) for eid in self.get_causal_chain(event_id)]
+
+    def _metadata(self, event_id: UUID) -> dict[str, Any]:
+        node = self._nodes.get(event_id)
+        if node is None:
+            return {}
+        return {"topic": node.topic, "timestamp": node.timestamp, "parent_id": node.parent_id}
+
+    @staticmethod
+    def _ancestor_at(node: _Node, depth: int) -> _Node:
+        """The ancestor of node at a depth no greater than node's (O(log depth))."""
+        while node.depth > depth:
+            if node.jump.depth >= depth:
+                node = node.jump
+            else:
+                # Only a tree root has no parent, and its depth is 0
+                assert node.parent is not None
+                node = node.parent
+        return node
+
+    @classmethod
+    def _lowest_common(cls, a: _Node, b: _Node) -> _Node | None:
+        """Lowest common ancestor of two nodes (either may be it), or None."""
+        if a.root is not b.root:
+            return None
+        if a.depth > b.depth:
+            a = cls._ancestor_at(a, b.depth)
+        elif b.depth > a.depth:
+            b = cls._ancestor_at(b, a.depth)
+        # Equal depths share jump distances, so both walks stay level
+        while a is not b:
+            if a.jump is not b.jump:
+                a, b = a.jump, b.jump
+            else:
+                # Distinct nodes of one tree at equal depth are below its root
+                assert a.parent is not None and b.parent is not None
+                a, b = a.parent, b.parent
+        return a
 
     def is_ancestor(self, potential_ancestor: UUID, event_id: UUID) -> bool:
         """
@@ -219,8 +458,17 @@ class CausalityGraph:
         Returns:
             True if potential_ancestor is an ancestor of event_id
         """
-        ancestors = self.get_ancestors(event_id)
-        return potential_ancestor in ancestors
+        node = self._nodes.get(event_id)
+        if node is None:
+            return False
+
+        ancestor = self._nodes.get(potential_ancestor)
+        if ancestor is None:
+            # Only the untracked parent above the tree can still match
+            return potential_ancestor == node.root.parent_id
+        if ancestor.root is not node.root or ancestor.depth >= node.depth:
+            return False
+        return self._ancestor_at(node, ancestor.depth) is ancestor
 
     def is_descendant(self, potential_descendant: UUID, event_id: UUID) -> bool:
         """
@@ -233,8 +481,7 @@ class CausalityGraph:
         Returns:
             True if potential_descendant is a descendant of event_id
         """
-        descendants = self.get_descendants(event_id)
-        return potential_descendant in descendants
+        return self.is_ancestor(event_id, potential_descendant)
 
     def get_depth(self, event_id: UUID) -> int:
         """
@@ -246,7 +493,10 @@ class CausalityGraph:
         Returns:
             Depth (0 for root events)
         """
-        return len(self.get_ancestors(event_id))
+        node = self._nodes.get(event_id)
+        if node is None:
+            return 0
+        return node.depth + (1 if node.root.parent_id else 0)
 
     def get_subtree_size(self, event_id: UUID) -> int:
         """
@@ -258,12 +508,15 @@ class CausalityGraph:
         Returns:
             Number of descendants
         """
-        return len(self.get_descendants(event_id))
+        return sum(1 for _ in self._walk(self._child_nodes(event_id)))
 
     def find_common_ancestor(self, event_id1: UUID, event_id2: UUID) -> UUID | None:
         """
         Find lowest common ancestor of two events.
 
+        The result is an ancestor of both events, so neither event
+        itself is returned.
+
         Args:
             event_id1: First event ID
             event_id2: Second event ID
@@ -271,14 +524,93 @@ class CausalityGraph:
         Returns:
             Common ancestor event ID or None
         """
-        ancestors1 = set(self.get_ancestors(event_id1))
-        ancestors2 = self.get_ancestors(event_id2)
+        a = self._nodes.get(event_id1)
+        b = self._nodes.get(event_id2)
+        if a is None or b is None:
+            return None
+
+        common = self._lowest_common(a, b)
+        if common is None:
+            # Separate trees can still hang off the same untracked parent
+            dangling = a.root.parent_id
+            return dangling if dangling and dangling == b.root.parent_id else None
+        if common is a or common is b:
+            return common.parent.id if common.parent else common.root.parent_id
+        return common.id
+
+    async def load_causal_chain(self, event_id: UUID) -> list[UUID]:
+        """
+        Get the causal chain of an event, loading cold ancestors from the store.
+
+        Without a store, or when the event's tracked chain reaches a
+        root, this is get_causal_chain(). Otherwise the store is asked
+        for the chain above the tracked part (or for the whole chain of
+        an untracked event), and the loaded events are added to the graph.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            List of event IDs from root to this event
+        """
+        node = self._nodes.get(event_id)
+        # Everything above the tracked tree, or the whole chain
+        cold_id = node.root.parent_id if node is not None else event_id
+        if self.store is None or cold_id is None:
+            self._stats["cache_hits"] += 1
+            return self.get_causal_chain(event_id)
+
+        tracked = self.get_causal_chain(event_id)
+        self._stats["store_lookups"] += 1
+        events = await self.store.get_causal_chain(cold_id, self.max_depth)
+        if not events:
+            return tracked
+
+        for event in events:
+            self.add_event(event)
+        self._stats["events_loaded"] += len(events)
+        # The tracked chain starts with cold_id, the last loaded event
+        return [event.id for event in events] + tracked[1:]
+
+    async def load_root(self, event_id: UUID) -> UUID:
+        """
+        Get the root of an event's causal chain, loading it from the store if needed.
+
+        Args:
+            event_id: Event ID
 
-        for ancestor in ancestors2:
-            if ancestor in ancestors1:
-                return ancestor
+        Returns:
+            Root event ID (see load_causal_chain)
+        """
+        node = self._nodes.get(event_id)
+        if self.store is None or (node is not None and not node.root.parent_id):
+            self._stats["cache_hits"] += 1
+            return self.get_root(event_id)
+        return (await self.load_causal_chain(event_id))[0]
+
+    async def load_descendants(self, event_id: UUID) -> AsyncIterator[UUID]:
+        """
+        Stream the descendants of an event.
 
-        return None
+        With a store, descendants are streamed from it (the graph cannot
+        tell whether its own subtree is complete); they are not cached.
+        Without one this iterates get_descendants().
+
+        Args:
+            event_id: Event ID
+
+        Yields:
+            Descendant event IDs, breadth-first
+        """
+        if self.store is None:
+            self._stats["cache_hits"] += 1
+            for descendant in self.get_descendants(event_id):
+                yield descendant
+            return
+
+        self._stats["store_lookups"] += 1
+        async for event in self.store.get_descendants(event_id, self.max_depth):
+            yield event.id
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -288,29 +620,48 @@ class CausalityGraph:
             Dictionary with statistics
         """
         return {
-            "events_tracked": self._stats["events_tracked"],
-            "root_events": self._stats["root_events"],
-            "causal_chains": len([e for e, p in self._parents.items() if p is None]),
-            "max_depth": max((self.get_depth(e) for e in self._events), default=0),
-            "total_relationships": len(self._parents),
+            "events_tracked": len(self._nodes),
+            "events_added": self._stats["events_added"],
+            "root_events": len(self._trees),
+            "causal_chains": len(self._trees),
+            "max_depth": len(self._depth_counts) - 1 if self._depth_counts else 0,
+            "total_relationships": len(self._nodes),
+            "waiting_for_parent": sum(len(roots) for roots in self._orphans.values()),
+            "max_events": self.max_events,
+            "approx_memory_bytes": len(self._nodes) * _BYTES_PER_EVENT,
+            "events_evicted": self._stats["events_evicted"],
+            "trees_evicted": self._stats["trees_evicted"],
+            "trees_adopted": self._stats["trees_adopted"],
+            "cache_hits": self._stats["cache_hits"],
+            "store_lookups": self._stats["store_lookups"],
+            "events_loaded": self._stats["events_loaded"],
         }
 
     def clear(self) -> None:
         """Clear all causality data."""
-        self._parents.clear()
-        self._children.clear()
-        self._events.clear()
+        self._nodes.clear()
+        self._trees.clear()
+        self._orphans.clear()
+        self._depth_counts.clear()
         self._stats = {
-            "events_tracked": 0,
-            "causal_chains": 0,
-            "root_events": 0,
+            "events_added": 0,
+            "events_evicted": 0,
+            "trees_evicted": 0,
+            "trees_adopted": 0,
+            "cache_hits": 0,
+            "store_lookups": 0,
+            "events_loaded": 0,
         }
         logger.info("Causality graph cleared")
 
+    def __len__(self) -> int:
+        """Number of tracked events."""
+        return len(self._nodes)
+
+    def __contains__(self, event_id: object) -> bool:
+        """Whether an event is tracked."""
+        return event_id in self._nodes
+
     def __repr__(self) -> str:
         """String representation."""
-        return (
-            f"CausalityGraph("
-            f"events={self._stats['events_tracked']}, "
-            f"roots={self._stats['root_events']})"
-        )
+        return f"CausalityGraph(events={len(self._nodes)}, roots={len(self._trees)})"
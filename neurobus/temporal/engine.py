@@ -6,13 +6,29 @@ Provides high-level API for event persistence, replay, and time-travel queries.
 
 import asyncio
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
+from dataclasses import replace
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
 from neurobus.core.event import Event
+from neurobus.temporal.causality import CausalityGraph
+from neurobus.temporal.partitioned import PartitionedEventStore
+from neurobus.temporal.projections import Projection
+from neurobus.temporal.segmented import SegmentedEventStore
+from neurobus.temporal.snapshots import (
+    Snapshot,
+    SnapshotCatalog,
+    read_snapshot_file,
+    write_snapshot_file,
+)
 from neurobus.temporal.store import EventStore
+from neurobus.utils.patterns import get_matcher
+from neurobus.utils.serialization import deserialize_compact, serialize_compact
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +43,11 @@ class TemporalEngine:
     Features:
     - Automatic event persistence
     - Event replay with filtering
+    - Streaming replay, optionally republished at a multiple of real time
     - Time-travel queries
-    - Snapshot creation and restoration
+    - Persistent snapshots: markers replayed lazily from the store, or
+      materialized to a snapshot file
+    - Projections: reducer state at any point in time from checkpoints
     - Audit trail queries
     - Statistics tracking
 
@@ -51,33 +70,86 @@ class TemporalEngine:
 
     def __init__(
         self,
-        store: EventStore | None = None,
+        store: EventStore | PartitionedEventStore | SegmentedEventStore | None = None,
         db_path: str = "neurobus_events.db",
         max_events: int = 1000000,
         auto_persist: bool = True,
+        partition_by: str | None = None,
+        snapshot_dir: str | Path | None = None,
+        causality_cache_size: int = 100_000,
     ) -> None:
         """
         Initialize temporal engine.
 
         Args:
             store: Optional custom event store
-            db_path: Database path (if store not provided)
+            db_path: Database path (if store not provided); with
+                partition_by, the partition directory is db_path without
+                its suffix
             max_events: Maximum events to store
             auto_persist: Whether to automatically persist events
+            partition_by: "hour" or "day" to use a PartitionedEventStore
+                (if store not provided)
+            snapshot_dir: Directory for materialized snapshot files
+                (default: next to the store's files)
+            causality_cache_size: Events kept in the causality graph
         """
+        if store is None and partition_by:
+            store = PartitionedEventStore(
+                directory=Path(db_path).with_suffix(""),
+                partition_by=partition_by,
+                max_events=max_events,
+            )
         self.store = store or EventStore(db_path=db_path, max_events=max_events)
         self.auto_persist = auto_persist
 
-        # Snapshots: snapshot_name -> list of events
-        self._snapshots: dict[str, list[Event]] = {}
+        # Causal chains: an EventStore answers cold lookups from its
+        # parent_id index, so the graph only caches what is looked up;
+        # for other stores it tracks stored events itself
+        self.causality = CausalityGraph(
+            max_events=causality_cache_size,
+            store=self.store if isinstance(self.store, EventStore) else None,
+        )
+
+        # Snapshot markers are kept with the store: in the EventStore
+        # database, or in snapshots.db in a directory store
+        if isinstance(self.store, EventStore):
+            catalog_path = self.store.db_path
+            default_dir = catalog_path.with_name(f"{catalog_path.stem}-snapshots")
+        else:
+            catalog_path = self.store.directory / "snapshots.db"
+            default_dir = self.store.directory / "snapshots"
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else default_dir
+        self._catalog = SnapshotCatalog(catalog_path)
+        self._snapshots: dict[str, Snapshot] = {}
+
+        # Projections, the timestamp of each one's latest checkpoint, and
+        # a counter bumped whenever late events invalidate checkpoints
+        self._projections: dict[str, Projection] = {}
+        self._checkpoint_horizons: dict[str, float | None] = {}
+        self._projection_epochs: dict[str, int] = {}
+        self._projection_stats = {
+            "rebuilds": 0,
+            "checkpoints_used": 0,
+            "checkpoints_saved": 0,
+            "checkpoints_invalidated": 0,
+            "events_folded": 0,
+        }
 
         logger.info(f"TemporalEngine initialized (auto_persist={auto_persist})")
 
     async def initialize(self) -> None:
-        """Initialize engine and storage."""
+        """Initialize engine and storage, and load snapshot markers."""
         await self.store.initialize()
+        await self._open_catalog()
         logger.info("TemporalEngine ready")
 
+    async def _open_catalog(self) -> None:
+        """Open the snapshot catalog and load its markers once."""
+        if not self._catalog.is_open:
+            await self._catalog.open()
+            self._snapshots = await self._catalog.load()
+
     async def store_event(self, event: Event) -> None:
         """
         Store an event.
@@ -89,6 +161,27 @@ class TemporalEngine:
             return
 
         await self.store.store_event(event)
+        if self.causality.store is None:
+            self.causality.add_event(event)
+        if self._checkpoint_horizons:
+            await self._invalidate_checkpoints([event])
+
+    async def store_events(self, events: list[Event]) -> None:
+        """
+        Store a batch of events in a single transaction.
+
+        Args:
+            events: Events to store
+        """
+        if not self.auto_persist:
+            return
+
+        await self.store.store_events(events)
+        if self.causality.store is None:
+            for event in events:
+                self.causality.add_event(event)
+        if self._checkpoint_horizons:
+            await self._invalidate_checkpoints(events)
 
     async def get_event(self, event_id: UUID | str) -> Event | None:
         """
@@ -112,7 +205,7 @@ class TemporalEngine:
         Query events by topic.
 
         Args:
-            topic: Topic pattern (supports * wildcard)
+            topic: Topic pattern ("*" within a segment, "#" for the rest)
             limit: Maximum events to return
             offset: Offset for pagination
 
@@ -129,7 +222,7 @@ class TemporalEngine:
         self,
         start_time: datetime,
         end_time: datetime,
-        topic: str = "*",
+        topic: str = "#",
         limit: int = 100,
     ) -> list[Event]:
         """
@@ -155,7 +248,7 @@ class TemporalEngine:
         self,
         hours: int = 0,
         days: int = 0,
-        topic: str = "*",
+        topic: str = "#",
         limit: int = 100,
     ) -> list[Event]:
         """
@@ -183,7 +276,7 @@ class TemporalEngine:
     async def query_at_time(
         self,
         point_in_time: datetime,
-        topic: str = "*",
+        topic: str = "#",
         limit: int = 100,
     ) -> list[Event]:
         """
@@ -207,7 +300,7 @@ class TemporalEngine:
         self,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
-        topic: str = "*",
+        topic: str = "#",
         handler: Callable[[Event], Any] | None = None,
         delay_ms: int = 0,
     ) -> list[Event]:
@@ -244,55 +337,278 @@ class TemporalEngine:
 
         return events
 
+    async def stream_replay(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        topic: str = "#",
+        speed: float | None = None,
+        page_size: int = 1000,
+        prefetch: int = 2,
+    ) -> AsyncGenerator[Event, None]:
+        """
+        Stream events from history with bounded memory.
+
+        Unlike replay(), events are read page by page (see
+        EventStore.stream_events), so memory use is bounded by
+        page_size * prefetch however long the time range is.
+
+        Args:
+            start_time: Optional start time
+            end_time: Optional end time
+            topic: Topic filter
+            speed: Pace events at this multiple of real time, based on
+                the gaps between their timestamps (1.0 = as recorded,
+                10.0 = ten times faster); None streams as fast as possible
+            page_size: Events per store page
+            prefetch: Pages read ahead of the consumer
+
+        Yields:
+            Events in chronological order
+
+        Raises:
+            ValueError: If speed is not positive
+
+        Example:
+            >>> async for event in engine.stream_replay(start_time=yesterday):
+            ...     rebuild_state(event)
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+
+        first_timestamp: float | None = None
+        wall_start = 0.0
+
+        # aclosing stops the store's prefetch as soon as this stream is closed
+        async with aclosing(
+            self.store.stream_events(
+                start_time=start_time,
+                end_time=end_time,
+                topic_pattern=topic,
+                page_size=page_size,
+                prefetch=prefetch,
+            )
+        ) as events:
+            async for event in events:
+                if speed is not None:
+                    timestamp = event.timestamp.timestamp()
+                    if first_timestamp is None:
+                        first_timestamp = timestamp
+                        wall_start = time.monotonic()
+                    delay = wall_start + (timestamp - first_timestamp) / speed - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                yield event
+
+    async def replay_into(
+        self,
+        bus: Any,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        topic: str = "#",
+        speed: float | None = None,
+        page_size: int = 1000,
+        prefetch: int = 2,
+    ) -> int:
+        """
+        Republish events from history on a bus.
+
+        Events are streamed with stream_replay() and published as new
+        events (fresh id and timestamp) carrying the original id in
+        metadata["replayed_from"], so they can be persisted again without
+        clashing with the originals.
+
+        Args:
+            bus: NeuroBus to publish on (must be running)
+            start_time: Optional start time
+            end_time: Optional end time
+            topic: Topic filter
+            speed: Multiple of real time (None = as fast as possible)
+            page_size: Events per store page
+            prefetch: Pages read ahead of publishing
+
+        Returns:
+            Number of events republished
+
+        Example:
+            >>> # Replay the last hour at 60x: one minute per second
+            >>> await engine.replay_into(bus, start_time=hour_ago, speed=60.0)
+        """
+        count = 0
+        async with aclosing(
+            self.stream_replay(
+                start_time=start_time,
+                end_time=end_time,
+                topic=topic,
+                speed=speed,
+                page_size=page_size,
+                prefetch=prefetch,
+            )
+        ) as events:
+            async for event in events:
+                await bus.publish(
+                    Event(
+                        topic=event.topic,
+                        data=event.data,
+                        context=event.context,
+                        metadata={**event.metadata, "replayed_from": str(event.id)},
+                        parent_id=event.parent_id,
+                    )
+                )
+                count += 1
+
+        logger.info(f"Republished {count} events")
+        return count
+
     async def create_snapshot(
         self,
         name: str,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
-        topic: str = "*",
+        topic: str = "#",
+        materialize: bool = False,
     ) -> int:
         """
-        Create a named snapshot of events.
+        Create a named, persistent snapshot of events.
+
+        The snapshot is stored as a marker (topic filter and time range,
+        ending now if end_time is not given) and its events are read from
+        the store when it is replayed. On an EventStore the marker also
+        records the last rowid, so events stored later never appear in it,
+        even with older timestamps. A marker only sees events the store
+        still retains; materialize exports the events to a snapshot file
+        instead, which also reloads faster. Creating a snapshot with an
+        existing name replaces it.
 
         Args:
             name: Snapshot name
             start_time: Optional start time
             end_time: Optional end time
             topic: Topic filter
+            materialize: Export the events to a snapshot file
 
         Returns:
             Number of events in snapshot
         """
-        events = await self.store.replay_events(
+        await self._open_catalog()
+
+        created_at = datetime.now()
+        end_time = end_time or created_at
+        max_rowid = None
+        if isinstance(self.store, EventStore):
+            max_rowid = await self.store.last_rowid() or 0
+        snapshot = Snapshot(
+            name=name,
+            topic=topic,
             start_time=start_time,
             end_time=end_time,
-            topic_pattern=topic,
+            max_rowid=max_rowid,
+            event_count=0,
+            created_at=created_at,
         )
 
-        self._snapshots[name] = events
-        logger.info(f"Created snapshot '{name}' with {len(events)} events")
+        if materialize:
+            path = self.snapshot_dir / f"{created_at:%Y%m%d%H%M%S%f}-{len(self._snapshots)}.snap"
+            async with aclosing(self._stream_store(snapshot)) as events:
+                count = await write_snapshot_file(path, events)
+        else:
+            path = None
+            count = await self.store.count_events(topic, start_time, end_time)
+
+        snapshot = replace(snapshot, event_count=count, path=path)
+        await self._catalog.save(snapshot)
+
+        previous = self._snapshots.get(name)
+        self._snapshots[name] = snapshot
+        if previous is not None and previous.path is not None:
+            await asyncio.to_thread(previous.path.unlink, True)
+
+        logger.info(
+            f"Created {'materialized ' if materialize else ''}snapshot '{name}' "
+            f"with {count} events"
+        )
+        return count
+
+    def _stream_store(
+        self, snapshot: Snapshot, page_size: int = 1000
+    ) -> AsyncGenerator[Event, None]:
+        """Stream a snapshot marker's events from the store."""
+        options: dict[str, Any] = {}
+        if snapshot.max_rowid is not None:
+            options["max_rowid"] = snapshot.max_rowid
+        return self.store.stream_events(
+            start_time=snapshot.start_time,
+            end_time=snapshot.end_time,
+            topic_pattern=snapshot.topic,
+            page_size=page_size,
+            **options,
+        )
+
+    async def stream_snapshot(
+        self, name: str, page_size: int = 1000
+    ) -> AsyncGenerator[Event, None]:
+        """
+        Stream the events of a named snapshot.
+
+        Materialized snapshots are read from their file; others are
+        streamed from the store page by page.
+
+        Args:
+            name: Snapshot name
+            page_size: Events per store page
+
+        Yields:
+            Events in chronological order (none for an unknown name)
+        """
+        await self._open_catalog()
+
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            return
 
-        return len(events)
+        if snapshot.path is not None:
+            events = read_snapshot_file(snapshot.path)
+        else:
+            events = self._stream_store(snapshot, page_size)
+        async with aclosing(events) as stream:
+            async for event in stream:
+                yield event
 
-    def get_snapshot(self, name: str) -> list[Event]:
+    async def get_snapshot(self, name: str) -> list[Event]:
         """
         Get events from a named snapshot.
 
+        Loads every event; use stream_snapshot() for large snapshots.
+
         Args:
             name: Snapshot name
 
         Returns:
             List of events in snapshot
         """
-        return self._snapshots.get(name, [])
+        async with aclosing(self.stream_snapshot(name)) as stream:
+            return [event async for event in stream]
+
+    def get_snapshot_info(self, name: str) -> Snapshot | None:
+        """
+        Get a snapshot's marker.
+
+        Args:
+            name: Snapshot name
+
+        Returns:
+            Snapshot marker or None if not found
+        """
+        return self._snapshots.get(name)
 
     def list_snapshots(self) -> list[str]:
         """Get list of snapshot names."""
         return list(self._snapshots.keys())
 
-    def delete_snapshot(self, name: str) -> bool:
+    async def delete_snapshot(self, name: str) -> bool:
         """
-        Delete a snapshot.
+        Delete a snapshot and its snapshot file.
 
         Args:
             name: Snapshot name
@@ -300,15 +616,242 @@ class TemporalEngine:
         Returns:
             True if deleted, False if not found
         """
-        if name in self._snapshots:
-            del self._snapshots[name]
-            logger.info(f"Deleted snapshot '{name}'")
-            return True
-        return False
+        await self._open_catalog()
+
+        snapshot = self._snapshots.pop(name, None)
+        if snapshot is None:
+            return False
+
+        await self._catalog.delete(name)
+        if snapshot.path is not None:
+            await asyncio.to_thread(snapshot.path.unlink, True)
+        logger.info(f"Deleted snapshot '{name}'")
+        return True
+
+    async def register_projection(
+        self,
+        name: str,
+        reducer: Callable[[Any, Event], Any],
+        topic: str = "#",
+        initial: Any = None,
+        checkpoint_interval: int = 1000,
+        version: int = 1,
+    ) -> Projection:
+        """
+        Register a projection for state_at() queries.
+
+        Checkpoints saved by an earlier process are reused if the name
+        and version match.
+
+        Args:
+            name: Projection name
+            reducer: Function (state, event) -> new state
+            topic: Topic pattern of the events to fold
+            initial: Initial state (deep-copied for each rebuild)
+            checkpoint_interval: Events folded between checkpoints (0 =
+                no checkpoints)
+            version: Reducer version; bump it when the reducer changes
+
+        Returns:
+            The registered projection
+
+        Raises:
+            ValueError: If checkpoint_interval is negative
+
+        Example:
+            >>> def balance(state, event):
+            ...     sign = 1 if event.topic == "account.deposited" else -1
+            ...     return state + sign * event.data["amount"]
+            >>> await engine.register_projection("balance", balance, "account.*", 0.0)
+            >>> await engine.state_at("balance", yesterday)
+        """
+        if checkpoint_interval < 0:
+            raise ValueError("checkpoint_interval must not be negative")
+
+        await self._open_catalog()
+
+        projection = Projection(name, reducer, topic, initial, checkpoint_interval, version)
+        self._projections[name] = projection
+        self._projection_epochs[name] = self._projection_epochs.get(name, 0) + 1
+        self._checkpoint_horizons[name] = await self._catalog.last_checkpoint_time(name, version)
+        return projection
+
+    def unregister_projection(self, name: str) -> bool:
+        """
+        Unregister a projection, keeping its checkpoints.
+
+        Args:
+            name: Projection name
+
+        Returns:
+            True if removed, False if not found
+        """
+        if self._projections.pop(name, None) is None:
+            return False
+        self._checkpoint_horizons.pop(name, None)
+        return True
+
+    def list_projections(self) -> list[str]:
+        """Get list of projection names."""
+        return list(self._projections.keys())
+
+    async def clear_checkpoints(self, name: str) -> int:
+        """
+        Delete every checkpoint of a projection.
+
+        Args:
+            name: Projection name
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        await self._open_catalog()
+
+        count = await self._catalog.delete_checkpoints(name)
+        if name in self._projections:
+            self._checkpoint_horizons[name] = None
+            self._projection_epochs[name] += 1
+        return count
+
+    async def state_at(
+        self,
+        name: str,
+        point_in_time: datetime | None = None,
+        use_checkpoints: bool = True,
+        page_size: int = 1000,
+    ) -> Any:
+        """
+        Rebuild a projection's state as of a point in time.
+
+        Starts from the nearest checkpoint at or before point_in_time and
+        folds the projection's events after it, up to and including
+        point_in_time, in chronological order. While folding, a checkpoint
+        is saved every checkpoint_interval events, so the next query near
+        the same time replays only the difference.
+
+        Checkpoints stay correct when events are stored through this
+        engine with timestamps before a checkpoint: such checkpoints are
+        deleted. Events written to the store directly, or removed from
+        it, are not tracked; call clear_checkpoints() after doing so.
+
+        Args:
+            name: Projection name
+            point_in_time: Time of the state (default: now)
+            use_checkpoints: Start from and save checkpoints; False folds
+                the full history
+            page_size: Events per store page
+
+        Returns:
+            The projection's state
+
+        Raises:
+            KeyError: If no projection is registered under name
+        """
+        projection = self._projections.get(name)
+        if projection is None:
+            raise KeyError(f"Unknown projection: {name}")
+
+        await self._open_catalog()
+
+        until = (point_in_time or datetime.now()).timestamp()
+        epoch = self._projection_epochs[name]
+        interval = projection.checkpoint_interval if use_checkpoints else 0
+        reducer = projection.reducer
+        is_async = asyncio.iscoroutinefunction(reducer)
+
+        checkpoint = None
+        if use_checkpoints:
+            checkpoint = await self._catalog.nearest_checkpoint(name, projection.version, until)
+        if checkpoint is None:
+            state = projection.initial_state()
+            since, total = None, 0
+        else:
+            since, total, state_bytes = checkpoint
+            state = deserialize_compact(state_bytes)
+            self._projection_stats["checkpoints_used"] += 1
+
+        # Timestamp of the last folded event; set before any checkpoint is due
+        last_timestamp = since if since is not None else float("-inf")
+        folded = 0
+        due = False
+        async with aclosing(
+            self.store.stream_events(
+                start_time=datetime.fromtimestamp(since) if since is not None else None,
+                end_time=datetime.fromtimestamp(until),
+                topic_pattern=projection.topic,
+                page_size=page_size,
+            )
+        ) as events:
+            async for event in events:
+                timestamp = event.timestamp.timestamp()
+                # Events at the checkpoint's timestamp are already folded in
+                if since is not None and timestamp <= since:
+                    continue
+
+                # Checkpoint only between timestamps, so none is split
+                if due and timestamp > last_timestamp:
+                    await self._save_checkpoint(projection, epoch, last_timestamp, total, state)
+                    due = False
+
+                state = await reducer(state, event) if is_async else reducer(state, event)
+                last_timestamp = timestamp
+                total += 1
+                folded += 1
+                if interval and folded % interval == 0:
+                    due = True
+
+        if due:
+            await self._save_checkpoint(projection, epoch, last_timestamp, total, state)
+
+        self._projection_stats["rebuilds"] += 1
+        self._projection_stats["events_folded"] += folded
+        return state
+
+    async def _save_checkpoint(
+        self, projection: Projection, epoch: int, timestamp: float, total: int, state: Any
+    ) -> None:
+        """Persist a checkpoint unless events were invalidated since the rebuild began."""
+        if self._projection_epochs.get(projection.name) != epoch:
+            return
+
+        await self._catalog.save_checkpoint(
+            projection.name, projection.version, timestamp, total, serialize_compact(state)
+        )
+        horizon = self._checkpoint_horizons.get(projection.name)
+        if horizon is None or timestamp > horizon:
+            self._checkpoint_horizons[projection.name] = timestamp
+        self._projection_stats["checkpoints_saved"] += 1
+
+    async def _invalidate_checkpoints(self, events: list[Event]) -> None:
+        """Delete checkpoints that new events with earlier timestamps make stale."""
+        for name, horizon in list(self._checkpoint_horizons.items()):
+            if horizon is None:
+                continue
+            projection = self._projections[name]
+            matches = get_matcher(projection.topic)
+            earliest = min(
+                (
+                    timestamp
+                    for event in events
+                    if (timestamp := event.timestamp.timestamp()) <= horizon
+                    and matches(event.topic)
+                ),
+                default=None,
+            )
+            if earliest is None:
+                continue
+
+            self._projection_epochs[name] += 1
+            removed = await self._catalog.delete_checkpoints(name, since=earliest)
+            self._checkpoint_horizons[name] = await self._catalog.last_checkpoint_time(
+                name, projection.version
+            )
+            self._projection_stats["checkpoints_invalidated"] += removed
+            logger.debug(f"Late events invalidated {removed} checkpoints of '{name}'")
 
     async def count_events(
         self,
-        topic: str = "*",
+        topic: str = "#",
         start_time: datetime | None = None,
         end_time: datetime | None = None,
     ) -> int:
@@ -343,10 +886,13 @@ class TemporalEngine:
             "auto_persist": self.auto_persist,
             "snapshots": len(self._snapshots),
             "snapshot_names": list(self._snapshots.keys()),
+            "projections": {"names": list(self._projections.keys()), **self._projection_stats},
+            "causality": self.causality.get_stats(),
         }
 
     async def close(self) -> None:
         """Close engine and storage."""
+        await self._catalog.close()
         await self.store.close()
         logger.info("TemporalEngine closed")
 
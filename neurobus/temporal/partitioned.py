@@ -0,0 +1,827 @@
+"""
+Time-partitioned event store.
+
+Spreads events over one SQLite file per hour or day, so retention drops
+whole files and time-range queries only open the partitions they cover.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import aclosing, asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from neurobus.core.event import Event
+from neurobus.exceptions.temporal import QueryError, StoreError
+from neurobus.temporal.rows import make_row_format
+from neurobus.temporal.store import EventStore
+from neurobus.utils.workers import SQLiteWorker
+
+logger = logging.getLogger(__name__)
+
+# Partition span in seconds and the UTC strftime format of its file name
+PARTITION_SPANS = {
+    "hour": (3600, "%Y%m%d%H"),
+    "day": (86400, "%Y%m%d"),
+}
+
+_PARTITION_PREFIX = "events-"
+_INDEX_FILE = "index.db"
+
+
+class _Partition:
+    """One partition file and, while open, its EventStore."""
+
+    __slots__ = ("key", "path", "store", "rows", "users")
+
+    def __init__(self, key: int, path: Path) -> None:
+        self.key = key
+        self.path = path
+        self.store: EventStore | None = None
+        self.rows: int | None = None  # Last known row count while closed
+        self.users = 0  # Open streams and operations; never evicted while > 0
+
+
+class _PartitionIndex(SQLiteWorker):
+    """
+    Small id -> partition index in its own SQLite file.
+
+    Ids are stored as 16-byte UUIDs with an integer partition key. All
+    access goes through one thread, like the EventStore writer.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path, "neurobus-pindex")
+
+    def setup(self, conn: sqlite3.Connection) -> None:
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS event_partitions (
+                id BLOB PRIMARY KEY,
+                partition INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_partition ON event_partitions(partition)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS partition_rows (
+                partition INTEGER PRIMARY KEY,
+                rows INTEGER NOT NULL
+            )
+            """
+        )
+
+    async def add(self, entries: list[tuple[bytes, int]]) -> None:
+        await self.run(self._add_sync, entries)
+
+    def _add_sync(self, entries: list[tuple[bytes, int]]) -> None:
+        try:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO event_partitions (id, partition) VALUES (?, ?)", entries
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            raise StoreError("index", str(e)) from e
+
+    async def lookup(self, event_id: bytes) -> int | None:
+        return await self.run(self._lookup_sync, event_id)
+
+    def _lookup_sync(self, event_id: bytes) -> int | None:
+        row = self.conn.execute(
+            "SELECT partition FROM event_partitions WHERE id = ?", (event_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def drop_batch(self, key: int, batch_size: int) -> int:
+        return await self.run(self._drop_batch_sync, key, batch_size)
+
+    async def indexed_partitions(self) -> set[int]:
+        return await self.run(
+            lambda: {
+                row[0]
+                for row in self.conn.execute("SELECT DISTINCT partition FROM event_partitions")
+            }
+        )
+
+    def _drop_batch_sync(self, key: int, batch_size: int) -> int:
+        try:
+            count = self.conn.execute(
+                """
+                DELETE FROM event_partitions WHERE id IN (
+                    SELECT id FROM event_partitions WHERE partition = ? LIMIT ?
+                )
+                """,
+                (key, batch_size),
+            ).rowcount
+            self.conn.execute("DELETE FROM partition_rows WHERE partition = ?", (key,))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            raise StoreError("index drop", str(e)) from e
+        return count
+
+    async def load_rows(self) -> dict[int, int]:
+        return await self.run(
+            lambda: dict(self.conn.execute("SELECT partition, rows FROM partition_rows"))
+        )
+
+    async def save_rows(self, rows: dict[int, int]) -> None:
+        await self.run(self._save_rows_sync, rows)
+
+    def _save_rows_sync(self, rows: dict[int, int]) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO partition_rows (partition, rows) VALUES (?, ?)",
+            rows.items(),
+        )
+        self.conn.commit()
+
+
+class PartitionedEventStore:
+    """
+    Event store split into time partitions, one SQLite file each.
+
+    Each event goes to the partition covering its timestamp (UTC hours or
+    days), stored as events-YYYYMMDD[HH].db in the store directory. Each
+    open partition is an EventStore, so write modes, topic planning and
+    off-loop I/O all apply per partition. At most max_open_partitions
+    stay open (least recently used are closed); closed partitions are
+    reopened on demand.
+
+    Queries prune partitions outside their time range. Counts and full
+    replays fan out to partitions in parallel; newest-first queries walk
+    partitions newest to oldest and stop once they have enough events.
+    get_event finds the partition through a small id -> partition index.
+
+    Retention drops whole partitions (file unlink, no row deletes): those
+    entirely older than retention_days, then the oldest ones while the
+    rest still hold at least max_events rows. Expiry is therefore
+    partition-granular. The dropped partition's id index entries are
+    purged afterwards by a background task; until then lookups that hit
+    them find no partition and return None.
+
+    Example:
+        >>> store = PartitionedEventStore("events/", partition_by="hour")
+        >>> await store.initialize()
+        >>> await store.store_event(event)
+        >>> events = await store.query_time_range(hour_ago, now)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = "neurobus_events",
+        partition_by: str = "day",
+        max_events: int = 0,
+        retention_days: float | None = None,
+        retention_interval: float = 60.0,
+        max_open_partitions: int = 8,
+        write_mode: str = "sync",
+        durability: str = "flush",
+        flush_batch_size: int = 500,
+        flush_interval_ms: float = 50.0,
+        read_pool_size: int = 2,
+        row_format: str = "text",
+        compression: str = "none",
+    ) -> None:
+        """
+        Initialize partitioned event store.
+
+        Args:
+            directory: Directory holding partition files and the id index
+            partition_by: "hour" or "day" (UTC)
+            max_events: Keep at least this many events when dropping old
+                partitions (0 = no count limit)
+            retention_days: Drop partitions older than this (None = keep)
+            retention_interval: Seconds between background retention passes
+            max_open_partitions: Partitions kept open at once
+            write_mode: Per-partition EventStore write mode
+            durability: Per-partition write-behind durability
+            flush_batch_size: Per-partition write-behind batch size
+            flush_interval_ms: Per-partition write-behind interval
+            read_pool_size: Reader threads per open partition
+            row_format: Row format of new partitions ("text" or "compact")
+            compression: Compact-format compression ("none", "zlib", "zstd");
+                each partition trains its own dictionary
+
+        Raises:
+            ValueError: If partition_by, row_format or compression is unknown
+        """
+        if partition_by not in PARTITION_SPANS:
+            raise ValueError(
+                f"Unknown partition_by: {partition_by}. Must be one of: {list(PARTITION_SPANS)}"
+            )
+
+        self.directory = Path(directory)
+        self.partition_by = partition_by
+        self.span, self._name_format = PARTITION_SPANS[partition_by]
+        self.max_events = max_events
+        self.retention_days = retention_days
+        self.retention_interval = retention_interval
+        self.max_open_partitions = max_open_partitions
+        self._store_options: dict[str, Any] = {
+            "write_mode": write_mode,
+            "durability": durability,
+            "flush_batch_size": flush_batch_size,
+            "flush_interval_ms": flush_interval_ms,
+            "read_pool_size": read_pool_size,
+            "row_format": row_format,
+            "compression": compression,
+        }
+        # Fail here rather than when the first partition opens
+        make_row_format(row_format, compression)
+
+        self._partitions: dict[int, _Partition] = {}
+        self._open: OrderedDict[int, _Partition] = OrderedDict()
+        self._open_lock = asyncio.Lock()
+        self._index = _PartitionIndex(self.directory / _INDEX_FILE)
+        self._initialized = False
+        self._retention_task: asyncio.Task[None] | None = None
+        self._purge_keys: list[int] = []
+        self._purge_task: asyncio.Task[None] | None = None
+        self._closing = False
+
+        # Statistics
+        self._stats = {
+            "events_stored": 0,
+            "partitions_opened": 0,
+            "partitions_dropped": 0,
+            "rows_dropped": 0,
+        }
+        self._retention_time = 0.0
+
+        logger.info(
+            f"PartitionedEventStore created with directory={self.directory}, "
+            f"partition_by={partition_by}"
+        )
+
+    async def initialize(self) -> None:
+        """Discover existing partitions and open the id index."""
+        if self._initialized:
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            await self._index.open()
+
+            known_rows = await self._index.load_rows()
+            for path in self.directory.glob(f"{_PARTITION_PREFIX}*.db"):
+                key = self._key_from_name(path.name)
+                if key is None:
+                    continue
+                partition = _Partition(key, path)
+                partition.rows = known_rows.get(key)
+                self._partitions[key] = partition
+
+            # Index entries of partitions dropped before a purge finished
+            stale = await self._index.indexed_partitions() - self._partitions.keys()
+            if stale:
+                self._schedule_purge(sorted(stale))
+
+            self._initialized = True
+            self._closing = False
+
+            if self.max_events > 0 or self.retention_days:
+                self._retention_task = asyncio.create_task(self._retention_loop())
+
+            logger.info(f"PartitionedEventStore initialized ({len(self._partitions)} partitions)")
+
+        except Exception as e:
+            raise StoreError("initialize", str(e)) from e
+
+    def _key_for(self, timestamp: float) -> int:
+        """Partition key for a Unix timestamp."""
+        return int(timestamp // self.span)
+
+    def _name_for(self, key: int) -> str:
+        """File name for a partition key."""
+        start = datetime.fromtimestamp(key * self.span, tz=UTC)
+        return f"{_PARTITION_PREFIX}{start.strftime(self._name_format)}.db"
+
+    def _key_from_name(self, name: str) -> int | None:
+        """Parse a partition file name back into its key."""
+        stem = name.removeprefix(_PARTITION_PREFIX).removesuffix(".db")
+        try:
+            start = datetime.strptime(stem, self._name_format).replace(tzinfo=UTC)
+        except ValueError:
+            logger.warning(f"Ignoring unrecognized partition file: {name}")
+            return None
+        return self._key_for(start.timestamp())
+
+    def _keys_between(self, start_time: datetime | None, end_time: datetime | None) -> list[int]:
+        """Existing partition keys overlapping [start_time, end_time], oldest first."""
+        low = self._key_for(start_time.timestamp()) if start_time else None
+        high = self._key_for(end_time.timestamp()) if end_time else None
+        return sorted(
+            key
+            for key in self._partitions
+            if (low is None or key >= low) and (high is None or key <= high)
+        )
+
+    @asynccontextmanager
+    async def _using(self, key: int, create: bool = False) -> AsyncIterator[EventStore | None]:
+        """
+        Open a partition for the duration of the block.
+
+        Args:
+            key: Partition key
+            create: Create the partition if it does not exist
+
+        Yields:
+            The partition's EventStore, or None if it does not exist
+        """
+        partition = await self._acquire(key, create)
+        if partition is None:
+            yield None
+            return
+        try:
+            yield partition.store
+        finally:
+            partition.users -= 1
+
+    async def _acquire(self, key: int, create: bool) -> _Partition | None:
+        """Open (or create) a partition and take a reference on it."""
+        async with self._open_lock:
+            partition = self._partitions.get(key)
+            if partition is None:
+                if not create:
+                    return None
+                partition = _Partition(key, self.directory / self._name_for(key))
+                self._partitions[key] = partition
+
+            if partition.store is None:
+                store = EventStore(
+                    db_path=partition.path,
+                    max_events=0,
+                    **self._store_options,
+                )
+                await store.initialize()
+                partition.store = store
+                self._stats["partitions_opened"] += 1
+
+            partition.users += 1
+            self._open[key] = partition
+            self._open.move_to_end(key)
+            await self._evict()
+            return partition
+
+    async def _evict(self) -> None:
+        """Close least recently used idle partitions over max_open_partitions."""
+        excess = len(self._open) - self.max_open_partitions
+        for key in list(self._open):
+            if excess <= 0:
+                return
+            partition = self._open[key]
+            if partition.users:
+                continue
+            await self._close_partition(partition)
+            excess -= 1
+
+    async def _close_partition(self, partition: _Partition) -> None:
+        """Close a partition's store, remembering its row count."""
+        store = partition.store
+        partition.store = None
+        self._open.pop(partition.key, None)
+        if store is None:
+            return
+        await store.close()
+        partition.rows = store.row_count
+        await self._index.save_rows({partition.key: partition.rows})
+
+    async def store_event(self, event: Event) -> None:
+        """
+        Store an event in the partition covering its timestamp.
+
+        Args:
+            event: Event to store
+
+        Raises:
+            StoreError: If storage fails
+        """
+        await self.store_events([event])
+
+    async def store_events(self, events: list[Event]) -> None:
+        """
+        Store a batch of events, one transaction per partition touched.
+
+        Partitions are written in parallel; if one fails, the others'
+        events may still have been stored.
+
+        Args:
+            events: Events to store
+
+        Raises:
+            StoreError: If storage fails
+        """
+        if not events:
+            return
+
+        if not self._initialized:
+            await self.initialize()
+
+        by_partition: dict[int, list[Event]] = {}
+        for event in events:
+            key = self._key_for(event.timestamp.timestamp())
+            by_partition.setdefault(key, []).append(event)
+
+        async def store_partition(key: int, batch: list[Event]) -> None:
+            async with self._using(key, create=True) as store:
+                assert store is not None
+                await store.store_events(batch)
+            # Index only what the partition committed
+            await self._index.add([(event.id.bytes, key) for event in batch])
+            self._stats["events_stored"] += len(batch)
+
+        await asyncio.gather(*(store_partition(k, b) for k, b in by_partition.items()))
+
+    async def flush(self) -> None:
+        """Commit buffered write-behind rows in every open partition."""
+        await asyncio.gather(*(p.store.flush() for p in list(self._open.values()) if p.store))
+
+    async def get_event(self, event_id: UUID | str) -> Event | None:
+        """
+        Get an event by ID via the id index.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Event or None if not found
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            event_uuid = event_id if isinstance(event_id, UUID) else UUID(event_id)
+            key = await self._index.lookup(event_uuid.bytes)
+        except Exception as e:
+            raise QueryError(f"Failed to get event {event_id}: {e}") from e
+
+        if key is None or key not in self._partitions:
+            return None
+
+        async with self._using(key) as store:
+            return await store.get_event(event_uuid) if store else None
+
+    async def query_by_topic(
+        self,
+        topic_pattern: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Event]:
+        """
+        Query events by topic pattern, newest first.
+
+        Partitions are read newest to oldest until limit + offset events
+        are found, so recent queries only touch recent partitions.
+
+        Args:
+            topic_pattern: Topic pattern ("*" and "#" as on the bus)
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+            limit: Maximum events to return
+            offset: Offset for pagination
+
+        Returns:
+            List of events
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        needed = limit + offset
+        events: list[Event] = []
+        for key in reversed(self._keys_between(start_time, end_time)):
+            async with self._using(key) as store:
+                if store is None:
+                    continue
+                events.extend(
+                    await store.query_by_topic(
+                        topic_pattern, start_time, end_time, limit=needed - len(events)
+                    )
+                )
+            if len(events) >= needed:
+                break
+
+        return events[offset:needed]
+
+    async def query_time_range(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int = 100,
+    ) -> list[Event]:
+        """
+        Query events in a time range.
+
+        Args:
+            start_time: Start time
+            end_time: End time
+            limit: Maximum events to return
+
+        Returns:
+            List of events
+        """
+        return await self.query_by_topic("#", start_time=start_time, end_time=end_time, limit=limit)
+
+    async def _fan_out(
+        self,
+        keys: list[int],
+        func: Callable[[EventStore], Any],
+    ) -> list[Any]:
+        """
+        Run func on each partition in parallel, at most max_open_partitions at once.
+
+        Args:
+            keys: Partition keys
+            func: Coroutine function taking the partition's store
+
+        Returns:
+            Results in key order (None for partitions that vanished)
+        """
+        semaphore = asyncio.Semaphore(self.max_open_partitions)
+
+        async def run(key: int) -> Any:
+            async with semaphore, self._using(key) as store:
+                return await func(store) if store else None
+
+        return await asyncio.gather(*(run(key) for key in keys))
+
+    async def replay_events(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        topic_pattern: str = "#",
+    ) -> list[Event]:
+        """
+        Replay events for time-travel or replay scenarios.
+
+        Partitions are queried in parallel; prefer stream_events for
+        large ranges.
+
+        Args:
+            start_time: Optional start time
+            end_time: Optional end time
+            topic_pattern: Topic pattern filter
+
+        Returns:
+            List of events in chronological order
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        results = await self._fan_out(
+            self._keys_between(start_time, end_time),
+            lambda store: store.replay_events(start_time, end_time, topic_pattern),
+        )
+        return [event for events in results if events for event in events]
+
+    async def stream_events(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        topic_pattern: str = "#",
+        page_size: int = 1000,
+        prefetch: int = 2,
+    ) -> AsyncGenerator[Event, None]:
+        """
+        Stream events in chronological order, one partition at a time.
+
+        Args:
+            start_time: Optional start time
+            end_time: Optional end time
+            topic_pattern: Topic pattern filter
+            page_size: Rows per page
+            prefetch: Pages buffered ahead of the consumer
+
+        Yields:
+            Events in chronological order
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        for key in self._keys_between(start_time, end_time):
+            async with self._using(key) as store:
+                if store is None:
+                    continue
+                async with aclosing(
+                    store.stream_events(start_time, end_time, topic_pattern, page_size, prefetch)
+                ) as events:
+                    async for event in events:
+                        yield event
+
+    async def count_events(
+        self,
+        topic_pattern: str = "#",
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> int:
+        """
+        Count events matching criteria across partitions in parallel.
+
+        Args:
+            topic_pattern: Topic pattern
+            start_time: Optional start time
+            end_time: Optional end time
+
+        Returns:
+            Event count
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        counts = await self._fan_out(
+            self._keys_between(start_time, end_time),
+            lambda store: store.count_events(topic_pattern, start_time, end_time),
+        )
+        return sum(count for count in counts if count)
+
+    async def _partition_rows(self, partition: _Partition) -> int:
+        """Row count of a partition, counting a closed unknown one once."""
+        if partition.store is not None:
+            await partition.store.flush()
+            return partition.store.row_count
+        if partition.rows is None:
+            async with self._using(partition.key) as store:
+                partition.rows = store.row_count if store else 0
+        return partition.rows
+
+    async def _retention_loop(self) -> None:
+        """Run retention passes every retention_interval."""
+        while not self._closing:
+            await asyncio.sleep(self.retention_interval)
+            if self._closing:
+                return
+            try:
+                await self.enforce_retention()
+            except Exception as e:
+                logger.error(f"Failed to enforce retention: {e}", exc_info=True)
+
+    async def enforce_retention(self) -> int:
+        """
+        Drop expired partitions and the oldest partitions over max_events.
+
+        Returns:
+            Number of events dropped
+        """
+        if not self._initialized:
+            return 0
+
+        start = time.perf_counter()
+        dropped = 0
+        keys = sorted(self._partitions)
+
+        if self.retention_days:
+            cutoff = self._key_for(time.time() - self.retention_days * 86400)
+            # A partition is expired once all of it is older than the cutoff
+            while keys and keys[0] < cutoff:
+                dropped += await self._drop_partition(keys.pop(0))
+
+        if self.max_events > 0 and len(keys) > 1:
+            rows = {key: await self._partition_rows(self._partitions[key]) for key in keys}
+            total = sum(rows.values())
+            # Never drop the newest partition; writes are landing there
+            while len(keys) > 1 and total - rows[keys[0]] >= self.max_events:
+                total -= rows[keys[0]]
+                dropped += await self._drop_partition(keys.pop(0))
+
+        self._retention_time += time.perf_counter() - start
+        return dropped
+
+    async def _drop_partition(self, key: int) -> int:
+        """
+        Delete a partition file and its id index entries.
+
+        Args:
+            key: Partition key
+
+        Returns:
+            Number of events the partition held
+        """
+        async with self._open_lock:
+            partition = self._partitions.get(key)
+            if partition is None:
+                return 0
+            if partition.users:
+                # In use by a query or stream; try again next pass
+                return 0
+
+            if partition.store is not None:
+                await self._close_partition(partition)
+            rows = partition.rows or 0
+            del self._partitions[key]
+
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{partition.path}{suffix}").unlink(missing_ok=True)
+
+        self._schedule_purge([key])
+        self._stats["partitions_dropped"] += 1
+        self._stats["rows_dropped"] += rows
+        logger.info(f"Dropped partition {partition.path.name} ({rows} events)")
+        return rows
+
+    def _schedule_purge(self, keys: list[int]) -> None:
+        """Queue dropped partitions for id index cleanup."""
+        self._purge_keys.extend(keys)
+        if self._purge_task is None or self._purge_task.done():
+            self._purge_task = asyncio.create_task(self._purge_index())
+
+    async def _purge_index(self, batch_size: int = 10_000) -> None:
+        """Delete id index entries of dropped partitions, one batch per transaction."""
+        while self._purge_keys:
+            key = self._purge_keys[0]
+            # A partition recreated under the same key owns its entries again
+            if key in self._partitions:
+                self._purge_keys.pop(0)
+                continue
+            try:
+                removed = await self._index.drop_batch(key, batch_size)
+            except Exception as e:
+                logger.error(f"Failed to purge index for partition {key}: {e}", exc_info=True)
+                return
+            if removed < batch_size:
+                self._purge_keys.pop(0)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        partitions = {
+            partition.path.name: await self._partition_rows(partition)
+            for _, partition in sorted(self._partitions.items())
+        }
+        db_size = sum(p.stat().st_size for p in self.directory.glob("*.db") if p.exists())
+
+        return {
+            "directory": str(self.directory),
+            "partition_by": self.partition_by,
+            "db_size_bytes": db_size,
+            "db_size_mb": round(db_size / 1024 / 1024, 2),
+            "total_events": sum(partitions.values()),
+            "max_events": self.max_events,
+            "events_stored": self._stats["events_stored"],
+            "partitions": partitions,
+            "open_partitions": len(self._open),
+            "partitions_opened": self._stats["partitions_opened"],
+            "retention": {
+                "retention_days": self.retention_days,
+                "partitions_dropped": self._stats["partitions_dropped"],
+                "rows_dropped": self._stats["rows_dropped"],
+                "time_ms": self._retention_time * 1000,
+            },
+        }
+
+    async def close(self) -> None:
+        """Close every open partition and the id index."""
+        self._closing = True
+
+        if self._retention_task is not None:
+            self._retention_task.cancel()
+            try:
+                await self._retention_task
+            except asyncio.CancelledError:
+                pass
+            self._retention_task = None
+
+        if self._purge_task is not None:
+            # Unfinished purges resume on the next initialize
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+            self._purge_keys.clear()
+
+        if not self._initialized:
+            return
+
+        async with self._open_lock:
+            for partition in list(self._open.values()):
+                await self._close_partition(partition)
+
+        await self._index.close()
+        self._partitions.clear()
+        self._initialized = False
+        logger.info("PartitionedEventStore closed")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"PartitionedEventStore(directory={self.directory}, "
+            f"partition_by={self.partition_by}, partitions={len(self._partitions)})"
+        )
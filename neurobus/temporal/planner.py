@@ -0,0 +1,297 @@
+"""
+Topic query planning for the event store.
+
+Translates bus topic patterns (utils.patterns rules: "*" matches within
+one segment, "#" matches any remaining characters) into SQL filters that
+can use the topic index, with results identical to wildcard_match.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+
+from neurobus.utils.patterns import get_matcher, is_wildcard_pattern, wildcard_match
+
+# SQL function name registered on connections for exact residual matching
+TOPIC_MATCH_FUNCTION = "topic_match"
+
+_MAX_CODE_POINT = 0x10FFFF
+
+
+@dataclass(frozen=True, slots=True)
+class TopicFilter:
+    """
+    A planned topic filter.
+
+    Attributes:
+        clause: SQL boolean expression over the events.topic column
+        params: Parameters for the clause's placeholders
+        strategy: How the filter was planned (for stats and debugging)
+        time_ordered: The clause hides the topic index so that a query
+            ordered by timestamp scans idx_timestamp and stops at its limit
+    """
+
+    clause: str
+    params: tuple[str, ...]
+    strategy: str
+    time_ordered: bool = False
+
+
+MATCH_NONE = TopicFilter("0", (), "none")
+
+
+def register_topic_match(conn: sqlite3.Connection) -> None:
+    """
+    Register the topic_match(pattern, topic) SQL function on a connection.
+
+    Args:
+        conn: SQLite connection
+    """
+    conn.create_function(TOPIC_MATCH_FUNCTION, 2, wildcard_match, deterministic=True)
+
+
+def literal_prefix(pattern: str) -> str:
+    """
+    Get the literal text before the first wildcard.
+
+    Every topic matching the pattern starts with this prefix.
+
+    Args:
+        pattern: Topic pattern
+
+    Returns:
+        Prefix (the whole pattern if it has no wildcards)
+    """
+    for i, char in enumerate(pattern):
+        if char in "*#":
+            return pattern[:i]
+    return pattern
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """
+    Get the smallest string greater than every string starting with prefix.
+
+    SQLite compares TEXT with BINARY collation as UTF-8 bytes, which
+    orders like Python code points, so prefix <= topic < bound is an
+    index range covering exactly the topics with that prefix.
+
+    Args:
+        prefix: Non-empty prefix
+
+    Returns:
+        Exclusive upper bound, or None if there is none
+    """
+    while prefix:
+        last = ord(prefix[-1])
+        if last < _MAX_CODE_POINT:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+def _range(prefix: str, column: str = "topic") -> tuple[str, tuple[str, ...]]:
+    """Build a range clause for topics starting with prefix."""
+    upper = prefix_upper_bound(prefix)
+    if upper is None:
+        return f"{column} >= ?", (prefix,)
+    return f"{column} >= ? AND {column} < ?", (prefix, upper)
+
+
+class TopicQueryPlanner:
+    """
+    Plans SQL topic filters for bus topic patterns.
+
+    Strategies, cheapest first:
+    - all: "#" matches every topic
+    - literal: no wildcards; an idx_topic equality lookup
+    - prefix: "<literal>#" (e.g. "user.#"); an idx_topic range scan
+    - catalog: other wildcard patterns ("*.error", "user.*.created");
+      the pattern is matched against the distinct topics in the topics
+      catalog table (range-scanned on the literal prefix), and events are
+      fetched with an idx_topic IN lookup of the matching topics
+    - residual: the catalog matched more than max_in_topics topics;
+      events are range-scanned on the literal prefix (or fully scanned
+      without one) and filtered by the topic_match SQL function
+    - like: legacy SQL LIKE patterns (containing "%"), passed through
+
+    Ordered, limited queries (newest N events, replay pages) can instead
+    walk idx_timestamp and stop after N matches. For a pattern matching a
+    fraction s of the topics in a table of R rows, that reads about N / s
+    rows, against about s * R rows plus a sort through idx_topic. Given
+    order_limit and total_rows, plan() estimates s from the catalog (the
+    caller can pass the catalog size it keeps as total_topics) and
+    writes the clause with "+topic" (which SQLite will not use an index
+    for) when the timestamp walk is cheaper.
+
+    Every strategy returns exactly the topics wildcard_match accepts. The
+    only divergence from a plain prefix range is how regex "$" and "."
+    treat newlines, so range strategies fall back to topic_match for
+    topics that contain one.
+
+    Example:
+        >>> planner = TopicQueryPlanner()
+        >>> planner.plan(conn, "user.#").clause
+        '(topic >= ? AND topic < ?) AND (instr(topic, char(10)) = 0 OR topic_match(?, topic))'
+    """
+
+    def __init__(self, max_in_topics: int = 500) -> None:
+        """
+        Initialize planner.
+
+        Args:
+            max_in_topics: Most catalog topics to inline in an IN list
+        """
+        self.max_in_topics = max_in_topics
+
+    def plan(
+        self,
+        conn: sqlite3.Connection,
+        pattern: str,
+        order_limit: int | None = None,
+        total_rows: int = 0,
+        total_topics: int | None = None,
+    ) -> TopicFilter:
+        """
+        Plan the topic filter for a pattern.
+
+        Args:
+            conn: Connection with the topics catalog and topic_match
+            pattern: Bus topic pattern, or a legacy LIKE pattern with "%"
+            order_limit: Rows needed, for queries ordered by timestamp
+            total_rows: Approximate rows in the events table
+            total_topics: Rows in the topics catalog (counted if None)
+
+        Returns:
+            Topic filter
+        """
+        if "%" in pattern:
+            # Legacy SQL LIKE syntax, kept for existing callers
+            return TopicFilter("topic LIKE ?", (pattern.replace("*", "%"),), "like")
+
+        prefix = literal_prefix(pattern)
+        matched: list[str] | None = None
+
+        if not is_wildcard_pattern(pattern):
+            strategy = "literal"
+        elif pattern == prefix + "#":
+            strategy = "prefix" if prefix else "all"
+        else:
+            matched = self._match_catalog(conn, pattern, prefix)
+            if matched is None:
+                strategy = "residual"
+            elif not matched:
+                return MATCH_NONE
+            else:
+                strategy = "catalog"
+
+        time_ordered = (
+            order_limit is not None
+            and strategy != "all"
+            and self._prefer_time_order(
+                conn, strategy, prefix, matched, order_limit, total_rows, total_topics
+            )
+        )
+        column = "+topic" if time_ordered else "topic"
+        residual = f"{TOPIC_MATCH_FUNCTION}(?, {column})"
+
+        clause: str
+        params: tuple[str, ...]
+        if strategy == "literal":
+            # "$" also matches before a trailing newline
+            clause, params = f"{column} IN (?, ?)", (pattern, pattern + "\n")
+        elif matched:
+            # Catalog strategy
+            clause, params = f"{column} IN ({', '.join('?' * len(matched))})", tuple(matched)
+        else:
+            if strategy == "residual":
+                clause, params = residual, (pattern,)
+            else:
+                # "." does not cross newlines, so only those topics need the regex
+                clause = f"(instr({column}, char(10)) = 0 OR {residual})"
+                params = (pattern,)
+            if prefix:
+                range_clause, range_params = _range(prefix, column)
+                clause, params = f"({range_clause}) AND {clause}", (*range_params, *params)
+
+        return TopicFilter(clause, params, strategy, time_ordered)
+
+    def _prefer_time_order(
+        self,
+        conn: sqlite3.Connection,
+        strategy: str,
+        prefix: str,
+        matched: list[str] | None,
+        order_limit: int,
+        total_rows: int,
+        total_topics: int | None,
+    ) -> bool:
+        """
+        Estimate whether walking idx_timestamp beats the topic index.
+
+        Args:
+            conn: SQLite connection
+            strategy: Planned strategy
+            prefix: Literal prefix of the pattern
+            matched: Catalog topics matched (catalog strategy)
+            order_limit: Rows the ordered query needs
+            total_rows: Approximate rows in the events table
+            total_topics: Rows in the topics catalog (counted if None)
+
+        Returns:
+            True if the query should scan in timestamp order
+        """
+        catalog_size = total_topics
+        if catalog_size is None:
+            catalog_size = int(conn.execute("SELECT COUNT(*) FROM topics").fetchone()[0])
+        if not catalog_size:
+            return False
+
+        topic_count: int
+        if strategy == "literal":
+            topic_count = 1
+        elif matched:
+            # Catalog strategy
+            topic_count = len(matched)
+        elif strategy == "prefix":
+            clause, params = _range(prefix)
+            topic_count = conn.execute(
+                f"SELECT COUNT(*) FROM topics WHERE {clause}", params
+            ).fetchone()[0]
+        else:
+            # Residual: more than max_in_topics topics matched
+            topic_count = self.max_in_topics + 1
+
+        # Assume rows are spread evenly over topics
+        selectivity = min(topic_count / catalog_size, 1.0)
+        if not selectivity:
+            return False
+        return order_limit / selectivity < selectivity * total_rows
+
+    def _match_catalog(
+        self, conn: sqlite3.Connection, pattern: str, prefix: str
+    ) -> list[str] | None:
+        """
+        Match the pattern against the distinct topics catalog.
+
+        Args:
+            conn: SQLite connection
+            pattern: Wildcard pattern
+            prefix: Its literal prefix
+
+        Returns:
+            Matching topics, or None if there are more than max_in_topics
+        """
+        if prefix:
+            clause, params = _range(prefix)
+            cursor = conn.execute(f"SELECT topic FROM topics WHERE {clause}", params)
+        else:
+            cursor = conn.execute("SELECT topic FROM topics")
+
+        matcher = get_matcher(pattern)
+        topics = []
+        for (topic,) in cursor:
+            if matcher(topic):
+                topics.append(topic)
+                if len(topics) > self.max_in_topics:
+                    return None
+        return topics
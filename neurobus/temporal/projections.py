@@ -0,0 +1,50 @@
+"""
+Projections: event-sourced state rebuilt from the event history.
+
+A projection folds the events of a topic pattern, in chronological
+order, into a state with a reducer. TemporalEngine.state_at(name, T)
+rebuilds the state as of any point in time. While replaying it saves a
+checkpoint of the state every checkpoint_interval events. Later calls
+start from the nearest checkpoint at or before T and only replay the
+events after it.
+"""
+
+import copy
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from neurobus.core.event import Event
+
+
+@dataclass(slots=True)
+class Projection:
+    """
+    A registered projection.
+
+    The state must be serializable with serialize_compact (dicts, lists,
+    scalars, UUIDs and datetimes) so that it can be checkpointed. Tuples
+    come back from checkpoints as lists.
+
+    Attributes:
+        name: Projection name
+        reducer: Function (state, event) -> new state; may mutate and
+            return the state it is given, and may be a coroutine function
+        topic: Topic pattern of the events it folds
+        initial: Initial state, deep-copied for each rebuild
+        checkpoint_interval: Events folded between checkpoints (0 = never
+            checkpoint)
+        version: Bump when the reducer changes; checkpoints of other
+            versions are ignored
+    """
+
+    name: str
+    reducer: Callable[[Any, Event], Any]
+    topic: str = "#"
+    initial: Any = None
+    checkpoint_interval: int = 1000
+    version: int = 1
+
+    def initial_state(self) -> Any:
+        """A fresh copy of the initial state."""
+        return copy.deepcopy(self.initial)
@@ -0,0 +1,492 @@
+"""
+Row formats for the event store's events table.
+
+A row format owns the table schema and converts events to rows and
+back. "text" is the original schema; "compact" stores ids as 16-byte
+blobs and each event's payload as one packed (optionally compressed)
+record.
+"""
+
+import logging
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from neurobus.core.event import Event
+from neurobus.utils.serialization import (
+    deserialize,
+    deserialize_compact,
+    serialize,
+    serialize_compact,
+)
+
+logger = logging.getLogger(__name__)
+
+ROW_FORMATS = ("text", "compact")
+COMPRESSION_CODECS = ("none", "zlib", "zstd")
+
+# Compact record header: codec byte, then for compressed records the
+# dictionary id (0 = none) before the compressed payload
+_RAW, _ZLIB, _ZSTD = 0, 1, 2
+_CODEC_IDS = {"zlib": _ZLIB, "zstd": _ZSTD}
+_COMPRESSED_HEADER = struct.Struct("<BI")
+
+# zlib preset dictionaries can be at most one window long
+_ZLIB_MAX_DICTIONARY = 32 * 1024
+_ZLIB_MEM_LEVEL = 4
+
+# Children lookups for causal chain queries. Only events with a parent are
+# indexed, and including id lets descendant walks stay in the index.
+_PARENT_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_parent_id ON {table}(parent_id, id) "
+    "WHERE parent_id IS NOT NULL"
+)
+
+
+def _zstd() -> Any:
+    """Import the optional zstandard module."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard not installed. Install with: pip install zstandard") from None
+    return zstandard
+
+
+class RowFormat:
+    """
+    Schema and row conversion for one events table layout.
+
+    Every format selects the timestamp as its fourth column (index 3)
+    and the topic as its second, which keyset pagination and the topic
+    catalog rely on.
+    """
+
+    name = ""
+    columns = ""
+    insert_columns = ""
+
+    @property
+    def insert_sql(self) -> str:
+        """INSERT statement for rows returned by encode()."""
+        placeholders = ", ".join("?" * len(self.insert_columns.split(",")))
+        return f"INSERT INTO {{table}} ({self.insert_columns}) VALUES ({placeholders})"
+
+    def create_table(self, conn: sqlite3.Connection, table: str = "events") -> None:
+        """Create the events table (without secondary indexes)."""
+        raise NotImplementedError
+
+    def create_indexes(self, conn: sqlite3.Connection, table: str = "events") -> None:
+        """Create the table's secondary indexes."""
+        raise NotImplementedError
+
+    def open(self, conn: sqlite3.Connection) -> None:
+        """Load format state from the database (writer thread)."""
+
+    def encode(self, event: Event, created_at: float) -> tuple[Any, ...]:
+        """Serialize an event into a row in insert_columns order."""
+        raise NotImplementedError
+
+    def decode(self, row: tuple[Any, ...]) -> Event:
+        """Build an event from a row in columns order."""
+        raise NotImplementedError
+
+    def id_param(self, event_id: UUID) -> Any:
+        """SQL parameter for comparing against the id column."""
+        raise NotImplementedError
+
+    def after_insert(self, conn: sqlite3.Connection) -> None:
+        """Hook run by the writer after each committed insert (writer thread)."""
+
+    def get_stats(self) -> dict[str, Any]:
+        """Format-specific statistics."""
+        return {"row_format": self.name}
+
+
+class TextRowFormat(RowFormat):
+    """
+    The original layout: TEXT UUIDs and three msgpack blobs per event.
+
+    Columns: id TEXT PRIMARY KEY, topic, data, timestamp, context,
+    metadata, parent_id TEXT, created_at.
+    """
+
+    name = "text"
+    columns = "id, topic, data, timestamp, context, metadata, parent_id"
+    insert_columns = "id, topic, data, timestamp, context, metadata, parent_id, created_at"
+
+    def create_table(self, conn: sqlite3.Connection, table: str = "events") -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id TEXT PRIMARY KEY,
+                topic TEXT NOT NULL,
+                data BLOB NOT NULL,
+                timestamp REAL NOT NULL,
+                context BLOB,
+                metadata BLOB,
+                parent_id TEXT,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+
+    def create_indexes(self, conn: sqlite3.Connection, table: str = "events") -> None:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_topic ON {table}(topic)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_timestamp ON {table}(timestamp)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_created_at ON {table}(created_at)")
+        conn.execute(_PARENT_INDEX_SQL.format(table=table))
+
+    def encode(self, event: Event, created_at: float) -> tuple[Any, ...]:
+        return (
+            str(event.id),
+            event.topic,
+            serialize(event.data),
+            event.timestamp.timestamp(),
+            serialize(event.context) if event.context else None,
+            serialize(event.metadata) if event.metadata else None,
+            str(event.parent_id) if event.parent_id else None,
+            created_at,
+        )
+
+    def decode(self, row: tuple[Any, ...]) -> Event:
+        event_id, topic, data_bytes, timestamp, context_bytes, metadata_bytes, parent_id = row
+        return Event(
+            id=UUID(event_id),
+            topic=topic,
+            data=deserialize(data_bytes),
+            timestamp=datetime.fromtimestamp(timestamp),
+            context=deserialize(context_bytes) if context_bytes else {},
+            metadata=deserialize(metadata_bytes) if metadata_bytes else {},
+            parent_id=UUID(parent_id) if parent_id else None,
+        )
+
+    def id_param(self, event_id: UUID) -> Any:
+        return str(event_id)
+
+
+class CompactRowFormat(RowFormat):
+    """
+    Compact layout: blob ids and one packed record per event.
+
+    Columns: id BLOB (16 bytes, unique index idx_id), topic, record,
+    timestamp, parent_id BLOB. The table keeps its integer rowid as the
+    primary key, so the id index holds 16-byte keys instead of a 36-char
+    TEXT primary key, and there is no created_at column or index.
+
+    record is [data, context, metadata] packed with serialize_compact
+    (msgpack ext types for UUID and datetime) behind a one-byte codec
+    header. With compression, records of at least compression_threshold
+    bytes are compressed with zlib or zstd when that makes them smaller.
+    The first training_samples such records train a dictionary (zstd's
+    trainer, or for zlib a preset dictionary of recent sample bytes),
+    stored in the dictionaries table; later records are compressed with
+    it, which is what makes compressing small, similar payloads pay off.
+    Records name the dictionary they need, so decoding works whatever
+    compression the store is configured with now.
+    """
+
+    name = "compact"
+    columns = "id, topic, record, timestamp, parent_id"
+    insert_columns = "id, topic, record, timestamp, parent_id"
+
+    def __init__(
+        self,
+        compression: str = "none",
+        compression_level: int | None = None,
+        compression_threshold: int = 64,
+        dictionary_size: int = 16 * 1024,
+        training_samples: int = 1000,
+    ) -> None:
+        """
+        Initialize compact format.
+
+        Args:
+            compression: "none", "zlib" or "zstd"
+            compression_level: Codec level (None = codec default)
+            compression_threshold: Smallest packed record to compress
+            dictionary_size: Target trained dictionary size in bytes
+            training_samples: Records collected before training (0 = no
+                dictionary)
+
+        Raises:
+            ValueError: If compression is unknown
+            ImportError: If compression is "zstd" and zstandard is missing
+        """
+        if compression not in COMPRESSION_CODECS:
+            raise ValueError(
+                f"Unknown compression: {compression}. Must be one of: {list(COMPRESSION_CODECS)}"
+            )
+        if compression == "zstd":
+            _zstd()
+
+        self.compression = compression
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        self.dictionary_size = dictionary_size
+        self.training_samples = training_samples
+
+        # Dictionaries by id; written by the writer, read by every thread
+        self._dictionaries: dict[int, bytes] = {}
+        self._dictionary_id = 0
+        # zstd (de)compressors and primed zlib compressors are not
+        # thread-safe: one per thread and dictionary
+        self._local = threading.local()
+        self._samples: list[bytes] = []
+
+        self._stats = {
+            "records_compressed": 0,
+            "bytes_packed": 0,
+            "bytes_stored": 0,
+        }
+
+    def create_table(self, conn: sqlite3.Connection, table: str = "events") -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id BLOB NOT NULL,
+                topic TEXT NOT NULL,
+                record BLOB NOT NULL,
+                timestamp REAL NOT NULL,
+                parent_id BLOB
+            )
+            """
+        )
+
+    def create_indexes(self, conn: sqlite3.Connection, table: str = "events") -> None:
+        conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS idx_id ON {table}(id)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_topic ON {table}(topic)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_timestamp ON {table}(timestamp)")
+        conn.execute(_PARENT_INDEX_SQL.format(table=table))
+
+    def open(self, conn: sqlite3.Connection) -> None:
+        """Create the dictionaries table and load every dictionary."""
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dictionaries (
+                id INTEGER PRIMARY KEY,
+                codec TEXT NOT NULL,
+                data BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        for dictionary_id, codec, data in conn.execute(
+            "SELECT id, codec, data FROM dictionaries ORDER BY id"
+        ):
+            self._dictionaries[dictionary_id] = data
+            if codec == self.compression:
+                self._dictionary_id = dictionary_id
+
+    def _zstd_codec(self, kind: str, dictionary_id: int) -> Any:
+        """This thread's zstd compressor or decompressor for a dictionary."""
+        codecs = getattr(self._local, kind, None)
+        if codecs is None:
+            codecs = {}
+            setattr(self._local, kind, codecs)
+        codec = codecs.get(dictionary_id)
+        if codec is None:
+            zstandard = _zstd()
+            dict_data = (
+                zstandard.ZstdCompressionDict(self._dictionaries[dictionary_id])
+                if dictionary_id
+                else None
+            )
+            if kind == "compressors":
+                codec = zstandard.ZstdCompressor(
+                    level=self.compression_level or 3, dict_data=dict_data
+                )
+            else:
+                codec = zstandard.ZstdDecompressor(dict_data=dict_data)
+            codecs[dictionary_id] = codec
+        return codec
+
+    def _zlib_compressor(self, dictionary_id: int, level: int) -> Any:
+        """
+        This thread's zlib compressor primed with a dictionary.
+
+        Records are small, so loading the dictionary would dominate;
+        callers copy() the primed state instead. The window is the
+        smallest that holds the dictionary, which keeps copies cheap.
+        """
+        compressors = getattr(self._local, "zlib", None)
+        if compressors is None:
+            compressors = self._local.zlib = {}
+        compressor = compressors.get(dictionary_id)
+        if compressor is None:
+            zdict = self._dictionaries[dictionary_id]
+            wbits = min(max(len(zdict) - 1, 511).bit_length(), 15)
+            compressor = zlib.compressobj(level, zlib.DEFLATED, wbits, _ZLIB_MEM_LEVEL, zdict=zdict)
+            compressors[dictionary_id] = compressor
+        return compressor
+
+    def encode(self, event: Event, created_at: float) -> tuple[Any, ...]:
+        record = serialize_compact([event.data, event.context or None, event.metadata or None])
+        return (
+            event.id.bytes,
+            event.topic,
+            self._compress(record),
+            event.timestamp.timestamp(),
+            event.parent_id.bytes if event.parent_id else None,
+        )
+
+    def decode(self, row: tuple[Any, ...]) -> Event:
+        event_id, topic, record, timestamp, parent_id = row
+        data, context, metadata = deserialize_compact(self._decompress(record))
+        return Event(
+            id=UUID(bytes=event_id),
+            topic=topic,
+            data=data,
+            timestamp=datetime.fromtimestamp(timestamp),
+            context=context or {},
+            metadata=metadata or {},
+            parent_id=UUID(bytes=parent_id) if parent_id else None,
+        )
+
+    def id_param(self, event_id: UUID) -> Any:
+        return event_id.bytes
+
+    def _compress(self, record: bytes) -> bytes:
+        """Add the codec header, compressing the record if it pays off."""
+        self._stats["bytes_packed"] += len(record)
+        if self.compression == "none" or len(record) < self.compression_threshold:
+            blob = b"\x00" + record
+        else:
+            if self.training_samples and not self._dictionary_id:
+                self._samples.append(record)
+
+            dictionary_id = self._dictionary_id
+            if self.compression == "zlib":
+                level = self.compression_level if self.compression_level is not None else 6
+                if dictionary_id:
+                    compressor = self._zlib_compressor(dictionary_id, level).copy()
+                    payload = compressor.compress(record) + compressor.flush()
+                else:
+                    payload = zlib.compress(record, level)
+            else:
+                payload = self._zstd_codec("compressors", dictionary_id).compress(record)
+
+            if len(payload) + _COMPRESSED_HEADER.size < len(record) + 1:
+                codec = _CODEC_IDS[self.compression]
+                blob = _COMPRESSED_HEADER.pack(codec, dictionary_id) + payload
+                self._stats["records_compressed"] += 1
+            else:
+                blob = b"\x00" + record
+
+        self._stats["bytes_stored"] += len(blob)
+        return blob
+
+    def _decompress(self, blob: bytes) -> bytes | memoryview:
+        """Strip the codec header and decompress (any thread)."""
+        codec = blob[0]
+        if codec == _RAW:
+            return memoryview(blob)[1:]
+
+        _, dictionary_id = _COMPRESSED_HEADER.unpack_from(blob)
+        payload = memoryview(blob)[_COMPRESSED_HEADER.size :]
+        if codec == _ZLIB:
+            if not dictionary_id:
+                return zlib.decompress(payload)
+            decompressor = zlib.decompressobj(zdict=self._dictionaries[dictionary_id])
+            return decompressor.decompress(payload) + decompressor.flush()
+
+        decompressed: bytes = self._zstd_codec("decompressors", dictionary_id).decompress(payload)
+        return decompressed
+
+    def after_insert(self, conn: sqlite3.Connection) -> None:
+        """Train and store a dictionary once enough samples are collected."""
+        if (
+            not self.training_samples
+            or self._dictionary_id
+            or len(self._samples) < self.training_samples
+        ):
+            return
+
+        samples, self._samples = self._samples, []
+        try:
+            data = self._train(samples)
+            dictionary_id = conn.execute(
+                "INSERT INTO dictionaries (codec, data, created_at) VALUES (?, ?, ?)",
+                (self.compression, data, time.time()),
+            ).lastrowid
+            assert dictionary_id is not None
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            # Keep compressing without a dictionary
+            self.training_samples = 0
+            logger.warning(f"Failed to train {self.compression} dictionary: {e}")
+            return
+
+        # Loaded before use, so no record names a dictionary readers lack
+        self._dictionaries[dictionary_id] = data
+        self._dictionary_id = dictionary_id
+        logger.info(
+            f"Trained {self.compression} dictionary {dictionary_id} "
+            f"({len(data)} bytes from {len(samples)} records)"
+        )
+
+    def _train(self, samples: list[bytes]) -> bytes:
+        """Build a dictionary from sample records."""
+        if self.compression == "zstd":
+            trained: bytes = _zstd().train_dictionary(self.dictionary_size, samples).as_bytes()
+            return trained
+        # zlib matches against the end of its preset dictionary most cheaply,
+        # so the most recent samples go last
+        size = min(self.dictionary_size, _ZLIB_MAX_DICTIONARY)
+        return b"".join(samples)[-size:]
+
+    def get_stats(self) -> dict[str, Any]:
+        packed = self._stats["bytes_packed"]
+        return {
+            "row_format": self.name,
+            "compression": self.compression,
+            "dictionary_id": self._dictionary_id or None,
+            "records_compressed": self._stats["records_compressed"],
+            "compression_ratio": (self._stats["bytes_stored"] / packed if packed else 1.0),
+        }
+
+
+def make_row_format(row_format: str, compression: str = "none", **options: Any) -> RowFormat:
+    """
+    Create a row format by name.
+
+    Args:
+        row_format: "text" or "compact"
+        compression: Compact-format compression codec
+        **options: Further CompactRowFormat options
+
+    Returns:
+        Row format
+
+    Raises:
+        ValueError: If row_format is unknown, or compression is set for "text"
+    """
+    if row_format == "text":
+        if compression != "none":
+            raise ValueError("Compression requires row_format='compact'")
+        return TextRowFormat()
+    if row_format == "compact":
+        return CompactRowFormat(compression, **options)
+    raise ValueError(f"Unknown row format: {row_format}. Must be one of: {list(ROW_FORMATS)}")
+
+
+def detect_row_format(conn: sqlite3.Connection, table: str = "events") -> str | None:
+    """
+    Detect the row format of an existing events table.
+
+    Args:
+        conn: SQLite connection
+        table: Table name
+
+    Returns:
+        "text", "compact", or None if the table does not exist
+    """
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if not columns:
+        return None
+    return "compact" if "record" in columns else "text"
@@ -0,0 +1,1199 @@
+"""
+Append-only segmented log event store.
+
+Stores events as length-prefixed records in append-only segment files,
+with a sparse time index per segment. Writes are sequential appends and
+replays read the segments through mmap, so both avoid SQLite's B-tree
+and page overhead for append-and-replay workloads.
+"""
+
+import asyncio
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, TypeVar
+from uuid import UUID
+
+from neurobus.core.event import Event
+from neurobus.exceptions.temporal import QueryError, StoreError
+from neurobus.utils.patterns import TopicMatcher, get_matcher
+from neurobus.utils.serialization import deserialize, serialize
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DURABILITY_MODES = ("flush", "fsync")
+
+# Record: length, crc32 | timestamp, event id, topic length | topic | msgpack body.
+# length covers the whole record; the crc covers everything after it.
+_PREFIX = struct.Struct("<II")
+_FIELDS = struct.Struct("<d16sI")
+_HEADER = struct.Struct("<IId16sI")
+
+# Sparse index entry: block start, block end, min and max timestamp, records
+_INDEX_ENTRY = struct.Struct("<QQddI")
+
+_LOG_SUFFIX = ".log"
+_INDEX_SUFFIX = ".idx"
+
+# A block tuple, as stored in the index: (start, end, min_ts, max_ts, count)
+_Block = tuple[int, int, float, float, int]
+
+# A record found by a scan: (topic, body start, record end, timestamp, event id)
+_Match = tuple[str, int, int, float, bytes]
+
+
+class _Segment:
+    """One segment file, its sparse index and, once read, its mapping."""
+
+    __slots__ = (
+        "base",
+        "path",
+        "blocks",
+        "indexed",
+        "block_open",
+        "size",
+        "count",
+        "min_ts",
+        "max_ts",
+        "mapped",
+        "users",
+        "dropped",
+    )
+
+    def __init__(self, base: int, path: Path) -> None:
+        self.base = base  # Sequence number of the first record
+        self.path = path
+        self.blocks: list[_Block] = []
+        self.indexed = 0  # Blocks already written to the index file
+        self.block_open = False  # Appends may still extend blocks[-1]
+        self.size = 0  # Bytes of complete, flushed records
+        self.count = 0
+        self.min_ts = float("inf")
+        self.max_ts = float("-inf")
+        self.mapped: mmap.mmap | None = None
+        self.users = 0  # Pinned by queries; never unlinked while > 0
+        self.dropped = False
+
+    @property
+    def index_path(self) -> Path:
+        """Path of the segment's sparse index file."""
+        return self.path.with_suffix(_INDEX_SUFFIX)
+
+
+def _topic_matcher(pattern: str) -> TopicMatcher | None:
+    """
+    Compile a topic pattern into a matcher.
+
+    Args:
+        pattern: Bus topic pattern, or a legacy LIKE pattern with "%"
+
+    Returns:
+        Matcher, or None if every topic matches
+    """
+    if pattern == "#":
+        return None
+    if "%" in pattern:
+        # Legacy SQL LIKE syntax, matched like EventStore (case-insensitive)
+        regex = "".join(
+            ".*" if char == "%" else "." if char == "_" else re.escape(char)
+            for char in pattern.replace("*", "%")
+        )
+        compiled = re.compile(regex, re.IGNORECASE | re.DOTALL)
+        return lambda topic: compiled.fullmatch(topic) is not None
+    return get_matcher(pattern)
+
+
+class SegmentedEventStore:
+    """
+    Event store built on an append-only log of segment files.
+
+    Each event is appended as one record to the active segment,
+    NNNNNNNNNNNNNNNNNNNN.log (named after the sequence number of its
+    first record). The active segment is rolled once it reaches
+    segment_bytes or spans segment_seconds of event time. Every
+    index_interval bytes of records form a block whose offsets, time
+    bounds and record count go into the segment's sparse .idx file, so
+    time-range queries skip blocks (and whole segments) outside the
+    range and unfiltered counts never read records.
+
+    Records carry their timestamp, id and topic in a fixed header ahead
+    of the msgpack body. Reads map segments with mmap and parse headers
+    and bodies straight from the mapping, so time and topic filters,
+    counts and get_event never decode a body, and replays decode only
+    the events they return.
+
+    Appends run on one writer thread, in order, and are flushed to the
+    OS (durability "flush") or fsynced ("fsync") before store_events
+    returns. Queries run on a pool of reader threads and see every
+    append that returned before they started. On initialize, a record
+    torn by a crash at the end of a segment is detected by its crc and
+    truncated, and index blocks that were not written are rebuilt.
+
+    Results follow log (append) order, which is timestamp order for
+    events stored as they are published: replays and streams are
+    oldest-appended first, query_by_topic is newest-appended first.
+    get_event and topic-filtered queries scan records, so this store
+    suits append-and-replay workloads rather than selective lookups.
+
+    Retention deletes whole sealed segments: those entirely older than
+    retention_days, then the oldest ones while the rest still hold at
+    least max_events records. The active segment is never deleted.
+
+    Example:
+        >>> store = SegmentedEventStore("events/")
+        >>> await store.initialize()
+        >>> await store.store_events(events)
+        >>> async for event in store.stream_events(start_time=yesterday):
+        ...     process(event)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = "neurobus_log",
+        max_events: int = 0,
+        retention_days: float | None = None,
+        retention_interval: float = 60.0,
+        segment_bytes: int = 64 * 1024 * 1024,
+        segment_seconds: float = 86400.0,
+        index_interval: int = 4096,
+        durability: str = "flush",
+        read_pool_size: int = 2,
+    ) -> None:
+        """
+        Initialize segmented event store.
+
+        Args:
+            directory: Directory holding segment and index files
+            max_events: Keep at least this many events when deleting old
+                segments (0 = no count limit)
+            retention_days: Delete segments older than this (None = keep)
+            retention_interval: Seconds between background retention passes
+            segment_bytes: Roll the active segment at this size
+            segment_seconds: Roll the active segment once it spans this
+                much event time
+            index_interval: Bytes of records per sparse index block
+            durability: "flush" or "fsync" after each append
+            read_pool_size: Reader threads
+
+        Raises:
+            ValueError: If durability is unknown
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"Unknown durability: {durability}. Must be one of: {list(DURABILITY_MODES)}"
+            )
+
+        self.directory = Path(directory)
+        self.max_events = max_events
+        self.retention_days = retention_days
+        self.retention_interval = retention_interval
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.index_interval = index_interval
+        self.durability = durability
+        self.read_pool_size = read_pool_size
+
+        self._segments: list[_Segment] = []
+        self._file: BinaryIO | None = None
+        self._index_file: BinaryIO | None = None
+        self._map_lock = threading.Lock()
+        self._initialized = False
+        self._closing = False
+        self._retention_task: asyncio.Task[None] | None = None
+
+        # I/O threads: one writer owning the active segment, a pool of readers
+        self._writer: ThreadPoolExecutor | None = None
+        self._readers: ThreadPoolExecutor | None = None
+        self._last_write: asyncio.Future[Any] | None = None
+
+        # Statistics
+        self._stats = {
+            "events_stored": 0,
+            "events_queried": 0,
+            "events_replayed": 0,
+            "segments_rolled": 0,
+            "segments_dropped": 0,
+            "rows_dropped": 0,
+            "records_truncated": 0,
+        }
+        self._retention_time = 0.0
+
+        logger.info(f"SegmentedEventStore created with directory={self.directory}")
+
+    async def initialize(self) -> None:
+        """Load segments, recover their tails and open the active segment."""
+        if self._initialized:
+            return
+
+        try:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neurobus-log-w")
+            self._readers = ThreadPoolExecutor(
+                max_workers=self.read_pool_size, thread_name_prefix="neurobus-log-r"
+            )
+            await self._write(self._load_sync)
+
+            self._initialized = True
+            self._closing = False
+
+            if self.max_events > 0 or self.retention_days:
+                self._retention_task = asyncio.create_task(self._retention_loop())
+
+            logger.info(
+                f"SegmentedEventStore initialized ({len(self._segments)} segments, "
+                f"{self.row_count} events)"
+            )
+
+        except Exception as e:
+            raise StoreError("initialize", str(e)) from e
+
+    def _load_sync(self) -> None:
+        """Load every segment and its index, then open the last one (writer thread)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._segments = []
+        for path in sorted(self.directory.glob(f"*{_LOG_SUFFIX}")):
+            try:
+                base = int(path.stem)
+            except ValueError:
+                logger.warning(f"Ignoring unrecognized segment file: {path.name}")
+                continue
+            self._segments.append(self._load_segment(_Segment(base, path)))
+
+        if not self._segments:
+            self._segments.append(_Segment(0, self._segment_path(0)))
+        self._open_active()
+
+    def _load_segment(self, segment: _Segment) -> _Segment:
+        """
+        Load a segment's index and rebuild what the index is missing.
+
+        Index entries past the end of the data are discarded, records
+        after the last indexed block are re-indexed, and a torn or
+        corrupt record (and everything after it) is truncated.
+
+        Args:
+            segment: Segment with base and path set
+
+        Returns:
+            The loaded segment
+        """
+        file_size = segment.path.stat().st_size
+
+        raw = segment.index_path.read_bytes() if segment.index_path.exists() else b""
+        entries: list[_Block] = []
+        end = 0
+        for entry in _INDEX_ENTRY.iter_unpack(raw[: len(raw) - len(raw) % _INDEX_ENTRY.size]):
+            # Stop at a torn entry or one for data that was never flushed
+            if entry[0] != end or entry[1] > file_size:
+                break
+            entries.append(entry)
+            end = entry[1]
+        rewrite = len(entries) * _INDEX_ENTRY.size != len(raw)
+
+        for block in entries:
+            self._add_block_stats(segment, block)
+        segment.blocks = entries
+        segment.indexed = len(entries)
+        segment.size = entries[-1][1] if entries else 0
+
+        if segment.size < file_size:
+            self._recover_tail(segment, file_size)
+
+        # Everything loaded is indexed and closed; appends start a new block
+        pending = segment.blocks[segment.indexed :]
+        with open(segment.index_path, "wb" if rewrite else "ab") as index_file:
+            blocks = segment.blocks if rewrite else pending
+            index_file.write(b"".join(_INDEX_ENTRY.pack(*block) for block in blocks))
+        segment.indexed = len(segment.blocks)
+        segment.block_open = False
+        return segment
+
+    def _recover_tail(self, segment: _Segment, file_size: int) -> None:
+        """Index records past the indexed blocks, truncating a torn tail (writer thread)."""
+        with open(segment.path, "r+b") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    pos = segment.size
+                    while pos + _HEADER.size <= file_size:
+                        length, crc, ts, _, topic_len = _HEADER.unpack_from(view, pos)
+                        if (
+                            length < _HEADER.size + topic_len
+                            or pos + length > file_size
+                            or zlib.crc32(view[pos + _PREFIX.size : pos + length]) != crc
+                        ):
+                            break
+                        self._track(segment, pos, length, ts)
+                        pos += length
+                        segment.size = pos
+
+            if segment.size < file_size:
+                logger.warning(
+                    f"Truncating {file_size - segment.size} bytes of incomplete records "
+                    f"from {segment.path.name}"
+                )
+                file.truncate(segment.size)
+                self._stats["records_truncated"] += 1
+
+    def _segment_path(self, base: int) -> Path:
+        """Segment file path for a base sequence number."""
+        return self.directory / f"{base:020d}{_LOG_SUFFIX}"
+
+    def _open_active(self) -> None:
+        """Open the last segment's files for appending (writer thread)."""
+        active = self._segments[-1]
+        # Kept open for appends until the segment rolls or the store closes
+        self._file = open(active.path, "ab")
+        self._index_file = open(active.index_path, "ab")
+
+    async def _write(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func on the writer thread.
+
+        Args:
+            func: Function using the active segment's files
+            *args: Arguments for func
+
+        Returns:
+            func's result
+        """
+        future = asyncio.get_running_loop().run_in_executor(self._writer, func, *args)
+        self._last_write = future
+        return await future
+
+    async def _read(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func on a reader thread after the writes submitted before it.
+
+        Args:
+            func: Function reading pinned segments
+            *args: Arguments for func
+
+        Returns:
+            func's result
+        """
+        await self._sync_writes()
+        return await asyncio.get_running_loop().run_in_executor(self._readers, func, *args)
+
+    async def _sync_writes(self) -> None:
+        """Wait for appends already submitted."""
+        last_write = self._last_write
+        if last_write is not None and not last_write.done():
+            # The writer is FIFO, so the last write finishing implies all did
+            await asyncio.wait([last_write])
+
+    def _pin(self) -> list[_Segment]:
+        """Snapshot the segments and keep them from being unlinked until _unpin."""
+        segments = list(self._segments)
+        for segment in segments:
+            segment.users += 1
+        return segments
+
+    def _unpin(self, segments: list[_Segment]) -> None:
+        """Release pinned segments, unlinking dropped ones nobody uses any more."""
+        for segment in segments:
+            segment.users -= 1
+            if segment.dropped and not segment.users:
+                # If closed meanwhile, the next retention pass drops it again
+                writer = self._writer
+                if writer is None:
+                    continue
+                try:
+                    writer.submit(self._unlink_sync, segment)
+                except RuntimeError:
+                    pass
+
+    async def store_event(self, event: Event) -> None:
+        """
+        Append an event to the log.
+
+        Args:
+            event: Event to store
+
+        Raises:
+            StoreError: If storage fails
+        """
+        await self.store_events([event])
+
+    async def store_events(self, events: list[Event]) -> None:
+        """
+        Append a batch of events with a single write.
+
+        Args:
+            events: Events to store
+
+        Raises:
+            StoreError: If storage fails
+        """
+        if not events:
+            return
+
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            await self._write(self._append_sync, events)
+        except StoreError:
+            raise
+        except Exception as e:
+            raise StoreError("store", str(e)) from e
+        self._stats["events_stored"] += len(events)
+
+    @staticmethod
+    def _encode(event: Event) -> tuple[bytes, float]:
+        """
+        Serialize an event into a log record.
+
+        Args:
+            event: Event to serialize
+
+        Returns:
+            Record bytes and the event's Unix timestamp
+        """
+        timestamp = event.timestamp.timestamp()
+        topic = event.topic.encode()
+        body = serialize(
+            [
+                event.data,
+                event.context or None,
+                event.metadata or None,
+                event.parent_id.bytes if event.parent_id else None,
+            ]
+        )
+        tail = _FIELDS.pack(timestamp, event.id.bytes, len(topic)) + topic + body
+        return _PREFIX.pack(_PREFIX.size + len(tail), zlib.crc32(tail)) + tail, timestamp
+
+    def _append_sync(self, events: list[Event]) -> None:
+        """Encode and append events, rolling segments as needed (writer thread)."""
+        buffer = bytearray()
+        records: list[tuple[int, float]] = []
+        active = self._segments[-1]
+        first_ts = active.min_ts
+        for event in events:
+            record, timestamp = self._encode(event)
+            if (active.count or records) and (
+                active.size + len(buffer) + len(record) > self.segment_bytes
+                or timestamp - first_ts >= self.segment_seconds
+            ):
+                self._commit_sync(buffer, records)
+                buffer.clear()
+                records.clear()
+                self._roll_sync()
+                active = self._segments[-1]
+                first_ts = float("inf")
+            buffer += record
+            records.append((len(record), timestamp))
+            first_ts = min(first_ts, timestamp)
+        self._commit_sync(buffer, records)
+
+    def _commit_sync(self, buffer: bytearray, records: list[tuple[int, float]]) -> None:
+        """
+        Write records to the active segment, then index them (writer thread).
+
+        The data is flushed before the blocks and size readers rely on are
+        updated, so readers only ever see complete records.
+
+        Args:
+            buffer: Encoded records
+            records: (length, timestamp) of each record in the buffer
+
+        Raises:
+            StoreError: If the write fails
+        """
+        if not records:
+            return
+        active = self._segments[-1]
+        file = self._file
+        assert file is not None
+        try:
+            file.write(buffer)
+            file.flush()
+            if self.durability == "fsync":
+                os.fsync(file.fileno())
+        except Exception as e:
+            # Drop a partial append so the segment still ends on a record
+            try:
+                file.truncate(active.size)
+            except OSError:
+                pass
+            raise StoreError("append", str(e)) from e
+
+        pos = active.size
+        for length, timestamp in records:
+            self._track(active, pos, length, timestamp)
+            pos += length
+        active.size = pos
+        self._write_index(active, seal=False)
+
+    def _track(self, segment: _Segment, pos: int, length: int, timestamp: float) -> None:
+        """Add a record to the segment's current block, or start a new block."""
+        blocks = segment.blocks
+        if segment.block_open and pos - blocks[-1][0] < self.index_interval:
+            start, _, low, high, count = blocks[-1]
+            blocks[-1] = (start, pos + length, min(low, timestamp), max(high, timestamp), count + 1)
+        else:
+            blocks.append((pos, pos + length, timestamp, timestamp, 1))
+            segment.block_open = True
+        segment.count += 1
+        segment.min_ts = min(segment.min_ts, timestamp)
+        segment.max_ts = max(segment.max_ts, timestamp)
+
+    @staticmethod
+    def _add_block_stats(segment: _Segment, block: _Block) -> None:
+        """Fold an indexed block into the segment's count and time bounds."""
+        segment.count += block[4]
+        segment.min_ts = min(segment.min_ts, block[2])
+        segment.max_ts = max(segment.max_ts, block[3])
+
+    def _write_index(self, segment: _Segment, seal: bool) -> None:
+        """
+        Append closed blocks to the active segment's index file (writer thread).
+
+        Args:
+            segment: Active segment
+            seal: Also write (and close) the block still being appended to
+        """
+        end = len(segment.blocks) if seal else len(segment.blocks) - 1
+        if end > segment.indexed:
+            assert self._index_file is not None
+            blocks = segment.blocks[segment.indexed : end]
+            self._index_file.write(b"".join(_INDEX_ENTRY.pack(*block) for block in blocks))
+            self._index_file.flush()
+            segment.indexed = end
+        if seal:
+            segment.block_open = False
+
+    def _roll_sync(self) -> None:
+        """Seal the active segment and start a new one (writer thread)."""
+        active = self._segments[-1]
+        self._close_active()
+        base = active.base + active.count
+        self._segments.append(_Segment(base, self._segment_path(base)))
+        self._open_active()
+        self._stats["segments_rolled"] += 1
+        logger.debug(f"Rolled segment {active.path.name} ({active.count} events)")
+
+    def _close_active(self) -> None:
+        """Index the active segment's last block and close its files (writer thread)."""
+        if self._file is None or self._index_file is None:
+            return
+        self._write_index(self._segments[-1], seal=True)
+        self._file.close()
+        self._index_file.close()
+        self._file = None
+        self._index_file = None
+
+    @property
+    def row_count(self) -> int:
+        """Events currently in the log."""
+        return sum(segment.count for segment in self._segments)
+
+    async def flush(self) -> None:
+        """Wait for in-flight appends; appends are flushed as they are written."""
+        await self._sync_writes()
+
+    def _mapping(self, segment: _Segment, end: int) -> mmap.mmap:
+        """
+        Get a read-only mapping covering at least end bytes (reader thread).
+
+        The active segment grows, so it is remapped when a read needs
+        bytes past the current mapping. Replaced mappings stay valid for
+        readers still holding views of them.
+
+        Args:
+            segment: Segment to map
+            end: Bytes the caller will read
+
+        Returns:
+            Memory map of the segment file
+        """
+        with self._map_lock:
+            mapped = segment.mapped
+            if mapped is None or len(mapped) < end:
+                with open(segment.path, "rb") as file:
+                    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                segment.mapped = mapped
+            return mapped
+
+    @staticmethod
+    def _bounds(start_time: datetime | None, end_time: datetime | None) -> tuple[float, float]:
+        """Inclusive Unix timestamp bounds for an optional time range."""
+        low = start_time.timestamp() if start_time else float("-inf")
+        high = end_time.timestamp() if end_time else float("inf")
+        return low, high
+
+    @staticmethod
+    def _scan(
+        view: memoryview,
+        start: int,
+        end: int,
+        low: float,
+        high: float,
+        matcher: TopicMatcher | None,
+    ) -> list[_Match]:
+        """
+        Find matching records in a byte range by their headers.
+
+        Args:
+            view: View of the mapped segment
+            start: Offset of the first record
+            end: Offset after the last record
+            low: Minimum timestamp
+            high: Maximum timestamp
+            matcher: Topic matcher (None = all topics)
+
+        Returns:
+            Matching records, in log order
+        """
+        unpack = _HEADER.unpack_from
+        header_size = _HEADER.size
+        matches = []
+        pos = start
+        while pos < end:
+            length, _, timestamp, event_id, topic_len = unpack(view, pos)
+            if low <= timestamp <= high:
+                topic_start = pos + header_size
+                body = topic_start + topic_len
+                topic = str(view[topic_start:body], "utf-8")
+                if matcher is None or matcher(topic):
+                    matches.append((topic, body, pos + length, timestamp, event_id))
+            pos += length
+        return matches
+
+    @staticmethod
+    def _decode(view: memoryview, match: _Match) -> Event:
+        """Decode a scanned record into an Event, reading its body in place."""
+        topic, body, end, timestamp, event_id = match
+        data, context, metadata, parent_id = deserialize(view[body:end])
+        return Event(
+            id=UUID(bytes=event_id),
+            topic=topic,
+            data=data,
+            timestamp=datetime.fromtimestamp(timestamp),
+            context=context or {},
+            metadata=metadata or {},
+            parent_id=UUID(bytes=parent_id) if parent_id else None,
+        )
+
+    def _blocks_in(
+        self, segment: _Segment, low: float, high: float, limit: int | None = None
+    ) -> list[_Block]:
+        """
+        Blocks of a segment that may hold records in [low, high].
+
+        Args:
+            segment: Segment
+            low: Minimum timestamp
+            high: Maximum timestamp
+            limit: Ignore records at or past this offset
+
+        Returns:
+            Overlapping blocks, in log order, clipped to limit
+        """
+        if not segment.count or segment.max_ts < low or segment.min_ts > high:
+            return []
+        # Blocks only ever grow at the end, so a length snapshot is consistent
+        blocks = segment.blocks[: len(segment.blocks)]
+        selected = []
+        for block in blocks:
+            if limit is not None and block[0] >= limit:
+                break
+            if block[3] >= low and block[2] <= high:
+                if limit is not None and block[1] > limit:
+                    block = (block[0], limit, block[2], block[3], block[4])
+                selected.append(block)
+        return selected
+
+    async def get_event(self, event_id: UUID | str) -> Event | None:
+        """
+        Get an event by ID, scanning record headers newest first.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Event or None if not found
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        segments = self._pin()
+        try:
+            event_uuid = event_id if isinstance(event_id, UUID) else UUID(event_id)
+            return await self._read(self._find_sync, segments, event_uuid.bytes)
+        except Exception as e:
+            raise QueryError(f"Failed to get event {event_id}: {e}") from e
+        finally:
+            self._unpin(segments)
+
+    def _find_sync(self, segments: list[_Segment], event_id: bytes) -> Event | None:
+        """Find a record by id (reader thread)."""
+        unpack = _HEADER.unpack_from
+        for segment in reversed(segments):
+            blocks = self._blocks_in(segment, float("-inf"), float("inf"))
+            if not blocks:
+                continue
+            with memoryview(self._mapping(segment, blocks[-1][1])) as view:
+                for start, end, *_ in reversed(blocks):
+                    pos = start
+                    while pos < end:
+                        length, _, timestamp, record_id, topic_len = unpack(view, pos)
+                        if record_id == event_id:
+                            topic_start = pos + _HEADER.size
+                            body = topic_start + topic_len
+                            topic = str(view[topic_start:body], "utf-8")
+                            match = (topic, body, pos + length, timestamp, record_id)
+                            return self._decode(view, match)
+                        pos += length
+        return None
+
+    async def query_by_topic(
+        self,
+        topic_pattern: str,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Event]:
+        """
+        Query events by topic pattern, newest first.
+
+        Blocks are read newest to oldest until limit + offset events are
+        found, so recent queries only touch the end of the log.
+
+        Args:
+            topic_pattern: Topic pattern ("*" and "#" as on the bus)
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+            limit: Maximum events to return
+            offset: Offset for pagination
+
+        Returns:
+            List of events
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        low, high = self._bounds(start_time, end_time)
+        segments = self._pin()
+        try:
+            events = await self._read(
+                self._query_sync, segments, low, high, _topic_matcher(topic_pattern), limit + offset
+            )
+        except Exception as e:
+            raise QueryError(f"Failed to query events: {e}") from e
+        finally:
+            self._unpin(segments)
+
+        events = events[offset:]
+        self._stats["events_queried"] += len(events)
+        return events
+
+    def _query_sync(
+        self,
+        segments: list[_Segment],
+        low: float,
+        high: float,
+        matcher: TopicMatcher | None,
+        needed: int,
+    ) -> list[Event]:
+        """Collect the newest needed matching events (reader thread)."""
+        events: list[Event] = []
+        for segment in reversed(segments):
+            blocks = self._blocks_in(segment, low, high)
+            if not blocks:
+                continue
+            with memoryview(self._mapping(segment, blocks[-1][1])) as view:
+                for start, end, *_ in reversed(blocks):
+                    for match in reversed(self._scan(view, start, end, low, high, matcher)):
+                        if len(events) >= needed:
+                            return events
+                        events.append(self._decode(view, match))
+        return events[:needed]
+
+    async def query_time_range(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int = 100,
+    ) -> list[Event]:
+        """
+        Query events in a time range.
+
+        Args:
+            start_time: Start time
+            end_time: End time
+            limit: Maximum events to return
+
+        Returns:
+            List of events
+        """
+        return await self.query_by_topic("#", start_time=start_time, end_time=end_time, limit=limit)
+
+    async def replay_events(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        topic_pattern: str = "#",
+    ) -> list[Event]:
+        """
+        Replay events for time-travel or replay scenarios.
+
+        Loads every matching event; prefer stream_events for large ranges.
+
+        Args:
+            start_time: Optional start time
+            end_time: Optional end time
+            topic_pattern: Topic pattern filter
+
+        Returns:
+            List of events in log order
+        """
+        return [
+            event
+            async for event in self.stream_events(
+                start_time, end_time, topic_pattern, page_size=10_000
+            )
+        ]
+
+    async def stream_events(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        topic_pattern: str = "#",
+        page_size: int = 1000,
+        prefetch: int = 2,
+    ) -> AsyncGenerator[Event, None]:
+        """
+        Stream events in log order without loading them all.
+
+        Pages are whole index blocks read from the mapped segments until
+        at least page_size events are collected; a background task reads
+        up to prefetch pages ahead of the consumer. Only records appended
+        before the stream started are returned, and the segments being
+        read are kept until the stream ends, even if retention drops them.
+
+        Args:
+            start_time: Optional start time
+            end_time: Optional end time
+            topic_pattern: Topic pattern filter
+            page_size: Events per page (at least; pages end on block boundaries)
+            prefetch: Pages buffered ahead of the consumer
+
+        Yields:
+            Events in log order
+
+        Raises:
+            ValueError: If page_size or prefetch is less than 1
+            QueryError: If reading a page fails
+        """
+        if page_size < 1 or prefetch < 1:
+            raise ValueError("page_size and prefetch must be at least 1")
+
+        if not self._initialized:
+            await self.initialize()
+
+        low, high = self._bounds(start_time, end_time)
+        matcher = _topic_matcher(topic_pattern)
+        segments = self._pin()
+        try:
+            plan = await self._read(self._plan_sync, segments, low, high)
+        except Exception as e:
+            self._unpin(segments)
+            raise QueryError(f"Failed to replay events: {e}") from e
+
+        pages: asyncio.Queue[list[Event] | BaseException | None] = asyncio.Queue(prefetch)
+
+        async def fetch_pages() -> None:
+            try:
+                cursor: tuple[int, int] | None = (0, 0)
+                while cursor is not None:
+                    events, cursor = await self._read(
+                        self._page_sync, plan, cursor, low, high, matcher, page_size
+                    )
+                    if events:
+                        await pages.put(events)
+                await pages.put(None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await pages.put(QueryError(f"Failed to replay events: {e}"))
+
+        fetcher = asyncio.create_task(fetch_pages())
+        try:
+            while (events := await pages.get()) is not None:
+                if isinstance(events, BaseException):
+                    raise events
+                self._stats["events_replayed"] += len(events)
+                for event in events:
+                    yield event
+        finally:
+            fetcher.cancel()
+            try:
+                await fetcher
+            except asyncio.CancelledError:
+                pass
+            self._unpin(segments)
+
+    def _plan_sync(
+        self, segments: list[_Segment], low: float, high: float
+    ) -> list[tuple[_Segment, list[_Block]]]:
+        """Select the blocks a stream reads, up to the current end of the log (reader thread)."""
+        limit = segments[-1].size if segments else 0
+        last = len(segments) - 1
+        return [
+            (segment, self._blocks_in(segment, low, high, limit if i == last else None))
+            for i, segment in enumerate(segments)
+        ]
+
+    def _page_sync(
+        self,
+        plan: list[tuple[_Segment, list[_Block]]],
+        cursor: tuple[int, int],
+        low: float,
+        high: float,
+        matcher: TopicMatcher | None,
+        page_size: int,
+    ) -> tuple[list[Event], tuple[int, int] | None]:
+        """
+        Read blocks from cursor until page_size events are found (reader thread).
+
+        Args:
+            plan: Segments and the blocks to read from each
+            cursor: (segment position, block position) to start at
+            low: Minimum timestamp
+            high: Maximum timestamp
+            matcher: Topic matcher
+            page_size: Events wanted
+
+        Returns:
+            Events and the next cursor (None when the plan is exhausted)
+        """
+        events: list[Event] = []
+        segment_pos, block_pos = cursor
+        while segment_pos < len(plan):
+            segment, blocks = plan[segment_pos]
+            if block_pos < len(blocks):
+                with memoryview(self._mapping(segment, blocks[-1][1])) as view:
+                    while block_pos < len(blocks):
+                        start, end, *_ = blocks[block_pos]
+                        block_pos += 1
+                        decode = self._decode
+                        events.extend(
+                            decode(view, match)
+                            for match in self._scan(view, start, end, low, high, matcher)
+                        )
+                        if len(events) >= page_size:
+                            return events, (segment_pos, block_pos)
+            segment_pos, block_pos = segment_pos + 1, 0
+        return events, None
+
+    async def count_events(
+        self,
+        topic_pattern: str = "#",
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+    ) -> int:
+        """
+        Count events matching criteria.
+
+        Blocks entirely inside the time range are counted from the index
+        when every topic matches; other blocks are counted from record
+        headers.
+
+        Args:
+            topic_pattern: Topic pattern
+            start_time: Optional start time
+            end_time: Optional end time
+
+        Returns:
+            Event count
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        low, high = self._bounds(start_time, end_time)
+        segments = self._pin()
+        try:
+            return await self._read(
+                self._count_sync, segments, low, high, _topic_matcher(topic_pattern)
+            )
+        except Exception as e:
+            raise QueryError(f"Failed to count events: {e}") from e
+        finally:
+            self._unpin(segments)
+
+    def _count_sync(
+        self,
+        segments: list[_Segment],
+        low: float,
+        high: float,
+        matcher: TopicMatcher | None,
+    ) -> int:
+        """Count matching records (reader thread)."""
+        total = 0
+        for segment in segments:
+            blocks = self._blocks_in(segment, low, high)
+            scan = [
+                block
+                for block in blocks
+                if matcher is not None or block[2] < low or block[3] > high
+            ]
+            total += sum(block[4] for block in blocks) - sum(block[4] for block in scan)
+            if not scan:
+                continue
+            with memoryview(self._mapping(segment, scan[-1][1])) as view:
+                for start, end, *_ in scan:
+                    total += len(self._scan(view, start, end, low, high, matcher))
+        return total
+
+    async def _retention_loop(self) -> None:
+        """Run retention passes every retention_interval."""
+        while not self._closing:
+            await asyncio.sleep(self.retention_interval)
+            if self._closing:
+                return
+            try:
+                await self.enforce_retention()
+            except Exception as e:
+                logger.error(f"Failed to enforce retention: {e}", exc_info=True)
+
+    async def enforce_retention(self) -> int:
+        """
+        Delete expired segments and the oldest segments over max_events.
+
+        Returns:
+            Number of events dropped
+        """
+        if not self._initialized:
+            return 0
+
+        start = time.perf_counter()
+        await self._sync_writes()
+        # The active (last) segment is never dropped; appends are landing there
+        sealed = self._segments[:-1]
+        drop: list[_Segment] = []
+
+        if self.retention_days:
+            cutoff = time.time() - self.retention_days * 86400
+            while sealed and sealed[0].max_ts < cutoff:
+                drop.append(sealed.pop(0))
+
+        if self.max_events > 0:
+            total = self.row_count - sum(segment.count for segment in drop)
+            while sealed and total - sealed[0].count >= self.max_events:
+                total -= sealed[0].count
+                drop.append(sealed.pop(0))
+
+        dropped = 0
+        for segment in drop:
+            self._segments.remove(segment)
+            segment.dropped = True
+            dropped += segment.count
+            self._stats["segments_dropped"] += 1
+            self._stats["rows_dropped"] += segment.count
+            if not segment.users:
+                await self._write(self._unlink_sync, segment)
+            logger.info(f"Dropped segment {segment.path.name} ({segment.count} events)")
+
+        self._retention_time += time.perf_counter() - start
+        return dropped
+
+    def _unlink_sync(self, segment: _Segment) -> None:
+        """Close a dropped segment's mapping and delete its files."""
+        with self._map_lock:
+            if segment.mapped is not None:
+                try:
+                    segment.mapped.close()
+                except BufferError:
+                    pass  # A replaced view is still alive; the GC closes it
+                segment.mapped = None
+        segment.path.unlink(missing_ok=True)
+        segment.index_path.unlink(missing_ok=True)
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        await self._sync_writes()
+        size = sum(segment.size for segment in self._segments)
+
+        return {
+            "directory": str(self.directory),
+            "db_size_bytes": size,
+            "db_size_mb": round(size / 1024 / 1024, 2),
+            "total_events": self.row_count,
+            "max_events": self.max_events,
+            "segments": len(self._segments),
+            "index_blocks": sum(len(segment.blocks) for segment in self._segments),
+            "durability": self.durability,
+            **self._stats,
+            "retention": {
+                "retention_days": self.retention_days,
+                "segments_dropped": self._stats["segments_dropped"],
+                "rows_dropped": self._stats["rows_dropped"],
+                "time_ms": self._retention_time * 1000,
+            },
+        }
+
+    async def close(self) -> None:
+        """Stop retention, index and close the active segment and stop the I/O threads."""
+        self._closing = True
+
+        if self._retention_task is not None:
+            self._retention_task.cancel()
+            try:
+                await self._retention_task
+            except asyncio.CancelledError:
+                pass
+            self._retention_task = None
+
+        if not self._initialized:
+            return
+
+        await self._write(self._close_active)
+        # Joining the I/O threads blocks, so do it off the event loop
+        await asyncio.to_thread(self._shutdown_threads)
+
+        self._initialized = False
+        logger.info("SegmentedEventStore closed")
+
+    def _shutdown_threads(self) -> None:
+        """Stop the I/O threads and release every mapping."""
+        assert self._readers is not None and self._writer is not None
+        self._readers.shutdown(wait=True)
+        self._writer.shutdown(wait=True)
+        for segment in self._segments:
+            if segment.mapped is not None:
+                try:
+                    segment.mapped.close()
+                except BufferError:
+                    pass
+                segment.mapped = None
+        self._segments = []
+        self._readers = None
+        self._writer = None
+        self._last_write = None
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"SegmentedEventStore(directory={self.directory}, "
+            f"segments={len(self._segments)}, initialized={self._initialized})"
+        )
@@ -0,0 +1,333 @@
+"""
+Persistent snapshot markers, materialized snapshot files and projection
+checkpoints.
+
+A snapshot is a marker, not a copy: its topic filter, time range and,
+on an EventStore, the last rowid stored when it was taken. Reading it
+streams the matching events from the store. A materialized snapshot
+also has its events exported to a file of serialize_compact records,
+which reloads without touching the store and outlives retention.
+
+Projection checkpoints (see neurobus.temporal.projections) are kept in
+the same catalog.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from neurobus.core.event import Event
+from neurobus.exceptions.temporal import StoreError
+from neurobus.utils.serialization import iter_deserialize_compact, serialize_compact
+from neurobus.utils.workers import SQLiteWorker
+
+logger = logging.getLogger(__name__)
+
+# First record of a snapshot file
+_FILE_HEADER = {"format": "neurobus-snapshot", "version": 1}
+
+# Events packed or unpacked per executor call
+_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """
+    A named snapshot marker.
+
+    Attributes:
+        name: Snapshot name
+        topic: Topic pattern filter
+        start_time: Optional start of the time range
+        end_time: End of the time range (the creation time if not given)
+        max_rowid: Last EventStore rowid included (None for other stores)
+        event_count: Events in the snapshot when it was created
+        created_at: Creation time
+        path: Materialized snapshot file, if any
+    """
+
+    name: str
+    topic: str
+    start_time: datetime | None
+    end_time: datetime
+    max_rowid: int | None
+    event_count: int
+    created_at: datetime
+    path: Path | None = None
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the events were exported to a snapshot file."""
+        return self.path is not None
+
+
+class SnapshotCatalog(SQLiteWorker):
+    """
+    Snapshot markers and projection checkpoints in SQLite tables.
+
+    The tables live in the EventStore database itself, or in a
+    snapshots.db file for stores without one. All access goes through
+    one thread, like the EventStore writer.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path, "neurobus-snap")
+
+    def setup(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                name TEXT PRIMARY KEY,
+                topic TEXT NOT NULL,
+                start_time REAL,
+                end_time REAL NOT NULL,
+                max_rowid INTEGER,
+                event_count INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                path TEXT
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                projection TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                timestamp REAL NOT NULL,
+                events INTEGER NOT NULL,
+                state BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (projection, version, timestamp)
+            ) WITHOUT ROWID
+            """
+        )
+
+    async def load(self) -> dict[str, Snapshot]:
+        return await self.run(self._load_sync)
+
+    def _load_sync(self) -> dict[str, Snapshot]:
+        rows = self.conn.execute(
+            "SELECT name, topic, start_time, end_time, max_rowid, event_count, created_at, path "
+            "FROM snapshots ORDER BY created_at"
+        )
+        return {
+            name: Snapshot(
+                name=name,
+                topic=topic,
+                start_time=datetime.fromtimestamp(start) if start is not None else None,
+                end_time=datetime.fromtimestamp(end),
+                max_rowid=max_rowid,
+                event_count=count,
+                created_at=datetime.fromtimestamp(created),
+                path=Path(path) if path else None,
+            )
+            for name, topic, start, end, max_rowid, count, created, path in rows
+        }
+
+    async def save(self, snapshot: Snapshot) -> None:
+        await self.run(self._save_sync, snapshot)
+
+    def _save_sync(self, snapshot: Snapshot) -> None:
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    snapshot.name,
+                    snapshot.topic,
+                    snapshot.start_time.timestamp() if snapshot.start_time else None,
+                    snapshot.end_time.timestamp(),
+                    snapshot.max_rowid,
+                    snapshot.event_count,
+                    snapshot.created_at.timestamp(),
+                    str(snapshot.path) if snapshot.path else None,
+                ),
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            raise StoreError("snapshot", str(e)) from e
+
+    async def delete(self, name: str) -> None:
+        await self.run(self._delete_sync, name)
+
+    def _delete_sync(self, name: str) -> None:
+        try:
+            self.conn.execute("DELETE FROM snapshots WHERE name = ?", (name,))
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            raise StoreError("snapshot", str(e)) from e
+
+    async def save_checkpoint(
+        self, projection: str, version: int, timestamp: float, events: int, state: bytes
+    ) -> None:
+        await self.run(self._save_checkpoint_sync, projection, version, timestamp, events, state)
+
+    def _save_checkpoint_sync(
+        self, projection: str, version: int, timestamp: float, events: int, state: bytes
+    ) -> None:
+        try:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+                (projection, version, timestamp, events, state, time.time()),
+            )
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            raise StoreError("checkpoint", str(e)) from e
+
+    async def nearest_checkpoint(
+        self, projection: str, version: int, timestamp: float
+    ) -> tuple[float, int, bytes] | None:
+        """Latest checkpoint at or before timestamp: (timestamp, events, state)."""
+        return await self.run(
+            lambda: self.conn.execute(
+                "SELECT timestamp, events, state FROM checkpoints "
+                "WHERE projection = ? AND version = ? AND timestamp <= ? "
+                "ORDER BY timestamp DESC LIMIT 1",
+                (projection, version, timestamp),
+            ).fetchone()
+        )
+
+    async def last_checkpoint_time(self, projection: str, version: int) -> float | None:
+        return await self.run(
+            lambda: self.conn.execute(
+                "SELECT MAX(timestamp) FROM checkpoints WHERE projection = ? AND version = ?",
+                (projection, version),
+            ).fetchone()[0]
+        )
+
+    async def delete_checkpoints(self, projection: str, since: float | None = None) -> int:
+        return await self.run(self._delete_checkpoints_sync, projection, since)
+
+    def _delete_checkpoints_sync(self, projection: str, since: float | None) -> int:
+        try:
+            if since is None:
+                count = self.conn.execute(
+                    "DELETE FROM checkpoints WHERE projection = ?", (projection,)
+                ).rowcount
+            else:
+                count = self.conn.execute(
+                    "DELETE FROM checkpoints WHERE projection = ? AND timestamp >= ?",
+                    (projection, since),
+                ).rowcount
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            raise StoreError("checkpoint", str(e)) from e
+        return count
+
+
+async def write_snapshot_file(path: Path, events: AsyncIterator[Event]) -> int:
+    """
+    Export events to a snapshot file.
+
+    Events are packed and written in chunks off the event loop. The file
+    is written under a temporary name and renamed once complete, so a
+    failed export never replaces an existing file.
+
+    Args:
+        path: Snapshot file to write
+        events: Events to export, in order
+
+    Returns:
+        Number of events written
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".tmp")
+    file = await asyncio.to_thread(open, partial, "wb")
+    count = 0
+    try:
+        chunk = [serialize_compact(_FILE_HEADER)]
+        async for event in events:
+            chunk.append(
+                serialize_compact(
+                    [
+                        event.id,
+                        event.topic,
+                        event.timestamp,
+                        event.data,
+                        event.context or None,
+                        event.metadata or None,
+                        event.parent_id,
+                    ]
+                )
+            )
+            count += 1
+            if len(chunk) >= _CHUNK_SIZE:
+                await asyncio.to_thread(file.write, b"".join(chunk))
+                chunk = []
+        await asyncio.to_thread(_finish_file, file, b"".join(chunk))
+    except BaseException:
+        await asyncio.to_thread(file.close)
+        partial.unlink(missing_ok=True)
+        raise
+    await asyncio.to_thread(os.replace, partial, path)
+    return count
+
+
+def _finish_file(file: BinaryIO, data: bytes) -> None:
+    """Write the last chunk, fsync and close."""
+    with file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+async def read_snapshot_file(path: Path) -> AsyncGenerator[Event, None]:
+    """
+    Stream the events of a snapshot file.
+
+    Records are unpacked in chunks off the event loop; memory use is
+    bounded by the chunk size, not the file size.
+
+    Args:
+        path: Snapshot file written by write_snapshot_file
+
+    Yields:
+        Events in the order they were exported
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a snapshot file
+    """
+    file = await asyncio.to_thread(open, path, "rb")
+    try:
+        records = iter_deserialize_compact(file)
+        header = await asyncio.to_thread(next, records, None)
+        if header != _FILE_HEADER:
+            raise ValueError(f"Not a snapshot file: {path}")
+        while events := await asyncio.to_thread(_read_chunk, records):
+            for event in events:
+                yield event
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+def _read_chunk(records: Iterator[Any]) -> list[Event]:
+    """Unpack the next chunk of events."""
+    return [
+        Event(
+            id=event_id,
+            topic=topic,
+            data=data,
+            timestamp=timestamp,
+            context=context or {},
+            metadata=metadata or {},
+            parent_id=parent_id,
+        )
+        for event_id, topic, timestamp, data, context, metadata, parent_id in itertools.islice(
+            records, _CHUNK_SIZE
+        )
+    ]
@@ -4,19 +4,85 @@ Event store for temporal event persistence.
 Provides durable storage and retrieval of events with time-travel capabilities.
 """
 
+import asyncio
 import logging
 import sqlite3
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from uuid import UUID
 
 from neurobus.core.event import Event
 from neurobus.exceptions.temporal import QueryError, StoreError
-from neurobus.utils.serialization import deserialize, serialize
+from neurobus.temporal.planner import TopicFilter, TopicQueryPlanner, register_topic_match
+from neurobus.temporal.rows import RowFormat, detect_row_format, make_row_format
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+WRITE_MODES = ("sync", "write_behind")
+DURABILITY_MODES = ("none", "flush", "fsync")
+
+# {columns} is filled in with the row format's select list at execution
+_SELECT_SQL = "SELECT {columns} FROM events"
+
+# _SELECT_SQL columns plus rowid, for keyset pagination
+_PAGE_SQL = "SELECT {columns}, rowid FROM events"
+
+# Default depth limit of causal chain queries; it also ends parent_id cycles
+MAX_CAUSAL_DEPTH = 1000
+
+# An event and its ancestors, root first; {columns} as in _SELECT_SQL
+_ANCESTORS_SQL = """
+    WITH RECURSIVE chain(rid, pid, depth) AS (
+        SELECT rowid, parent_id, 0 FROM events WHERE id = ?
+        UNION ALL
+        SELECT events.rowid, events.parent_id, chain.depth + 1
+        FROM chain JOIN events ON events.id = chain.pid
+        WHERE chain.depth < ?
+    )
+    SELECT {columns} FROM chain JOIN events ON events.rowid = chain.rid
+    ORDER BY chain.depth DESC
+"""
+
+# One page of an event's descendants as (depth, rowid), breadth-first and
+# in storage order within a generation (the ORDER BY makes the recursion
+# queue a priority queue), after a (depth, rowid) keyset cursor; walks
+# idx_parent_id without touching rows and stops once the page is full
+_DESCENDANTS_SQL = """
+    WITH RECURSIVE tree(rid, eid, depth) AS (
+        VALUES (NULL, ?, 0)
+        UNION ALL
+        SELECT events.rowid, events.id, tree.depth + 1
+        FROM tree JOIN events ON events.parent_id = tree.eid
+        WHERE tree.depth < ?
+        ORDER BY 3, 1
+    )
+    SELECT depth, rid FROM tree WHERE depth > ? OR (depth = ? AND rid > ?) LIMIT ?
+"""
+
+# Table a migration copies rows into before it replaces events
+_MIGRATION_TABLE = "events_migrating"
+
+_INSERT_TOPIC_SQL = "INSERT OR IGNORE INTO topics (topic) VALUES (?)"
+
+# Writer-side cache of catalogued topics; cleared when it grows past this
+_KNOWN_TOPICS_LIMIT = 100_000
+
+# Oldest rows before a cutoff, one retention batch at a time
+_EXPIRED_ROWIDS_SQL = "SELECT rowid FROM events WHERE timestamp < ? ORDER BY timestamp ASC LIMIT ?"
+
+# Drops catalogued topics that retention left without events
+_DELETE_ORPHAN_TOPIC_SQL = (
+    "DELETE FROM topics WHERE topic = ? "
+    "AND NOT EXISTS (SELECT 1 FROM events WHERE events.topic = topics.topic)"
+)
+
 
 class EventStore:
     """
@@ -28,10 +94,61 @@ class EventStore:
     Features:
     - Durable SQLite storage
     - Indexed queries by topic, time, ID
+    - Bus wildcard topic patterns planned onto the topic index
     - Time-travel queries (events at point in time)
-    - Event replay functionality
-    - Retention policies
+    - Event replay functionality (including streamed, paginated replay)
+    - Incremental retention (row cap and age expiry)
     - Statistics tracking
+    - Optional write-behind group commit
+    - SQLite I/O off the event loop
+
+    Threading: a single writer thread owns the read-write connection and
+    runs every write (inserts, commits, retention). Queries run on a
+    small pool of threads, each with its own read-only connection, which
+    WAL lets proceed concurrently with the writer. The async API awaits
+    these threads, so a slow fsync or a large replay scan never blocks
+    the event loop. Reads first wait for writes already issued, so a
+    read always sees earlier writes.
+
+    Write modes:
+    - sync: every store call is its own transaction
+    - write_behind: rows are serialized immediately, buffered, and
+      committed by a background writer with one executemany per batch,
+      once flush_batch_size rows are buffered or flush_interval_ms has
+      passed since the first buffered row, whichever comes first.
+      Queries flush the buffer first, so reads always see prior writes.
+
+    Topic patterns follow the bus rules ("*" within one segment, "#" for
+    the rest of the topic) and return exactly what wildcard_match would.
+    TopicQueryPlanner turns them into idx_topic lookups or range scans,
+    using a catalog of distinct topics for patterns with "*". Patterns
+    containing "%" are still passed to SQL LIKE for compatibility.
+
+    Retention: the store keeps a running row count instead of counting
+    the table. A background task prunes the oldest rows (by rowid, i.e.
+    insertion order) once the count exceeds max_events, and expires rows
+    whose timestamp is older than retention_days. It deletes in batches
+    of retention_batch_size rows, each its own transaction on the writer
+    thread, so inserts interleave with a large prune. Passes run every
+    retention_interval seconds, or sooner once a full batch is due; the
+    row cap is therefore enforced eventually, not on every insert. Call
+    enforce_retention() to prune immediately.
+
+    Row formats:
+    - text (default): TEXT UUID primary key and separate msgpack blobs
+      for data, context and metadata
+    - compact: 16-byte BLOB ids (unique idx_id on a rowid table) and one
+      record per event packed with msgpack ext types, optionally zlib or
+      zstd compressed with a trained dictionary (see CompactRowFormat)
+    An existing table keeps its format until migrate() converts it to
+    the configured one.
+
+    Durability (write_behind):
+    - none: store calls return once the row is buffered (fire-and-forget;
+      rows buffered at a crash are lost, write errors are only logged)
+    - flush: store calls wait until their batch is committed
+    - fsync: like flush, with PRAGMA synchronous=FULL so each batch
+      commit is fsynced
 
     Example:
         >>> store = EventStore("events.db")
@@ -44,6 +161,17 @@ class EventStore:
         self,
         db_path: str | Path = "neurobus_events.db",
         max_events: int = 1000000,
+        write_mode: str = "sync",
+        durability: str = "flush",
+        flush_batch_size: int = 500,
+        flush_interval_ms: float = 50.0,
+        read_pool_size: int = 4,
+        retention_days: float | None = None,
+        retention_interval: float = 1.0,
+        retention_batch_size: int = 10_000,
+        row_format: str = "text",
+        compression: str = "none",
+        compression_threshold: int = 64,
     ) -> None:
         """
         Initialize event store.
@@ -51,18 +179,98 @@ class EventStore:
         Args:
             db_path: Path to SQLite database
             max_events: Maximum events to store (for retention)
+            write_mode: "sync" or "write_behind"
+            durability: "none", "flush" or "fsync" (see class docstring)
+            flush_batch_size: Rows per write-behind batch
+            flush_interval_ms: Maximum time a row waits in the buffer
+            read_pool_size: Reader threads (each with a read-only connection)
+            retention_days: Expire events older than this (None = keep)
+            retention_interval: Seconds between background retention passes
+            retention_batch_size: Maximum rows deleted per transaction
+            row_format: "text" or "compact" (see class docstring)
+            compression: "none", "zlib" or "zstd" (compact format only)
+            compression_threshold: Smallest packed record to compress
+
+        Raises:
+            ValueError: If write_mode, durability, row_format or
+                compression is unknown
+            ImportError: If compression is "zstd" and zstandard is missing
         """
+        if write_mode not in WRITE_MODES:
+            raise ValueError(
+                f"Unknown write mode: {write_mode}. Must be one of: {list(WRITE_MODES)}"
+            )
+
+        if durability not in DURABILITY_MODES:
+            raise ValueError(
+                f"Unknown durability: {durability}. Must be one of: {list(DURABILITY_MODES)}"
+            )
+
         self.db_path = Path(db_path)
         self.max_events = max_events
+        self.write_mode = write_mode
+        self.durability = durability
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.read_pool_size = read_pool_size
+        self.retention_days = retention_days
+        self.retention_interval = retention_interval
+        self.retention_batch_size = retention_batch_size
+        self.row_format = row_format
         self._conn: sqlite3.Connection | None = None
         self._initialized = False
+        self._planner = TopicQueryPlanner()
+        self._known_topics: set[str] = set()
+        self._topic_plans: dict[str, int] = {}
+
+        # Row formats: configured, of the table on disk (used by readers and
+        # inserts), and used to serialize new rows (differs only in migrate())
+        self._target_format = make_row_format(
+            row_format, compression, compression_threshold=compression_threshold
+        )
+        self._format: RowFormat = self._target_format
+        self._encoder: RowFormat = self._target_format
+        # Held by migrate() while it swaps the table and publishes _format
+        self._format_lock = threading.Lock()
+
+        # I/O threads: one writer owning _conn, a pool of readers
+        self._writer: ThreadPoolExecutor | None = None
+        self._readers: ThreadPoolExecutor | None = None
+        self._reader_local = threading.local()
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._reader_lock = threading.Lock()
+        self._last_write: asyncio.Future[Any] | None = None
+
+        # Write-behind buffer: serialized rows, and per store call the end
+        # of its rows in the buffer and its waiter (None without durability)
+        self._pending_rows: list[tuple[Any, ...]] = []
+        self._pending_calls: list[tuple[int, asyncio.Future[None] | None]] = []
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._writer_task: asyncio.Task[None] | None = None
+        self._closing = False
+        self._closed = False
+
+        # Retention: row and catalog counts maintained by the writer thread
+        self._row_count = 0
+        self._topic_count = 0
+        self._retention_due = asyncio.Event()
+        self._retention_task: asyncio.Task[None] | None = None
 
         # Statistics
         self._stats = {
             "events_stored": 0,
             "events_queried": 0,
             "events_replayed": 0,
+            "batches_flushed": 0,
+            "max_batch_size": 0,
+            "write_errors": 0,
+            "retention_runs": 0,
+            "rows_pruned": 0,
+            "rows_expired": 0,
         }
+        self._flush_time = 0.0
+        self._retention_time = 0.0
 
         logger.info(f"EventStore created with db_path={self.db_path}")
 
@@ -75,64 +283,152 @@ class EventStore:
             # Create database directory if needed
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Connect to database
-            self._conn = sqlite3.connect(
-                str(self.db_path),
-                check_same_thread=False,
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neurobus-store-w")
+            self._readers = ThreadPoolExecutor(
+                max_workers=self.read_pool_size, thread_name_prefix="neurobus-store-r"
             )
+            await self._write(self._initialize_sync)
+
+            self._initialized = True
+            self._closing = False
+            self._closed = False
+
+            if self.write_mode == "write_behind":
+                self._writer_task = asyncio.create_task(self._writer_loop())
+
+            if self.max_events > 0 or self.retention_days:
+                self._retention_task = asyncio.create_task(self._retention_loop())
+
+            logger.info("EventStore initialized successfully")
+
+        except Exception as e:
+            raise StoreError("initialize", str(e)) from e
+
+    async def _ensure_open(self) -> None:
+        """
+        Initialize the store on first use.
+
+        Raises:
+            StoreError: If the store was closed; only initialize() reopens it
+        """
+        if self._closed:
+            raise StoreError("open", "event store is closed")
+        if not self._initialized:
+            await self.initialize()
+
+    def _initialize_sync(self) -> None:
+        """Open the writer connection and create the schema (writer thread)."""
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+        )
 
-            # Enable WAL mode for better concurrency
-            self._conn.execute("PRAGMA journal_mode=WAL")
+        # Enable WAL mode for better concurrency
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        if self.durability == "fsync":
+            self._conn.execute("PRAGMA synchronous=FULL")
+        else:
             self._conn.execute("PRAGMA synchronous=NORMAL")
 
-            # Create events table
-            self._conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS events (
-                    id TEXT PRIMARY KEY,
-                    topic TEXT NOT NULL,
-                    data BLOB NOT NULL,
-                    timestamp REAL NOT NULL,
-                    context BLOB,
-                    metadata BLOB,
-                    parent_id TEXT,
-                    created_at REAL NOT NULL
-                )
-            """
+        # Create the events table, or keep the format of an existing one
+        existing = detect_row_format(self._conn)
+        if existing is None or existing == self._target_format.name:
+            row_format = self._target_format
+        else:
+            row_format = make_row_format(existing)
+            logger.warning(
+                f"Events table in {self.db_path} uses the {existing} row format; "
+                f"call migrate() to convert it to {self._target_format.name}"
             )
+        row_format.create_table(self._conn)
+        row_format.create_indexes(self._conn)
+        row_format.open(self._conn)
+        if row_format is not self._target_format:
+            self._target_format.open(self._conn)
+        self._format = self._encoder = row_format
+
+        # Catalog of distinct topics, used to plan wildcard queries
+        has_catalog = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'topics'"
+        ).fetchone()
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS topics (topic TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        if not has_catalog:
+            # Databases from before the catalog: backfill from idx_topic
+            self._conn.execute("INSERT OR IGNORE INTO topics SELECT DISTINCT topic FROM events")
+        self._known_topics.clear()
 
-            # Create indexes
-            self._conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_topic
-                ON events(topic)
-            """
-            )
+        self._conn.commit()
 
-            self._conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_timestamp
-                ON events(timestamp)
-            """
-            )
+        # Count once at startup; inserts and deletes keep them current
+        self._row_count = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        self._topic_count = self._conn.execute("SELECT COUNT(*) FROM topics").fetchone()[0]
 
-            self._conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_created_at
-                ON events(created_at)
-            """
-            )
+    @property
+    def _writer_conn(self) -> sqlite3.Connection:
+        """The writer thread's connection; only valid while initialized."""
+        if self._conn is None:
+            raise StoreError("write", "store is not initialized")
+        return self._conn
 
-            self._conn.commit()
-            self._initialized = True
+    async def _write(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func on the writer thread.
 
-            logger.info("EventStore initialized successfully")
+        Args:
+            func: Function using self._conn
+            *args: Arguments for func
 
-        except Exception as e:
-            raise StoreError(
-                f"Failed to initialize event store: {e}",
-                original_error=e,
-            ) from e
+        Returns:
+            func's result
+        """
+        future = asyncio.get_running_loop().run_in_executor(self._writer, func, *args)
+        self._last_write = future
+        return await future
+
+    async def _read(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func(connection, *args) on a reader thread.
+
+        Waits for buffered and in-flight writes first, so the read sees
+        every write issued before it.
+
+        Args:
+            func: Function taking a read-only connection
+            *args: Arguments for func
+
+        Returns:
+            func's result
+        """
+        await self._sync_writes()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, self._with_reader, func, *args)
+
+    async def _sync_writes(self) -> None:
+        """Commit buffered rows and wait for writes already submitted."""
+        if self._pending_rows:
+            await self._flush_pending()
+
+        last_write = self._last_write
+        if last_write is not None and not last_write.done():
+            # The writer is FIFO, so the last write finishing implies all did
+            await asyncio.wait([last_write])
+
+    def _with_reader(self, func: Callable[..., T], *args: Any) -> T:
+        """Call func with this reader thread's connection (reader thread)."""
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+            register_topic_match(conn)
+            self._reader_local.conn = conn
+            with self._reader_lock:
+                self._reader_conns.append(conn)
+        return func(conn, *args)
 
     async def store_event(self, event: Event) -> None:
         """
@@ -144,50 +440,198 @@ class EventStore:
         Raises:
             StoreError: If storage fails
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_open()
 
-        try:
-            # Serialize data
-            data_bytes = serialize(event.data)
-            context_bytes = serialize(event.context) if event.context else None
-            metadata_bytes = serialize(event.metadata) if event.metadata else None
-
-            # Convert timestamp to Unix timestamp
-            timestamp = event.timestamp.timestamp()
-            created_at = datetime.now().timestamp()
-
-            # Insert event
-            self._conn.execute(
-                """
-                INSERT INTO events
-                (id, topic, data, timestamp, context, metadata, parent_id, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(event.id),
-                    event.topic,
-                    data_bytes,
-                    timestamp,
-                    context_bytes,
-                    metadata_bytes,
-                    str(event.parent_id) if event.parent_id else None,
-                    created_at,
-                ),
-            )
+        if self.write_mode == "write_behind":
+            await self._enqueue([self._encoder.encode(event, time.time())])
+            return
 
-            self._conn.commit()
-            self._stats["events_stored"] += 1
+        await self._write(self._insert_sync, [self._encoder.encode(event, time.time())], "insert")
+        self._check_retention()
+
+    async def store_events(self, events: list[Event]) -> None:
+        """
+        Store a batch of events in a single transaction.
 
-            # Check retention policy
-            await self._enforce_retention()
+        Args:
+            events: Events to store
+
+        Raises:
+            StoreError: If storage fails (no event of the batch is stored)
+        """
+        if not events:
+            return
+
+        await self._ensure_open()
+
+        created_at = time.time()
+        encode = self._encoder.encode
+        rows = [encode(event, created_at) for event in events]
+
+        if self.write_mode == "write_behind":
+            await self._enqueue(rows)
+            return
 
+        await self._write(self._insert_sync, rows, "batch insert")
+        self._check_retention()
+
+    def _insert_sync(self, rows: list[tuple[Any, ...]], operation: str) -> None:
+        """
+        Insert rows in one transaction (writer thread).
+
+        Args:
+            rows: Serialized rows
+            operation: Operation name for errors
+
+        Raises:
+            StoreError: If the insert fails (no row is stored)
+        """
+        new_topics = {row[1] for row in rows} - self._known_topics
+        added_topics = 0
+        try:
+            self._writer_conn.executemany(self._format.insert_sql.format(table="events"), rows)
+            if new_topics:
+                added_topics = self._writer_conn.executemany(
+                    _INSERT_TOPIC_SQL, [(topic,) for topic in new_topics]
+                ).rowcount
+            self._writer_conn.commit()
         except Exception as e:
-            self._conn.rollback()
-            raise StoreError(
-                f"Failed to store event {event.id}: {e}",
-                original_error=e,
-            ) from e
+            self._writer_conn.rollback()
+            raise StoreError(operation, str(e)) from e
+        self._format.after_insert(self._writer_conn)
+
+        if len(self._known_topics) + len(new_topics) > _KNOWN_TOPICS_LIMIT:
+            self._known_topics.clear()
+        self._known_topics.update(new_topics)
+
+        self._stats["events_stored"] += len(rows)
+        self._row_count += len(rows)
+        self._topic_count += added_topics
+
+    async def _enqueue(self, rows: list[tuple[Any, ...]]) -> None:
+        """
+        Buffer rows for the write-behind writer.
+
+        Args:
+            rows: Serialized rows
+
+        Raises:
+            StoreError: If durability is "flush"/"fsync" and the batch fails
+        """
+        waiter = None
+        if self.durability != "none":
+            waiter = asyncio.get_running_loop().create_future()
+
+        self._pending_rows.extend(rows)
+        self._pending_calls.append((len(self._pending_rows), waiter))
+        self._has_pending.set()
+        if len(self._pending_rows) >= self.flush_batch_size:
+            self._batch_full.set()
+
+        if waiter is not None:
+            await waiter
+
+    async def _writer_loop(self) -> None:
+        """Commit buffered rows by batch size or flush interval."""
+        while True:
+            if not self._pending_rows:
+                if self._closing:
+                    return
+                self._has_pending.clear()
+                await self._has_pending.wait()
+                continue
+
+            # Wait for a full batch, at most flush_interval after the first row
+            if len(self._pending_rows) < self.flush_batch_size and not self._closing:
+                self._batch_full.clear()
+                try:
+                    async with asyncio.timeout(self.flush_interval):
+                        await self._batch_full.wait()
+                except TimeoutError:
+                    pass
+
+            await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        """Write all buffered rows in one transaction and wake their waiters."""
+        rows, self._pending_rows = self._pending_rows, []
+        calls, self._pending_calls = self._pending_calls, []
+        if not rows:
+            return
+
+        errors = await self._write(self._write_batch_sync, rows, [end for end, _ in calls])
+        self._check_retention()
+
+        for (_, waiter), error in zip(calls, errors, strict=True):
+            if waiter is None or waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
+
+    def _write_batch_sync(
+        self, rows: list[tuple[Any, ...]], ends: list[int]
+    ) -> list[StoreError | None]:
+        """
+        Commit a write-behind batch (writer thread).
+
+        If the batch fails, each store call's rows are retried in their
+        own transaction, so a bad row fails only the call that wrote it.
+
+        Args:
+            rows: Serialized rows
+            ends: End of each store call's rows in rows
+
+        Returns:
+            Per store call, None on success, otherwise its error
+        """
+        start = time.perf_counter()
+        try:
+            try:
+                self._insert_sync(rows, "batch insert")
+                errors: list[StoreError | None] = [None] * len(ends)
+            except StoreError as e:
+                errors = [e] if len(ends) == 1 else self._insert_calls_sync(rows, ends)
+
+            failed = sum(error is not None for error in errors)
+            if failed:
+                self._stats["write_errors"] += failed
+                logger.error(
+                    f"Write-behind batch of {len(rows)} events: {failed} of {len(ends)} "
+                    f"store calls failed: {next(e for e in errors if e is not None)}"
+                )
+            if failed < len(ends):
+                self._stats["batches_flushed"] += 1
+                self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(rows))
+            return errors
+        finally:
+            self._flush_time += time.perf_counter() - start
+
+    def _insert_calls_sync(
+        self, rows: list[tuple[Any, ...]], ends: list[int]
+    ) -> list[StoreError | None]:
+        """Insert each store call's rows in its own transaction (writer thread)."""
+        errors: list[StoreError | None] = []
+        begin = 0
+        for end in ends:
+            try:
+                self._insert_sync(rows[begin:end], "batch insert")
+                errors.append(None)
+            except StoreError as e:
+                errors.append(e)
+            begin = end
+        return errors
+
+    @property
+    def row_count(self) -> int:
+        """Rows in the table as of the last committed write (no table scan)."""
+        return self._row_count
+
+    async def flush(self) -> None:
+        """Commit any buffered write-behind rows now."""
+        if self._initialized:
+            await self._sync_writes()
 
     async def get_event(self, event_id: UUID | str) -> Event | None:
         """
@@ -199,33 +643,152 @@ class EventStore:
         Returns:
             Event or None if not found
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_open()
 
         try:
-            event_id_str = str(event_id)
-
-            cursor = self._conn.execute(
-                """
-                SELECT id, topic, data, timestamp, context, metadata, parent_id
-                FROM events
-                WHERE id = ?
-                """,
-                (event_id_str,),
-            )
+            event_id = event_id if isinstance(event_id, UUID) else UUID(event_id)
+        except ValueError:
+            return None
 
-            row = cursor.fetchone()
+        try:
+            events = await self._read(self._fetch_events, _SELECT_SQL + " WHERE id = ?", [event_id])
+            return events[0] if events else None
 
-            if row is None:
-                return None
+        except Exception as e:
+            raise QueryError(f"Failed to get event {event_id}: {e}") from e
 
-            return self._row_to_event(row)
+    async def get_causal_chain(
+        self, event_id: UUID | str, max_depth: int = MAX_CAUSAL_DEPTH
+    ) -> list[Event]:
+        """
+        Get an event and its stored ancestors, root first.
+
+        Follows parent_id with a recursive query, one idx_id lookup per
+        ancestor. The chain stops at the first parent that is not stored
+        (never stored, or removed by retention) or after max_depth
+        ancestors.
+
+        Args:
+            event_id: Event ID
+            max_depth: Maximum ancestors to follow
+
+        Returns:
+            Events from the oldest ancestor found to the event itself, or
+            an empty list if the event is not stored
+
+        Raises:
+            QueryError: If the query fails
+        """
+        await self._ensure_open()
 
+        try:
+            event_id = event_id if isinstance(event_id, UUID) else UUID(event_id)
+        except ValueError:
+            return []
+
+        try:
+            return await self._read(self._fetch_events, _ANCESTORS_SQL, [event_id, max_depth])
         except Exception as e:
-            raise QueryError(
-                f"Failed to get event {event_id}: {e}",
-                original_error=e,
-            ) from e
+            raise QueryError(f"Failed to get causal chain of {event_id}: {e}") from e
+
+    async def get_root(
+        self, event_id: UUID | str, max_depth: int = MAX_CAUSAL_DEPTH
+    ) -> Event | None:
+        """
+        Get the oldest stored ancestor of an event.
+
+        Args:
+            event_id: Event ID
+            max_depth: Maximum ancestors to follow
+
+        Returns:
+            The first event of get_causal_chain() (the event itself if it
+            has no stored parent), or None if the event is not stored
+
+        Raises:
+            QueryError: If the query fails
+        """
+        chain = await self.get_causal_chain(event_id, max_depth)
+        return chain[0] if chain else None
+
+    async def get_descendants(
+        self,
+        event_id: UUID | str,
+        max_depth: int = MAX_CAUSAL_DEPTH,
+        limit: int | None = None,
+        page_size: int = 1000,
+    ) -> AsyncGenerator[Event, None]:
+        """
+        Stream the stored descendants of an event, breadth-first.
+
+        A recursive query over idx_parent_id is paged with a (depth, rowid)
+        keyset cursor (the event itself need not be stored); each page of
+        rowids is then read and yielded, so only one page of rowids and
+        events is held in memory. Descendants removed by retention while
+        streaming are skipped.
+
+        Args:
+            event_id: Event ID
+            max_depth: Maximum generations below the event
+            limit: Maximum descendants to return (None = all)
+            page_size: Events read per query
+
+        Yields:
+            Children first, then grandchildren, and so on
+
+        Raises:
+            ValueError: If page_size is less than 1
+            QueryError: If a query fails
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        await self._ensure_open()
+
+        try:
+            event_id = event_id if isinstance(event_id, UUID) else UUID(event_id)
+        except ValueError:
+            return
+
+        # Keyset cursor: the root sits at depth 0 with a NULL rowid
+        depth, rowid = 0, 0
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            try:
+                keys = await self._read(
+                    self._fetch_tuples,
+                    _DESCENDANTS_SQL,
+                    [event_id, max_depth, depth, depth, rowid, size],
+                )
+                if not keys:
+                    return
+                events = await self._read(self._fetch_by_rowids, [r for _, r in keys])
+            except Exception as e:
+                raise QueryError(f"Failed to get descendants of {event_id}: {e}") from e
+            self._stats["events_replayed"] += len(events)
+            for event in events:
+                yield event
+            if len(keys) < size:
+                return
+            depth, rowid = keys[-1]
+            if remaining is not None:
+                remaining -= len(keys)
+
+    def _fetch_tuples(
+        self, conn: sqlite3.Connection, query: str, params: list[Any]
+    ) -> list[tuple[Any, ...]]:
+        """Run a query returning plain rows (reader thread)."""
+        cursor = self._execute(conn, query, params, None, None, self._format)
+        return [tuple(row) for row in cursor]
+
+    def _fetch_by_rowids(self, conn: sqlite3.Connection, rowids: list[int]) -> list[Event]:
+        """Fetch events by rowid, in the order given (reader thread)."""
+        query = _PAGE_SQL + f" WHERE rowid IN ({', '.join('?' * len(rowids))})"
+        rows, row_format = self._fetch_rows(conn, query, rowids)
+        decode = row_format.decode
+        by_rowid = {row[-1]: row for row in rows}
+        return [decode(by_rowid[r][:-1]) for r in rowids if r in by_rowid]
 
     async def query_by_topic(
         self,
@@ -239,7 +802,7 @@ class EventStore:
         Query events by topic pattern.
 
         Args:
-            topic_pattern: Topic pattern (supports % wildcard for SQLite LIKE)
+            topic_pattern: Topic pattern ("*" and "#" as on the bus)
             start_time: Optional start time filter
             end_time: Optional end time filter
             limit: Maximum events to return
@@ -248,16 +811,11 @@ class EventStore:
         Returns:
             List of events
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_open()
 
         try:
-            query = """
-                SELECT id, topic, data, timestamp, context, metadata, parent_id
-                FROM events
-                WHERE topic LIKE ?
-            """
-            params: list[Any] = [topic_pattern.replace("*", "%")]
+            query = _SELECT_SQL + " WHERE {topic}"
+            params: list[Any] = []
 
             if start_time:
                 query += " AND timestamp >= ?"
@@ -270,18 +828,16 @@ class EventStore:
             query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
             params.extend([limit, offset])
 
-            cursor = self._conn.execute(query, params)
-            rows = cursor.fetchall()
+            events = await self._read(
+                self._fetch_events, query, params, topic_pattern, limit + offset
+            )
 
-            self._stats["events_queried"] += len(rows)
+            self._stats["events_queried"] += len(events)
 
-            return [self._row_to_event(row) for row in rows]
+            return events
 
         except Exception as e:
-            raise QueryError(
-                f"Failed to query events: {e}",
-                original_error=e,
-            ) from e
+            raise QueryError(f"Failed to query events: {e}") from e
 
     async def query_time_range(
         self,
@@ -301,7 +857,7 @@ class EventStore:
             List of events
         """
         return await self.query_by_topic(
-            "%",  # Match all topics
+            "#",  # Match all topics
             start_time=start_time,
             end_time=end_time,
             limit=limit,
@@ -311,7 +867,7 @@ class EventStore:
         self,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
-        topic_pattern: str = "%",
+        topic_pattern: str = "#",
     ) -> list[Event]:
         """
         Replay events for time-travel or replay scenarios.
@@ -324,16 +880,11 @@ class EventStore:
         Returns:
             List of events in chronological order
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_open()
 
         try:
-            query = """
-                SELECT id, topic, data, timestamp, context, metadata, parent_id
-                FROM events
-                WHERE topic LIKE ?
-            """
-            params: list[Any] = [topic_pattern.replace("*", "%")]
+            query = _SELECT_SQL + " WHERE {topic}"
+            params: list[Any] = []
 
             if start_time:
                 query += " AND timestamp >= ?"
@@ -345,22 +896,149 @@ class EventStore:
 
             query += " ORDER BY timestamp ASC"  # Chronological order for replay
 
-            cursor = self._conn.execute(query, params)
-            rows = cursor.fetchall()
+            events = await self._read(self._fetch_events, query, params, topic_pattern)
+
+            self._stats["events_replayed"] += len(events)
+
+            return events
+
+        except Exception as e:
+            raise QueryError(f"Failed to replay events: {e}") from e
+
+    async def stream_events(
+        self,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        topic_pattern: str = "#",
+        page_size: int = 1000,
+        prefetch: int = 2,
+        max_rowid: int | None = None,
+    ) -> AsyncGenerator[Event, None]:
+        """
+        Stream events in chronological order without loading them all.
 
-            self._stats["events_replayed"] += len(rows)
+        Pages are fetched with keyset pagination on (timestamp, rowid),
+        so each page is an index range scan no matter how deep into the
+        history it is. A background task reads up to prefetch pages ahead
+        of the consumer. Only rows that existed when the stream started
+        are returned, so events stored while streaming (for example by
+        republishing the replay) are not picked up again.
 
-            return [self._row_to_event(row) for row in rows]
+        Args:
+            start_time: Optional start time
+            end_time: Optional end time
+            topic_pattern: Topic pattern filter
+            page_size: Rows per page
+            prefetch: Pages buffered ahead of the consumer
+            max_rowid: Only return rows stored up to this rowid (see
+                last_rowid()), for example to replay a snapshot
 
+        Yields:
+            Events in chronological order
+
+        Raises:
+            ValueError: If page_size or prefetch is less than 1
+            QueryError: If a page query fails
+
+        Example:
+            >>> async for event in store.stream_events(start_time=yesterday):
+            ...     process(event)
+        """
+        if page_size < 1 or prefetch < 1:
+            raise ValueError("page_size and prefetch must be at least 1")
+
+        await self._ensure_open()
+
+        try:
+            topic = await self._read(self._plan_topic, topic_pattern, page_size)
+            last_rowid = await self._read(self._fetch_scalar, "SELECT MAX(rowid) FROM events", [])
+        except Exception as e:
+            raise QueryError(f"Failed to replay events: {e}") from e
+        if last_rowid is None:
+            return
+        if max_rowid is not None:
+            last_rowid = min(last_rowid, max_rowid)
+
+        query = _PAGE_SQL + " WHERE " + topic.clause + " AND rowid <= ?"
+        params: list[Any] = [*topic.params, last_rowid]
+
+        if start_time:
+            query += " AND timestamp >= ?"
+            params.append(start_time.timestamp())
+
+        if end_time:
+            query += " AND timestamp <= ?"
+            params.append(end_time.timestamp())
+
+        first_page = query + " ORDER BY timestamp, rowid LIMIT ?"
+        next_page = query + " AND (timestamp, rowid) > (?, ?) ORDER BY timestamp, rowid LIMIT ?"
+
+        pages: asyncio.Queue[list[Event] | BaseException | None] = asyncio.Queue(prefetch)
+
+        async def fetch_pages() -> None:
+            try:
+                page = await self._read(self._fetch_page, first_page, [*params, page_size])
+                while True:
+                    events, last_key = page
+                    if events:
+                        await pages.put(events)
+                    if last_key is None or len(events) < page_size:
+                        break
+                    page = await self._read(
+                        self._fetch_page, next_page, [*params, *last_key, page_size]
+                    )
+                await pages.put(None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await pages.put(QueryError(f"Failed to replay events: {e}"))
+
+        fetcher = asyncio.create_task(fetch_pages())
+        try:
+            while (events := await pages.get()) is not None:
+                if isinstance(events, BaseException):
+                    raise events
+                self._stats["events_replayed"] += len(events)
+                for event in events:
+                    yield event
+        finally:
+            fetcher.cancel()
+            try:
+                await fetcher
+            except asyncio.CancelledError:
+                pass
+
+    def _fetch_page(
+        self, conn: sqlite3.Connection, query: str, params: list[Any]
+    ) -> tuple[list[Event], tuple[float, int] | None]:
+        """Fetch one keyset page and its last (timestamp, rowid) key (reader thread)."""
+        rows, row_format = self._fetch_rows(conn, query, params)
+        if not rows:
+            return [], None
+        last = rows[-1]
+        decode = row_format.decode
+        return [decode(row[:-1]) for row in rows], (last[3], last[-1])
+
+    async def last_rowid(self) -> int | None:
+        """
+        Get the rowid of the newest stored row.
+
+        Rowids only grow while the table holds rows, so rows stored later
+        have larger rowids (see stream_events(max_rowid=...)).
+
+        Returns:
+            Largest rowid, or None if the table is empty
+        """
+        await self._ensure_open()
+
+        try:
+            return await self._read(self._fetch_scalar, "SELECT MAX(rowid) FROM events", [])
         except Exception as e:
-            raise QueryError(
-                f"Failed to replay events: {e}",
-                original_error=e,
-            ) from e
+            raise QueryError(f"Failed to read last rowid: {e}") from e
 
     async def count_events(
         self,
-        topic_pattern: str = "%",
+        topic_pattern: str = "#",
         start_time: datetime | None = None,
         end_time: datetime | None = None,
     ) -> int:
@@ -375,12 +1053,11 @@ class EventStore:
         Returns:
             Event count
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_open()
 
         try:
-            query = "SELECT COUNT(*) FROM events WHERE topic LIKE ?"
-            params: list[Any] = [topic_pattern.replace("*", "%")]
+            query = "SELECT COUNT(*) FROM events WHERE {topic}"
+            params: list[Any] = []
 
             if start_time:
                 query += " AND timestamp >= ?"
@@ -390,68 +1067,431 @@ class EventStore:
                 query += " AND timestamp <= ?"
                 params.append(end_time.timestamp())
 
-            cursor = self._conn.execute(query, params)
-            count = cursor.fetchone()[0]
+            return await self._read(self._fetch_scalar, query, params, topic_pattern)
+
+        except Exception as e:
+            raise QueryError(f"Failed to count events: {e}") from e
+
+    def _fetch_events(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        params: list[Any],
+        topic_pattern: str | None = None,
+        order_limit: int | None = None,
+    ) -> list[Event]:
+        """Run a row query and build events (reader thread)."""
+        rows, row_format = self._fetch_rows(conn, query, params, topic_pattern, order_limit)
+        decode = row_format.decode
+        return [decode(row) for row in rows]
+
+    def _fetch_rows(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        params: list[Any],
+        topic_pattern: str | None = None,
+        order_limit: int | None = None,
+    ) -> tuple[list[tuple[Any, ...]], RowFormat]:
+        """
+        Run a row query in the current row format (reader thread).
+
+        If migrate() swaps the table between reading self._format and
+        running the query, the query fails on the old columns; it is
+        retried once the swap has published the new format.
+
+        Returns:
+            Rows and the format to decode them with
+        """
+        row_format = self._format
+        try:
+            cursor = self._execute(conn, query, params, topic_pattern, order_limit, row_format)
+            return cursor.fetchall(), row_format
+        except sqlite3.OperationalError:
+            with self._format_lock:
+                if self._format is row_format:
+                    raise
+                row_format = self._format
+        cursor = self._execute(conn, query, params, topic_pattern, order_limit, row_format)
+        return cursor.fetchall(), row_format
+
+    def _fetch_scalar(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        params: list[Any],
+        topic_pattern: str | None = None,
+    ) -> Any:
+        """Run a single-value query (reader thread)."""
+        cursor = self._execute(conn, query, params, topic_pattern, None, self._format)
+        return cursor.fetchone()[0]
+
+    def _execute(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        params: list[Any],
+        topic_pattern: str | None,
+        order_limit: int | None,
+        row_format: RowFormat,
+    ) -> sqlite3.Cursor:
+        """
+        Execute a query, planning its {topic} filter first (reader thread).
+
+        Args:
+            conn: Reader connection
+            query: SQL, with a leading {topic} placeholder if topic_pattern is
+                set and an optional {columns} placeholder for the row columns
+            params: Parameters after the topic filter's; UUIDs are converted
+                to row_format's id representation
+            topic_pattern: Optional topic pattern
+            order_limit: Rows needed, if the query is ordered by timestamp
+            row_format: Format of the events table
+
+        Returns:
+            Cursor
+        """
+        params = [row_format.id_param(p) if isinstance(p, UUID) else p for p in params]
+        if topic_pattern is None:
+            return conn.execute(query.format(columns=row_format.columns), params)
+
+        topic = self._plan_topic(conn, topic_pattern, order_limit)
+        return conn.execute(
+            query.format(columns=row_format.columns, topic=topic.clause),
+            [*topic.params, *params],
+        )
+
+    def _plan_topic(
+        self, conn: sqlite3.Connection, topic_pattern: str, order_limit: int | None = None
+    ) -> TopicFilter:
+        """Plan a topic filter and count its strategy (reader thread)."""
+        topic = self._planner.plan(
+            conn, topic_pattern, order_limit, self._row_count, self._topic_count
+        )
+        with self._reader_lock:
+            self._topic_plans[topic.strategy] = self._topic_plans.get(topic.strategy, 0) + 1
+        return topic
+
+    def _check_retention(self) -> None:
+        """Wake the retention task early once a full batch is over the cap."""
+        if 0 < self.max_events <= self._row_count - self.retention_batch_size:
+            self._retention_due.set()
+
+    async def _retention_loop(self) -> None:
+        """Run retention passes every retention_interval or when woken."""
+        while not self._closing:
+            try:
+                async with asyncio.timeout(self.retention_interval):
+                    await self._retention_due.wait()
+            except TimeoutError:
+                pass
+            self._retention_due.clear()
+
+            if self._closing:
+                return
+
+            try:
+                await self.enforce_retention()
+            except Exception as e:
+                logger.error(f"Failed to enforce retention: {e}", exc_info=True)
+
+    async def enforce_retention(self) -> int:
+        """
+        Apply the age limit and row cap now.
+
+        Expired rows are deleted first, then the oldest rows beyond
+        max_events, each in batches of at most retention_batch_size.
+
+        Returns:
+            Number of rows removed
+
+        Raises:
+            StoreError: If a delete fails
+        """
+        if not self._initialized:
+            return 0
+
+        self._stats["retention_runs"] += 1
+        expired = 0
+        pruned = 0
+
+        if self.retention_days:
+            cutoff = time.time() - self.retention_days * 86400
+            while not self._closing:
+                removed = await self._write(self._expire_batch_sync, cutoff)
+                expired += removed
+                if removed < self.retention_batch_size:
+                    break
+
+        if self.max_events > 0:
+            await self._sync_writes()
+            while not self._closing and self._row_count > self.max_events:
+                removed = await self._write(self._prune_batch_sync)
+                pruned += removed
+                if not removed:
+                    break
+
+        if expired or pruned:
+            logger.info(
+                f"Retention removed {pruned} events over max_events "
+                f"and {expired} expired events"
+            )
+        return expired + pruned
+
+    def _prune_batch_sync(self) -> int:
+        """
+        Delete the oldest rows over max_events as one rowid range (writer thread).
+
+        At most retention_batch_size rows are deleted per call.
 
-            return count
+        Returns:
+            Rows deleted
 
+        Raises:
+            StoreError: If the delete fails
+        """
+        count = min(self._row_count - self.max_events, self.retention_batch_size)
+        if count <= 0:
+            return 0
+
+        start = time.perf_counter()
+        try:
+            row = self._writer_conn.execute(
+                "SELECT rowid FROM events ORDER BY rowid LIMIT 1 OFFSET ?", (count - 1,)
+            ).fetchone()
+            if row is None:
+                return 0
+            topics = self._writer_conn.execute(
+                "SELECT DISTINCT topic FROM events WHERE rowid <= ?", row
+            ).fetchall()
+            removed = self._writer_conn.execute("DELETE FROM events WHERE rowid <= ?", row).rowcount
+            orphaned = self._delete_orphan_topics(topics)
+            self._writer_conn.commit()
         except Exception as e:
-            raise QueryError(
-                f"Failed to count events: {e}",
-                original_error=e,
-            ) from e
+            self._writer_conn.rollback()
+            raise StoreError("retention", str(e)) from e
+        finally:
+            self._retention_time += time.perf_counter() - start
+
+        self._row_count -= removed
+        self._topic_count -= orphaned
+        self._stats["rows_pruned"] += removed
+        return removed
+
+    def _expire_batch_sync(self, cutoff: float) -> int:
+        """
+        Delete up to retention_batch_size rows older than cutoff (writer thread).
+
+        Args:
+            cutoff: Unix timestamp; events before it are expired
 
-    async def _enforce_retention(self) -> None:
-        """Enforce retention policy by removing oldest events."""
-        if self.max_events <= 0:
-            return  # No retention limit
+        Returns:
+            Rows deleted
 
+        Raises:
+            StoreError: If the delete fails
+        """
+        start = time.perf_counter()
         try:
-            # Count total events
-            cursor = self._conn.execute("SELECT COUNT(*) FROM events")
-            total = cursor.fetchone()[0]
-
-            if total > self.max_events:
-                # Delete oldest events beyond limit
-                excess = total - self.max_events
-
-                self._conn.execute(
-                    """
-                    DELETE FROM events
-                    WHERE id IN (
-                        SELECT id FROM events
-                        ORDER BY timestamp ASC
-                        LIMIT ?
-                    )
-                    """,
-                    (excess,),
-                )
+            batch = (cutoff, self.retention_batch_size)
+            topics = self._writer_conn.execute(
+                f"SELECT DISTINCT topic FROM events WHERE rowid IN ({_EXPIRED_ROWIDS_SQL})", batch
+            ).fetchall()
+            removed = self._writer_conn.execute(
+                f"DELETE FROM events WHERE rowid IN ({_EXPIRED_ROWIDS_SQL})", batch
+            ).rowcount
+            orphaned = self._delete_orphan_topics(topics)
+            self._writer_conn.commit()
+        except Exception as e:
+            self._writer_conn.rollback()
+            raise StoreError("retention", str(e)) from e
+        finally:
+            self._retention_time += time.perf_counter() - start
+
+        self._row_count -= removed
+        self._topic_count -= orphaned
+        self._stats["rows_expired"] += removed
+        return removed
+
+    def _delete_orphan_topics(self, topics: list[tuple[str]]) -> int:
+        """
+        Remove catalogued topics that no longer have events (writer thread).
 
-                self._conn.commit()
-                logger.info(f"Removed {excess} events due to retention policy")
+        Runs inside the caller's retention transaction.
+
+        Args:
+            topics: Topics of the deleted rows, as 1-tuples
+
+        Returns:
+            Topics removed from the catalog
+        """
+        if not topics:
+            return 0
+        self._known_topics.difference_update(topic for (topic,) in topics)
+        return self._writer_conn.executemany(_DELETE_ORPHAN_TOPIC_SQL, topics).rowcount
+
+    async def migrate(self, batch_size: int = 10_000) -> int:
+        """
+        Convert the events table to the configured row format.
+
+        Rows are copied in rowid order into a new table, batch_size rows
+        per transaction, while reads and writes carry on against the old
+        one. A final transaction copies rows stored meanwhile, drops rows
+        retention removed meanwhile, and swaps the tables. Rowids and
+        timestamps are kept, so streams running across the swap continue
+        where they were. A text table's created_at becomes the event
+        timestamp.
+
+        Args:
+            batch_size: Rows copied per transaction
+
+        Returns:
+            Number of rows in the converted table (0 if already converted)
+
+        Raises:
+            StoreError: If the migration fails; the old table is kept
+        """
+        await self._ensure_open()
+
+        source, target = self._format, self._target_format
+        if source is target:
+            return 0
+
+        logger.info(f"Migrating {self.db_path} from {source.name} to {target.name} rows")
+        await self._write(self._begin_migration_sync, target)
+
+        last_rowid: int | None = 0
+        while last_rowid is not None:
+            last_rowid = await self._write(
+                self._migrate_batch_sync, source, target, last_rowid, batch_size
+            )
 
+        # Buffered rows are already in the old format: hand them to the swap
+        # job, and queue both without yielding so no row can slip between
+        await self._sync_writes()
+        rows, self._pending_rows = self._pending_rows, []
+        calls, self._pending_calls = self._pending_calls, []
+        waiters = [waiter for _, waiter in calls if waiter is not None]
+        self._encoder = target
+        future = asyncio.get_running_loop().run_in_executor(
+            self._writer, self._finish_migration_sync, source, target, rows
+        )
+        self._last_write = future
+        try:
+            migrated = await future
         except Exception as e:
-            logger.error(f"Failed to enforce retention: {e}", exc_info=True)
-
-    def _row_to_event(self, row: tuple) -> Event:
-        """Convert database row to Event."""
-        event_id, topic, data_bytes, timestamp, context_bytes, metadata_bytes, parent_id = row
-
-        # Deserialize
-        data = deserialize(data_bytes)
-        context = deserialize(context_bytes) if context_bytes else {}
-        metadata = deserialize(metadata_bytes) if metadata_bytes else {}
-
-        return Event(
-            id=UUID(event_id),
-            topic=topic,
-            data=data,
-            timestamp=datetime.fromtimestamp(timestamp),
-            context=context,
-            metadata=metadata,
-            parent_id=UUID(parent_id) if parent_id else None,
+            self._encoder = source
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(StoreError("batch insert", str(e)))
+            raise
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        logger.info(f"Migrated {migrated} events to {target.name} rows")
+        return migrated
+
+    def _begin_migration_sync(self, target: RowFormat) -> None:
+        """Create an empty target table without indexes (writer thread)."""
+        try:
+            self._writer_conn.execute(f"DROP TABLE IF EXISTS {_MIGRATION_TABLE}")
+            target.create_table(self._writer_conn, _MIGRATION_TABLE)
+            self._writer_conn.commit()
+        except Exception as e:
+            self._writer_conn.rollback()
+            raise StoreError("migrate", str(e)) from e
+
+    def _migrate_batch_sync(
+        self, source: RowFormat, target: RowFormat, after_rowid: int, limit: int
+    ) -> int | None:
+        """
+        Copy up to limit rows after after_rowid into the target table (writer thread).
+
+        Returns:
+            Last rowid copied, or None once no rows are left
+        """
+        try:
+            rows = self._writer_conn.execute(
+                f"SELECT {source.columns}, rowid FROM events WHERE rowid > ? "
+                "ORDER BY rowid LIMIT ?",
+                (after_rowid, limit),
+            ).fetchall()
+            if not rows:
+                return None
+            self._copy_rows(source, target, rows)
+            self._writer_conn.commit()
+        except Exception as e:
+            self._writer_conn.rollback()
+            raise StoreError("migrate", str(e)) from e
+
+        target.after_insert(self._writer_conn)
+        last_rowid: int = rows[-1][-1]
+        return last_rowid
+
+    def _copy_rows(self, source: RowFormat, target: RowFormat, rows: list[tuple[Any, ...]]) -> None:
+        """Re-encode source rows (with trailing rowid) into the target table."""
+        encoded = []
+        for row in rows:
+            event = source.decode(row[:-1])
+            encoded.append((row[-1], *target.encode(event, event.timestamp.timestamp())))
+
+        placeholders = ", ".join("?" * (len(encoded[0]) - 1))
+        self._writer_conn.executemany(
+            f"INSERT INTO {_MIGRATION_TABLE} (rowid, {target.insert_columns}) "
+            f"VALUES (?, {placeholders})",
+            encoded,
         )
 
+    def _finish_migration_sync(
+        self, source: RowFormat, target: RowFormat, rows: list[tuple[Any, ...]]
+    ) -> int:
+        """
+        Catch up and swap in the migrated table in one transaction (writer thread).
+
+        Args:
+            source: Format of the current table
+            target: Format of the migrated table
+            rows: Buffered rows in the source format, not yet inserted
+
+        Returns:
+            Rows in the migrated table
+        """
+        with self._format_lock:
+            try:
+                if rows:
+                    self._insert_sync(rows, "batch insert")
+                self._writer_conn.execute("BEGIN IMMEDIATE")
+                last_rowid = self._writer_conn.execute(
+                    f"SELECT COALESCE(MAX(rowid), 0) FROM {_MIGRATION_TABLE}"
+                ).fetchone()[0]
+                tail = self._writer_conn.execute(
+                    f"SELECT {source.columns}, rowid FROM events WHERE rowid > ?",
+                    (last_rowid,),
+                ).fetchall()
+                if tail:
+                    self._copy_rows(source, target, tail)
+                self._writer_conn.execute(
+                    f"DELETE FROM {_MIGRATION_TABLE} "
+                    "WHERE rowid NOT IN (SELECT rowid FROM events)"
+                )
+                self._writer_conn.execute("DROP TABLE events")
+                self._writer_conn.execute(f"ALTER TABLE {_MIGRATION_TABLE} RENAME TO events")
+                target.create_indexes(self._writer_conn)
+                self._writer_conn.commit()
+            except Exception as e:
+                self._writer_conn.rollback()
+                raise StoreError("migrate", str(e)) from e
+
+            self._format = target
+            target.after_insert(self._writer_conn)
+            self._row_count = self._writer_conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            return self._row_count
+
+    def _row_to_event(self, row: tuple[Any, ...]) -> Event:
+        """Convert a database row in the current row format to an Event."""
+        return self._format.decode(row)
+
     async def get_stats(self) -> dict[str, Any]:
         """
         Get store statistics.
@@ -459,34 +1499,100 @@ class EventStore:
         Returns:
             Dictionary with statistics
         """
-        if not self._initialized:
-            await self.initialize()
+        await self._ensure_open()
+
+        # Maintained by the writer thread; no table scan
+        await self._sync_writes()
+        total_events = self._row_count
 
         # Get database size
         db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
 
-        # Get total events
-        cursor = self._conn.execute("SELECT COUNT(*) FROM events")
-        total_events = cursor.fetchone()[0]
-
         return {
             "db_path": str(self.db_path),
             "db_size_bytes": db_size,
             "db_size_mb": round(db_size / 1024 / 1024, 2),
             "total_events": total_events,
+            "total_topics": self._topic_count,
             "max_events": self.max_events,
             "events_stored": self._stats["events_stored"],
             "events_queried": self._stats["events_queried"],
             "events_replayed": self._stats["events_replayed"],
+            "write_mode": self.write_mode,
+            "write_behind": {
+                "durability": self.durability,
+                "pending": len(self._pending_rows),
+                "batches_flushed": self._stats["batches_flushed"],
+                "max_batch_size": self._stats["max_batch_size"],
+                "avg_batch_size": (
+                    self._stats["events_stored"] / self._stats["batches_flushed"]
+                    if self._stats["batches_flushed"]
+                    else 0.0
+                ),
+                "write_errors": self._stats["write_errors"],
+                "flush_time_ms": self._flush_time * 1000,
+            },
+            "topic_plans": dict(self._topic_plans),
+            "format": self._format.get_stats(),
+            "retention": {
+                "retention_days": self.retention_days,
+                "runs": self._stats["retention_runs"],
+                "rows_pruned": self._stats["rows_pruned"],
+                "rows_expired": self._stats["rows_expired"],
+                "time_ms": self._retention_time * 1000,
+            },
         }
 
     async def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
-            self._initialized = False
-            logger.info("EventStore closed")
+        """
+        Flush buffered rows, stop background tasks and close the connection.
+
+        Later reads and writes raise StoreError until initialize() is
+        called again.
+        """
+        self._closing = True
+        self._closed = True
+
+        if self._retention_task is not None:
+            self._retention_due.set()
+            await self._retention_task
+            self._retention_task = None
+
+        if self._writer_task is not None:
+            self._has_pending.set()
+            self._batch_full.set()
+            await self._writer_task
+            self._writer_task = None
+
+        if not self._initialized:
+            return
+
+        await self._sync_writes()
+
+        # Joining the I/O threads blocks, so do it off the event loop
+        await asyncio.to_thread(self._shutdown_threads)
+
+        self._initialized = False
+        logger.info("EventStore closed")
+
+    def _shutdown_threads(self) -> None:
+        """Close all connections and stop the I/O threads."""
+        assert self._readers is not None and self._writer is not None
+        self._readers.shutdown(wait=True)
+        with self._reader_lock:
+            for conn in self._reader_conns:
+                conn.close()
+            self._reader_conns.clear()
+
+        # Reader threads are gone; fresh ones get fresh connections
+        self._reader_local = threading.local()
+
+        self._writer.submit(self._writer_conn.close).result()
+        self._writer.shutdown(wait=True)
+        self._conn = None
+        self._readers = None
+        self._writer = None
+        self._last_write = None
 
     def __repr__(self) -> str:
         """String representation."""
@@ -10,8 +10,22 @@ from neurobus.utils.helpers import (
     safe_repr,
     unflatten_dict,
 )
-from neurobus.utils.patterns import extract_variables, wildcard_match
-from neurobus.utils.serialization import deserialize, event_to_bytes, serialize
+from neurobus.utils.layered import LayeredContext, to_plain_dict
+from neurobus.utils.patterns import (
+    PatternCache,
+    extract_variables,
+    get_matcher,
+    get_pattern_cache,
+    wildcard_match,
+)
+from neurobus.utils.serialization import (
+    deserialize,
+    deserialize_compact,
+    event_to_bytes,
+    iter_deserialize_compact,
+    serialize,
+    serialize_compact,
+)
 from neurobus.utils.timing import AsyncTimer, Timer, measure_async_time, measure_time
 from neurobus.utils.validation import (
     validate_dict,
@@ -20,6 +34,7 @@ from neurobus.utils.validation import (
     validate_timeout,
     validate_topic,
 )
+from neurobus.utils.workers import SerialWorker, SQLiteWorker
 
 __all__ = [
     # Validation
@@ -30,7 +45,10 @@ __all__ = [
     "validate_dict",
     # Serialization
     "serialize",
+    "serialize_compact",
     "deserialize",
+    "deserialize_compact",
+    "iter_deserialize_compact",
     "event_to_bytes",
     # Timing
     "Timer",
@@ -40,6 +58,15 @@ __all__ = [
     # Patterns
     "wildcard_match",
     "extract_variables",
+    "get_matcher",
+    "get_pattern_cache",
+    "PatternCache",
+    # Layered context
+    "LayeredContext",
+    "to_plain_dict",
+    # Workers
+    "SerialWorker",
+    "SQLiteWorker",
     # Helpers
     "get_function_name",
     "is_async_callable",
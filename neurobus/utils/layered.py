@@ -0,0 +1,164 @@
+"""
+Layered copy-on-write mappings for event context.
+
+A LayeredContext reads through a stack of mappings (highest precedence
+first) instead of merging them into a new dict. Writes go to a private
+top layer, so the underlying layers are never modified and only keys
+that are actually written are materialized.
+"""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+# Tombstone for keys deleted from a LayeredContext
+_DELETED = object()
+_MISSING = object()
+
+
+class LayeredContext(MutableMapping[str, Any]):
+    """
+    Copy-on-write mapping over a stack of context layers.
+
+    Lookups return the value from the first layer (highest precedence)
+    that has the key. With deep=True, nested mappings are merged the same
+    way as utils.helpers.deep_merge: a nested mapping in a higher layer
+    is layered over nested mappings below it, and any non-mapping value
+    replaces everything beneath it. With deep=False, the first layer
+    wins outright, like dict.update.
+
+    Layers are referenced, not copied. Nested mappings are returned as
+    LayeredContext views so in-place updates stay local; other mutable
+    values (lists, objects) are shared with the layer they came from.
+
+    Example:
+        >>> ctx = LayeredContext({"user_id": "alice"}, {"app": "1.0", "user_id": "?"})
+        >>> ctx["user_id"], ctx["app"]
+        ('alice', '1.0')
+        >>> ctx["app"] = "2.0"  # only this key is materialized
+    """
+
+    __slots__ = ("_layers", "_writes", "_deep")
+
+    def __init__(self, *layers: Mapping[str, Any], deep: bool = True) -> None:
+        """
+        Initialize layered context.
+
+        Args:
+            *layers: Mappings in precedence order (first wins)
+            deep: Merge nested mappings across layers
+        """
+        self._layers = layers
+        self._writes: dict[str, Any] | None = None
+        self._deep = deep
+
+    def __getitem__(self, key: str) -> Any:
+        """Look up key through the write layer and then each layer."""
+        writes = self._writes
+        if writes is not None and key in writes:
+            value = writes[key]
+            if value is _DELETED:
+                raise KeyError(key)
+            return value
+
+        found: list[Mapping[str, Any]] = []
+        for layer in self._layers:
+            value = layer.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+            if not isinstance(value, Mapping):
+                if found:
+                    break
+                return value
+            found.append(value)
+            if not self._deep:
+                break
+
+        if not found:
+            raise KeyError(key)
+
+        # Cache the nested view so in-place updates to it persist here
+        view = LayeredContext(*found, deep=self._deep)
+        if writes is None:
+            writes = self._writes = {}
+        writes[key] = view
+        return view
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Write key to this context only."""
+        if self._writes is None:
+            self._writes = {}
+        self._writes[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Hide key from this context."""
+        if key not in self:
+            raise KeyError(key)
+        self[key] = _DELETED
+
+    def __contains__(self, key: object) -> bool:
+        """Check key presence without materializing nested views."""
+        writes = self._writes
+        if writes is not None and key in writes:
+            return writes[key] is not _DELETED
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys in merge order (lowest layer first, then writes)."""
+        keys: dict[str, None] = {}
+        for layer in reversed(self._layers):
+            keys.update(dict.fromkeys(layer))
+
+        writes = self._writes
+        if writes is None:
+            return iter(keys)
+
+        keys.update(dict.fromkeys(writes))
+        return (key for key in keys if writes.get(key) is not _DELETED)
+
+    def __len__(self) -> int:
+        """Number of visible keys."""
+        return sum(1 for _ in self)
+
+    def copy(self) -> dict[str, Any]:
+        """
+        Return a shallow plain-dict copy.
+
+        Returns:
+            Dictionary of the visible keys and values
+        """
+        return dict(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Flatten into plain nested dictionaries.
+
+        Returns:
+            Deep-merged dictionary, suitable for JSON or msgpack
+        """
+        return {
+            key: value.to_dict() if isinstance(value, LayeredContext) else value
+            for key, value in self.items()
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"LayeredContext({self.to_dict()!r})"
+
+
+def to_plain_dict(mapping: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Convert a context mapping to a plain dict.
+
+    Plain dicts are returned as-is; layered views are flattened.
+
+    Args:
+        mapping: Context mapping
+
+    Returns:
+        Plain dictionary
+    """
+    if type(mapping) is dict:
+        return mapping
+    if isinstance(mapping, LayeredContext):
+        return mapping.to_dict()
+    return dict(mapping)
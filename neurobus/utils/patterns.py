@@ -1,7 +1,15 @@
 """Pattern matching utilities for topic patterns."""
 
 import re
+from collections import OrderedDict
+from collections.abc import Callable
 from fnmatch import fnmatch
+from functools import lru_cache
+from threading import RLock
+from typing import Any
+
+# A compiled topic matcher: takes a topic, returns whether it matches
+TopicMatcher = Callable[[str], bool]
 
 
 def wildcard_match(pattern: str, topic: str) -> bool:
@@ -18,6 +26,9 @@ def wildcard_match(pattern: str, topic: str) -> bool:
         - "user.#" matches "user.login", "user.profile.update"
         - "*.error" matches "system.error", "network.error"
 
+    Matchers are compiled once per pattern and kept in a shared LRU
+    cache (see get_pattern_cache).
+
     Args:
         pattern: Pattern string with wildcards
         topic: Topic string to match
@@ -25,9 +36,22 @@ def wildcard_match(pattern: str, topic: str) -> bool:
     Returns:
         True if topic matches pattern
     """
-    # Convert pattern to regex
-    regex_pattern = _wildcard_to_regex(pattern)
-    return bool(re.match(regex_pattern, topic))
+    return _pattern_cache.get(pattern)(topic)
+
+
+def get_matcher(pattern: str) -> TopicMatcher:
+    """
+    Get the cached compiled matcher for a pattern.
+
+    Useful when one pattern is tested against many topics.
+
+    Args:
+        pattern: Pattern string with wildcards
+
+    Returns:
+        Callable returning True if a topic matches the pattern
+    """
+    return _pattern_cache.get(pattern)
 
 
 def _wildcard_to_regex(pattern: str) -> str:
@@ -53,6 +77,180 @@ def _wildcard_to_regex(pattern: str) -> str:
     return f"^{regex}$"
 
 
+def compile_matcher(pattern: str) -> TopicMatcher:
+    """
+    Compile a wildcard pattern into a matcher function.
+
+    Pure literal patterns compare strings and prefix-only patterns
+    ("user.#") use str.startswith, so neither touches the regex engine.
+    Everything else is compiled to a regex once.
+
+    Args:
+        pattern: Wildcard pattern
+
+    Returns:
+        Matcher function with the same semantics as wildcard_match
+    """
+    if not is_wildcard_pattern(pattern):
+
+        def match_literal(topic: str) -> bool:
+            if topic == pattern:
+                return True
+            # "$" also matches before a trailing newline
+            return "\n" in topic and _regex_fallback(pattern, topic)
+
+        return match_literal
+
+    if pattern == "#" or (pattern.endswith(".#") and not is_wildcard_pattern(pattern[:-1])):
+        prefix = pattern[:-1]
+
+        def match_prefix(topic: str) -> bool:
+            # ".*" never crosses a newline, so those topics need the regex
+            if "\n" in topic:
+                return _regex_fallback(pattern, topic)
+            return topic.startswith(prefix)
+
+        return match_prefix
+
+    regex = re.compile(_wildcard_to_regex(pattern))
+
+    def match_regex(topic: str) -> bool:
+        return regex.match(topic) is not None
+
+    return match_regex
+
+
+def _regex_fallback(pattern: str, topic: str) -> bool:
+    """Match using the regex translation (for topics containing newlines)."""
+    return re.match(_wildcard_to_regex(pattern), topic) is not None
+
+
+class PatternCache:
+    """
+    Thread-safe LRU cache of compiled topic matchers.
+
+    Features:
+    - LRU eviction policy
+    - Literal and prefix fast paths (see compile_matcher)
+    - Hit/miss statistics
+
+    Attributes:
+        max_size: Maximum number of cached matchers
+
+    Example:
+        >>> cache = PatternCache(max_size=1024)
+        >>> matcher = cache.get("user.*")
+        >>> matcher("user.login")
+        True
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        """
+        Initialize pattern cache.
+
+        Args:
+            max_size: Maximum cache entries (0 = unlimited)
+        """
+        self.max_size = max_size
+
+        # OrderedDict for LRU behavior
+        self._cache: OrderedDict[str, TopicMatcher] = OrderedDict()
+        self._lock = RLock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, pattern: str) -> TopicMatcher:
+        """
+        Get the matcher for a pattern, compiling it on a miss.
+
+        Args:
+            pattern: Wildcard pattern
+
+        Returns:
+            Compiled matcher
+        """
+        with self._lock:
+            matcher = self._cache.get(pattern)
+            if matcher is not None:
+                self._cache.move_to_end(pattern)
+                self._hits += 1
+                return matcher
+
+            self._misses += 1
+            matcher = compile_matcher(pattern)
+            self._cache[pattern] = matcher
+
+            # Evict least recently used if over capacity
+            if self.max_size > 0 and len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+            return matcher
+
+    def clear(self) -> None:
+        """Clear all cached matchers."""
+        with self._lock:
+            self._cache.clear()
+
+    def size(self) -> int:
+        """Get current cache size."""
+        with self._lock:
+            return len(self._cache)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": hit_rate,
+                "total_requests": total_requests,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        """Get cache size."""
+        return self.size()
+
+    def __repr__(self) -> str:
+        """String representation for debugging."""
+        stats = self.get_stats()
+        return (
+            f"PatternCache("
+            f"size={stats['size']}/{stats['max_size']}, "
+            f"hit_rate={stats['hit_rate']:.2%})"
+        )
+
+
+# Shared matcher cache used by wildcard_match
+_pattern_cache = PatternCache()
+
+
+def get_pattern_cache() -> PatternCache:
+    """Get the shared pattern cache instance."""
+    return _pattern_cache
+
+
 def glob_match(pattern: str, topic: str) -> bool:
     """
     Match topic using shell-style glob patterns.
@@ -85,7 +283,23 @@ def extract_variables(pattern: str, topic: str) -> dict[str, str] | None:
     Returns:
         Dictionary of variable names to values, or None if no match
     """
-    # Convert pattern to regex with named groups
+    match = _variable_regex(pattern).match(topic)
+    if match:
+        return match.groupdict()
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _variable_regex(pattern: str) -> re.Pattern[str]:
+    """
+    Compile a variable pattern to a regex with named groups.
+
+    Args:
+        pattern: Pattern with variable placeholders
+
+    Returns:
+        Compiled regex
+    """
     regex_pattern = pattern
     variables = re.findall(r"\{(\w+)\}", pattern)
 
@@ -96,12 +310,7 @@ def extract_variables(pattern: str, topic: str) -> dict[str, str] | None:
     regex_pattern = regex_pattern.replace("*", r"[^.]+")
     regex_pattern = regex_pattern.replace("#", r".*")
 
-    regex_pattern = f"^{regex_pattern}$"
-
-    match = re.match(regex_pattern, topic)
-    if match:
-        return match.groupdict()
-    return None
+    return re.compile(f"^{regex_pattern}$")
 
 
 def is_wildcard_pattern(pattern: str) -> bool:
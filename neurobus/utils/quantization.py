@@ -0,0 +1,124 @@
+"""
+Scalar quantization of embedding vectors.
+
+"float16" halves a float32 vector. "int8" stores one signed byte per
+component plus one float32 scale per vector (its largest absolute
+component / 127), about a quarter of the size. Scores are computed from
+the codes a block of rows at a time, so a full-precision copy of a
+quantized matrix is never materialized.
+
+This module needs numpy and is not imported by neurobus.utils.
+"""
+
+from typing import Any
+
+import numpy as np
+
+QUANTIZATIONS = ("none", "float16", "int8")
+
+# Rows converted to float32 per block while scoring quantized codes; small
+# blocks are still in cache when multiplied
+_SCORE_CHUNK = 1024
+
+_CODE_DTYPES = {"none": np.float32, "float16": np.float16, "int8": np.int8}
+
+
+def validate_quantization(quantization: str) -> str:
+    """
+    Check a quantization mode.
+
+    Args:
+        quantization: Mode name
+
+    Returns:
+        The mode
+
+    Raises:
+        ValueError: If the mode is not one of QUANTIZATIONS
+    """
+    if quantization not in QUANTIZATIONS:
+        raise ValueError(f"Invalid quantization {quantization!r}. Must be one of: {QUANTIZATIONS}")
+    return quantization
+
+
+def code_dtype(quantization: str) -> Any:
+    """NumPy dtype of the codes of a quantization mode."""
+    return _CODE_DTYPES[quantization]
+
+
+def bytes_per_vector(dim: int, quantization: str) -> int:
+    """Bytes one quantized vector takes, including its scale."""
+    size = dim * int(np.dtype(code_dtype(quantization)).itemsize)
+    return size + 4 if quantization == "int8" else size
+
+
+def quantize(vectors: Any, quantization: str) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Quantize a matrix of vectors.
+
+    Args:
+        vectors: Matrix with one vector per row
+        quantization: Mode name
+
+    Returns:
+        (codes, scales): codes with the mode's dtype, and for int8 one
+        float32 scale per row (None otherwise)
+    """
+    array = np.asarray(vectors, dtype=np.float32)
+    if quantization != "int8":
+        return array.astype(code_dtype(quantization), copy=False), None
+
+    scales = np.abs(array).max(axis=-1) / 127.0
+    divisor = np.where(scales > 0, scales, 1.0)[..., None]
+    codes = np.rint(array / divisor).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize(codes: np.ndarray, scales: Any, quantization: str) -> np.ndarray:
+    """
+    Approximate the original vectors from their codes.
+
+    Args:
+        codes: Quantized vectors
+        scales: Per-vector scales (int8 only)
+        quantization: Mode name
+
+    Returns:
+        float32 vectors
+    """
+    vectors = codes.astype(np.float32)
+    if quantization == "int8":
+        vectors *= np.asarray(scales, dtype=np.float32)[..., None]
+    return vectors
+
+
+def quantized_scores(
+    codes: np.ndarray,
+    scales: np.ndarray | None,
+    query: np.ndarray,
+    quantization: str,
+) -> np.ndarray:
+    """
+    Dot products of a float32 query with every row of a code matrix.
+
+    Args:
+        codes: Quantized vectors, one per row
+        scales: Per-row scales (int8 only)
+        query: float32 query vector
+        quantization: Mode name
+
+    Returns:
+        float32 scores, one per row
+    """
+    if quantization == "none":
+        exact: np.ndarray = codes @ query
+        return exact
+
+    scores = np.empty(codes.shape[0], dtype=np.float32)
+    for start in range(0, codes.shape[0], _SCORE_CHUNK):
+        block = codes[start : start + _SCORE_CHUNK]
+        scores[start : start + len(block)] = block.astype(np.float32) @ query
+    if quantization == "int8":
+        assert scales is not None
+        scores *= scales
+    return scores
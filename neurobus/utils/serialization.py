@@ -1,11 +1,24 @@
 """Serialization utilities using msgpack."""
 
-from datetime import datetime
-from typing import Any
+import struct
+from collections.abc import Iterator, Mapping
+from datetime import UTC, datetime, timedelta, timezone
+from typing import Any, BinaryIO
 from uuid import UUID
 
 import msgpack
 
+# msgpack ext type codes used by serialize_compact
+EXT_UUID = 1
+EXT_DATETIME = 2  # Naive: int64 microseconds since 1970-01-01
+EXT_DATETIME_TZ = 3  # Aware: int64 UTC microseconds since the epoch, int32 UTC offset seconds
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_INT64 = struct.Struct("<q")
+_INT64_INT32 = struct.Struct("<qi")
+
 
 def serialize(data: Any) -> bytes:
     """
@@ -25,7 +38,7 @@ def serialize(data: Any) -> bytes:
     return msgpack.packb(data, default=_encode_special_types, use_bin_type=True)
 
 
-def deserialize(data: bytes) -> Any:
+def deserialize(data: bytes | memoryview) -> Any:
     """
     Deserialize data from msgpack format.
 
@@ -41,6 +54,120 @@ def deserialize(data: bytes) -> Any:
     return msgpack.unpackb(data, raw=False, object_hook=_decode_special_types)
 
 
+def serialize_compact(data: Any) -> bytes:
+    """
+    Serialize data to msgpack with ext types for UUID and datetime.
+
+    UUIDs take 18 bytes and datetimes 10 (14 with a timezone) instead
+    of the {"__uuid__": ...} and {"__datetime__": ...} maps serialize()
+    writes. Timezones round-trip as fixed UTC offsets, as with
+    serialize(). Other types are encoded as by serialize().
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        Serialized bytes
+
+    Raises:
+        TypeError: If data contains non-serializable types
+    """
+    packed: bytes = msgpack.packb(data, default=_encode_ext_types, use_bin_type=True)
+    return packed
+
+
+def deserialize_compact(data: bytes | memoryview) -> Any:
+    """
+    Deserialize data written by serialize_compact.
+
+    Maps may have non-string keys (e.g. ints), as serialize_compact
+    writes them.
+
+    Args:
+        data: Serialized bytes
+
+    Returns:
+        Deserialized data
+
+    Raises:
+        ValueError: If data is invalid msgpack
+    """
+    return msgpack.unpackb(data, raw=False, ext_hook=_decode_ext_types, strict_map_key=False)
+
+
+def iter_deserialize_compact(stream: BinaryIO, read_size: int = 1024 * 1024) -> Iterator[Any]:
+    """
+    Lazily deserialize consecutive serialize_compact values from a file.
+
+    Values are read read_size bytes at a time, so memory use does not
+    grow with the file.
+
+    Args:
+        stream: Binary file positioned at the first value
+        read_size: Bytes read from the file at a time
+
+    Returns:
+        Iterator over the deserialized values
+
+    Raises:
+        ValueError: If the file holds invalid msgpack
+    """
+    return iter(
+        msgpack.Unpacker(
+            stream,
+            raw=False,
+            ext_hook=_decode_ext_types,
+            read_size=read_size,
+            strict_map_key=False,
+        )
+    )
+
+
+def _encode_ext_types(obj: Any) -> Any:
+    """
+    Encode UUID and datetime as msgpack ext types, other types as serialize() does.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        Encoded representation
+    """
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(EXT_UUID, obj.bytes)
+    elif isinstance(obj, datetime):
+        offset = obj.utcoffset()
+        if offset is None:
+            return msgpack.ExtType(EXT_DATETIME, _INT64.pack((obj - _EPOCH) // _MICROSECOND))
+        return msgpack.ExtType(
+            EXT_DATETIME_TZ,
+            _INT64_INT32.pack((obj - _EPOCH_UTC) // _MICROSECOND, int(offset.total_seconds())),
+        )
+    return _encode_special_types(obj)
+
+
+def _decode_ext_types(code: int, data: bytes) -> Any:
+    """
+    Decode msgpack ext types written by _encode_ext_types.
+
+    Args:
+        code: Ext type code
+        data: Ext payload
+
+    Returns:
+        Decoded object (an ExtType for unknown codes)
+    """
+    if code == EXT_UUID:
+        return UUID(bytes=data)
+    elif code == EXT_DATETIME:
+        return _EPOCH + timedelta(microseconds=_INT64.unpack(data)[0])
+    elif code == EXT_DATETIME_TZ:
+        micros, offset = _INT64_INT32.unpack(data)
+        moment = _EPOCH_UTC + timedelta(microseconds=micros)
+        return moment.astimezone(timezone(timedelta(seconds=offset)))
+    return msgpack.ExtType(code, data)
+
+
 def _encode_special_types(obj: Any) -> Any:
     """
     Encode special types for msgpack serialization.
@@ -58,6 +185,9 @@ def _encode_special_types(obj: Any) -> Any:
         return {"__uuid__": str(obj)}
     elif isinstance(obj, datetime):
         return {"__datetime__": obj.isoformat()}
+    elif isinstance(obj, Mapping):
+        # Read-only or layered mappings (e.g. LayeredContext)
+        return dict(obj)
     elif hasattr(obj, "__dict__"):
         # Fallback for objects with __dict__
         return {"__object__": obj.__class__.__name__, "data": obj.__dict__}
@@ -0,0 +1,141 @@
+"""
+Single-thread workers for blocking I/O.
+
+A SerialWorker runs blocking calls one at a time on its own thread, so
+state that only the worker touches (an SQLite connection, an index being
+updated) needs no locks and is never seen half-updated. SQLiteWorker
+adds a connection opened and closed on that thread.
+"""
+
+import asyncio
+import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SerialWorker:
+    """
+    Runs blocking functions on one dedicated thread.
+
+    Example:
+        >>> worker = SerialWorker("neurobus-index")
+        >>> worker.start()
+        >>> result = await worker.run(index.search, query)
+        >>> await worker.stop()
+    """
+
+    def __init__(self, thread_name_prefix: str) -> None:
+        """
+        Initialize worker.
+
+        Args:
+            thread_name_prefix: Name prefix of the worker thread
+        """
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker thread accepts calls."""
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if running)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=self.thread_name_prefix
+            )
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run func(*args) on the worker thread.
+
+        Args:
+            func: Blocking function
+            *args: Positional arguments
+
+        Returns:
+            The function's result
+
+        Raises:
+            RuntimeError: If the worker is not running
+        """
+        if self._executor is None:
+            raise RuntimeError(f"{self.thread_name_prefix} worker is not running")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def stop(self) -> None:
+        """Finish queued calls and join the thread, off the event loop."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, True)
+
+
+class SQLiteWorker(SerialWorker):
+    """
+    SerialWorker owning one SQLite connection in WAL mode.
+
+    Subclasses create their schema in setup() and use conn only from
+    functions passed to run().
+    """
+
+    def __init__(self, path: Path, thread_name_prefix: str) -> None:
+        """
+        Initialize worker.
+
+        Args:
+            path: Database file
+            thread_name_prefix: Name prefix of the worker thread
+        """
+        super().__init__(thread_name_prefix)
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the connection is open."""
+        return self._conn is not None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """
+        The connection (worker thread only).
+
+        Raises:
+            RuntimeError: If the database is not open
+        """
+        if self._conn is None:
+            raise RuntimeError(f"{self.path} is not open")
+        return self._conn
+
+    async def open(self) -> None:
+        """Start the worker and open the database on it."""
+        self.start()
+        await self.run(self._open_sync)
+
+    def _open_sync(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        self.setup(conn)
+        conn.commit()
+        self._conn = conn
+
+    def setup(self, conn: sqlite3.Connection) -> None:
+        """
+        Prepare a newly opened connection (worker thread).
+
+        Args:
+            conn: Connection; committed after this returns
+        """
+
+    async def close(self) -> None:
+        """Close the connection and stop the worker."""
+        if self._conn is not None and self.is_running:
+            await self.run(self._conn.close)
+        self._conn = None
+        await self.stop()
@@ -0,0 +1,99 @@
+"""
+Benchmark: recall and throughput of the IVF index against brute force.
+
+Indexes clustered unit embeddings (384 dimensions, as all-MiniLM-L6-v2
+produces) and measures recall@10 and queries per second for several
+nprobe values. The exact answers come from a brute-force matrix product
+over the same vectors. Run the full comparison (100k and 1M vectors)
+with:
+
+    python -m tests.performance.test_ann_benchmark
+"""
+
+import time
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from neurobus.memory.ivf import IVFIndex
+
+DIM = 384
+K = 10
+QUERIES = 200
+CHUNK = 50_000
+NPROBES = (1, 4, 16, 64)
+
+
+def _clustered(count: int, rng: np.random.Generator, centres: np.ndarray) -> np.ndarray:
+    """Unit vectors scattered around random cluster centres."""
+    vectors = centres[rng.integers(0, len(centres), count)]
+    vectors += 0.8 * rng.standard_normal((count, DIM), dtype=np.float32) / np.sqrt(DIM)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def run_benchmark(num_vectors: int, nprobes: tuple[int, ...] = NPROBES) -> dict[str, dict]:
+    """Recall@10 and QPS of brute force and each nprobe."""
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal((4096, DIM), dtype=np.float32)
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+
+    data = np.empty((num_vectors, DIM), dtype=np.float32)
+    ids = [uuid4() for _ in range(num_vectors)]
+    index = IVFIndex(dim=DIM, normalize=False)
+    start = time.perf_counter()
+    for offset in range(0, num_vectors, CHUNK):
+        chunk = _clustered(min(CHUNK, num_vectors - offset), rng, centres)
+        data[offset : offset + len(chunk)] = chunk
+        index.add(ids[offset : offset + len(chunk)], chunk)
+    build_seconds = time.perf_counter() - start
+    queries = _clustered(QUERIES, rng, centres)
+
+    results: dict[str, dict] = {}
+    start = time.perf_counter()
+    exact = []
+    for query in queries:
+        scores = data @ query
+        top = np.argpartition(scores, -K)[-K:]
+        exact.append({ids[i] for i in top.tolist()})
+    results["brute force"] = {"recall": 1.0, "qps": QUERIES / (time.perf_counter() - start)}
+    del data
+
+    for nprobe in nprobes:
+        start = time.perf_counter()
+        found = [index.search(query, K, nprobe=nprobe) for query in queries]
+        qps = QUERIES / (time.perf_counter() - start)
+        hits = sum(
+            len(expected & {i for i, _ in top}) for expected, top in zip(exact, found, strict=True)
+        )
+        results[f"ivf nprobe={nprobe}"] = {"recall": hits / (K * QUERIES), "qps": qps}
+
+    stats = index.get_stats()
+    results["index"] = {
+        "lists": stats["lists"],
+        "build_s": build_seconds,
+        "mb": stats["bytes"] / 1024 / 1024,
+    }
+    return results
+
+
+@pytest.mark.performance
+def test_ivf_keeps_high_recall():
+    """At nprobe=16 the index must find most of the true nearest neighbours."""
+    results = run_benchmark(50_000, nprobes=(16,))
+
+    assert results["ivf nprobe=16"]["recall"] > 0.75
+
+
+if __name__ == "__main__":
+    for num_vectors in (100_000, 1_000_000):
+        results = run_benchmark(num_vectors)
+        info = results.pop("index")
+        print(
+            f"\n{num_vectors:,} vectors, {DIM} dimensions, {info['lists']} lists "
+            f"(built in {info['build_s']:.1f} s, {info['mb']:.0f} MB)"
+        )
+        print(f"{'search':>16} {'recall@10':>10} {'QPS':>10}")
+        for name, r in results.items():
+            print(f"{name:>16} {r['recall']:>10.3f} {r['qps']:>10.0f}")
@@ -0,0 +1,124 @@
+"""
+Benchmark: causal chain lookups served by the EventStore.
+
+Stores a causal forest, then compares rebuilding a CausalityGraph from a
+full replay (the only option before chains were queryable) with cold
+lookups through the store's parent_id index and hot lookups from the
+graph cache. Run the full comparison with:
+
+    python -m tests.performance.test_causal_store_benchmark
+"""
+
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.causality import CausalityGraph
+from neurobus.temporal.store import EventStore
+
+BATCH = 5000
+QUERIES = 200
+
+
+def _events(count: int, window: int = 1000, root_rate: float = 0.001) -> list[Event]:
+    """A forest where each parent is one of the last `window` events."""
+    rng = random.Random(0)
+    events: list[Event] = []
+    for i in range(count):
+        if events and rng.random() > root_rate:
+            parent = events[rng.randrange(max(0, len(events) - window), len(events))]
+            events.append(parent.child_event("bench", {"n": i}))
+        else:
+            events.append(Event(topic="bench", data={"n": i}))
+    return events
+
+
+async def _median_ms(coro_func, args) -> float:
+    latencies = []
+    for arg in args:
+        start = time.perf_counter()
+        await coro_func(arg)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+def run_benchmark(num_events: int) -> dict[str, float]:
+    """Time causal lookups on num_events stored events (milliseconds)."""
+    events = _events(num_events)
+    rng = random.Random(1)
+    targets = [rng.choice(events).id for _ in range(QUERIES)]
+
+    async def _run() -> dict[str, float]:
+        results = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            store = EventStore(db_path=Path(tmp) / "events.db", max_events=0)
+            await store.initialize()
+            for i in range(0, num_events, BATCH):
+                await store.store_events(events[i : i + BATCH])
+
+            start = time.perf_counter()
+            rebuilt = CausalityGraph()
+            async for event in store.stream_events(page_size=5000):
+                rebuilt.add_event(event)
+            rebuilt.get_causal_chain(targets[0])
+            results["full rebuild, first lookup"] = (time.perf_counter() - start) * 1000
+
+            results["store get_causal_chain"] = await _median_ms(store.get_causal_chain, targets)
+
+            graph = CausalityGraph(store=store, max_events=100_000)
+            results["graph cold lookup"] = await _median_ms(graph.load_causal_chain, targets)
+            results["graph hot lookup"] = await _median_ms(graph.load_causal_chain, targets)
+
+            async def descendants(event_id):
+                return [e async for e in store.get_descendants(event_id, max_depth=3)]
+
+            results["store descendants (3 levels)"] = await _median_ms(descendants, targets[:50])
+            await store.close()
+        return results
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.performance
+def test_store_lookups_match_rebuilt_graph():
+    """Store and store-backed graph lookups must match a graph rebuilt by replay."""
+    events = _events(5000, window=100, root_rate=0.01)
+    rng = random.Random(1)
+    targets = [rng.choice(events).id for _ in range(50)]
+
+    async def _run(tmp: Path) -> None:
+        store = EventStore(db_path=tmp / "events.db", max_events=0)
+        await store.initialize()
+        await store.store_events(events)
+
+        rebuilt = CausalityGraph()
+        async for event in store.stream_events(page_size=1000):
+            rebuilt.add_event(event)
+
+        graph = CausalityGraph(store=store, max_events=100_000)
+        for target in targets:
+            expected = rebuilt.get_causal_chain(target)
+            assert [e.id for e in await store.get_causal_chain(target)] == expected
+            assert await graph.load_causal_chain(target) == expected
+            assert await graph.load_causal_chain(target) == expected
+
+            descendants = {e.id async for e in store.get_descendants(target)}
+            assert descendants == set(rebuilt.get_descendants(target))
+        await store.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run(Path(tmp)))
+
+
+if __name__ == "__main__":
+    for num_events in (100_000, 500_000):
+        results = run_benchmark(num_events)
+        print(f"\n{num_events:,} events, median latency (ms)")
+        for name, ms in results.items():
+            print(f"{name:>30} {ms:>10.2f}")
@@ -0,0 +1,165 @@
+"""
+Benchmark: CausalityGraph ancestry queries, stats and memory.
+
+Builds a forest where each event's parent is a recent earlier event and
+compares the indexed graph with a replica of the previous dict-of-parents
+implementation on is_ancestor, find_common_ancestor, get_descendants and
+get_stats. Run the full comparison (1M events) with:
+
+    python -m tests.performance.test_causality_benchmark
+"""
+
+import random
+import statistics
+import time
+import tracemalloc
+from collections import defaultdict
+from uuid import UUID
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.causality import CausalityGraph
+
+QUERIES = 2000
+
+
+class LegacyGraph:
+    """Replica of the previous CausalityGraph queries."""
+
+    def __init__(self) -> None:
+        self._parents: dict[UUID, UUID | None] = {}
+        self._children: dict[UUID, list[UUID]] = defaultdict(list)
+        self._events: dict[UUID, dict] = {}
+
+    def add_event(self, event: Event) -> None:
+        self._parents[event.id] = event.parent_id
+        if event.parent_id:
+            self._children[event.parent_id].append(event.id)
+        self._events[event.id] = {
+            "topic": event.topic,
+            "timestamp": event.timestamp,
+            "parent_id": event.parent_id,
+        }
+
+    def get_ancestors(self, event_id: UUID) -> list[UUID]:
+        ancestors = []
+        current = event_id
+        while True:
+            parent = self._parents.get(current)
+            if parent is None:
+                break
+            ancestors.append(parent)
+            current = parent
+        return ancestors
+
+    def get_descendants(self, event_id: UUID) -> list[UUID]:
+        descendants = []
+        to_visit = list(self._children.get(event_id, []))
+        while to_visit:
+            current = to_visit.pop(0)
+            descendants.append(current)
+            to_visit.extend(self._children.get(current, []))
+        return descendants
+
+    def is_ancestor(self, potential_ancestor: UUID, event_id: UUID) -> bool:
+        return potential_ancestor in self.get_ancestors(event_id)
+
+    def find_common_ancestor(self, event_id1: UUID, event_id2: UUID) -> UUID | None:
+        ancestors1 = set(self.get_ancestors(event_id1))
+        for ancestor in self.get_ancestors(event_id2):
+            if ancestor in ancestors1:
+                return ancestor
+        return None
+
+    def get_stats(self) -> dict[str, int]:
+        max_depth = max((len(self.get_ancestors(e)) for e in self._parents), default=0)
+        return {"events_tracked": len(self._parents), "max_depth": max_depth}
+
+
+def _events(count: int, window: int = 1000, root_rate: float = 0.001) -> list[Event]:
+    """A forest where each parent is one of the last `window` events."""
+    rng = random.Random(0)
+    events: list[Event] = []
+    for i in range(count):
+        if events and rng.random() > root_rate:
+            parent = events[rng.randrange(max(0, len(events) - window), len(events))]
+            events.append(Event(topic="bench", parent_id=parent.id))
+        else:
+            events.append(Event(topic="bench"))
+    for event in events:
+        # Ids and timestamps are generated lazily; keep that out of the timings
+        _ = (event.id, event.timestamp)
+    return events
+
+
+def _median_us(func, pairs) -> float:
+    latencies = []
+    for a, b in pairs:
+        start = time.perf_counter()
+        func(a, b)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(latencies)
+
+
+def run_benchmark(num_events: int) -> dict[str, dict[str, float]]:
+    """Time graph operations on num_events events, indexed and previous."""
+    events = _events(num_events)
+    rng = random.Random(1)
+    pairs = [(rng.choice(events).id, rng.choice(events).id) for _ in range(QUERIES)]
+    graphs = {"indexed": CausalityGraph(), "previous": LegacyGraph()}
+
+    results: dict[str, dict[str, float]] = {}
+    for name, graph in graphs.items():
+        r: dict[str, float] = {}
+        tracemalloc.start()
+        start = time.perf_counter()
+        for event in events:
+            graph.add_event(event)
+        r["add_per_s"] = num_events / (time.perf_counter() - start)
+        r["bytes_per_event"] = tracemalloc.get_traced_memory()[0] / num_events
+        tracemalloc.stop()
+
+        true_pairs = [(graph.get_ancestors(b)[-1], b) for _, b in pairs[:200]]
+        r["is_ancestor_us"] = _median_us(graph.is_ancestor, pairs)
+        r["is_ancestor_true_us"] = _median_us(graph.is_ancestor, true_pairs)
+        r["common_ancestor_us"] = _median_us(graph.find_common_ancestor, pairs)
+        root = events[0].id
+        start = time.perf_counter()
+        graph.get_descendants(root)
+        r["descendants_ms"] = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        r["max_depth"] = graph.get_stats()["max_depth"]
+        r["stats_ms"] = (time.perf_counter() - start) * 1000
+        results[name] = r
+    return results
+
+
+@pytest.mark.performance
+def test_indexed_graph_matches_chain_walks():
+    """Indexed ancestry, LCA and descendant queries must answer like chain walks."""
+    events = _events(5000)
+    rng = random.Random(1)
+    pairs = [(rng.choice(events).id, rng.choice(events).id) for _ in range(500)]
+
+    indexed, previous = CausalityGraph(), LegacyGraph()
+    for event in events:
+        indexed.add_event(event)
+        previous.add_event(event)
+
+    assert indexed.get_stats()["max_depth"] == previous.get_stats()["max_depth"]
+    for a, b in pairs:
+        assert indexed.is_ancestor(a, b) == previous.is_ancestor(a, b)
+        assert indexed.find_common_ancestor(a, b) == previous.find_common_ancestor(a, b)
+    root = events[0].id
+    assert set(indexed.get_descendants(root)) == set(previous.get_descendants(root))
+
+
+if __name__ == "__main__":
+    for num_events in (100_000, 1_000_000):
+        results = run_benchmark(num_events)
+        print(f"\n{num_events:,} events")
+        names = list(results)
+        print(f"{'':>24}" + "".join(f"{n:>14}" for n in names))
+        for key in results[names[0]]:
+            print(f"{key:>24}" + "".join(f"{results[n][key]:>14.1f}" for n in names))
@@ -0,0 +1,105 @@
+"""
+Benchmark: EventDispatcher fast path vs. the previous gather/wait_for path.
+
+Run the full comparison with:
+
+    python -m tests.performance.test_dispatch_benchmark
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from neurobus.core.dispatcher import EventDispatcher
+from neurobus.core.event import Event
+from neurobus.core.subscription import Subscription
+from neurobus.utils.timing import with_timeout
+
+
+class _LegacyDispatcher(EventDispatcher):
+    """Replica of the dispatch path before the fast path was added."""
+
+    async def dispatch(self, event: Event, subscriptions: list[Subscription]) -> None:
+        if not subscriptions:
+            return
+        self._total_dispatched += 1
+        tasks = [self._execute_legacy(event, sub) for sub in subscriptions]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _execute_legacy(self, event: Event, subscription: Subscription) -> None:
+        async with self._semaphore:
+            await with_timeout(
+                subscription.handle_event(event),
+                timeout=self.handler_timeout,
+                error_context={
+                    "event_id": str(event.id),
+                    "subscription_id": str(subscription.id),
+                },
+            )
+            self._total_succeeded += 1
+
+
+async def _handler(event: Event) -> None:
+    pass
+
+
+async def _events_per_second(
+    dispatcher: EventDispatcher, num_subscribers: int, num_events: int
+) -> float:
+    """Dispatch num_events to num_subscribers no-op handlers and return events/sec."""
+    subs = [Subscription(pattern="bench", handler=_handler) for _ in range(num_subscribers)]
+    event = Event(topic="bench")
+
+    start = time.perf_counter()
+    for _ in range(num_events):
+        await dispatcher.dispatch(event, subs)
+    return num_events / (time.perf_counter() - start)
+
+
+def run_benchmark(num_subscribers: int, num_events: int) -> dict[str, float]:
+    """Compare legacy and current dispatch throughput."""
+
+    async def _run() -> dict[str, float]:
+        legacy = await _events_per_second(_LegacyDispatcher(), num_subscribers, num_events)
+        current = await _events_per_second(EventDispatcher(), num_subscribers, num_events)
+        return {"legacy_eps": legacy, "current_eps": current, "speedup": current / legacy}
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("num_subscribers", [1, 3])
+def test_fast_path_matches_legacy_dispatch(num_subscribers):
+    """Both dispatch paths must call every handler once and count the same stats."""
+
+    async def _calls(dispatcher: EventDispatcher) -> tuple[list[str], int, int]:
+        received: list[str] = []
+
+        async def handler(event: Event) -> None:
+            received.append(event.topic)
+
+        subs = [Subscription(pattern="bench", handler=handler) for _ in range(num_subscribers)]
+        for _ in range(100):
+            await dispatcher.dispatch(Event(topic="bench"), subs)
+        stats = dispatcher.get_stats()
+        return received, stats["total_dispatched"], stats["total_succeeded"]
+
+    async def _run() -> None:
+        legacy = await _calls(_LegacyDispatcher())
+        current = await _calls(EventDispatcher())
+
+        assert current == legacy
+        assert len(current[0]) == current[2] == 100 * num_subscribers
+
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    print(f"{'subscribers':>12} {'legacy ev/s':>12} {'current ev/s':>13} {'speedup':>8}")
+    for subscribers in (1, 2, 10):
+        r = run_benchmark(num_subscribers=subscribers, num_events=50_000)
+        print(
+            f"{subscribers:>12} {r['legacy_eps']:>12.0f} "
+            f"{r['current_eps']:>13.0f} {r['speedup']:>7.1f}x"
+        )
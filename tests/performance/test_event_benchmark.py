@@ -0,0 +1,82 @@
+"""
+Benchmark: slotted lazy Event vs. the previous @dataclass Event.
+
+Run the full comparison with:
+
+    python -m tests.performance.test_event_benchmark
+"""
+
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from neurobus.core.event import Event
+
+
+@dataclass
+class _LegacyEvent:
+    """Replica of Event before it was slotted."""
+
+    topic: str
+    data: dict[str, Any] = field(default_factory=dict)
+    id: UUID = field(default_factory=uuid4)
+    timestamp: datetime = field(default_factory=datetime.now)
+    context: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    parent_id: UUID | None = None
+
+
+def _bytes_per_event(cls: type, num_events: int) -> float:
+    """Return traced bytes allocated per live event."""
+    tracemalloc.start()
+    events = [cls(topic="bench", data={"n": i}) for i in range(num_events)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return size / num_events
+
+
+def _events_per_second(cls: type, num_events: int) -> float:
+    """Return events created per second."""
+    start = time.perf_counter()
+    for i in range(num_events):
+        cls(topic="bench", data={"n": i})
+    return num_events / (time.perf_counter() - start)
+
+
+def run_benchmark(num_events: int) -> dict[str, float]:
+    """Compare memory and creation rate of the legacy and current Event."""
+    return {
+        "legacy_bytes": _bytes_per_event(_LegacyEvent, num_events),
+        "current_bytes": _bytes_per_event(Event, num_events),
+        "legacy_eps": _events_per_second(_LegacyEvent, num_events),
+        "current_eps": _events_per_second(Event, num_events),
+    }
+
+
+@pytest.mark.performance
+def test_event_memory_benchmark():
+    """Slotted events must be smaller and expose the legacy defaults."""
+    assert _bytes_per_event(Event, 5000) < _bytes_per_event(_LegacyEvent, 5000)
+
+    event, legacy = Event(topic="bench"), _LegacyEvent(topic="bench")
+    for name in ("data", "context", "metadata", "parent_id"):
+        assert getattr(event, name) == getattr(legacy, name)
+    assert isinstance(event.id, UUID) and event.id == event.id
+    assert isinstance(event.timestamp, datetime)
+
+
+if __name__ == "__main__":
+    r = run_benchmark(num_events=200_000)
+    print(f"{'':>8} {'bytes/event':>12} {'events/s':>12}")
+    print(f"{'legacy':>8} {r['legacy_bytes']:>12.0f} {r['legacy_eps']:>12.0f}")
+    print(f"{'current':>8} {r['current_bytes']:>12.0f} {r['current_eps']:>12.0f}")
+    print(
+        f"{'ratio':>8} {r['legacy_bytes'] / r['current_bytes']:>11.1f}x "
+        f"{r['current_eps'] / r['legacy_eps']:>11.1f}x"
+    )
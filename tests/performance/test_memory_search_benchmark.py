@@ -0,0 +1,116 @@
+"""
+Benchmark: semantic memory search over the embedding matrix.
+
+Fills a MemoryStore with random unit embeddings (384 dimensions, as
+all-MiniLM-L6-v2 produces) and times search_similar() against a replica
+of the previous search, a Python loop scoring list embeddings one at a
+time. Run the full comparison (10k, 100k and 1M memories) with:
+
+    python -m tests.performance.test_memory_search_benchmark
+"""
+
+import statistics
+import time
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from neurobus.memory.store import MemoryEntry, MemoryStore
+
+DIM = 384
+QUERIES = 20
+CHUNK = 10_000
+
+
+def _unit_vectors(count: int, rng: np.random.Generator) -> np.ndarray:
+    vectors = rng.standard_normal((count, DIM), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def legacy_search(entries: list[MemoryEntry], query: np.ndarray, limit: int, threshold: float):
+    """Replica of the previous MemoryEngine.search loop over list embeddings."""
+    results = []
+    for entry in entries:
+        if entry.embedding is None:
+            continue
+        similarity = max(0.0, min(1.0, float(np.dot(query, entry.embedding))))
+        if similarity >= threshold:
+            results.append((entry, similarity))
+    results.sort(key=lambda x: x[1], reverse=True)
+    return results[:limit]
+
+
+def _median_ms(func, queries) -> float:
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+def run_benchmark(num_memories: int, legacy: bool = True) -> dict[str, float]:
+    """Median search latency (ms) over num_memories memories."""
+    rng = np.random.default_rng(0)
+    queries = _unit_vectors(QUERIES, rng)
+    store = MemoryStore(max_memories=num_memories + 1)
+    legacy_entries = []
+
+    add_seconds = 0.0
+    for offset in range(0, num_memories, CHUNK):
+        vectors = _unit_vectors(min(CHUNK, num_memories - offset), rng)
+        start = time.perf_counter()
+        for vector in vectors:
+            store.add(MemoryEntry(uuid4(), "bench", "", embedding=vector))
+        add_seconds += time.perf_counter() - start
+        if legacy:
+            legacy_entries.extend(
+                MemoryEntry(uuid4(), "bench", "", embedding=v) for v in vectors.tolist()
+            )
+    results = {"add_us": add_seconds * 1_000_000 / num_memories}
+
+    results["matrix_ms"] = _median_ms(lambda q: store.search_similar(q, limit=10), queries)
+    if legacy:
+        results["legacy_ms"] = _median_ms(
+            lambda q: legacy_search(legacy_entries, q, 10, 0.0), queries[:3]
+        )
+
+        # Same top results as the loop
+        query = queries[0]
+        expected = [e.embedding for e, _ in legacy_search(legacy_entries, query, 10, 0.0)]
+        found = [e.embedding.tolist() for e, _ in store.search_similar(query, limit=10)]
+        assert np.allclose(found, expected, atol=1e-6)
+
+    results["matrix_mb"] = store.get_stats()["embeddings"]["bytes"] / 1024 / 1024
+    return results
+
+
+@pytest.mark.performance
+def test_matrix_search_matches_python_loop():
+    """Matrix search must return the same memories and scores as the loop."""
+    rng = np.random.default_rng(0)
+    vectors = _unit_vectors(2000, rng)
+    store = MemoryStore(max_memories=len(vectors) + 1)
+    legacy_entries = []
+    for vector in vectors:
+        event_id = uuid4()
+        store.add(MemoryEntry(event_id, "bench", "", embedding=vector))
+        legacy_entries.append(MemoryEntry(event_id, "bench", "", embedding=vector.tolist()))
+
+    for query in _unit_vectors(QUERIES, rng):
+        expected = legacy_search(legacy_entries, query, 10, 0.0)
+        found = store.search_similar(query, limit=10)
+        assert [e.event_id for e, _ in found] == [e.event_id for e, _ in expected]
+        assert [s for _, s in found] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+
+if __name__ == "__main__":
+    for num_memories, legacy in ((10_000, True), (100_000, True), (1_000_000, False)):
+        r = run_benchmark(num_memories, legacy)
+        print(f"\n{num_memories:,} memories, {DIM} dimensions")
+        print(f"  previous loop search:  {r.get('legacy_ms', float('nan')):>9.1f} ms")
+        print(f"  matrix search:         {r['matrix_ms']:>9.1f} ms")
+        print(f"  add:                   {r['add_us']:>9.1f} us/memory")
+        print(f"  matrix size:           {r['matrix_mb']:>9.1f} MB")
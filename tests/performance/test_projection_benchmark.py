@@ -0,0 +1,118 @@
+"""
+Benchmark: checkpointed state_at() vs. full replay.
+
+Stores an account history, builds checkpoints once, then times
+state_at() at random points in time with checkpoints and with a full
+replay from the beginning, for several checkpoint intervals. Run the
+full comparison with:
+
+    python -m tests.performance.test_projection_benchmark
+"""
+
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.engine import TemporalEngine
+
+BATCH = 5000
+QUERIES = 20
+
+
+def _events(count: int) -> list[Event]:
+    """Deposits and withdrawals over 100 accounts, one millisecond apart."""
+    start = datetime.now() - timedelta(seconds=count / 1000)
+    return [
+        Event(
+            topic="account.withdrawn" if i % 4 == 0 else "account.deposited",
+            data={"account": f"acc-{i % 100}", "amount": i % 50 + 1},
+            timestamp=start + timedelta(milliseconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def balances(state: dict, event: Event) -> dict:
+    """Per-account balances."""
+    sign = -1 if event.topic == "account.withdrawn" else 1
+    account = event.data["account"]
+    state[account] = state.get(account, 0) + sign * event.data["amount"]
+    return state
+
+
+async def _latency_ms(engine: TemporalEngine, times: list[datetime], **options) -> float:
+    """Median state_at() latency over the given points in time."""
+    latencies = []
+    for at in times:
+        start = time.perf_counter()
+        await engine.state_at("balances", at, **options)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+
+def run_benchmark(num_events: int, intervals: tuple[int, ...]) -> dict[str, float]:
+    """Median state_at() latency per checkpoint interval and for full replay."""
+    events = _events(num_events)
+    rng = random.Random(0)
+    times = [rng.choice(events).timestamp for _ in range(QUERIES)]
+
+    async def _run() -> dict[str, float]:
+        results = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = TemporalEngine(db_path=str(Path(tmp) / "events.db"), max_events=0)
+            await engine.initialize()
+            for i in range(0, num_events, BATCH):
+                await engine.store_events(events[i : i + BATCH])
+
+            for interval in intervals:
+                await engine.register_projection(
+                    "balances", balances, "account.*", {}, interval, version=interval
+                )
+                start = time.perf_counter()
+                await engine.state_at("balances")
+                results[f"first call (every {interval})"] = (time.perf_counter() - start) * 1000
+                results[f"checkpoints every {interval}"] = await _latency_ms(engine, times)
+
+            results["full replay"] = await _latency_ms(engine, times[:5], use_checkpoints=False)
+            await engine.close()
+        return results
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.performance
+def test_checkpointed_state_matches_full_replay():
+    """state_at() from checkpoints must equal a full replay at any point in time."""
+    events = _events(5000)
+    rng = random.Random(0)
+    times = [rng.choice(events).timestamp for _ in range(QUERIES)]
+
+    async def _run(tmp: Path) -> None:
+        engine = TemporalEngine(db_path=str(tmp / "events.db"), max_events=0)
+        await engine.initialize()
+        await engine.store_events(events)
+        await engine.register_projection("balances", balances, "account.*", {}, 500)
+        await engine.state_at("balances")
+
+        for at in times:
+            expected = await engine.state_at("balances", at, use_checkpoints=False)
+            assert await engine.state_at("balances", at) == expected
+        await engine.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run(Path(tmp)))
+
+
+if __name__ == "__main__":
+    for num_events in (100_000, 500_000):
+        results = run_benchmark(num_events, (1000, 10_000))
+        print(f"\n{num_events:,} events, median state_at() latency (ms)")
+        for name, ms in results.items():
+            print(f"{name:>28} {ms:>10.1f}")
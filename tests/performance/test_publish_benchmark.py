@@ -0,0 +1,113 @@
+"""
+Benchmark: NeuroBus.publish_many vs. a loop of publish.
+
+Run the full comparison with:
+
+    python -m tests.performance.test_publish_benchmark
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from neurobus import Event, NeuroBus
+from neurobus.config.schema import NeuroBusConfig
+
+
+def _make_bus(store_path: Path | None, delivered: list[Event] | None = None) -> NeuroBus:
+    """Create a bus with a few wildcard subscribers, optionally persisting events."""
+    config = NeuroBusConfig(
+        temporal={"enabled": store_path is not None, "store_path": store_path or Path(".")},
+    )
+    bus = NeuroBus(config=config)
+
+    async def handler(event: Event) -> None:
+        if delivered is not None:
+            delivered.append(event)
+
+    bus.subscribe("metrics.*", handler=handler)
+    bus.subscribe("metrics.#", handler=handler)
+    bus.subscribe("metrics.cpu", handler=handler)
+    return bus
+
+
+async def _run(num_events: int, batch_size: int, store_path: Path | None) -> dict[str, float]:
+    """Measure events/sec for publish loop vs publish_many."""
+    events = [Event(topic=f"metrics.{('cpu', 'mem', 'disk')[i % 3]}") for i in range(num_events)]
+
+    bus = _make_bus(store_path / "loop" if store_path else None)
+    async with bus:
+        start = time.perf_counter()
+        for event in events:
+            await bus.publish(event)
+        loop_time = time.perf_counter() - start
+
+    events = [Event(topic=event.topic) for event in events]
+    bus = _make_bus(store_path / "batch" if store_path else None)
+    async with bus:
+        start = time.perf_counter()
+        for i in range(0, num_events, batch_size):
+            await bus.publish_many(events[i : i + batch_size])
+        batch_time = time.perf_counter() - start
+
+    return {
+        "loop_eps": num_events / loop_time,
+        "batch_eps": num_events / batch_time,
+        "speedup": loop_time / batch_time,
+    }
+
+
+def run_benchmark(num_events: int, batch_size: int, persist: bool) -> dict[str, float]:
+    """Run one benchmark configuration."""
+    if not persist:
+        return asyncio.run(_run(num_events, batch_size, None))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        return asyncio.run(_run(num_events, batch_size, Path(tmp)))
+
+
+async def _deliveries(store_path: Path, batch_size: int | None) -> tuple[list[str], int]:
+    """Topics of handler calls, and stored event count, after one workload."""
+    events = [Event(topic=f"metrics.{('cpu', 'mem', 'disk')[i % 3]}") for i in range(300)]
+    delivered: list[Event] = []
+    bus = _make_bus(store_path, delivered)
+    async with bus:
+        if batch_size is None:
+            for event in events:
+                await bus.publish(event)
+        else:
+            for i in range(0, len(events), batch_size):
+                await bus.publish_many(events[i : i + batch_size])
+        stored = await bus.temporal.count_events()
+    return [event.topic for event in delivered], stored
+
+
+@pytest.mark.performance
+def test_publish_many_matches_publish_loop_with_persistence():
+    """Batches must deliver and persist the same events as the publish loop."""
+
+    async def _compare(tmp: Path) -> None:
+        loop_calls, loop_stored = await _deliveries(tmp / "loop", None)
+        batch_calls, batch_stored = await _deliveries(tmp / "batch", 100)
+
+        # cpu matches three subscriptions, mem and disk two
+        assert len(loop_calls) == 100 * 3 + 200 * 2
+        assert sorted(batch_calls) == sorted(loop_calls)
+        assert batch_stored == loop_stored == 300
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_compare(Path(tmp)))
+
+
+if __name__ == "__main__":
+    print(f"{'persist':>8} {'batch':>6} {'loop ev/s':>12} {'batch ev/s':>12} {'speedup':>8}")
+    for persist in (False, True):
+        for batch_size in (10, 100, 1000):
+            r = run_benchmark(num_events=10_000, batch_size=batch_size, persist=persist)
+            print(
+                f"{persist!s:>8} {batch_size:>6} {r['loop_eps']:>12.0f} "
+                f"{r['batch_eps']:>12.0f} {r['speedup']:>7.1f}x"
+            )
@@ -0,0 +1,119 @@
+"""
+Benchmark: footprint and recall of quantized embedding storage.
+
+Fills an EmbeddingMatrix with clustered unit embeddings (384 dimensions,
+as all-MiniLM-L6-v2 produces) stored as float32, float16, int8, and int8
+reranked at full precision from memory-mapped originals. Reports resident
+bytes per vector, recall@10 against an exact float32 search and median
+search latency, plus the bytes per entry of an EmbeddingCache. Run the
+full comparison (100k and 1M vectors) with:
+
+    python -m tests.performance.test_quantization_benchmark
+"""
+
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from neurobus.memory.vectors import EmbeddingMatrix
+from neurobus.semantic.cache import EmbeddingCache
+
+DIM = 384
+K = 10
+QUERIES = 50
+CHUNK = 50_000
+MODES = {
+    "float32": {"quantization": "none"},
+    "float16": {"quantization": "float16"},
+    "int8": {"quantization": "int8"},
+    "int8 + rerank x4": {"quantization": "int8", "rerank": 4},
+}
+
+
+def _clustered(count: int, rng: np.random.Generator) -> np.ndarray:
+    """Unit vectors scattered around 4096 random cluster centres."""
+    centres = np.random.default_rng(42).standard_normal((4096, DIM), dtype=np.float32)
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+    vectors = centres[rng.integers(0, len(centres), count)]
+    vectors += 0.8 * rng.standard_normal((count, DIM), dtype=np.float32) / np.sqrt(DIM)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def run_benchmark(num_vectors: int, modes: dict = MODES) -> dict[str, dict]:
+    """Bytes per vector, recall@10 and median latency (ms) per storage mode."""
+    rng = np.random.default_rng(0)
+    data = np.empty((num_vectors, DIM), dtype=np.float32)
+    for offset in range(0, num_vectors, CHUNK):
+        data[offset : offset + CHUNK] = _clustered(min(CHUNK, num_vectors - offset), rng)
+    queries = _clustered(QUERIES, rng)
+    exact = [set(np.argpartition(data @ q, -K)[-K:].tolist()) for q in queries]
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, options in modes.items():
+            if options.get("rerank"):
+                options = {**options, "originals_path": Path(tmp) / "originals.f32"}
+            matrix = EmbeddingMatrix(initial_capacity=num_vectors, **options)
+            ids = list(range(num_vectors))  # Row numbers double as memory IDs
+            for row, vector in zip(ids, data, strict=True):
+                matrix.add(row, vector)
+
+            latencies, hits = [], 0
+            for query, expected in zip(queries, exact, strict=True):
+                start = time.perf_counter()
+                found = matrix.search(query, K)
+                latencies.append((time.perf_counter() - start) * 1000)
+                hits += len(expected & {row for row, _ in found})
+
+            stats = matrix.get_stats()
+            results[name] = {
+                "bytes_per_vector": stats["bytes"] / stats["capacity"],
+                "recall": hits / (K * QUERIES),
+                "ms": statistics.median(latencies),
+            }
+            del matrix
+    return results
+
+
+def cache_bytes_per_entry(entries: int = 1000) -> dict[str, float]:
+    """Embedding bytes per EmbeddingCache entry for each storage mode."""
+    rng = np.random.default_rng(0)
+    vectors = _clustered(entries, rng)
+    sizes = {}
+    for quantization in ("none", "float16", "int8"):
+        cache = EmbeddingCache(max_size=0, ttl=0, quantization=quantization)
+        for i, vector in enumerate(vectors):
+            cache.set(f"text {i}", vector)
+        sizes[quantization] = cache.get_stats()["bytes_per_vector"]
+    return sizes
+
+
+@pytest.mark.performance
+def test_int8_quarters_memory_and_rerank_restores_recall():
+    """int8 must take about a quarter of float32 with reranked recall near exact."""
+    results = run_benchmark(20_000)
+
+    assert results["int8"]["bytes_per_vector"] < 0.3 * results["float32"]["bytes_per_vector"]
+    assert results["int8"]["recall"] > 0.9
+    assert results["int8 + rerank x4"]["recall"] > 0.99
+    assert results["float16"]["recall"] > 0.99
+
+
+if __name__ == "__main__":
+    for num_vectors in (100_000, 1_000_000):
+        results = run_benchmark(num_vectors)
+        print(f"\n{num_vectors:,} vectors, {DIM} dimensions")
+        print(f"{'storage':>18} {'bytes/vector':>13} {'recall@10':>10} {'search ms':>10}")
+        for name, r in results.items():
+            print(
+                f"{name:>18} {r['bytes_per_vector']:>13.0f} {r['recall']:>10.3f} {r['ms']:>10.1f}"
+            )
+
+    print(f"\nEmbeddingCache, {DIM} dimensions (bytes per entry, float32 input)")
+    for quantization, size in cache_bytes_per_entry().items():
+        print(f"{quantization:>18} {size:>13.0f}")
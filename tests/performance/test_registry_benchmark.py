@@ -0,0 +1,101 @@
+"""
+Benchmark: segment trie vs. linear wildcard scan in SubscriptionRegistry.
+
+Run the full comparison (10, 1k and 100k patterns) with:
+
+    python -m tests.performance.test_registry_benchmark
+"""
+
+import time
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.core.registry import SubscriptionRegistry
+from neurobus.core.subscription import Subscription
+from neurobus.utils.patterns import wildcard_match
+
+
+async def _handler(event: Event) -> None:
+    pass
+
+
+def _build_registry(num_patterns: int) -> SubscriptionRegistry:
+    """Build a registry with a mix of agent/tenant style wildcard patterns."""
+    registry = SubscriptionRegistry(max_size=0)
+    for i in range(num_patterns):
+        kind = i % 3
+        if kind == 0:
+            pattern = f"agent.*.status{i}"
+        elif kind == 1:
+            pattern = f"tenant{i}.#"
+        else:
+            pattern = f"*.service{i}.*"
+        registry.add(Subscription(pattern=pattern, handler=_handler))
+    return registry
+
+
+def _linear_scan(registry: SubscriptionRegistry, topic: str) -> list[str]:
+    """Reference implementation: test every wildcard pattern."""
+    return [p for p in registry._wildcard_patterns if wildcard_match(p, topic)]
+
+
+def _time_per_lookup(func, topics: list[str], min_seconds: float = 0.2) -> float:
+    """Return average seconds per call of func over topics."""
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        for topic in topics:
+            func(topic)
+        calls += len(topics)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def _topics(num_patterns: int) -> list[str]:
+    """Topics hitting each pattern kind, plus one that matches nothing."""
+    return [
+        "agent.7.status0",
+        f"tenant{num_patterns // 2 - (num_patterns // 2) % 3 + 1}.users.created",
+        "edge.service2.ping",
+        "unmatched.topic.here",
+    ]
+
+
+def run_benchmark(num_patterns: int) -> dict[str, float]:
+    """Compare trie and linear lookup latency for a registry size."""
+    registry = _build_registry(num_patterns)
+    topics = _topics(num_patterns)
+
+    for topic in topics:
+        assert sorted(registry._trie.match(topic)) == sorted(_linear_scan(registry, topic))
+
+    trie_time = _time_per_lookup(registry._trie.match, topics)
+    linear_time = _time_per_lookup(lambda t: _linear_scan(registry, t), topics)
+
+    return {
+        "patterns": num_patterns,
+        "trie_us": trie_time * 1e6,
+        "linear_us": linear_time * 1e6,
+        "speedup": linear_time / trie_time,
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("num_patterns", [10, 1000])
+def test_trie_matches_linear_scan(num_patterns):
+    """Trie lookup must find the same patterns as the linear scan."""
+    registry = _build_registry(num_patterns)
+
+    for topic in _topics(num_patterns):
+        expected = _linear_scan(registry, topic)
+        assert sorted(registry._trie.match(topic)) == sorted(expected)
+        assert expected or topic == "unmatched.topic.here"
+
+
+if __name__ == "__main__":
+    print(f"{'patterns':>10} {'trie (us)':>12} {'linear (us)':>12} {'speedup':>10}")
+    for size in (10, 1_000, 100_000):
+        r = run_benchmark(size)
+        print(f"{size:>10} {r['trie_us']:>12.2f} {r['linear_us']:>12.2f} {r['speedup']:>9.1f}x")
@@ -0,0 +1,111 @@
+"""
+Benchmark: EventStore row formats.
+
+Writes the same events with the text layout, the compact layout and the
+compact layout with zlib compression, then reports bytes on disk per
+event, batched insert throughput and streamed replay throughput. Run
+the full comparison with:
+
+    python -m tests.performance.test_row_format_benchmark
+"""
+
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.store import EventStore
+
+BATCH = 1000
+
+FORMATS = {
+    "text": {},
+    "compact": {"row_format": "compact"},
+    "compact+zlib": {"row_format": "compact", "compression": "zlib"},
+}
+
+
+def _events(count: int) -> list[Event]:
+    """Events with typical small payloads, one millisecond apart."""
+    start = datetime.now() - timedelta(seconds=count / 1000)
+    return [
+        Event(
+            topic=f"orders.region{i % 8}.{'created' if i % 4 else 'updated'}",
+            data={
+                "order_id": uuid4(),
+                "customer": f"customer-{i % 500}",
+                "items": [{"sku": f"SKU-{i % 97}", "qty": i % 5 + 1, "price": 19.99}],
+                "status": "pending",
+                "placed_at": start + timedelta(milliseconds=i),
+            },
+            timestamp=start + timedelta(milliseconds=i),
+            context={"session": f"s{i % 50}", "user_agent": "checkout-service/2.3"},
+            metadata={"source": "checkout", "schema": 3},
+            parent_id=uuid4() if i % 3 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+async def _measure(db_path: Path, events: list[Event], **options) -> dict[str, float]:
+    """Time batched inserts and a full replay, then measure the file size."""
+    store = EventStore(db_path=db_path, max_events=0, **options)
+    await store.initialize()
+    result: dict[str, float] = {}
+
+    start = time.perf_counter()
+    for i in range(0, len(events), BATCH):
+        await store.store_events(events[i : i + BATCH])
+    result["insert_eps"] = len(events) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    count = 0
+    async for _ in store.stream_events(page_size=5000):
+        count += 1
+    assert count == len(events)
+    result["replay_eps"] = count / (time.perf_counter() - start)
+
+    await store.close()
+    # Closing checkpoints the WAL, so the main file holds every page
+    result["bytes_per_event"] = db_path.stat().st_size / len(events)
+    return result
+
+
+def run_benchmark(num_events: int) -> dict[str, dict[str, float]]:
+    """Compare every row format on num_events events."""
+    events = _events(num_events)
+
+    async def _run() -> dict[str, dict[str, float]]:
+        results = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, options in FORMATS.items():
+                results[name] = await _measure(Path(tmp) / f"{name}.db", events, **options)
+        return results
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.performance
+def test_compact_rows_are_smaller():
+    """The compact layout must use fewer bytes per event, compressed fewer still."""
+    results = run_benchmark(20_000)
+
+    text, compact, zlib = (results[name]["bytes_per_event"] for name in FORMATS)
+    assert compact < text
+    assert zlib < compact
+
+
+if __name__ == "__main__":
+    for num_events in (100_000, 500_000):
+        print(f"\n{num_events:,} events")
+        print(f"{'format':>14} {'bytes/event':>12} {'insert ev/s':>12} {'replay ev/s':>12}")
+        for name, r in run_benchmark(num_events).items():
+            print(
+                f"{name:>14} {r['bytes_per_event']:>12.1f} "
+                f"{r['insert_eps']:>12,.0f} {r['replay_eps']:>12,.0f}"
+            )
@@ -0,0 +1,140 @@
+"""
+Benchmark: SegmentedEventStore vs. EventStore write and replay throughput.
+
+Writes the same events to both stores, in batches and one at a time,
+then times a full streamed replay, a filtered replay and a count.
+Run the full comparison with:
+
+    python -m tests.performance.test_segmented_benchmark
+"""
+
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.segmented import SegmentedEventStore
+from neurobus.temporal.store import EventStore
+
+BATCH = 1000
+SINGLE_WRITES = 2000
+
+
+def _events(count: int) -> list[Event]:
+    """Events over 50 topics, one millisecond apart."""
+    start = datetime.now() - timedelta(seconds=count / 1000)
+    return [
+        Event(
+            topic=f"svc{i % 10}.entity.{'created' if i % 5 else 'error'}",
+            data={"n": i, "payload": "x" * 64},
+            timestamp=start + timedelta(milliseconds=i),
+            metadata={"source": "bench"},
+        )
+        for i in range(count)
+    ]
+
+
+async def _drain(store, **filters) -> int:
+    """Stream every matching event, returning how many were read."""
+    count = 0
+    async for _ in store.stream_events(page_size=5000, **filters):
+        count += 1
+    return count
+
+
+async def _measure(store, events: list[Event]) -> dict[str, float]:
+    """Time writes and replays on an initialized, empty store."""
+    await store.initialize()
+    result: dict[str, float] = {}
+
+    start = time.perf_counter()
+    for i in range(0, len(events), BATCH):
+        await store.store_events(events[i : i + BATCH])
+    result["batch_write_eps"] = len(events) / (time.perf_counter() - start)
+
+    extra = _events(SINGLE_WRITES)
+    start = time.perf_counter()
+    for event in extra:
+        await store.store_event(event)
+    result["single_write_eps"] = SINGLE_WRITES / (time.perf_counter() - start)
+
+    total = len(events) + SINGLE_WRITES
+    start = time.perf_counter()
+    assert await _drain(store) == total
+    result["replay_eps"] = total / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    result["filtered"] = await _drain(store, topic_pattern="*.entity.error")
+    result["filtered_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    assert await store.count_events() == total
+    result["count_ms"] = (time.perf_counter() - start) * 1000
+
+    await store.close()
+    return result
+
+
+def run_benchmark(num_events: int) -> dict[str, dict[str, float]]:
+    """Compare both stores on num_events events."""
+    events = _events(num_events)
+
+    async def _run() -> dict[str, dict[str, float]]:
+        with tempfile.TemporaryDirectory() as tmp:
+            sqlite = await _measure(
+                EventStore(db_path=Path(tmp) / "events.db", max_events=0), events
+            )
+            segmented = await _measure(SegmentedEventStore(Path(tmp) / "log"), events)
+        assert sqlite["filtered"] == segmented["filtered"]
+        return {"EventStore": sqlite, "SegmentedEventStore": segmented}
+
+    return asyncio.run(_run())
+
+
+async def _contents(store, events: list[Event]) -> tuple[list[UUID], list[UUID], int]:
+    """Store events in batches, then return replayed ids, filtered ids and count."""
+    await store.initialize()
+    for i in range(0, len(events), BATCH):
+        await store.store_events(events[i : i + BATCH])
+
+    replayed = [event.id async for event in store.stream_events()]
+    filtered = [event.id async for event in store.stream_events(topic_pattern="*.entity.error")]
+    count = await store.count_events()
+    await store.close()
+    return replayed, filtered, count
+
+
+@pytest.mark.performance
+def test_segmented_store_matches_event_store():
+    """Both stores must replay, filter and count the same events."""
+    events = _events(5000)
+
+    async def _run(tmp: Path) -> None:
+        sqlite = await _contents(EventStore(db_path=tmp / "events.db", max_events=0), events)
+        segmented = await _contents(SegmentedEventStore(tmp / "log"), events)
+
+        assert segmented == sqlite
+        assert segmented[0] == [event.id for event in events]
+        assert len(segmented[1]) == 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run(Path(tmp)))
+
+
+if __name__ == "__main__":
+    for num_events in (100_000, 1_000_000):
+        print(f"\n{num_events:,} events")
+        print(
+            f"{'store':>20} {'batch w/s':>11} {'single w/s':>11} {'replay ev/s':>12} "
+            f"{'filtered ms':>12} {'count ms':>9}"
+        )
+        for name, r in run_benchmark(num_events).items():
+            print(
+                f"{name:>20} {r['batch_write_eps']:>11,.0f} {r['single_write_eps']:>11,.0f} "
+                f"{r['replay_eps']:>12,.0f} {r['filtered_ms']:>12.1f} {r['count_ms']:>9.1f}"
+            )
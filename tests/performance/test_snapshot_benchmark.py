@@ -0,0 +1,118 @@
+"""
+Benchmark: snapshot creation and reload.
+
+Compares creating a snapshot marker, materializing it to a snapshot
+file and the previous in-memory copy, then reading the snapshot back
+from the store and from its file. Run the full comparison with:
+
+    python -m tests.performance.test_snapshot_benchmark
+"""
+
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.engine import TemporalEngine
+
+BATCH = 5000
+
+
+def _events(count: int) -> list[Event]:
+    """Events over 20 topics, one millisecond apart."""
+    start = datetime.now() - timedelta(seconds=count / 1000)
+    return [
+        Event(
+            topic=f"sensor.{i % 20}.reading",
+            data={"n": i, "value": i * 0.5, "unit": "celsius"},
+            timestamp=start + timedelta(milliseconds=i),
+            metadata={"source": "bench"},
+        )
+        for i in range(count)
+    ]
+
+
+async def _timed(coro) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = await coro
+    return (time.perf_counter() - start) * 1000, result
+
+
+async def _drain(engine: TemporalEngine, name: str) -> int:
+    count = 0
+    async for _ in engine.stream_snapshot(name, page_size=5000):
+        count += 1
+    return count
+
+
+def run_benchmark(num_events: int) -> dict[str, float]:
+    """Time snapshot operations on num_events events (milliseconds)."""
+    events = _events(num_events)
+
+    async def _run() -> dict[str, float]:
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = TemporalEngine(db_path=str(Path(tmp) / "events.db"), max_events=0)
+            await engine.initialize()
+            for i in range(0, num_events, BATCH):
+                await engine.store_events(events[i : i + BATCH])
+
+            results = {}
+            results["copy_ms"], copied = await _timed(engine.store.replay_events())
+            assert len(copied) == num_events
+            del copied
+            results["marker_ms"], _ = await _timed(engine.create_snapshot("marker"))
+            results["materialize_ms"], _ = await _timed(
+                engine.create_snapshot("file", materialize=True)
+            )
+            results["read_store_ms"], count = await _timed(_drain(engine, "marker"))
+            assert count == num_events
+            results["read_file_ms"], count = await _timed(_drain(engine, "file"))
+            assert count == num_events
+            results["file_bytes_per_event"] = (
+                engine.get_snapshot_info("file").path.stat().st_size / num_events
+            )
+            await engine.close()
+            return results
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.performance
+def test_marker_and_file_match_copy():
+    """Marker and materialized snapshots must read back the copied events."""
+    events = _events(5000)
+
+    async def _run(tmp: Path) -> None:
+        engine = TemporalEngine(db_path=str(tmp / "events.db"), max_events=0)
+        await engine.initialize()
+        await engine.store_events(events)
+
+        copied = [event.id for event in await engine.store.replay_events()]
+        await engine.create_snapshot("marker")
+        await engine.create_snapshot("file", materialize=True)
+        # Later events are not part of either snapshot
+        await engine.store_events(_events(10))
+
+        for name in ("marker", "file"):
+            read = [event.id async for event in engine.stream_snapshot(name, page_size=1000)]
+            assert read == copied, name
+        await engine.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run(Path(tmp)))
+
+
+if __name__ == "__main__":
+    for num_events in (100_000, 500_000):
+        r = run_benchmark(num_events)
+        print(f"\n{num_events:,} events")
+        print(f"  in-memory copy (previous create_snapshot): {r['copy_ms']:>9.1f} ms")
+        print(f"  create marker:                             {r['marker_ms']:>9.1f} ms")
+        print(f"  create materialized:                       {r['materialize_ms']:>9.1f} ms")
+        print(f"  read marker from store:                    {r['read_store_ms']:>9.1f} ms")
+        print(f"  read materialized file:                    {r['read_file_ms']:>9.1f} ms")
+        print(f"  snapshot file bytes/event:                 {r['file_bytes_per_event']:>9.1f}")
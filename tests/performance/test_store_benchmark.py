@@ -0,0 +1,115 @@
+"""
+Benchmark: EventStore sync writes vs. write-behind group commit.
+
+Events are offered at a fixed target rate, each by its own task (as with
+many concurrent publishers); the benchmark reports the achieved rate and
+the latency of each store call. Run the full comparison (1k, 10k and
+100k events/sec) with:
+
+    python -m tests.performance.test_store_benchmark
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.store import EventStore
+
+
+async def _paced_writes(store: EventStore, rate: int, duration: float) -> dict[str, float]:
+    """Start one store_event task per event at the target rate and time each call."""
+    num_events = int(rate * duration)
+    events = [Event(topic=f"bench.{i % 10}", data={"n": i}) for i in range(num_events)]
+    latencies: list[float] = []
+
+    async def timed_store(event: Event) -> None:
+        t0 = time.perf_counter()
+        await store.store_event(event)
+        latencies.append(time.perf_counter() - t0)
+
+    tasks = []
+    start = time.perf_counter()
+    for i, event in enumerate(events):
+        # Sleep when ahead of schedule; a saturated store just falls behind
+        ahead = start + i / rate - time.perf_counter()
+        if ahead > 0.001:
+            await asyncio.sleep(ahead)
+        elif i % 100 == 0:
+            # Let started tasks run even when behind schedule
+            await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(timed_store(event)))
+
+    await asyncio.gather(*tasks)
+    await store.close()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "achieved_eps": num_events / elapsed,
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+    }
+
+
+def run_benchmark(rate: int, duration: float, **store_options) -> dict[str, float]:
+    """Run one configuration against a fresh database."""
+
+    async def _run() -> dict[str, float]:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = EventStore(db_path=Path(tmp) / "events.db", max_events=0, **store_options)
+            await store.initialize()
+            return await _paced_writes(store, rate, duration)
+
+    return asyncio.run(_run())
+
+
+CONFIGURATIONS = {
+    "sync": {"write_mode": "sync"},
+    "wb/none": {"write_mode": "write_behind", "durability": "none"},
+    "wb/flush": {"write_mode": "write_behind", "durability": "flush"},
+    "wb/fsync": {"write_mode": "write_behind", "durability": "fsync"},
+}
+
+
+async def _stored_ids(db_path: Path, num_events: int, **store_options) -> list[str]:
+    """Write events concurrently, reopen the database and return the stored ids."""
+    events = [Event(topic=f"bench.{i % 10}", data={"n": i}) for i in range(num_events)]
+    store = EventStore(db_path=db_path, max_events=0, **store_options)
+    await store.initialize()
+    await asyncio.gather(*(store.store_event(event) for event in events))
+    await store.close()
+
+    reopened = EventStore(db_path=db_path, max_events=0)
+    await reopened.initialize()
+    stored = await reopened.replay_events()
+    await reopened.close()
+    return sorted(str(event.id) for event in stored)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("name", list(CONFIGURATIONS))
+def test_write_modes_persist_every_event(name):
+    """Every write mode must have persisted all events once the store is closed."""
+
+    async def _run(tmp: Path) -> None:
+        ids = await _stored_ids(tmp / "events.db", 500, **CONFIGURATIONS[name])
+        assert len(ids) == len(set(ids)) == 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run(Path(tmp)))
+
+
+if __name__ == "__main__":
+    print(f"{'target/s':>9} {'mode':>9} {'achieved/s':>11} {'p50 (us)':>9} {'p99 (us)':>10}")
+    for rate in (1_000, 10_000, 100_000):
+        for name, options in CONFIGURATIONS.items():
+            r = run_benchmark(rate=rate, duration=2.0, **options)
+            print(
+                f"{rate:>9} {name:>9} {r['achieved_eps']:>11.0f} "
+                f"{r['p50_us']:>9.1f} {r['p99_us']:>10.1f}"
+            )
@@ -0,0 +1,131 @@
+"""
+Benchmark: event loop lag during a large EventStore replay.
+
+Compares a replay that runs SQLite on the event loop (how EventStore
+worked before its I/O moved to threads) with EventStore.replay_events,
+while a ticker task measures how late the loop wakes it up.
+
+Run the full comparison with:
+
+    python -m tests.performance.test_store_io_benchmark
+"""
+
+import asyncio
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.store import _SELECT_SQL, EventStore
+
+TICK = 0.001
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each 1ms sleep wakes up."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _replay_on_loop(store: EventStore) -> list[Event]:
+    """Replica of the previous replay: query and decode on the loop thread."""
+    conn = sqlite3.connect(str(store.db_path))
+    query = _SELECT_SQL.format(columns=store._format.columns) + " ORDER BY timestamp ASC"
+    rows = conn.execute(query).fetchall()
+    events = [store._row_to_event(row) for row in rows]
+    conn.close()
+    return events
+
+
+async def _replay_threaded(store: EventStore) -> list[Event]:
+    return await store.replay_events()
+
+
+async def _measure(store: EventStore, replay) -> dict[str, float]:
+    """Run one replay while the ticker samples loop lag."""
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    await replay(store)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+
+    lags.sort()
+    p99 = lags[max(int(len(lags) * 0.99) - 1, 0)]
+    return {
+        "replay_ms": elapsed * 1000,
+        "max_lag_ms": lags[-1] * 1000,
+        "p99_lag_ms": p99 * 1000,
+        "median_lag_ms": statistics.median(lags) * 1000,
+    }
+
+
+def run_benchmark(num_events: int) -> dict[str, dict[str, float]]:
+    """Fill a store with num_events and compare loop lag for both replays."""
+
+    async def _run() -> dict[str, dict[str, float]]:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = EventStore(db_path=Path(tmp) / "events.db", max_events=0)
+            await store.initialize()
+            for i in range(0, num_events, 5000):
+                batch = min(5000, num_events - i)
+                await store.store_events(
+                    [Event(topic=f"bench.{n % 10}", data={"n": n}) for n in range(batch)]
+                )
+
+            result = {
+                "on_loop": await _measure(store, _replay_on_loop),
+                "threaded": await _measure(store, _replay_threaded),
+            }
+            await store.close()
+            return result
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.performance
+def test_threaded_replay_matches_on_loop_replay():
+    """Threaded replay must return the same events, in order, as on-loop SQLite."""
+
+    async def _run(tmp: Path) -> None:
+        store = EventStore(db_path=tmp / "events.db", max_events=0)
+        await store.initialize()
+        await store.store_events(
+            [Event(topic=f"bench.{n % 10}", data={"n": n}) for n in range(2000)]
+        )
+
+        expected = await _replay_on_loop(store)
+        replayed = await _replay_threaded(store)
+        await store.close()
+        assert len(replayed) == 2000
+        assert [e.id for e in replayed] == [e.id for e in expected]
+        assert [e.data for e in replayed] == [e.data for e in expected]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(_run(Path(tmp)))
+
+
+if __name__ == "__main__":
+    print(
+        f"{'events':>8} {'replay':>9} {'time (ms)':>10} "
+        f"{'max lag':>9} {'p99 lag':>9} {'med lag':>9}"
+    )
+    for size in (10_000, 100_000, 500_000):
+        r = run_benchmark(size)
+        for name in ("on_loop", "threaded"):
+            m = r[name]
+            print(
+                f"{size:>8} {name:>9} {m['replay_ms']:>10.1f} {m['max_lag_ms']:>9.2f} "
+                f"{m['p99_lag_ms']:>9.2f} {m['median_lag_ms']:>9.2f}"
+            )
@@ -0,0 +1,172 @@
+"""
+Benchmark: planned topic queries vs. the previous SQL LIKE translation.
+
+Builds an events table with synthetic rows over 1,000 distinct topics
+("<domain>.<entity>.<action>"), then times count_events and
+query_by_topic through the planner against the equivalent LIKE query.
+Run the full comparison (including a 10M-row table, which takes a few
+minutes to build and about 2GB of disk) with:
+
+    python -m tests.performance.test_topic_query_benchmark
+"""
+
+import asyncio
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from neurobus.temporal.rows import TextRowFormat
+from neurobus.temporal.store import EventStore
+from neurobus.utils.serialization import serialize
+
+DOMAINS = [f"d{i}" for i in range(10)]
+ENTITIES = [f"e{i}" for i in range(20)]
+ACTIONS = ["created", "updated", "deleted", "viewed", "error"]
+TOPICS = [f"{d}.{e}.{a}" for d in DOMAINS for e in ENTITIES for a in ACTIONS]
+
+# (label, planned pattern, legacy LIKE pattern selecting the same rows)
+QUERIES = [
+    ("literal", "d1.e1.created", "d1.e1.created"),
+    ("prefix", "d1.#", "d1.%"),
+    ("prefix 2", "d1.e1.#", "d1.e1.%"),
+    ("catalog", "*.*.error", "%.%.error"),
+    ("catalog 2", "*.e1.*", "%.e1.%"),
+]
+
+# The previous translation: LIKE over a full table scan
+LIKE_COUNT_SQL = "SELECT COUNT(*) FROM events WHERE topic LIKE ?"
+LIKE_PAGE_SQL = "SELECT id FROM events WHERE topic LIKE ? ORDER BY timestamp DESC LIMIT 100"
+
+
+def build_table(db_path: Path, num_rows: int) -> None:
+    """Create a store database and bulk-insert synthetic rows."""
+
+    async def _init() -> None:
+        store = EventStore(db_path=db_path, max_events=0)
+        await store.initialize()
+        await store.close()
+
+    asyncio.run(_init())
+
+    data = serialize({"n": 1})
+    start = time.time() - num_rows / 1000
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA synchronous=OFF")
+    batch = 100_000
+    for offset in range(0, num_rows, batch):
+        conn.executemany(
+            TextRowFormat().insert_sql.format(table="events"),
+            (
+                (str(UUID(int=i)), TOPICS[i % len(TOPICS)], data, start + i / 1000)
+                + (None, None, None, 0.0)
+                for i in range(offset, min(offset + batch, num_rows))
+            ),
+        )
+        conn.commit()
+    conn.executemany("INSERT OR IGNORE INTO topics (topic) VALUES (?)", ((t,) for t in TOPICS))
+    conn.commit()
+    conn.close()
+
+
+def _time(func, repeat: int = 3) -> float:
+    """Best-of-repeat wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def _atime(coro_factory, repeat: int = 3) -> float:
+    """Best-of-repeat wall time of an awaitable in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_benchmark(num_rows: int, repeat: int = 3) -> list[dict[str, float | str]]:
+    """Time every query in QUERIES both ways on a fresh table."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "events.db"
+        build_table(db_path, num_rows)
+        legacy = sqlite3.connect(db_path)
+
+        async def _run() -> None:
+            store = EventStore(db_path=db_path, max_events=0)
+            await store.initialize()
+
+            for label, pattern, like in QUERIES:
+                result = {
+                    "query": label,
+                    "pattern": pattern,
+                    "rows": await store.count_events(pattern),
+                    "like_count_ms": _time(
+                        lambda like=like: legacy.execute(LIKE_COUNT_SQL, (like,)).fetchone(),
+                        repeat,
+                    ),
+                    "like_page_ms": _time(
+                        lambda like=like: legacy.execute(LIKE_PAGE_SQL, (like,)).fetchall(),
+                        repeat,
+                    ),
+                    "count_ms": await _atime(
+                        lambda pattern=pattern: store.count_events(pattern), repeat
+                    ),
+                    "page_ms": await _atime(
+                        lambda pattern=pattern: store.query_by_topic(pattern, limit=100), repeat
+                    ),
+                }
+                results.append(result)
+
+            await store.close()
+
+        asyncio.run(_run())
+        legacy.close()
+    return results
+
+
+@pytest.mark.performance
+def test_planned_queries_match_like_queries():
+    """Planned counts and newest pages must match the LIKE translation."""
+
+    async def _compare(db_path: Path, legacy: sqlite3.Connection) -> None:
+        store = EventStore(db_path=db_path, max_events=0)
+        await store.initialize()
+        for label, pattern, like in QUERIES:
+            expected_count = legacy.execute(LIKE_COUNT_SQL, (like,)).fetchone()[0]
+            expected_page = [row[0] for row in legacy.execute(LIKE_PAGE_SQL, (like,))]
+            page = await store.query_by_topic(pattern, limit=100)
+
+            assert await store.count_events(pattern) == expected_count, label
+            assert [str(event.id) for event in page] == expected_page, label
+        await store.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "events.db"
+        build_table(db_path, 20_000)
+        legacy = sqlite3.connect(db_path)
+        asyncio.run(_compare(db_path, legacy))
+        legacy.close()
+
+
+if __name__ == "__main__":
+    for rows in (1_000_000, 10_000_000):
+        print(f"\n{rows:,} rows")
+        print(
+            f"{'query':>10} {'pattern':>14} {'matches':>9} "
+            f"{'LIKE count':>11} {'count':>8} {'LIKE page':>10} {'page':>8}  (ms)"
+        )
+        for r in run_benchmark(rows):
+            print(
+                f"{r['query']:>10} {r['pattern']:>14} {r['rows']:>9} "
+                f"{r['like_count_ms']:>11.1f} {r['count_ms']:>8.1f} "
+                f"{r['like_page_ms']:>10.1f} {r['page_ms']:>8.1f}"
+            )
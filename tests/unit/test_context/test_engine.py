@@ -1,8 +1,11 @@
 """Tests for context engine."""
 
+import json
+
 from neurobus.context.engine import ContextEngine
 from neurobus.core.event import Event
 from neurobus.types.context import ContextScope
+from neurobus.utils.helpers import deep_merge
 
 
 class TestContextEngine:
@@ -162,6 +165,71 @@ class TestContextEngine:
         assert enriched.context["role"] == "admin"
         assert enriched.context["session_id"] == "session_123"
 
+    def test_enrich_event_matches_merged_context(self):
+        """Test enrichment keeps deep-merge override semantics."""
+        engine = ContextEngine()
+
+        engine.set_global("prefs", {"theme": "dark", "lang": "en"})
+        engine.set_session("s1", "prefs", {"lang": "fr"})
+        engine.set_user("alice", "level", 1)
+
+        event = Event(
+            topic="test",
+            context={"session_id": "s1", "user_id": "alice", "prefs": {"tz": "UTC"}},
+        )
+        enriched = engine.enrich_event(event)
+
+        expected = deep_merge(engine.get_merged_context("s1", "alice"), event.context)
+        assert enriched.context == expected
+        assert enriched.to_dict()["context"] == expected
+        assert enriched.id == event.id
+
+    def test_enrich_event_is_isolated(self):
+        """Test enriched context is a snapshot and writes don't leak."""
+        engine = ContextEngine()
+        engine.set_global("prefs", {"theme": "dark"})
+
+        event = Event(topic="test", context={"a": 1})
+        enriched = engine.enrich_event(event)
+
+        engine.set_global("late", True)
+        enriched.context["prefs"]["theme"] = "light"
+        enriched.context["a"] = 2
+
+        assert "late" not in enriched.context
+        assert engine.get_global("prefs") == {"theme": "dark"}
+        assert event.context == {"a": 1}
+
+    def test_enrich_event_snapshots_event_context(self):
+        """Test later writes to the source event's context never reach the enriched one."""
+        engine = ContextEngine()
+        engine.set_global("g", 1)
+
+        event = Event(topic="test", context={"a": 1, "n": {"k": 1}, "l": [1]})
+        enriched = engine.enrich_event(event)
+
+        event.context["a"] = 2
+        event.context["n"]["k"] = 5
+        enriched.context["l"].append(9)
+
+        assert enriched.context == {"a": 1, "n": {"k": 1}, "l": [1, 9], "g": 1}
+        assert event.context["l"] == [1]
+
+    def test_enrich_event_context_is_plain_dict(self):
+        """Test handlers receive a JSON-serializable dict context."""
+        engine = ContextEngine()
+        engine.set_global("prefs", {"theme": "dark"})
+        engine.set_session("s1", "prefs", {"lang": "fr"})
+
+        enriched = engine.enrich_event(Event(topic="test", context={"session_id": "s1"}))
+
+        assert type(enriched.context) is dict
+        assert type(enriched.context["prefs"]) is dict
+        assert json.loads(json.dumps(enriched.context)) == {
+            "session_id": "s1",
+            "prefs": {"theme": "dark", "lang": "fr"},
+        }
+
     def test_query_context(self):
         """Test querying context with filter."""
         engine = ContextEngine()
@@ -215,6 +215,30 @@ class TestContextStore:
         assert "key2" in all_context
         assert "key1" not in all_context
 
+    def test_snapshot_is_point_in_time(self):
+        """Test snapshots don't see later writes or deletes."""
+        store = ContextStore()
+        store.set("key1", "value1", ContextScope.SESSION, "s1")
+
+        snapshot = store.snapshot(ContextScope.SESSION, "s1")
+        store.set("key2", "value2", ContextScope.SESSION, "s1")
+        store.delete("key1", ContextScope.SESSION, "s1")
+
+        assert dict(snapshot) == {"key1": "value1"}
+        assert store.get_all(ContextScope.SESSION, "s1") == {"key2": "value2"}
+        assert not store.snapshot(ContextScope.SESSION, "missing")
+
+    def test_snapshot_hides_expired(self):
+        """Test entries expiring after the snapshot read as missing."""
+        store = ContextStore()
+        store.set("key1", "value1", ContextScope.GLOBAL, ttl=0.05)
+
+        snapshot = store.snapshot(ContextScope.GLOBAL)
+        time.sleep(0.1)
+
+        assert "key1" not in snapshot
+        assert len(snapshot) == 0
+
     def test_statistics(self):
         """Test store statistics."""
         store = ContextStore()
@@ -274,3 +274,76 @@ class TestNeuroBus:
         # Working handler should still execute
         assert len(called) == 1
         assert called[0] == "success"
+
+    async def test_publish_many_preserves_order(self):
+        """Test batch publish delivers events to each subscriber in order."""
+        bus = NeuroBus()
+        received: dict[str, list[int]] = {"slow": [], "fast": []}
+
+        @bus.subscribe("seq.*")
+        async def slow_handler(event: Event):
+            await asyncio.sleep(0.001 * (5 - event.data["n"] % 5))
+            received["slow"].append(event.data["n"])
+
+        @bus.subscribe("seq.#")
+        async def fast_handler(event: Event):
+            received["fast"].append(event.data["n"])
+
+        async with bus:
+            count = await bus.publish_many(
+                Event(topic=f"seq.{n % 3}", data={"n": n}) for n in range(20)
+            )
+
+        assert count == 20
+        assert received["slow"] == list(range(20))
+        assert received["fast"] == list(range(20))
+
+    async def test_publish_many_applies_filters(self):
+        """Test filters run per event in a batch."""
+        bus = NeuroBus()
+        received = []
+
+        @bus.subscribe("order", filter=lambda e: e.data["amount"] > 10)
+        async def handler(event: Event):
+            received.append(event.data["amount"])
+
+        async with bus:
+            await bus.publish_many([Event(topic="order", data={"amount": a}) for a in (5, 50, 500)])
+
+        assert received == [50, 500]
+
+    async def test_publish_many_validates_before_side_effects(self):
+        """Test an invalid event rejects the whole batch."""
+        from neurobus.exceptions.core import ValidationError
+
+        bus = NeuroBus()
+        received = []
+
+        @bus.subscribe("ok")
+        async def handler(event: Event):
+            received.append(event)
+
+        async with bus:
+            with pytest.raises(ValidationError):
+                await bus.publish_many([Event(topic="ok"), Event(topic="bad topic!")])
+
+        assert received == []
+
+    async def test_publish_stream(self):
+        """Test publishing from an async iterable."""
+        bus = NeuroBus()
+        received = []
+
+        @bus.subscribe("tick")
+        async def handler(event: Event):
+            received.append(event.data["n"])
+
+        async def produce():
+            for n in range(7):
+                yield Event(topic="tick", data={"n": n})
+
+        async with bus:
+            count = await bus.publish_stream(produce(), batch_size=3)
+
+        assert count == 7
+        assert received == list(range(7))
@@ -0,0 +1,172 @@
+"""Tests for EventDispatcher."""
+
+import asyncio
+
+import pytest
+
+from neurobus import Event, NeuroBus
+from neurobus.config.schema import NeuroBusConfig
+from neurobus.core.dispatcher import EventDispatcher
+from neurobus.core.subscription import Subscription
+
+
+class TestDirectDispatch:
+    """Test cases for the default direct dispatch mode."""
+
+    async def test_single_subscriber_fast_path(self):
+        """Test a single matching subscription is executed."""
+        dispatcher = EventDispatcher()
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.topic)
+
+        await dispatcher.dispatch(
+            Event(topic="test"), [Subscription(pattern="test", handler=handler)]
+        )
+
+        assert received == ["test"]
+        assert dispatcher.get_stats()["total_succeeded"] == 1
+
+    async def test_timeout_is_counted(self):
+        """Test handler timeouts are counted as timeouts, not failures."""
+        dispatcher = EventDispatcher(handler_timeout=0.01)
+
+        async def slow(event: Event):
+            await asyncio.sleep(1)
+
+        subs = [Subscription(pattern="test", handler=slow)]
+        await dispatcher.dispatch(Event(topic="test"), subs)
+        await dispatcher.dispatch(Event(topic="test"), subs * 2)
+
+        stats = dispatcher.get_stats()
+        assert stats["total_timeout"] == 3
+        assert stats["total_failed"] == 0
+
+    async def test_single_subscriber_error_isolated(self):
+        """Test a failing single handler does not propagate with isolation."""
+        dispatcher = EventDispatcher()
+
+        async def failing(event: Event):
+            raise ValueError("boom")
+
+        await dispatcher.dispatch(
+            Event(topic="test"), [Subscription(pattern="test", handler=failing)]
+        )
+
+        assert dispatcher.get_stats()["total_failed"] == 1
+
+
+class TestMailboxDispatch:
+    """Test cases for mailbox dispatch mode."""
+
+    def test_invalid_mode_raises(self):
+        """Test unknown dispatch mode is rejected."""
+        with pytest.raises(ValueError):
+            EventDispatcher(mode="broadcast")
+
+    async def test_fifo_order_per_subscription(self):
+        """Test each subscriber sees events in dispatch order."""
+        dispatcher = EventDispatcher(mode="mailbox")
+        received = []
+
+        async def handler(event: Event):
+            # Earlier events sleep longer; order must still hold
+            await asyncio.sleep(0.001 * (10 - event.data["n"]))
+            received.append(event.data["n"])
+
+        sub = Subscription(pattern="test", handler=handler)
+        for n in range(10):
+            await dispatcher.dispatch(Event(topic="test", data={"n": n}), [sub])
+
+        await dispatcher.stop()
+
+        assert received == list(range(10))
+
+    async def test_slow_subscriber_isolated(self):
+        """Test a slow subscriber does not delay a fast one."""
+        dispatcher = EventDispatcher(mode="mailbox", mailbox_size=100)
+        gate = asyncio.Event()
+        fast_received = []
+
+        async def slow_handler(event: Event):
+            await gate.wait()
+
+        async def fast_handler(event: Event):
+            fast_received.append(event)
+
+        slow = Subscription(pattern="test", handler=slow_handler)
+        fast = Subscription(pattern="test", handler=fast_handler)
+
+        for _ in range(5):
+            await dispatcher.dispatch(Event(topic="test"), [slow, fast])
+        await asyncio.sleep(0.01)
+
+        assert len(fast_received) == 5
+        stats = dispatcher.get_stats()["mailboxes"]
+        assert stats["count"] == 2
+        assert stats["subscriptions"][str(slow.id)]["depth"] == 4
+
+        gate.set()
+        await dispatcher.stop()
+
+    async def test_drop_counters(self):
+        """Test drops are counted per subscription."""
+        dispatcher = EventDispatcher(
+            mode="mailbox", mailbox_size=1, mailbox_overflow_policy="drop_newest"
+        )
+        gate = asyncio.Event()
+
+        async def handler(event: Event):
+            await gate.wait()
+
+        sub = Subscription(pattern="test", handler=handler)
+        await dispatcher.dispatch(Event(topic="test"), [sub])
+        await asyncio.sleep(0)
+        for _ in range(3):
+            await dispatcher.dispatch(Event(topic="test"), [sub])
+
+        stats = dispatcher.get_stats()["mailboxes"]
+        assert stats["total_dropped"] == 2
+        assert stats["subscriptions"][str(sub.id)]["dropped"] == 2
+
+        gate.set()
+        await dispatcher.stop()
+
+    async def test_handler_errors_are_isolated(self):
+        """Test failing handlers do not stop the consumer."""
+        dispatcher = EventDispatcher(mode="mailbox")
+        received = []
+
+        async def handler(event: Event):
+            if event.data["n"] == 1:
+                raise ValueError("boom")
+            received.append(event.data["n"])
+
+        sub = Subscription(pattern="test", handler=handler)
+        for n in range(3):
+            await dispatcher.dispatch(Event(topic="test", data={"n": n}), [sub])
+        await dispatcher.stop()
+
+        assert received == [0, 2]
+
+    async def test_bus_mailbox_mode(self):
+        """Test mailbox mode through the bus, including unsubscribe."""
+        bus = NeuroBus(config=NeuroBusConfig(core={"dispatch_mode": "mailbox"}))
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.data["n"])
+
+        sub = bus.subscribe("ticks", handler=handler)
+
+        await bus.start()
+        for n in range(5):
+            await bus.publish(Event(topic="ticks", data={"n": n}))
+
+        bus.unsubscribe(sub)
+        await bus.publish(Event(topic="ticks", data={"n": 99}))
+        await bus.stop()
+
+        assert received == list(range(5))
+        assert bus.get_stats()["dispatcher"]["mailboxes"]["count"] == 0
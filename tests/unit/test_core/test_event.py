@@ -76,6 +76,31 @@ class TestEvent:
         assert new_event.context == {"a": 1, "b": 2, "c": 3}
         assert new_event.id == event.id  # Same ID
         assert new_event.topic == event.topic
+        assert isinstance(new_event.context, dict)
+
+    def test_with_context_is_isolated(self):
+        """Test with_context replaces keys shallowly and never shares writes."""
+        event = Event(topic="test", context={"nested": {"k": 1}, "a": 1})
+        new_event = event.with_context(a=2)
+
+        new_event.context["nested"]["k"] = 2
+        other = event.with_context(nested={"j": 1})
+
+        assert event.context == {"nested": {"k": 1}, "a": 1}
+        assert new_event.context == {"nested": {"k": 2}, "a": 2}
+        assert other.context["nested"] == {"j": 1}
+
+    def test_with_context_snapshots_source(self):
+        """Test later writes to either event's context never reach the other."""
+        event = Event(topic="test", context={"x": 1, "n": {"k": 1}, "l": [1]})
+        new_event = event.with_context(y=2)
+
+        event.context["x"] = 99
+        event.context["n"]["k"] = 5
+        new_event.context["l"].append(9)
+
+        assert new_event.context == {"x": 1, "n": {"k": 1}, "l": [1, 9], "y": 2}
+        assert event.context["l"] == [1]
 
     def test_child_event(self):
         """Test child_event method."""
@@ -144,3 +169,48 @@ class TestEvent:
         assert "Event" in repr_str
         assert "test.event" in repr_str
         assert str(event.id)[:8] in repr_str
+
+    def test_slotted(self):
+        """Test events carry no per-instance __dict__."""
+        event = Event(topic="test")
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = 1
+
+    def test_lazy_id_and_timestamp_are_stable(self):
+        """Test lazily generated id/timestamp do not change between reads."""
+        before = datetime.now()
+        event = Event(topic="test")
+        after = datetime.now()
+
+        assert event.id == event.id
+        assert event.timestamp is event.timestamp
+        assert before <= event.timestamp <= after
+
+    def test_default_mappings_not_shared(self):
+        """Test default data/context/metadata are independent per event."""
+        first = Event(topic="test")
+        second = Event(topic="test")
+
+        first.metadata["tag"] = "x"
+        first.context["user"] = "alice"
+
+        assert second.metadata == {}
+        assert second.context == {}
+
+    def test_round_trip(self):
+        """Test to_dict/from_dict round trip preserves the event."""
+        event = Event(topic="test", data={"k": 1}, parent_id=uuid4())
+
+        assert Event.from_dict(event.to_dict()) == event
+
+    def test_copy_and_pickle_keep_id(self):
+        """Test copies and pickles keep a lazily generated id."""
+        import copy
+        import pickle
+
+        event = Event(topic="test")
+
+        assert copy.deepcopy(event).id == event.id
+        assert pickle.loads(pickle.dumps(event)) == event
@@ -0,0 +1,190 @@
+"""Tests for HandlerExecutors and executor-backed subscriptions."""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from neurobus import Event, NeuroBus
+from neurobus.config.schema import NeuroBusConfig
+from neurobus.core.executors import HandlerExecutors
+from neurobus.core.subscription import Subscription
+
+
+def process_handler(event: Event) -> None:
+    """Module-level handler so it can be pickled into a worker process."""
+    path = event.data["path"]
+    with open(path, "w") as f:
+        f.write(f"{os.getpid()} {event.topic} {event.id}")
+
+
+def failing_handler(event: Event) -> None:
+    """Module-level handler that always fails."""
+    raise ValueError("boom")
+
+
+class TestHandlerExecutors:
+    """Test cases for HandlerExecutors."""
+
+    async def test_thread_runs_off_loop_thread(self):
+        """Test sync handlers run on a pool thread."""
+        executors = HandlerExecutors(thread_pool_size=2)
+        threads = []
+
+        def handler(event: Event):
+            threads.append(threading.current_thread())
+
+        await executors.run("thread", handler, Event(topic="test"))
+        await executors.shutdown()
+
+        assert threads[0] is not threading.current_thread()
+        assert threads[0].name.startswith("neurobus-handler")
+
+    async def test_thread_runs_async_handler(self):
+        """Test coroutine handlers are run to completion in the worker."""
+        executors = HandlerExecutors()
+        received = []
+
+        async def handler(event: Event):
+            received.append(event.topic)
+
+        await executors.run("thread", handler, Event(topic="test"))
+        await executors.shutdown()
+
+        assert received == ["test"]
+
+    async def test_process_receives_serialized_event(self, tmp_path):
+        """Test process handlers run in another process with an equal event."""
+        executors = HandlerExecutors(process_pool_size=1)
+        event = Event(topic="cpu.task", data={"path": str(tmp_path / "out.txt")})
+
+        await executors.run("process", process_handler, event)
+        await executors.shutdown()
+
+        pid, topic, event_id = (tmp_path / "out.txt").read_text().split()
+        assert int(pid) != os.getpid()
+        assert topic == "cpu.task"
+        assert event_id == str(event.id)
+
+    async def test_errors_propagate_and_are_counted(self):
+        """Test handler exceptions reach the caller and update stats."""
+        executors = HandlerExecutors()
+
+        with pytest.raises(ValueError):
+            await executors.run("thread", failing_handler, Event(topic="test"))
+
+        stats = executors.get_stats()["thread"]
+        await executors.shutdown()
+
+        assert stats["failed"] == 1
+        assert stats["active"] == 0
+
+    async def test_stats(self):
+        """Test saturation stats for started and unused pools."""
+        executors = HandlerExecutors(thread_pool_size=4)
+
+        await executors.run("thread", lambda e: None, Event(topic="test"))
+        stats = executors.get_stats()
+        await executors.shutdown()
+
+        assert stats["thread"]["started"] is True
+        assert stats["thread"]["max_workers"] == 4
+        assert stats["thread"]["completed"] == 1
+        assert stats["thread"]["peak_active"] == 1
+        assert stats["thread"]["saturation"] == 0.0
+        assert stats["process"]["started"] is False
+
+    async def test_timed_out_handler_stays_active(self):
+        """Test a cancelled call counts as active until its handler returns."""
+        executors = HandlerExecutors(thread_pool_size=1)
+        release = threading.Event()
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await executors.run("thread", lambda e: release.wait(), Event(topic="test"))
+
+        assert executors.get_stats()["thread"]["active"] == 1
+        release.set()
+        await executors.shutdown()
+
+        stats = executors.get_stats()["thread"]
+        assert stats["active"] == 0
+        assert stats["completed"] == 1
+
+    async def test_shutdown_timeout_leaves_hung_handlers(self):
+        """Test shutdown returns after its timeout while a handler hangs."""
+        executors = HandlerExecutors()
+        release = threading.Event()
+        task = asyncio.create_task(
+            executors.run("thread", lambda e: release.wait(), Event(topic="test"))
+        )
+        await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(executors.shutdown(timeout=0.05), timeout=5)
+
+        assert not task.done()
+        release.set()
+        await task
+        assert executors.get_stats()["thread"]["completed"] == 1
+
+    def test_invalid_executor_rejected(self):
+        """Test unknown executor kinds are rejected by Subscription."""
+        with pytest.raises(ValueError):
+            Subscription(pattern="test", handler=lambda e: None, executor="gpu")
+
+
+class TestBusExecutors:
+    """Test cases for bus.subscribe(executor=...)."""
+
+    async def test_sync_handler_on_thread_pool(self):
+        """Test a sync handler subscribed with executor='thread'."""
+        config = NeuroBusConfig(core={"thread_pool_size": 2})
+        received = []
+
+        async with NeuroBus(config=config) as bus:
+
+            @bus.subscribe("sync.*", executor="thread")
+            def handler(event: Event):
+                received.append(event.topic)
+
+            await bus.publish(Event(topic="sync.test"))
+
+            stats = bus.get_stats()["dispatcher"]["executors"]
+
+        assert received == ["sync.test"]
+        assert stats["thread"]["max_workers"] == 2
+        assert stats["thread"]["completed"] == 1
+
+    async def test_process_handler_via_bus(self, tmp_path):
+        """Test a process-pool handler subscribed on the bus."""
+        config = NeuroBusConfig(core={"process_pool_size": 1})
+        path = tmp_path / "out.txt"
+
+        async with NeuroBus(config=config) as bus:
+            bus.subscribe("cpu.task", handler=process_handler, executor="process")
+            await bus.publish(Event(topic="cpu.task", data={"path": str(path)}))
+
+        assert path.read_text().split()[1] == "cpu.task"
+
+    async def test_thread_handlers_see_same_event_id(self):
+        """Test thread handlers racing on a fresh event agree on its id."""
+        config = NeuroBusConfig(core={"thread_pool_size": 4})
+        first: list[tuple[int, str]] = []
+        second: list[tuple[int, str]] = []
+
+        async with NeuroBus(config=config) as bus:
+
+            @bus.subscribe("race.*", executor="thread")
+            def handler_a(event: Event):
+                first.append((event.data["n"], str(event.id)))
+
+            @bus.subscribe("race.*", executor="thread")
+            def handler_b(event: Event):
+                second.append((event.data["n"], str(event.id)))
+
+            for n in range(500):
+                await bus.publish(Event(topic="race.test", data={"n": n}))
+
+        assert len(first) == len(second) == 500
+        assert sorted(first) == sorted(second)
@@ -0,0 +1,223 @@
+"""Tests for PublishQueue and queued publish mode."""
+
+import asyncio
+
+import pytest
+
+from neurobus import Event, NeuroBus
+from neurobus.config.schema import NeuroBusConfig
+from neurobus.core.queue import PublishQueue
+from neurobus.exceptions.core import BusShutdownError, PublishQueueFullError
+from neurobus.monitoring.metrics import MetricsCollector
+
+
+class TestPublishQueue:
+    """Test cases for PublishQueue."""
+
+    def test_invalid_policy_raises(self):
+        """Test unknown overflow policy is rejected."""
+
+        async def process(event: Event):
+            pass
+
+        with pytest.raises(ValueError):
+            PublishQueue(process, overflow_policy="spill")
+
+    async def test_put_before_start_raises(self):
+        """Test enqueueing on a stopped queue."""
+
+        async def process(event: Event):
+            pass
+
+        queue = PublishQueue(process)
+
+        with pytest.raises(BusShutdownError):
+            await queue.put(Event(topic="test"))
+
+    async def test_workers_process_events(self):
+        """Test events are processed by workers."""
+        processed = []
+
+        async def process(event: Event):
+            processed.append(event.data["n"])
+
+        queue = PublishQueue(process, num_workers=1)
+        await queue.start()
+        for n in range(5):
+            await queue.put(Event(topic="test", data={"n": n}))
+        await queue.stop()
+
+        assert processed == list(range(5))
+        assert queue.get_stats()["processed"] == 5
+
+    @pytest.mark.parametrize(
+        "policy,expected",
+        [("drop_newest", [0, 1]), ("drop_oldest", [2, 3])],
+    )
+    async def test_drop_policies(self, policy, expected):
+        """Test drop policies when the queue is full."""
+        processed = []
+        gate = asyncio.Event()
+
+        async def process(event: Event):
+            await gate.wait()
+            processed.append(event.data["n"])
+
+        queue = PublishQueue(process, max_size=2, num_workers=1, overflow_policy=policy)
+        await queue.start()
+
+        # Occupy the worker so the queue fills up
+        await queue.put(Event(topic="test", data={"n": -1}))
+        await asyncio.sleep(0)
+
+        for n in range(4):
+            await queue.put(Event(topic="test", data={"n": n}))
+
+        gate.set()
+        await queue.stop()
+
+        assert processed == [-1, *expected]
+
+    async def test_raise_policy(self):
+        """Test raise policy rejects when full."""
+        gate = asyncio.Event()
+
+        async def process(event: Event):
+            await gate.wait()
+
+        queue = PublishQueue(process, max_size=1, num_workers=1, overflow_policy="raise")
+        await queue.start()
+        await queue.put(Event(topic="test"))
+        await asyncio.sleep(0)
+        await queue.put(Event(topic="test"))
+
+        with pytest.raises(PublishQueueFullError):
+            await queue.put(Event(topic="test"))
+
+        gate.set()
+        await queue.stop()
+        assert queue.get_stats()["rejected"] == 1
+
+    async def test_block_policy_applies_backpressure(self):
+        """Test block policy waits for space."""
+        processed = []
+
+        async def process(event: Event):
+            await asyncio.sleep(0.001)
+            processed.append(event)
+
+        queue = PublishQueue(process, max_size=2, num_workers=1, overflow_policy="block")
+        await queue.start()
+        for _ in range(10):
+            await queue.put(Event(topic="test"))
+            assert queue.depth <= 2
+        await queue.stop()
+
+        assert len(processed) == 10
+
+    async def test_stop_timeout_discards_remaining(self):
+        """Test drain respects the timeout."""
+
+        async def process(event: Event):
+            await asyncio.sleep(1)
+
+        queue = PublishQueue(process, num_workers=1)
+        await queue.start()
+        for _ in range(3):
+            await queue.put(Event(topic="test"))
+
+        await asyncio.wait_for(queue.stop(timeout=0.05), timeout=1)
+        assert not queue.is_running
+
+    async def test_stop_wakes_blocked_producers(self):
+        """Test producers blocked on a full queue get an error when it stops."""
+        gate = asyncio.Event()
+
+        async def process(event: Event):
+            await gate.wait()
+
+        queue = PublishQueue(process, max_size=1, num_workers=1, overflow_policy="block")
+        await queue.start()
+        await queue.put(Event(topic="test"))
+        await asyncio.sleep(0)
+        await queue.put(Event(topic="test"))
+        producer = asyncio.create_task(queue.put(Event(topic="test")))
+        await asyncio.sleep(0.01)
+        assert not producer.done()
+
+        await asyncio.wait_for(queue.stop(timeout=0.05), timeout=1)
+
+        with pytest.raises(BusShutdownError):
+            await asyncio.wait_for(producer, timeout=1)
+        gate.set()
+
+    async def test_metrics_fed(self):
+        """Test queue depth and latency reach the collector."""
+        metrics = MetricsCollector()
+
+        async def process(event: Event):
+            pass
+
+        queue = PublishQueue(process, metrics=metrics)
+        await queue.start()
+        await queue.put(Event(topic="test"))
+        await queue.stop()
+
+        assert metrics.get_histogram_stats("enqueue_to_dispatch_latency_seconds")["count"] == 1
+        assert metrics.get_gauge("queue_depth") == 0.0
+
+
+class TestQueuedBus:
+    """Test cases for the bus in queued publish mode."""
+
+    async def test_publish_is_decoupled_from_handlers(self):
+        """Test publish returns before slow handlers complete."""
+        config = NeuroBusConfig(core={"enable_publish_queue": True, "publish_workers": 1})
+        bus = NeuroBus(config=config)
+        received = []
+
+        @bus.subscribe("work")
+        async def slow_handler(event: Event):
+            await asyncio.sleep(0.01)
+            received.append(event.data["n"])
+
+        await bus.start()
+        for n in range(5):
+            await bus.publish(Event(topic="work", data={"n": n}))
+
+        assert len(received) < 5
+        assert bus.get_stats()["queue"]["enqueued"] == 5
+
+        await bus.stop(timeout=5.0)
+
+        assert received == list(range(5))
+
+    async def test_publish_rejected_while_stopping(self):
+        """Test the bus refuses publishes while it drains the queue."""
+        from neurobus.exceptions.core import BusNotStartedError
+
+        config = NeuroBusConfig(core={"enable_publish_queue": True, "publish_workers": 1})
+        bus = NeuroBus(config=config)
+        gate = asyncio.Event()
+
+        @bus.subscribe("work")
+        async def blocked_handler(event: Event):
+            await gate.wait()
+
+        await bus.start()
+        await bus.publish(Event(topic="work"))
+        stopping = asyncio.create_task(bus.stop(timeout=5.0))
+        await asyncio.sleep(0.01)
+
+        assert bus.state == "stopping"
+        with pytest.raises(BusNotStartedError):
+            await bus.publish(Event(topic="work"))
+
+        gate.set()
+        await stopping
+        assert bus.state == "stopped"
+
+    def test_invalid_policy_config(self):
+        """Test config validation of the overflow policy."""
+        with pytest.raises(ValueError):
+            NeuroBusConfig(core={"queue_overflow_policy": "spill"})
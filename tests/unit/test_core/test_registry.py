@@ -1,15 +1,18 @@
 """Tests for SubscriptionRegistry."""
 
+import random
+
 import pytest
 
 from neurobus.core.event import Event
-from neurobus.core.registry import SubscriptionRegistry
+from neurobus.core.registry import SubscriptionRegistry, TopicTrie
 from neurobus.core.subscription import Subscription
 from neurobus.exceptions.core import (
     DuplicateSubscriptionError,
     RegistryFullError,
     SubscriptionNotFoundError,
 )
+from neurobus.utils.patterns import wildcard_match
 
 
 class TestSubscriptionRegistry:
@@ -259,3 +262,165 @@ class TestSubscriptionRegistry:
         assert stats["exact_patterns"] == 1
         assert stats["wildcard_patterns"] == 1
         assert stats["capacity"] == 100
+
+    async def test_wildcard_removal_updates_matches(self):
+        """Test removed wildcard subscriptions stop matching."""
+        registry = SubscriptionRegistry()
+
+        async def handler(event: Event):
+            pass
+
+        sub = Subscription(pattern="agent.*.status", handler=handler)
+        registry.add(sub)
+        assert registry.find_matches(Event(topic="agent.1.status")) == [sub]
+
+        registry.remove(sub.id)
+        assert registry.find_matches(Event(topic="agent.1.status")) == []
+
+
+class TestTopicTrie:
+    """Test cases for TopicTrie."""
+
+    def test_single_segment_wildcard(self):
+        """Test * matches exactly one segment."""
+        trie = TopicTrie()
+        trie.insert("agent.*.status")
+
+        assert trie.match("agent.42.status") == ["agent.*.status"]
+        assert trie.match("agent.status") == []
+        assert trie.match("agent.1.2.status") == []
+
+    def test_multi_segment_wildcard(self):
+        """Test # matches one or more segments."""
+        trie = TopicTrie()
+        trie.insert("tenant.#")
+        trie.insert("a.#.z")
+
+        assert trie.match("tenant.1") == ["tenant.#"]
+        assert trie.match("tenant.1.users.created") == ["tenant.#"]
+        assert trie.match("tenant") == []
+        assert trie.match("a.b.c.z") == ["a.#.z"]
+        assert trie.match("a.z") == []
+
+    def test_partial_segment_wildcards_fall_back(self):
+        """Test patterns with wildcards inside a segment still match."""
+        trie = TopicTrie()
+        trie.insert("user*.login")
+        trie.insert("sys#")
+
+        assert trie.match("users.login") == ["user*.login"]
+        assert trie.match("system.error.critical") == ["sys#"]
+
+    def test_matches_in_insertion_order(self):
+        """Test matches are returned in insertion order."""
+        trie = TopicTrie()
+        for pattern in ["#", "a.*", "*.b", "a.#"]:
+            trie.insert(pattern)
+
+        assert trie.match("a.b") == ["#", "a.*", "*.b", "a.#"]
+
+    def test_remove_prunes_pattern(self):
+        """Test removing patterns."""
+        trie = TopicTrie()
+        trie.insert("a.*.c")
+        trie.insert("a.*")
+
+        assert trie.remove("a.*.c") is True
+        assert trie.remove("a.*.c") is False
+        assert "a.*.c" not in trie
+        assert trie.match("a.b.c") == []
+        assert trie.match("a.b") == ["a.*"]
+        assert len(trie) == 1
+
+    def test_equivalent_to_wildcard_match(self):
+        """Test trie results agree with wildcard_match on random inputs."""
+        rng = random.Random(42)
+        words = ["a", "b", "c", "", "*", "#", "b*", "#c"]
+        patterns = {
+            ".".join(rng.choice(words) for _ in range(rng.randint(1, 4))) for _ in range(300)
+        }
+        patterns = [p for p in patterns if "*" in p or "#" in p]
+
+        trie = TopicTrie()
+        for pattern in patterns:
+            trie.insert(pattern)
+
+        for _ in range(500):
+            topic = ".".join(
+                rng.choice(["a", "b", "c", "bc", ""]) for _ in range(rng.randint(1, 5))
+            )
+            expected = [p for p in patterns if wildcard_match(p, topic)]
+            assert sorted(trie.match(topic)) == sorted(expected), topic
+
+
+class TestResolvedCache:
+    """Test cases for the per-topic resolved-subscription cache."""
+
+    async def test_repeated_lookups_hit_cache(self):
+        """Test hot topics are served from the cache."""
+        registry = SubscriptionRegistry()
+
+        async def handler(event: Event):
+            pass
+
+        registry.add(Subscription(pattern="user.*", handler=handler))
+
+        for _ in range(3):
+            assert len(registry.find_matches(Event(topic="user.login"))) == 1
+
+        stats = registry.get_stats()["match_cache"]
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    async def test_add_and_remove_invalidate(self):
+        """Test registry changes invalidate cached topics."""
+        registry = SubscriptionRegistry()
+
+        async def handler(event: Event):
+            pass
+
+        event = Event(topic="user.login")
+        sub1 = Subscription(pattern="user.login", handler=handler)
+        registry.add(sub1)
+        assert registry.find_matches(event) == [sub1]
+
+        sub2 = Subscription(pattern="user.#", handler=handler, priority=5)
+        registry.add(sub2)
+        assert registry.find_matches(event) == [sub2, sub1]
+
+        registry.remove(sub2.id)
+        assert registry.find_matches(event) == [sub1]
+
+        registry.clear()
+        assert registry.find_matches(event) == []
+
+    async def test_filters_run_per_event(self):
+        """Test cached candidates are still filtered per event."""
+        registry = SubscriptionRegistry()
+
+        async def handler(event: Event):
+            pass
+
+        registry.add(
+            Subscription(
+                pattern="order.created",
+                handler=handler,
+                filter_func=lambda e: e.data.get("amount", 0) > 100,
+            )
+        )
+
+        assert registry.find_matches(Event(topic="order.created", data={"amount": 500}))
+        assert not registry.find_matches(Event(topic="order.created", data={"amount": 5}))
+
+    async def test_cache_is_bounded(self):
+        """Test LRU bound on cached topics."""
+        registry = SubscriptionRegistry(cache_size=2)
+
+        async def handler(event: Event):
+            pass
+
+        registry.add(Subscription(pattern="#", handler=handler))
+        for topic in ["a", "b", "c"]:
+            registry.find_matches(Event(topic=topic))
+
+        assert registry.get_stats()["match_cache"]["size"] == 2
@@ -0,0 +1,172 @@
+"""Tests for the IVF index and its memory adapter."""
+
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.memory.ivf import IVFIndex
+from neurobus.memory.ivf_adapter import IVFAdapter
+
+DIM = 16
+
+
+def _clustered(count: int, seed: int = 0) -> np.ndarray:
+    """Unit vectors around 20 random centres."""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((20, DIM))
+    vectors = centres[rng.integers(0, 20, count)] + 0.2 * rng.standard_normal((count, DIM))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def _exact_top(vectors: np.ndarray, query: np.ndarray, k: int) -> set[int]:
+    return set(np.argsort(vectors @ query)[::-1][:k].tolist())
+
+
+class TestIVFIndex:
+    """Training, search, updates and persistence."""
+
+    def test_untrained_index_is_exact(self):
+        vectors = _clustered(100)
+        ids = [uuid4() for _ in range(100)]
+        index = IVFIndex(dim=DIM, train_threshold=1000)
+        index.add(ids, vectors)
+
+        results = index.search(vectors[7], k=5)
+
+        assert not index.is_trained
+        assert {ids.index(i) for i, _ in results} == _exact_top(vectors, vectors[7], 5)
+        assert results[0] == (ids[7], pytest.approx(1.0))
+
+    def test_trains_at_threshold_and_keeps_recall(self):
+        vectors = _clustered(3000)
+        ids = [uuid4() for _ in range(3000)]
+        index = IVFIndex(dim=DIM, nprobe=4, train_threshold=1000)
+        for start in range(0, 3000, 500):
+            index.add(ids[start : start + 500], vectors[start : start + 500])
+
+        assert index.is_trained
+        assert len(index) == 3000
+        hits = 0
+        for query in vectors[:50]:
+            found = {ids.index(i) for i, _ in index.search(query, k=10)}
+            hits += len(found & _exact_top(vectors, query, 10))
+        assert hits / 500 > 0.9
+
+        # Scanning every list is an exact search
+        lists = index.get_stats()["lists"]
+        found = {ids.index(i) for i, _ in index.search(vectors[0], k=10, nprobe=lists)}
+        assert found == _exact_top(vectors, vectors[0], 10)
+
+    def test_auto_nlist_retrains_as_index_grows(self):
+        index = IVFIndex(dim=DIM, train_threshold=100, retrain_factor=4.0)
+        vectors = _clustered(500)
+        for start in range(0, 500, 50):
+            index.add([uuid4() for _ in range(50)], vectors[start : start + 50])
+
+        stats = index.get_stats()
+        assert stats["trainings"] == 2
+        assert stats["lists"] == round(400**0.5)
+
+    def test_remove_and_replace(self):
+        vectors = _clustered(2000)
+        ids = [uuid4() for _ in range(2000)]
+        index = IVFIndex(dim=DIM, train_threshold=500)
+        index.add(ids, vectors)
+
+        assert index.remove(ids[:10] + [uuid4()]) == 10
+        assert ids[0] not in index
+        assert all(i not in ids[:10] for i, _ in index.search(vectors[0], k=20, nprobe=100))
+        # Moved vectors stay reachable
+        for position in (10, 500, 1999):
+            assert index.search(vectors[position], k=1)[0][0] == ids[position]
+
+        index.add([ids[20]], vectors[:1])
+        assert len(index) == 1990
+        assert np.allclose(index.get(ids[20]), vectors[0])
+
+    def test_save_and_load(self, tmp_path):
+        vectors = _clustered(1500)
+        ids = [uuid4() for _ in range(1500)]
+        index = IVFIndex(dim=DIM, nprobe=3, train_threshold=1000)
+        index.add(ids, vectors)
+        index.remove(ids[:5])
+        path = tmp_path / "index.npz"
+        index.save(path)
+
+        loaded = IVFIndex.load(path, nprobe=3)
+
+        assert len(loaded) == 1495
+        assert loaded.get_stats()["lists"] == index.get_stats()["lists"]
+        assert loaded.search(vectors[42], k=5) == index.search(vectors[42], k=5)
+        loaded.add([uuid4()], vectors[:1])
+        assert len(loaded) == 1496
+
+    def test_rejects_foreign_files_and_bad_shapes(self, tmp_path):
+        path = tmp_path / "other.npz"
+        np.savez(path, data=np.zeros(3))
+
+        with pytest.raises(ValueError):
+            IVFIndex.load(path)
+        with pytest.raises(ValueError):
+            IVFIndex(dim=DIM).add([uuid4()], np.zeros((1, DIM + 1)))
+        with pytest.raises(ValueError):
+            IVFIndex(dim=DIM).add([uuid4(), uuid4()], np.zeros((1, DIM)))
+
+
+class TestIVFAdapter:
+    """BaseMemoryAdapter implementation over the index."""
+
+    async def test_store_search_and_filter(self):
+        adapter = IVFAdapter(vector_size=DIM)
+        await adapter.initialize()
+        vectors = _clustered(40)
+        events = [Event(topic=f"topic.{i % 2}", data={"n": i}) for i in range(40)]
+        await adapter.store_events(events, vectors)
+
+        results = await adapter.search_similar(vectors[3].tolist(), k=3)
+        filtered = await adapter.search_similar(vectors[3], k=5, filter_dict={"topic": "topic.0"})
+
+        assert results[0].event_id == events[3].id
+        assert results[0].payload["data"] == {"n": 3}
+        assert len(filtered) == 5
+        assert all(r.payload["topic"] == "topic.0" for r in filtered)
+        assert adapter.get_stats()["index"]["vectors"] == 40
+        await adapter.close()
+
+    async def test_get_and_delete(self):
+        adapter = IVFAdapter(vector_size=DIM)
+        await adapter.initialize()
+        event = Event(topic="user.login", data={"user": "a"})
+        await adapter.store_event(event, _clustered(1)[0].tolist())
+
+        assert (await adapter.get_event(event.id))["topic"] == "user.login"
+        assert await adapter.delete_event(event.id)
+        assert not await adapter.delete_event(event.id)
+        assert await adapter.get_event(event.id) is None
+        assert await adapter.search_similar(_clustered(1)[0], k=1) == []
+        await adapter.close()
+
+    async def test_close_persists_for_the_next_adapter(self, tmp_path):
+        vectors = _clustered(10)
+        events = [Event(topic="t", data={"n": i}) for i in range(10)]
+        adapter = IVFAdapter(path=tmp_path, vector_size=DIM)
+        await adapter.initialize()
+        await adapter.store_events(events, vectors)
+        await adapter.close()
+
+        reopened = IVFAdapter(path=tmp_path, vector_size=DIM)
+        await reopened.initialize()
+        results = await reopened.search_similar(vectors[4], k=1)
+
+        assert results[0].event_id == events[4].id
+        assert results[0].payload["data"] == {"n": 4}
+        await reopened.close()
+
+    async def test_requires_initialize(self):
+        adapter = IVFAdapter(vector_size=DIM)
+
+        with pytest.raises(RuntimeError):
+            await adapter.search_similar([0.0] * DIM)
@@ -119,6 +119,20 @@ class TestMemoryStore:
         assert len(results) == 2
         assert all("user" in r.topic for r in results)
 
+    def test_search_by_topic_substring(self):
+        """Test substring search across topic segments."""
+        store = MemoryStore()
+
+        store.add(MemoryEntry(uuid4(), "user.login", "content1"))
+        store.add(MemoryEntry(uuid4(), "admin.user.created", "content2"))
+        store.add(MemoryEntry(uuid4(), "system.error", "content3"))
+
+        results = store.search_by_topic_substring("user.")
+
+        assert sorted(r.topic for r in results) == ["admin.user.created", "user.login"]
+        # Wildcard characters are plain text here
+        assert store.search_by_topic_substring("#") == []
+
     def test_search_by_time(self):
         """Test searching by time range."""
         store = MemoryStore()
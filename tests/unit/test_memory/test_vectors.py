@@ -0,0 +1,189 @@
+"""Tests for the embedding matrix and vectorized memory search."""
+
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.memory.engine import MemoryEngine
+from neurobus.memory.store import MemoryEntry, MemoryStore
+from neurobus.memory.vectors import EmbeddingMatrix
+
+
+def _unit(*values: float) -> list[float]:
+    vector = np.asarray(values, dtype=np.float64)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class TestEmbeddingMatrix:
+    """Row management and search."""
+
+    def test_search_orders_by_score(self):
+        matrix = EmbeddingMatrix()
+        ids = [uuid4() for _ in range(3)]
+        matrix.add(ids[0], _unit(1, 0))
+        matrix.add(ids[1], _unit(1, 1))
+        matrix.add(ids[2], _unit(0, 1))
+
+        results = matrix.search(_unit(1, 0.1), k=2)
+
+        assert [memory_id for memory_id, _ in results] == ids[:2]
+        assert results[0][1] == pytest.approx(np.dot(_unit(1, 0), _unit(1, 0.1)), rel=1e-6)
+        assert matrix.search(_unit(1, 0), k=5, threshold=0.9) == [(ids[0], pytest.approx(1.0))]
+
+    def test_growth_and_row_reuse(self):
+        matrix = EmbeddingMatrix(initial_capacity=2)
+        ids = [uuid4() for _ in range(5)]
+        for i, memory_id in enumerate(ids):
+            matrix.add(memory_id, [float(i), 1.0])
+
+        assert matrix.capacity == 8
+        assert matrix.get(ids[3]).tolist() == [3.0, 1.0]
+
+        matrix.remove(ids[1])
+        replacement = uuid4()
+        matrix.add(replacement, [9.0, 1.0])
+
+        assert matrix.get_stats()["free_rows"] == 0
+        assert len(matrix) == 5
+        assert matrix.search([1.0, 0.0], k=1)[0][0] == replacement
+
+    def test_removed_rows_are_never_returned(self):
+        matrix = EmbeddingMatrix()
+        keep, drop = uuid4(), uuid4()
+        matrix.add(keep, [0.0, 1.0])
+        matrix.add(drop, [1.0, 0.0])
+        matrix.remove(drop)
+
+        assert matrix.search([1.0, 0.0], k=10) == [(keep, 0.0)]
+
+    def test_dimension_mismatch(self):
+        matrix = EmbeddingMatrix()
+        matrix.add(uuid4(), [1.0, 0.0])
+
+        with pytest.raises(ValueError):
+            matrix.add(uuid4(), [1.0, 0.0, 0.0])
+
+
+class TestMemoryStoreEmbeddings:
+    """Embeddings moving in and out of the store's matrix."""
+
+    def test_entry_embedding_reads_its_row(self):
+        store = MemoryStore()
+        entry = MemoryEntry(uuid4(), "topic", "content", embedding=[0.5, 0.5])
+        store.add(entry)
+
+        assert entry.embedding.dtype == np.float32
+        assert entry.embedding.tolist() == [0.5, 0.5]
+        assert store.get_stats()["embeddings"]["embeddings"] == 1
+
+    def test_pruned_entries_keep_their_embedding(self):
+        store = MemoryStore(max_memories=2)
+        entries = [
+            MemoryEntry(uuid4(), "topic", str(i), embedding=[float(i), 1.0], importance=i / 10)
+            for i in range(3)
+        ]
+        for entry in entries:
+            store.add(entry)
+
+        assert entries[0].embedding.tolist() == [0.0, 1.0]
+        assert store.get_stats()["embeddings"]["capacity"] >= 2
+        assert [e for e, _ in store.search_similar([1.0, 0.0], limit=5)] == entries[:0:-1]
+
+    def test_search_skips_entries_without_embeddings(self):
+        store = MemoryStore()
+        store.add(MemoryEntry(uuid4(), "topic", "plain"))
+
+        assert store.search_similar([1.0, 0.0]) == []
+
+
+class _Encoder:
+    """Deterministic stand-in for SemanticEncoder: one axis per keyword."""
+
+    words = ("login", "logout", "payment")
+
+    def encode(self, text: str):
+        vector = np.array([float(w in text) for w in self.words] + [0.1], dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+
+class TestMemoryEngineSearch:
+    """MemoryEngine.search over the matrix."""
+
+    async def test_search_ranks_by_similarity(self):
+        engine = MemoryEngine(auto_consolidate=False)
+        engine.enable_semantic = True
+        engine._encoder = _Encoder()
+        login = await engine.remember_event(Event(topic="user.login"))
+        await engine.remember_event(Event(topic="user.logout"))
+        await engine.remember_event(Event(topic="order.payment"))
+
+        results = await engine.search("login", limit=2, threshold=0.5)
+
+        assert results == [login]
+        assert login.access_count == 1
+
+
+class TestQuantizedMatrix:
+    """float16/int8 rows, scored on the codes, with optional reranking."""
+
+    @pytest.fixture
+    def vectors(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((2000, 64)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def _fill(self, matrix: EmbeddingMatrix, vectors: np.ndarray) -> list:
+        ids = [uuid4() for _ in range(len(vectors))]
+        for memory_id, vector in zip(ids, vectors, strict=True):
+            matrix.add(memory_id, vector)
+        return ids
+
+    @pytest.mark.parametrize("quantization, bytes_per_vector", [("float16", 128), ("int8", 68)])
+    def test_quantized_search_keeps_recall(self, vectors, quantization, bytes_per_vector):
+        matrix = EmbeddingMatrix(quantization=quantization)
+        ids = self._fill(matrix, vectors)
+
+        hits = 0
+        for query in vectors[:20]:
+            exact = {ids[i] for i in np.argsort(vectors @ query)[::-1][:10]}
+            hits += len(exact & {memory_id for memory_id, _ in matrix.search(query, k=10)})
+
+        stats = matrix.get_stats()
+        assert hits / 200 > 0.95
+        assert stats["bytes_per_vector"] == bytes_per_vector
+        assert stats["bytes"] == stats["capacity"] * bytes_per_vector
+        assert np.abs(matrix.get(ids[0]) - vectors[0]).max() < 0.01
+
+    def test_rerank_returns_exact_scores(self, vectors, tmp_path):
+        matrix = EmbeddingMatrix(
+            quantization="int8", rerank=4, originals_path=tmp_path / "originals.f32"
+        )
+        ids = self._fill(matrix, vectors)
+        matrix.remove(ids[1])
+
+        results = matrix.search(vectors[0], k=5)
+        expected = np.sort(np.delete(vectors, 1, axis=0) @ vectors[0])[::-1][:5]
+
+        assert results[0][0] == ids[0]
+        assert [score for _, score in results] == pytest.approx(expected.tolist(), abs=1e-6)
+        assert np.array_equal(matrix.get(ids[2]), vectors[2])
+        # Originals are memory-mapped, so only the codes are resident
+        assert matrix.get_stats()["bytes"] == matrix.capacity * 68
+
+    def test_unknown_quantization(self):
+        with pytest.raises(ValueError):
+            EmbeddingMatrix(quantization="int4")
+        with pytest.raises(ValueError):
+            MemoryStore(quantization="int4")
+
+    def test_store_clear_detaches_from_scratch_file(self, tmp_path):
+        store = MemoryStore(quantization="int8", rerank=2, originals_path=tmp_path / "o.f32")
+        entry = MemoryEntry(uuid4(), "topic", "content", embedding=[0.6, 0.8])
+        store.add(entry)
+
+        store.clear()
+        store.add(MemoryEntry(uuid4(), "topic", "other", embedding=[1.0, 0.0]))
+
+        assert entry.embedding.tolist() == pytest.approx([0.6, 0.8])
@@ -3,6 +3,7 @@
 import time
 
 import numpy as np
+import pytest
 
 from neurobus.semantic.cache import EmbeddingCache
 
@@ -166,3 +167,33 @@ class TestEmbeddingCache:
 
         assert "EmbeddingCache" in repr_str
         assert "1/100" in repr_str
+
+
+class TestQuantizedCache:
+    """EmbeddingCache with float16 and int8 storage."""
+
+    def test_int8_round_trip_and_bytes(self):
+        cache = EmbeddingCache(quantization="int8")
+        embedding = np.linspace(-1.0, 1.0, 384).astype(np.float32)
+
+        cache.set("text", embedding)
+        restored = cache.get("text")
+
+        assert restored.dtype == np.float32
+        assert np.abs(restored - embedding).max() <= 1 / 254 + 1e-6
+        assert cache.get_stats()["bytes_per_vector"] == 384 + 4
+
+    def test_float16_bytes_follow_evictions(self):
+        cache = EmbeddingCache(max_size=2, ttl=0, quantization="float16")
+        for key in ("a", "b", "c"):
+            cache.set(key, np.ones(384, dtype=np.float32))
+
+        assert cache.get_stats()["bytes"] == 2 * 384 * 2
+        assert np.array_equal(cache.get("c"), np.ones(384, dtype=np.float32))
+
+        cache.clear()
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_unknown_quantization(self):
+        with pytest.raises(ValueError):
+            EmbeddingCache(quantization="int4")
@@ -0,0 +1,231 @@
+"""Tests for the causality graph."""
+
+import random
+from uuid import uuid4
+
+from neurobus.core.event import Event
+from neurobus.temporal.causality import CausalityGraph
+from neurobus.temporal.store import EventStore
+
+
+def _chain(length: int) -> list[Event]:
+    """A linear chain root -> ... -> leaf."""
+    events = [Event(topic="chain.0")]
+    for i in range(1, length):
+        events.append(events[-1].child_event(f"chain.{i}"))
+    return events
+
+
+def _random_forest(count: int, seed: int = 0) -> list[Event]:
+    """Events whose parent is a random earlier event, or none."""
+    rng = random.Random(seed)
+    events = []
+    for i in range(count):
+        if events and rng.random() > 0.05:
+            parent = events[rng.randrange(max(0, len(events) - 50), len(events))]
+            events.append(parent.child_event(f"e.{i}"))
+        else:
+            events.append(Event(topic=f"e.{i}"))
+    return events
+
+
+def _naive_ancestors(parents: dict, event_id) -> list:
+    ancestors = []
+    parent = parents.get(event_id)
+    while parent is not None:
+        ancestors.append(parent)
+        parent = parents.get(parent)
+    return ancestors
+
+
+class TestCausalityGraph:
+    """Relationship queries."""
+
+    def test_chain_queries(self):
+        events = _chain(6)
+        graph = CausalityGraph()
+        for event in events:
+            graph.add_event(event)
+        ids = [e.id for e in events]
+
+        assert graph.get_parent(ids[3]) == ids[2]
+        assert graph.get_children(ids[3]) == [ids[4]]
+        assert graph.get_ancestors(ids[5]) == ids[4::-1]
+        assert graph.get_descendants(ids[1]) == ids[2:]
+        assert graph.get_causal_chain(ids[4]) == ids[:5]
+        assert graph.get_root(ids[5]) == ids[0]
+        assert graph.get_depth(ids[5]) == 5
+        assert graph.get_subtree_size(ids[2]) == 3
+        assert graph.is_ancestor(ids[1], ids[4])
+        assert not graph.is_ancestor(ids[4], ids[1])
+        assert graph.is_descendant(ids[4], ids[1])
+        assert [m["topic"] for m in graph.get_chain_metadata(ids[2])] == [
+            "chain.0",
+            "chain.1",
+            "chain.2",
+        ]
+
+    def test_common_ancestor_excludes_the_events(self):
+        root = Event(topic="root")
+        left = root.child_event("left")
+        right = root.child_event("right")
+        leaf = left.child_event("leaf")
+        graph = CausalityGraph()
+        for event in (root, left, right, leaf):
+            graph.add_event(event)
+
+        assert graph.find_common_ancestor(leaf.id, right.id) == root.id
+        assert graph.find_common_ancestor(left.id, leaf.id) == root.id
+        assert graph.find_common_ancestor(root.id, leaf.id) is None
+        assert graph.find_common_ancestor(leaf.id, Event(topic="other").id) is None
+
+    def test_matches_naive_walks(self):
+        events = _random_forest(2000)
+        graph = CausalityGraph()
+        for event in events:
+            graph.add_event(event)
+        parents = {e.id: e.parent_id for e in events}
+        rng = random.Random(1)
+
+        for _ in range(300):
+            a, b = rng.choice(events).id, rng.choice(events).id
+            ancestors_a = _naive_ancestors(parents, a)
+            ancestors_b = _naive_ancestors(parents, b)
+            assert graph.get_ancestors(a) == ancestors_a
+            assert graph.get_depth(a) == len(ancestors_a)
+            assert graph.is_ancestor(b, a) == (b in ancestors_a)
+            expected = next((x for x in ancestors_b if x in set(ancestors_a)), None)
+            assert graph.find_common_ancestor(a, b) == expected
+
+        stats = graph.get_stats()
+        assert stats["events_tracked"] == 2000
+        assert stats["max_depth"] == max(len(_naive_ancestors(parents, e.id)) for e in events)
+
+    def test_child_before_parent_is_adopted(self):
+        root, middle, leaf = _chain(3)
+        graph = CausalityGraph()
+        graph.add_event(root)
+        graph.add_event(leaf)
+
+        assert graph.get_root(leaf.id) == middle.id
+        assert graph.get_descendants(middle.id) == [leaf.id]
+
+        graph.add_event(middle)
+
+        assert graph.get_root(leaf.id) == root.id
+        assert graph.get_depth(leaf.id) == 2
+        assert graph.is_ancestor(root.id, leaf.id)
+        assert graph.get_stats()["root_events"] == 1
+
+    def test_untracked_parent_ends_the_chain(self):
+        missing = uuid4()
+        event = Event(topic="orphan", parent_id=missing)
+        graph = CausalityGraph()
+        graph.add_event(event)
+
+        assert graph.get_ancestors(event.id) == [missing]
+        assert graph.get_causal_chain(event.id) == [missing, event.id]
+        assert graph.is_ancestor(missing, event.id)
+        assert graph.get_depth(event.id) == 1
+
+    def test_clear(self):
+        graph = CausalityGraph()
+        for event in _chain(3):
+            graph.add_event(event)
+        graph.clear()
+
+        assert len(graph) == 0
+        assert graph.get_stats()["max_depth"] == 0
+
+
+class TestEviction:
+    """Bounded graphs."""
+
+    def test_max_events_drops_least_recent_trees(self):
+        old, recent = _chain(3), _chain(3)
+        graph = CausalityGraph(max_events=6)
+        for event in old + recent:
+            graph.add_event(event)
+        graph.add_event(old[-1].child_event("extends.old"))
+
+        # The old tree was extended last, so the other one goes
+        assert recent[0].id not in graph
+        assert old[0].id in graph
+        assert len(graph) == 4
+        assert graph.get_stats()["trees_evicted"] == 1
+
+    def test_children_of_evicted_trees_start_new_trees(self):
+        first = _chain(2)
+        graph = CausalityGraph(max_events=2)
+        for event in first + _chain(2):
+            graph.add_event(event)
+        late = first[-1].child_event("late")
+        graph.add_event(late)
+
+        assert graph.get_root(late.id) == first[-1].id
+        assert graph.get_depth(late.id) == 1
+
+    def test_max_age(self, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("neurobus.temporal.causality.time.monotonic", lambda: clock[0])
+        graph = CausalityGraph(max_age=60)
+        stale = _chain(3)
+        for event in stale:
+            graph.add_event(event)
+        clock[0] += 120
+        fresh = Event(topic="fresh")
+        graph.add_event(fresh)
+
+        assert all(e.id not in graph for e in stale)
+        assert fresh.id in graph
+
+    def test_memory_budget_sets_event_limit(self):
+        graph = CausalityGraph(memory_budget_mb=1)
+
+        assert 0 < graph.max_events < 10_000
+
+
+class TestStoreBacked:
+    """CausalityGraph as a cache in front of an EventStore."""
+
+    async def test_cold_chain_is_loaded_and_cached(self, tmp_path):
+        store = EventStore(db_path=tmp_path / "events.db")
+        events = _chain(5)
+        await store.store_events(events)
+        ids = [e.id for e in events]
+        graph = CausalityGraph(store=store)
+
+        assert await graph.load_causal_chain(ids[3]) == ids[:4]
+        assert graph.get_causal_chain(ids[3]) == ids[:4]
+
+        # The leaf hangs under a cached ancestor: answered from memory
+        graph.add_event(events[4])
+        assert await graph.load_root(ids[4]) == ids[0]
+        stats = graph.get_stats()
+        assert stats["store_lookups"] == 1
+        assert stats["cache_hits"] == 1
+        await store.close()
+
+    async def test_partial_chain_is_completed_from_store(self, tmp_path):
+        store = EventStore(db_path=tmp_path / "events.db")
+        events = _chain(6)
+        await store.store_events(events)
+        ids = [e.id for e in events]
+        graph = CausalityGraph(store=store)
+        for event in events[3:]:
+            graph.add_event(event)
+
+        assert await graph.load_causal_chain(ids[5]) == ids
+        assert graph.get_depth(ids[5]) == 5
+        assert [d async for d in graph.load_descendants(ids[0])] == ids[1:]
+        await store.close()
+
+    async def test_without_store(self):
+        graph = CausalityGraph()
+        events = _chain(3)
+        for event in events:
+            graph.add_event(event)
+
+        assert await graph.load_causal_chain(events[2].id) == [e.id for e in events]
+        descendants = [d async for d in graph.load_descendants(events[0].id)]
+        assert descendants == [events[1].id, events[2].id]
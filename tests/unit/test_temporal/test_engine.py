@@ -0,0 +1,236 @@
+"""Tests for TemporalEngine."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.engine import TemporalEngine
+from neurobus.temporal.store import EventStore
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create a temporal engine with a temporary store."""
+    engine = TemporalEngine(store=EventStore(db_path=tmp_path / "events.db"))
+    await engine.initialize()
+    yield engine
+    await engine.close()
+
+
+def _history(count: int, step: timedelta = timedelta(milliseconds=10)) -> list[Event]:
+    start = datetime.now() - timedelta(hours=1)
+    return [
+        Event(topic=f"user.{i % 2}", data={"n": i}, timestamp=start + i * step)
+        for i in range(count)
+    ]
+
+
+class TestStreamReplay:
+    """Test cases for streaming replay."""
+
+    async def test_streams_all_pages_in_order(self, engine):
+        """Test events come back in chronological order across pages."""
+        events = _history(25)
+        await engine.store_events(list(reversed(events)))
+
+        replayed = [e async for e in engine.stream_replay(page_size=4, prefetch=1)]
+
+        assert replayed == events
+
+    async def test_equal_timestamps_not_skipped(self, engine):
+        """Test keyset pagination keeps rows sharing a timestamp at a page boundary."""
+        timestamp = datetime.now()
+        events = [Event(topic="tie", data={"n": i}, timestamp=timestamp) for i in range(7)]
+        await engine.store_events(events)
+
+        replayed = [e async for e in engine.stream_replay(page_size=3)]
+
+        assert [e.data["n"] for e in replayed] == list(range(7))
+
+    async def test_filters(self, engine):
+        """Test topic and time filters apply to the stream."""
+        events = _history(10)
+        await engine.store_events(events)
+
+        replayed = [
+            e
+            async for e in engine.stream_replay(
+                start_time=events[2].timestamp, topic="user.0", page_size=2
+            )
+        ]
+
+        assert replayed == [e for e in events[2:] if e.topic == "user.0"]
+
+    async def test_early_exit_stops_prefetch(self, engine):
+        """Test breaking out of the stream cancels the prefetch task."""
+        await engine.store_events(_history(50))
+
+        stream = engine.stream_replay(page_size=5)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert not [t for t in tasks if "fetch_pages" in repr(t.get_coro())]
+
+    async def test_speed_paces_events(self, engine, monkeypatch):
+        """Test speed replays the recorded gaps scaled by the multiple."""
+        await engine.store_events(_history(3, step=timedelta(milliseconds=100)))
+
+        # Fake clock that only advances when the replay sleeps
+        clock = [0.0]
+        delays: list[float] = []
+        real_sleep = asyncio.sleep
+
+        async def fake_sleep(delay, result=None):
+            if delay > 0:
+                delays.append(delay)
+                clock[0] += delay
+            return await real_sleep(0, result)
+
+        monkeypatch.setattr(
+            "neurobus.temporal.engine.time", SimpleNamespace(monotonic=lambda: clock[0])
+        )
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        replayed = [e async for e in engine.stream_replay(speed=2.0)]
+
+        assert len(replayed) == 3
+        assert delays == pytest.approx([0.05, 0.05], abs=1e-5)
+
+    async def test_invalid_arguments(self, engine):
+        """Test non-positive speed and page size are rejected."""
+        with pytest.raises(ValueError):
+            [e async for e in engine.stream_replay(speed=0)]
+        with pytest.raises(ValueError):
+            [e async for e in engine.stream_replay(page_size=0)]
+
+    async def test_replay_into_republishes(self, engine):
+        """Test replay_into publishes copies tagged with the original id."""
+        events = _history(5)
+        await engine.store_events(events)
+
+        class RecordingBus:
+            def __init__(self) -> None:
+                self.published: list[Event] = []
+
+            async def publish(self, event: Event) -> None:
+                self.published.append(event)
+                # Republished events are persisted again, as on a real bus
+                await engine.store_event(event)
+
+        bus = RecordingBus()
+        count = await engine.replay_into(bus, page_size=2)
+
+        assert count == 5
+        assert [e.metadata["replayed_from"] for e in bus.published] == [str(e.id) for e in events]
+        assert [e.data for e in bus.published] == [e.data for e in events]
+        assert await engine.count_events() == 10
+
+    async def test_snapshot_uses_stream(self, engine):
+        """Test snapshots hold the same events as a full replay."""
+        events = _history(12)
+        await engine.store_events(events)
+
+        assert await engine.create_snapshot("all") == 12
+        assert await engine.get_snapshot("all") == events
+
+
+class TestSnapshots:
+    """Test cases for persistent snapshots."""
+
+    async def test_marker_excludes_later_events(self, engine):
+        """Test a snapshot ignores events stored after it, even with older timestamps."""
+        events = _history(10)
+        await engine.store_events(events[::2])
+        await engine.create_snapshot("even", topic="user.0")
+
+        await engine.store_events(events[1::2])
+        await engine.store_events([Event(topic="user.0", timestamp=events[0].timestamp)])
+
+        assert await engine.get_snapshot("even") == events[::2]
+        assert engine.get_snapshot_info("even").event_count == 5
+
+    async def test_snapshots_survive_restart(self, tmp_path):
+        """Test markers and snapshot files are reloaded by a new engine."""
+        events = _history(20)
+        engine = TemporalEngine(db_path=str(tmp_path / "events.db"))
+        await engine.initialize()
+        await engine.store_events(events)
+        await engine.create_snapshot("lazy", start_time=events[5].timestamp)
+        assert await engine.create_snapshot("file", topic="user.1", materialize=True) == 10
+        await engine.close()
+
+        engine = TemporalEngine(db_path=str(tmp_path / "events.db"))
+        await engine.initialize()
+
+        assert engine.list_snapshots() == ["lazy", "file"]
+        assert await engine.get_snapshot("lazy") == events[5:]
+        assert engine.get_snapshot_info("file").materialized
+        assert [e async for e in engine.stream_snapshot("file")] == events[1::2]
+        await engine.close()
+
+    async def test_materialized_outlives_store(self, engine):
+        """Test a materialized snapshot reads its file, not the store."""
+        events = _history(2500)
+        await engine.store_events(events)
+        await engine.create_snapshot("all", materialize=True)
+
+        await engine.store.store_events(_history(3))
+        engine.store.max_events = 1
+        await engine.store.enforce_retention()
+
+        assert await engine.get_snapshot("all") == events
+
+    async def test_replace_and_delete(self, engine):
+        """Test replacing and deleting snapshots removes their files."""
+        await engine.store_events(_history(4))
+        await engine.create_snapshot("s", materialize=True)
+        first = engine.get_snapshot_info("s").path
+        await engine.create_snapshot("s", materialize=True)
+        second = engine.get_snapshot_info("s").path
+
+        assert not first.exists()
+        assert await engine.delete_snapshot("s")
+        assert not second.exists()
+        assert not await engine.delete_snapshot("s")
+        assert await engine.get_snapshot("s") == []
+
+    async def test_directory_store_catalog(self, tmp_path):
+        """Test stores without a database keep markers in snapshots.db."""
+        engine = TemporalEngine(db_path=str(tmp_path / "events.db"), partition_by="day")
+        await engine.initialize()
+        events = _history(6)
+        await engine.store_events(events)
+        await engine.create_snapshot("all")
+
+        assert (tmp_path / "events" / "snapshots.db").exists()
+        assert await engine.get_snapshot("all") == events
+        await engine.close()
+
+
+class TestCausality:
+    """The engine's causality graph."""
+
+    async def test_event_store_chains_load_on_demand(self, engine):
+        root = Event(topic="request")
+        child = root.child_event("response")
+        await engine.store_events([root, child])
+
+        assert len(engine.causality) == 0
+        assert await engine.causality.load_causal_chain(child.id) == [root.id, child.id]
+        assert (await engine.get_stats())["causality"]["events_tracked"] == 2
+
+    async def test_other_stores_track_stored_events(self, tmp_path):
+        engine = TemporalEngine(db_path=str(tmp_path / "events.db"), partition_by="day")
+        await engine.initialize()
+        root = Event(topic="request")
+        child = root.child_event("response")
+        await engine.store_event(root)
+        await engine.store_events([child])
+
+        assert engine.causality.get_causal_chain(child.id) == [root.id, child.id]
+        await engine.close()
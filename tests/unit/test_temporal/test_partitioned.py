@@ -0,0 +1,154 @@
+"""Tests for PartitionedEventStore."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.engine import TemporalEngine
+from neurobus.temporal.partitioned import PartitionedEventStore
+
+
+def _hourly_events(hours: int, per_hour: int = 3) -> list[Event]:
+    """Events spread over the last `hours` hours, oldest first."""
+    base = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=hours - 1)
+    return [
+        Event(
+            topic=f"user.{i % 2}",
+            data={"h": h, "i": i},
+            timestamp=base + timedelta(hours=h, minutes=i * 10),
+        )
+        for h in range(hours)
+        for i in range(per_hour)
+    ]
+
+
+@pytest.fixture
+async def store(tmp_path):
+    """Create an hourly partitioned store."""
+    store = PartitionedEventStore(tmp_path / "events", partition_by="hour")
+    await store.initialize()
+    yield store
+    await store.close()
+
+
+class TestPartitionedEventStore:
+    """Test cases for PartitionedEventStore."""
+
+    def test_invalid_partition_by(self, tmp_path):
+        """Test unknown partition spans are rejected."""
+        with pytest.raises(ValueError):
+            PartitionedEventStore(tmp_path, partition_by="week")
+
+    async def test_one_file_per_partition(self, store):
+        """Test events land in the partition covering their timestamp."""
+        await store.store_events(_hourly_events(4))
+
+        files = sorted(p.name for p in store.directory.glob("events-*.db"))
+        stats = await store.get_stats()
+
+        assert len(files) == 4
+        assert stats["total_events"] == 12
+        assert sorted(stats["partitions"].values()) == [3, 3, 3, 3]
+
+    async def test_get_event_uses_index(self, store):
+        """Test get_event finds events in any partition."""
+        events = _hourly_events(3)
+        await store.store_events(events)
+
+        assert await store.get_event(events[0].id) == events[0]
+        assert await store.get_event(str(events[-1].id)) == events[-1]
+        assert await store.get_event(Event(topic="missing").id) is None
+
+    async def test_time_range_prunes_partitions(self, store):
+        """Test time-range queries only open overlapping partitions."""
+        events = _hourly_events(6)
+        await store.store_events(events)
+        await store.close()
+        await store.initialize()
+        opened = store._stats["partitions_opened"]
+
+        start = events[6].timestamp
+        end = events[8].timestamp
+        found = await store.query_time_range(start, end, limit=100)
+
+        assert sorted(e.data["i"] + 3 * e.data["h"] for e in found) == [6, 7, 8]
+        assert store._stats["partitions_opened"] == opened + 1
+
+    async def test_query_newest_first_across_partitions(self, store):
+        """Test newest-first queries merge partitions and honour offset."""
+        events = _hourly_events(3)
+        await store.store_events(events)
+
+        page = await store.query_by_topic("user.#", limit=4, offset=1)
+
+        assert page == list(reversed(events))[1:5]
+
+    async def test_replay_count_and_stream(self, store):
+        """Test fan-out queries return every partition's events in order."""
+        events = _hourly_events(5)
+        await store.store_events(events)
+
+        assert await store.replay_events() == events
+        assert [e async for e in store.stream_events(page_size=2)] == events
+        assert await store.count_events("user.0") == sum(e.topic == "user.0" for e in events)
+
+    async def test_lru_closes_idle_partitions(self, tmp_path):
+        """Test at most max_open_partitions stay open."""
+        store = PartitionedEventStore(tmp_path, partition_by="hour", max_open_partitions=2)
+        events = _hourly_events(5)
+        await store.store_events(events)
+
+        assert len(store._open) == 2
+        assert await store.replay_events() == events
+        await store.close()
+
+    async def test_retention_drops_whole_partitions(self, tmp_path):
+        """Test expired partitions are unlinked and leave the id index."""
+        store = PartitionedEventStore(tmp_path, partition_by="hour", retention_days=1)
+        old = Event(topic="old", timestamp=datetime.now() - timedelta(days=2))
+        new = Event(topic="new")
+        await store.store_events([old, new])
+
+        assert await store.enforce_retention() == 1
+
+        assert len(list(tmp_path.glob("events-*.db"))) == 1
+        assert await store.get_event(old.id) is None
+        assert await store.get_event(new.id) == new
+        stats = await store.get_stats()
+        assert stats["retention"]["partitions_dropped"] == 1
+        assert stats["retention"]["rows_dropped"] == 1
+
+        await store._purge_task
+        assert len(await store._index.indexed_partitions()) == 1
+        await store.close()
+
+    async def test_max_events_keeps_newest_partitions(self, tmp_path):
+        """Test the oldest partitions are dropped while the rest hold max_events."""
+        store = PartitionedEventStore(tmp_path, partition_by="hour", max_events=6)
+        events = _hourly_events(4)
+        await store.store_events(events)
+
+        assert await store.enforce_retention() == 6
+
+        assert await store.replay_events() == events[6:]
+        await store.close()
+
+    async def test_reopen_restores_partitions(self, tmp_path):
+        """Test partitions and the index survive close and reopen."""
+        events = _hourly_events(3)
+        store = PartitionedEventStore(tmp_path, partition_by="day")
+        await store.store_events(events)
+        await store.close()
+
+        reopened = PartitionedEventStore(tmp_path, partition_by="day")
+        assert await reopened.count_events() == 9
+        assert await reopened.get_event(events[4].id) == events[4]
+        await reopened.close()
+
+    async def test_engine_partition_by(self, tmp_path):
+        """Test TemporalEngine builds a partitioned store on request."""
+        engine = TemporalEngine(db_path=str(tmp_path / "events.db"), partition_by="day")
+
+        assert isinstance(engine.store, PartitionedEventStore)
+        assert engine.store.directory == tmp_path / "events"
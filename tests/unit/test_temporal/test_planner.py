@@ -0,0 +1,182 @@
+"""Tests for topic query planning."""
+
+import sqlite3
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.planner import (
+    TopicQueryPlanner,
+    literal_prefix,
+    prefix_upper_bound,
+    register_topic_match,
+)
+from neurobus.temporal.store import EventStore
+from neurobus.utils.patterns import wildcard_match
+
+TOPICS = [
+    "user",
+    "user.login",
+    "user.logout",
+    "User.login",
+    "user.profile.update",
+    "user.profile.delete",
+    "userx.login",
+    "user_admin.login",
+    "system.error",
+    "network.error",
+    "network.error.retry",
+    "a.b.c.d",
+    "user.login\n",
+    "user.a\nb",
+]
+
+PATTERNS = [
+    "#",
+    "*",
+    "user",
+    "user.login",
+    "user.#",
+    "user#",
+    "user.*",
+    "user.*.update",
+    "*.error",
+    "*.error.#",
+    "us*.login",
+    "user.pro*",
+    "*.*",
+    "a.#.d",
+    "nothing.*",
+]
+
+
+@pytest.fixture
+async def store(tmp_path):
+    """Create a store holding one event per test topic."""
+    store = EventStore(db_path=tmp_path / "topics.db")
+    await store.store_events([Event(topic=topic) for topic in TOPICS])
+    yield store
+    await store.close()
+
+
+class TestTopicHelpers:
+    """Test cases for prefix helpers."""
+
+    def test_literal_prefix(self):
+        """Test the prefix stops at the first wildcard."""
+        assert literal_prefix("user.#") == "user."
+        assert literal_prefix("user.*.x") == "user."
+        assert literal_prefix("*.error") == ""
+        assert literal_prefix("user.login") == "user.login"
+
+    def test_prefix_upper_bound(self):
+        """Test the exclusive bound increments the last character."""
+        assert prefix_upper_bound("user.") == "user/"
+        assert prefix_upper_bound("a\U0010ffff") == "b"
+        assert prefix_upper_bound("\U0010ffff") is None
+
+
+class TestTopicQueryPlanner:
+    """Test cases for TopicQueryPlanner."""
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    async def test_results_match_wildcard_match(self, store, pattern):
+        """Test every strategy returns exactly the wildcard_match topics."""
+        expected = sorted(topic for topic in TOPICS if wildcard_match(pattern, topic))
+
+        events = await store.query_by_topic(pattern, limit=1000)
+
+        assert sorted(event.topic for event in events) == expected
+        assert await store.count_events(pattern) == len(expected)
+        assert sorted([e.topic async for e in store.stream_events(topic_pattern=pattern)]) == (
+            expected
+        )
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    async def test_residual_matches_wildcard_match(self, store, pattern):
+        """Test the topic_match fallback is exact when the catalog overflows."""
+        store._planner.max_in_topics = 0
+        expected = sorted(topic for topic in TOPICS if wildcard_match(pattern, topic))
+
+        events = await store.query_by_topic(pattern, limit=1000)
+
+        assert sorted(event.topic for event in events) == expected
+
+    async def test_strategies(self, store):
+        """Test which strategy each pattern shape is planned with."""
+        conn = sqlite3.connect(store.db_path)
+        register_topic_match(conn)
+        planner = TopicQueryPlanner()
+
+        assert planner.plan(conn, "user.login").strategy == "literal"
+        assert planner.plan(conn, "user.#").strategy == "prefix"
+        assert planner.plan(conn, "#").strategy == "all"
+        assert planner.plan(conn, "*.error").strategy == "catalog"
+        assert planner.plan(conn, "nothing.*").strategy == "none"
+        assert planner.plan(conn, "user%").strategy == "like"
+        assert TopicQueryPlanner(max_in_topics=1).plan(conn, "*.error").strategy == "residual"
+        conn.close()
+
+    async def test_prefix_uses_topic_index(self, store):
+        """Test prefix and catalog plans search idx_topic instead of scanning."""
+        conn = sqlite3.connect(store.db_path)
+        register_topic_match(conn)
+        planner = TopicQueryPlanner()
+
+        for pattern in ("user.#", "*.error"):
+            topic = planner.plan(conn, pattern)
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT COUNT(*) FROM events WHERE {topic.clause}",
+                topic.params,
+            ).fetchall()
+            assert "USING COVERING INDEX idx_topic" in plan[0][3]
+        conn.close()
+
+    async def test_broad_ordered_query_walks_timestamp_index(self, store):
+        """Test a broad pattern with a small limit is planned in timestamp order."""
+        conn = sqlite3.connect(store.db_path)
+        register_topic_match(conn)
+        planner = TopicQueryPlanner()
+
+        broad = planner.plan(conn, "user.#", order_limit=1, total_rows=1_000_000)
+        narrow = planner.plan(conn, "system.#", order_limit=1000, total_rows=1_000)
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT id FROM events WHERE {broad.clause} "
+            "ORDER BY timestamp DESC LIMIT 1",
+            broad.params,
+        ).fetchall()
+
+        assert broad.time_ordered
+        assert not narrow.time_ordered
+        assert "idx_timestamp" in plan[0][3]
+        conn.close()
+
+    async def test_legacy_like_patterns(self, store):
+        """Test patterns containing % still use SQL LIKE (case-insensitive)."""
+        assert await store.count_events("user.%") == 7
+
+    async def test_plan_stats(self, store):
+        """Test planned strategies are counted in store stats."""
+        await store.count_events("user.#")
+        await store.count_events("*.error")
+
+        plans = (await store.get_stats())["topic_plans"]
+
+        assert plans["prefix"] == 1
+        assert plans["catalog"] == 1
+
+    async def test_catalog_backfilled_for_existing_database(self, tmp_path):
+        """Test a database without the topics catalog gets it on initialize."""
+        db_path = tmp_path / "old.db"
+        store = EventStore(db_path=db_path)
+        await store.store_events([Event(topic="a.x"), Event(topic="b.x")])
+        await store.close()
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE topics")
+        conn.commit()
+        conn.close()
+
+        await store.initialize()
+        assert await store.count_events("*.x") == 2
+        await store.close()
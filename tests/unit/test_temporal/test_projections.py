@@ -0,0 +1,170 @@
+"""Tests for projections and checkpointed state_at queries."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.engine import TemporalEngine
+
+START = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _transactions(count: int, start: datetime = START) -> list[Event]:
+    """Deposits and withdrawals one second apart, with a noise topic in between."""
+    events = []
+    for i in range(count):
+        topic = "account.withdrawn" if i % 3 == 0 else "account.deposited"
+        events.append(
+            Event(topic=topic, data={"amount": i}, timestamp=start + timedelta(seconds=i))
+        )
+        events.append(Event(topic="other.event", timestamp=start + timedelta(seconds=i)))
+    return events
+
+
+def balance(state: dict, event: Event) -> dict:
+    """Fold deposits and withdrawals into a balance and a transaction count."""
+    sign = -1 if event.topic == "account.withdrawn" else 1
+    state["balance"] += sign * event.data["amount"]
+    state["count"] += 1
+    return state
+
+
+def _expected(count: int) -> dict:
+    """Balance after the first count transactions."""
+    amounts = [-i if i % 3 == 0 else i for i in range(count)]
+    return {"balance": sum(amounts), "count": count}
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    """Create an engine with a registered balance projection."""
+    engine = TemporalEngine(db_path=str(tmp_path / "events.db"))
+    await engine.initialize()
+    await engine.register_projection(
+        "balance", balance, "account.*", {"balance": 0, "count": 0}, checkpoint_interval=10
+    )
+    yield engine
+    await engine.close()
+
+
+class TestProjections:
+    """Test cases for TemporalEngine projections."""
+
+    async def test_state_at_matches_full_replay(self, engine):
+        """Test checkpointed rebuilds equal folding the whole history."""
+        await engine.store_events(_transactions(100))
+
+        for seconds in (0, 9, 10, 55, 99, 150):
+            at = START + timedelta(seconds=seconds)
+            expected = _expected(min(seconds + 1, 100))
+            assert await engine.state_at("balance", at) == expected
+            assert await engine.state_at("balance", at, use_checkpoints=False) == expected
+
+        stats = (await engine.get_stats())["projections"]
+        assert stats["checkpoints_saved"] == 10
+        assert stats["checkpoints_used"] > 0
+
+    async def test_checkpoint_limits_replay(self, engine):
+        """Test a query after a checkpoint folds only the delta."""
+        await engine.store_events(_transactions(100))
+        await engine.state_at("balance")
+        before = engine._projection_stats["events_folded"]
+
+        assert await engine.state_at("balance", START + timedelta(seconds=95)) == _expected(96)
+        assert engine._projection_stats["events_folded"] - before == 6
+
+    async def test_checkpoints_never_split_a_timestamp(self, engine):
+        """Test events sharing a timestamp are never split by a checkpoint."""
+        events = [
+            Event(topic="account.deposited", data={"amount": 1}, timestamp=START) for _ in range(25)
+        ]
+        await engine.store_events(events)
+
+        await engine.state_at("balance")
+
+        assert await engine.state_at("balance", START) == {"balance": 25, "count": 25}
+
+    async def test_late_events_invalidate_checkpoints(self, engine):
+        """Test events stored behind a checkpoint are included in later rebuilds."""
+        await engine.store_events(_transactions(50))
+        await engine.state_at("balance")
+        late = Event(
+            topic="account.deposited",
+            data={"amount": 1000},
+            timestamp=START + timedelta(seconds=20.5),
+        )
+        await engine.store_event(late)
+
+        state = await engine.state_at("balance", START + timedelta(seconds=45))
+
+        expected = _expected(46)
+        assert state == {"balance": expected["balance"] + 1000, "count": 47}
+        assert (await engine.get_stats())["projections"]["checkpoints_invalidated"] > 0
+
+    async def test_checkpoint_state_with_int_keys(self, engine):
+        """Test states keyed by ints survive a checkpoint round trip."""
+
+        def per_bucket(state: dict, event: Event) -> dict:
+            bucket = event.data["amount"] % 3
+            state[bucket] = state.get(bucket, 0) + 1
+            return state
+
+        await engine.register_projection(
+            "buckets", per_bucket, "account.*", {}, checkpoint_interval=2
+        )
+        await engine.store_events(_transactions(10))
+
+        expected = {0: 4, 1: 3, 2: 3}
+        assert await engine.state_at("buckets") == expected
+        assert await engine.state_at("buckets") == expected
+        assert engine._projection_stats["checkpoints_used"] > 0
+
+    async def test_checkpoints_persist(self, tmp_path):
+        """Test a new engine resumes from checkpoints saved by an earlier one."""
+        db_path = str(tmp_path / "events.db")
+        engine = TemporalEngine(db_path=db_path)
+        await engine.register_projection(
+            "balance", balance, "account.*", {"balance": 0, "count": 0}
+        )
+        await engine.store_events(_transactions(30))
+        projection = engine._projections["balance"]
+        projection.checkpoint_interval = 10
+        await engine.state_at("balance")
+        await engine.close()
+
+        engine = TemporalEngine(db_path=db_path)
+        await engine.initialize()
+        await engine.register_projection(
+            "balance", balance, "account.*", {"balance": 0, "count": 0}
+        )
+
+        assert await engine.state_at("balance") == _expected(30)
+        assert engine._projection_stats["events_folded"] == 0
+
+        await engine.register_projection(
+            "balance", balance, "account.*", {"balance": 0, "count": 0}, version=2
+        )
+        assert await engine.state_at("balance") == _expected(30)
+        assert engine._projection_stats["events_folded"] == 30
+        await engine.close()
+
+    async def test_async_reducer_and_clear(self, engine):
+        """Test coroutine reducers and clearing checkpoints."""
+
+        async def count(state: int, event: Event) -> int:
+            return state + 1
+
+        await engine.register_projection("count", count, "#", 0, checkpoint_interval=5)
+        await engine.store_events(_transactions(10))
+
+        assert await engine.state_at("count") == 20
+        assert await engine.clear_checkpoints("count") == 4
+        assert await engine.state_at("count", START + timedelta(seconds=4)) == 10
+
+    async def test_unknown_projection(self, engine):
+        """Test state_at rejects unknown projections."""
+        with pytest.raises(KeyError):
+            await engine.state_at("missing")
+        assert engine.unregister_projection("balance")
+        assert engine.list_projections() == []
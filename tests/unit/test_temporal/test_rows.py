@@ -0,0 +1,217 @@
+"""Tests for events table row formats and migration."""
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.rows import CompactRowFormat, detect_row_format, make_row_format
+from neurobus.temporal.store import EventStore
+from neurobus.utils.serialization import deserialize_compact, serialize, serialize_compact
+
+
+def _events(count: int) -> list[Event]:
+    """Events with every optional field, one second apart."""
+    start = datetime.now() - timedelta(seconds=count)
+    return [
+        Event(
+            topic=f"orders.{i % 3}",
+            data={"n": i, "item": "widget", "tags": ["a", "b"], "price": 9.5},
+            timestamp=start + timedelta(seconds=i),
+            context={"session": "s1"} if i % 2 else {},
+            metadata={"source": "test", "ref": uuid4()},
+            parent_id=uuid4() if i % 4 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+class TestCompactSerialization:
+    """Test cases for serialize_compact."""
+
+    def test_round_trip_ext_types(self):
+        """Test UUIDs and datetimes survive as msgpack ext types."""
+        value = {
+            "id": uuid4(),
+            "naive": datetime(2024, 5, 1, 12, 30, 15, 123456),
+            "aware": datetime(2024, 5, 1, 12, 30, tzinfo=UTC),
+            "nested": [{"at": datetime(1960, 1, 1)}],
+        }
+
+        assert deserialize_compact(serialize_compact(value)) == value
+
+    def test_smaller_than_tagged_encoding(self):
+        """Test ext types take fewer bytes than the tagged-dict encoding."""
+        value = {"id": uuid4(), "at": datetime.now()}
+
+        assert len(serialize_compact(value)) < len(serialize(value))
+
+
+class TestRowFormats:
+    """Test cases for row format selection."""
+
+    def test_invalid_options(self):
+        """Test unknown formats and compression without compact rows are rejected."""
+        with pytest.raises(ValueError):
+            make_row_format("columnar")
+        with pytest.raises(ValueError):
+            make_row_format("text", "zlib")
+        with pytest.raises(ValueError):
+            make_row_format("compact", "lz4")
+
+    async def test_compact_round_trip(self, tmp_path):
+        """Test every event field survives the compact layout."""
+        store = EventStore(db_path=tmp_path / "events.db", row_format="compact")
+        events = _events(20)
+        await store.store_events(events)
+
+        assert await store.replay_events() == events
+        assert await store.get_event(events[3].id) == events[3]
+        assert await store.get_event(str(events[4].id)) == events[4]
+        assert await store.get_event("not-a-uuid") is None
+        assert await store.count_events("orders.1") == 7
+        assert [e async for e in store.stream_events(page_size=3)] == events
+
+        conn = sqlite3.connect(store.db_path)
+        assert detect_row_format(conn) == "compact"
+        assert conn.execute("SELECT length(id) FROM events LIMIT 1").fetchone() == (16,)
+        conn.close()
+        await store.close()
+
+    async def test_zlib_trains_dictionary(self, tmp_path):
+        """Test zlib compression trains, stores and reloads a dictionary."""
+        store = EventStore(
+            db_path=tmp_path / "events.db",
+            row_format="compact",
+            compression="zlib",
+            compression_threshold=16,
+        )
+        store._target_format.training_samples = 10
+        events = _events(40)
+        await store.store_events(events[:20])
+        await store.store_events(events[20:])
+
+        stats = (await store.get_stats())["format"]
+        assert stats["dictionary_id"] is not None
+        assert stats["compression_ratio"] < 1.0
+        await store.close()
+
+        reopened = EventStore(db_path=tmp_path / "events.db", row_format="compact")
+        assert await reopened.replay_events() == events
+        await reopened.close()
+
+    async def test_zstd_round_trip(self, tmp_path):
+        """Test zstd compression with a trained dictionary."""
+        pytest.importorskip("zstandard")
+        store = EventStore(db_path=tmp_path / "events.db", row_format="compact", compression="zstd")
+        store._target_format.training_samples = 50
+        events = _events(200)
+        for i in range(0, 200, 50):
+            await store.store_events(events[i : i + 50])
+
+        assert await store.replay_events() == events
+        await store.close()
+
+    def test_small_records_stay_raw(self):
+        """Test records below compression_threshold are not compressed."""
+        row_format = CompactRowFormat("zlib", compression_threshold=10_000)
+        event = _events(1)[0]
+
+        assert row_format.decode(row_format.encode(event, 0.0)) == event
+        assert row_format.get_stats()["records_compressed"] == 0
+
+
+class TestMigration:
+    """Test cases for EventStore.migrate."""
+
+    async def test_existing_table_keeps_format(self, tmp_path):
+        """Test a text table is read as text until migrated."""
+        db_path = tmp_path / "events.db"
+        store = EventStore(db_path=db_path)
+        events = _events(10)
+        await store.store_events(events)
+        await store.close()
+
+        store = EventStore(db_path=db_path, row_format="compact")
+        await store.initialize()
+
+        assert store._format.name == "text"
+        assert await store.replay_events() == events
+        await store.close()
+
+    async def test_text_to_compact_and_back(self, tmp_path):
+        """Test migrating in both directions keeps every event and the indexes."""
+        db_path = tmp_path / "events.db"
+        store = EventStore(db_path=db_path)
+        events = _events(50)
+        await store.store_events(events)
+        await store.close()
+
+        store = EventStore(db_path=db_path, row_format="compact", compression="zlib")
+        assert await store.migrate(batch_size=7) == 50
+        assert await store.migrate() == 0
+        assert await store.replay_events() == events
+        assert await store.get_event(events[10].id) == events[10]
+        await store.close()
+
+        store = EventStore(db_path=db_path)
+        assert await store.migrate() == 50
+        assert await store.replay_events() == events
+        await store.close()
+
+        conn = sqlite3.connect(db_path)
+        assert detect_row_format(conn) == "text"
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert "events_migrating" not in tables
+        assert "idx_created_at" in tables
+        conn.close()
+
+    async def test_writes_during_migration(self, tmp_path):
+        """Test rows written between batches and buffered rows are carried over."""
+        db_path = tmp_path / "events.db"
+        events = _events(40)
+        store = EventStore(db_path=db_path)
+        await store.store_events(events[:20])
+        await store.close()
+
+        store = EventStore(
+            db_path=db_path, row_format="compact", write_mode="write_behind", durability="none"
+        )
+        await store.initialize()
+        concurrent = iter(events[20:30])
+        copy_batch = store._migrate_batch_sync
+
+        def copy_then_write(*args):
+            # Runs on the writer thread, like an insert queued between batches
+            last_rowid = copy_batch(*args)
+            event = next(concurrent, None)
+            if last_rowid is not None and event is not None:
+                store._insert_sync([store._format.encode(event, 0.0)], "insert")
+            return last_rowid
+
+        store._migrate_batch_sync = copy_then_write
+        await store.store_events(events[30:])
+
+        assert await store.migrate(batch_size=5) == 40
+        assert await store.replay_events() == events
+        await store.close()
+
+    async def test_stream_across_migration(self, tmp_path):
+        """Test a stream started before migrate() continues on the new table."""
+        db_path = tmp_path / "events.db"
+        events = _events(30)
+        store = EventStore(db_path=db_path)
+        await store.store_events(events)
+        await store.close()
+
+        store = EventStore(db_path=db_path, row_format="compact")
+        seen = []
+        async for event in store.stream_events(page_size=4, prefetch=1):
+            if not seen:
+                await store.migrate()
+            seen.append(event)
+
+        assert seen == events
+        await store.close()
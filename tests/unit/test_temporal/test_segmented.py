@@ -0,0 +1,204 @@
+"""Tests for SegmentedEventStore."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from neurobus.core.event import Event
+from neurobus.temporal.engine import TemporalEngine
+from neurobus.temporal.segmented import SegmentedEventStore
+
+
+def _events(count: int, start: datetime | None = None) -> list[Event]:
+    """Events one minute apart, oldest first."""
+    start = start or datetime.now() - timedelta(minutes=count)
+    return [
+        Event(
+            topic=f"user.{i % 3}",
+            data={"i": i},
+            timestamp=start + timedelta(minutes=i),
+            context={"session": "s"} if i % 2 else None,
+            parent_id=Event(topic="parent").id if i % 5 == 0 else None,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+async def store(tmp_path):
+    """Create a store with small segments and index blocks."""
+    store = SegmentedEventStore(tmp_path / "log", segment_bytes=4096, index_interval=512)
+    await store.initialize()
+    yield store
+    await store.close()
+
+
+class TestSegmentedEventStore:
+    """Test cases for SegmentedEventStore."""
+
+    def test_invalid_durability(self, tmp_path):
+        """Test unknown durability modes are rejected."""
+        with pytest.raises(ValueError):
+            SegmentedEventStore(tmp_path, durability="none")
+
+    async def test_round_trip(self, store):
+        """Test every field survives the record format."""
+        events = _events(10)
+        await store.store_events(events)
+
+        assert await store.replay_events() == events
+        assert await store.get_event(events[5].id) == events[5]
+        assert await store.get_event(str(events[0].id)) == events[0]
+        assert await store.get_event(Event(topic="missing").id) is None
+
+    async def test_segments_roll_by_size(self, store):
+        """Test the active segment rolls at segment_bytes."""
+        events = _events(200)
+        await store.store_events(events[:100])
+        for event in events[100:]:
+            await store.store_event(event)
+
+        stats = await store.get_stats()
+
+        assert stats["segments"] > 2
+        assert stats["segments_rolled"] == stats["segments"] - 1
+        assert len(list(store.directory.glob("*.log"))) == stats["segments"]
+        assert await store.count_events() == 200
+        assert [e async for e in store.stream_events(page_size=7)] == events
+
+    async def test_segments_roll_by_time(self, tmp_path):
+        """Test the active segment rolls once it spans segment_seconds."""
+        store = SegmentedEventStore(tmp_path, segment_seconds=600)
+        await store.store_events(_events(30))
+
+        assert (await store.get_stats())["segments"] == 3
+        await store.close()
+
+    async def test_topic_and_time_filters(self, store):
+        """Test queries filter on topic patterns and time ranges."""
+        events = _events(60)
+        await store.store_events(events)
+        start, end = events[10].timestamp, events[29].timestamp
+        expected = [e for e in events[10:30] if e.topic == "user.1"]
+
+        assert await store.replay_events(start, end, "user.1") == expected
+        assert await store.count_events("user.1", start, end) == len(expected)
+        assert await store.count_events(start_time=start, end_time=end) == 20
+        assert await store.count_events("*.2") == 20
+        assert await store.count_events("user.%") == 60
+        assert await store.query_time_range(start, end, limit=100) == events[29:9:-1]
+
+    async def test_query_newest_first(self, store):
+        """Test query_by_topic walks the log backwards and honours offset."""
+        events = _events(50)
+        await store.store_events(events)
+
+        page = await store.query_by_topic("user.#", limit=5, offset=2)
+
+        assert page == list(reversed(events))[2:7]
+
+    async def test_stream_ignores_later_appends(self, store):
+        """Test a stream only returns records that existed when it started."""
+        events = _events(40)
+        await store.store_events(events)
+
+        seen = []
+        async for event in store.stream_events(page_size=5):
+            if not seen:
+                await store.store_events(_events(5))
+            seen.append(event)
+
+        assert seen == events
+
+    async def test_reopen_restores_log(self, tmp_path):
+        """Test segments and indexes survive close and reopen."""
+        events = _events(100)
+        store = SegmentedEventStore(tmp_path, segment_bytes=4096, index_interval=512)
+        await store.store_events(events)
+        await store.close()
+
+        reopened = SegmentedEventStore(tmp_path, segment_bytes=4096, index_interval=512)
+        await reopened.store_events(_events(1, start=datetime.now()))
+
+        assert await reopened.count_events() == 101
+        assert (await reopened.replay_events())[:100] == events
+        await reopened.close()
+
+    async def test_recovers_torn_tail(self, tmp_path):
+        """Test a partial record at the end of a segment is truncated on open."""
+        events = _events(10)
+        store = SegmentedEventStore(tmp_path, index_interval=256)
+        await store.store_events(events)
+        await store.close()
+
+        segment = next(tmp_path.glob("*.log"))
+        data = segment.read_bytes()
+        segment.write_bytes(data[:-5])
+        (tmp_path / segment.name.replace(".log", ".idx")).unlink()
+
+        reopened = SegmentedEventStore(tmp_path, index_interval=256)
+        assert await reopened.replay_events() == events[:9]
+        assert (await reopened.get_stats())["records_truncated"] == 1
+
+        await reopened.store_event(events[9])
+        assert await reopened.replay_events() == events
+        await reopened.close()
+
+    async def test_retention_drops_expired_segments(self, tmp_path):
+        """Test expired sealed segments are deleted whole."""
+        store = SegmentedEventStore(tmp_path, retention_days=1, segment_seconds=3600)
+        old = _events(5, start=datetime.now() - timedelta(days=3))
+        new = _events(5)
+        await store.store_events(old + new)
+
+        assert await store.enforce_retention() == 5
+
+        assert await store.replay_events() == new
+        assert len(list(tmp_path.glob("*.log"))) == 1
+        stats = await store.get_stats()
+        assert stats["retention"]["segments_dropped"] == 1
+        await store.close()
+
+    async def test_max_events_keeps_newest_segments(self, store):
+        """Test the oldest segments are dropped while the rest hold max_events."""
+        store.max_events = 50
+        events = _events(200)
+        await store.store_events(events)
+
+        dropped = await store.enforce_retention()
+
+        remaining = await store.replay_events()
+        assert dropped + len(remaining) == 200
+        assert len(remaining) >= 50
+        assert remaining == events[dropped:]
+
+    async def test_retention_waits_for_streams(self, store):
+        """Test a segment dropped mid-stream is unlinked after the stream ends."""
+        store.max_events = 1
+        events = _events(200)
+        await store.store_events(events)
+        first = sorted(store.directory.glob("*.log"))[0]
+
+        seen = []
+        async for event in store.stream_events(page_size=5):
+            if not seen:
+                assert await store.enforce_retention() > 0
+                assert first.exists()
+            seen.append(event)
+
+        assert seen == events
+        await store.flush()
+        await store.close()
+        assert not first.exists()
+
+    async def test_engine_accepts_store(self, tmp_path):
+        """Test TemporalEngine replays through a segmented store."""
+        engine = TemporalEngine(store=SegmentedEventStore(tmp_path))
+        await engine.initialize()
+        events = _events(20)
+        await engine.store_events(events)
+
+        replayed = [e async for e in engine.stream_replay(topic="user.0")]
+
+        assert replayed == [e for e in events if e.topic == "user.0"]
+        await engine.close()
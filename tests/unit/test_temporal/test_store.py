@@ -1,6 +1,7 @@
 """Tests for event store."""
 
 import asyncio
+import threading
 from datetime import datetime, timedelta
 from uuid import uuid4
 
@@ -44,6 +45,44 @@ class TestEventStore:
         assert retrieved.topic == event.topic
         assert retrieved.data == event.data
 
+    async def test_store_events_batch(self, temp_store):
+        """Test storing a batch of events in one transaction."""
+        events = [Event(topic=f"batch.{i}", data={"i": i}) for i in range(10)]
+
+        await temp_store.store_events(events)
+
+        assert await temp_store.count_events() == 10
+        retrieved = await temp_store.get_event(events[3].id)
+        assert retrieved.data == {"i": 3}
+
+    async def test_store_events_batch_is_atomic(self, temp_store):
+        """Test a failing batch stores nothing."""
+        from neurobus.exceptions.temporal import StoreError
+
+        event = Event(topic="dup", data={})
+        with pytest.raises(StoreError):
+            await temp_store.store_events([Event(topic="ok", data={}), event, event])
+
+        assert await temp_store.count_events() == 0
+
+    async def test_closed_store_refuses_writes(self, tmp_path):
+        """Test a closed store is not reopened by a later write."""
+        from neurobus.exceptions.temporal import StoreError
+
+        store = EventStore(db_path=tmp_path / "closed.db")
+        await store.initialize()
+        await store.close()
+
+        with pytest.raises(StoreError):
+            await store.store_event(Event(topic="late"))
+        with pytest.raises(StoreError):
+            await store.store_events([Event(topic="late")])
+        assert not store._initialized
+
+        await store.initialize()
+        assert await store.count_events() == 0
+        await store.close()
+
     async def test_get_nonexistent_event(self, temp_store):
         """Test getting nonexistent event."""
         event_id = uuid4()
@@ -131,6 +170,9 @@ class TestEventStore:
         for i in range(10):
             await store.store_event(Event(topic=f"event.{i}", data={}))
 
+        # Retention runs in the background; apply it now
+        assert await store.enforce_retention() == 5
+
         # Should only have 5 events (oldest removed)
         total = await store.count_events()
         assert total == 5
@@ -149,3 +191,338 @@ class TestEventStore:
         assert "events_stored" in stats
         assert stats["total_events"] >= 1
         assert stats["events_stored"] >= 1
+
+
+class TestWriteBehind:
+    """Test cases for write-behind group commit."""
+
+    async def _store(self, tmp_path, **kwargs) -> EventStore:
+        store = EventStore(db_path=tmp_path / "wb.db", write_mode="write_behind", **kwargs)
+        await store.initialize()
+        return store
+
+    def test_invalid_modes(self):
+        """Test unknown write mode and durability are rejected."""
+        with pytest.raises(ValueError):
+            EventStore(write_mode="lazy")
+        with pytest.raises(ValueError):
+            EventStore(durability="maybe")
+
+    async def test_batch_size_trigger(self, tmp_path):
+        """Test a full batch is committed without waiting for the interval."""
+        store = await self._store(
+            tmp_path, durability="none", flush_batch_size=10, flush_interval_ms=10_000
+        )
+
+        for _ in range(10):
+            await store.store_event(Event(topic="test"))
+        await asyncio.sleep(0.05)
+
+        assert store._stats["batches_flushed"] == 1
+        assert store._stats["events_stored"] == 10
+        await store.close()
+
+    async def test_interval_trigger(self, tmp_path):
+        """Test a partial batch is committed after the flush interval."""
+        store = await self._store(
+            tmp_path, durability="none", flush_batch_size=1000, flush_interval_ms=10
+        )
+
+        await store.store_event(Event(topic="test"))
+        assert store._stats["batches_flushed"] == 0
+
+        await asyncio.sleep(0.1)
+
+        assert store._stats["batches_flushed"] == 1
+        await store.close()
+
+    async def test_flush_durability_groups_writers(self, tmp_path):
+        """Test concurrent waiting writers share one transaction."""
+        store = await self._store(tmp_path, durability="flush", flush_interval_ms=20)
+
+        await asyncio.gather(*(store.store_event(Event(topic="test")) for _ in range(50)))
+
+        stats = await store.get_stats()
+        assert stats["write_behind"]["batches_flushed"] == 1
+        assert stats["total_events"] == 50
+        await store.close()
+
+    async def test_flush_durability_reports_errors(self, tmp_path):
+        """Test waiting writers see batch failures."""
+        from neurobus.exceptions.temporal import StoreError
+
+        store = await self._store(tmp_path, durability="fsync", flush_interval_ms=5)
+        event = Event(topic="test")
+        await store.store_event(event)
+
+        with pytest.raises(StoreError):
+            await store.store_event(Event(topic="test", id=event.id))
+
+        assert (await store.get_stats())["write_behind"]["write_errors"] == 1
+        await store.close()
+
+    @pytest.mark.parametrize("durability", ["fsync", "none"])
+    async def test_bad_row_fails_only_its_call(self, tmp_path, durability):
+        """Test a duplicate in a group commit does not fail the other calls."""
+        from neurobus.exceptions.temporal import StoreError
+
+        store = await self._store(tmp_path, durability=durability, flush_interval_ms=20)
+        first = Event(topic="test")
+        await store.store_event(first)
+        await store.flush()
+
+        good = [Event(topic="test") for _ in range(10)]
+        results = await asyncio.gather(
+            *(store.store_event(event) for event in good[:5]),
+            store.store_events([Event(topic="test"), Event(topic="test", id=first.id)]),
+            *(store.store_event(event) for event in good[5:]),
+            return_exceptions=True,
+        )
+        await store.flush()
+
+        if durability == "fsync":
+            assert isinstance(results.pop(5), StoreError)
+            assert results == [None] * 10
+        assert await store.count_events() == 11
+        for event in good:
+            assert await store.get_event(event.id) == event
+        assert (await store.get_stats())["write_behind"]["write_errors"] == 1
+        await store.close()
+
+    async def test_reads_see_buffered_rows(self, tmp_path):
+        """Test queries flush the buffer first."""
+        store = await self._store(tmp_path, durability="none", flush_interval_ms=10_000)
+        event = Event(topic="test")
+
+        await store.store_event(event)
+
+        assert await store.get_event(event.id) == event
+        await store.close()
+
+    async def test_close_flushes(self, tmp_path):
+        """Test close commits buffered rows."""
+        store = await self._store(tmp_path, durability="none", flush_interval_ms=10_000)
+        await store.store_events([Event(topic="test") for _ in range(5)])
+        await store.close()
+
+        reopened = EventStore(db_path=tmp_path / "wb.db")
+        assert await reopened.count_events() == 5
+        await reopened.close()
+
+
+class TestRetention:
+    """Test cases for incremental retention."""
+
+    async def test_prunes_oldest_in_batches(self, tmp_path):
+        """Test the row cap removes the oldest rows, one batch per transaction."""
+        store = EventStore(
+            db_path=tmp_path / "ret.db",
+            max_events=10,
+            retention_batch_size=4,
+            retention_interval=3600,
+        )
+        events = [Event(topic="test", data={"n": i}) for i in range(20)]
+        await store.store_events(events)
+        await store.enforce_retention()
+
+        remaining = await store.replay_events()
+        assert [e.data["n"] for e in remaining] == list(range(10, 20))
+        stats = await store.get_stats()
+        assert stats["total_events"] == 10
+        assert stats["retention"]["rows_pruned"] == 10
+        await store.close()
+
+    async def test_background_prune(self, tmp_path):
+        """Test the background task enforces the cap without an explicit call."""
+        store = EventStore(
+            db_path=tmp_path / "ret.db",
+            max_events=5,
+            retention_batch_size=5,
+            retention_interval=3600,
+        )
+        await store.store_events([Event(topic="test") for _ in range(12)])
+        await asyncio.sleep(0.05)
+
+        assert await store.count_events() == 5
+        await store.close()
+
+    async def test_expires_old_events(self, tmp_path):
+        """Test events older than retention_days are expired."""
+        store = EventStore(db_path=tmp_path / "ret.db", max_events=0, retention_days=1)
+        old = Event(topic="old", timestamp=datetime.now() - timedelta(days=2))
+        new = Event(topic="new")
+        await store.store_events([old, new])
+
+        assert await store.enforce_retention() == 1
+
+        assert await store.get_event(old.id) is None
+        assert await store.get_event(new.id) == new
+        stats = await store.get_stats()
+        assert stats["retention"]["rows_expired"] == 1
+        assert stats["total_events"] == 1
+        await store.close()
+
+    async def test_drops_orphaned_topics(self, tmp_path):
+        """Test pruned and expired topics leave the catalog and can come back."""
+        store = EventStore(
+            db_path=tmp_path / "ret.db", max_events=3, retention_days=1, retention_interval=3600
+        )
+        await store.store_events(
+            [
+                Event(topic="expired", timestamp=datetime.now() - timedelta(days=2)),
+                Event(topic="pruned"),
+                Event(topic="kept"),
+                Event(topic="kept"),
+                Event(topic="kept"),
+            ]
+        )
+        await store.enforce_retention()
+
+        assert (await store.get_stats())["total_topics"] == 1
+        assert await store.query_by_topic("*ed") == []
+        assert len(await store.query_by_topic("k*")) == 3
+
+        await store.store_event(Event(topic="pruned"))
+        assert len(await store.query_by_topic("p*")) == 1
+        assert (await store.get_stats())["total_topics"] == 2
+        await store.close()
+
+        await store.initialize()
+        assert (await store.get_stats())["total_topics"] == 2
+        await store.close()
+
+    async def test_row_count_survives_reopen(self, tmp_path):
+        """Test the maintained row count is restored from the table."""
+        store = EventStore(db_path=tmp_path / "ret.db")
+        await store.store_events([Event(topic="test") for _ in range(7)])
+        await store.close()
+
+        await store.initialize()
+        assert (await store.get_stats())["total_events"] == 7
+        await store.close()
+
+
+class TestStoreThreads:
+    """Test cases for SQLite I/O on store threads."""
+
+    async def test_writes_run_on_writer_thread(self, tmp_path, monkeypatch):
+        """Test inserts run on the dedicated writer thread, not the loop."""
+        store = EventStore(db_path=tmp_path / "io.db")
+        await store.initialize()
+        threads = []
+        insert = store._insert_sync
+
+        def recording_insert(*args):
+            threads.append(threading.current_thread().name)
+            return insert(*args)
+
+        monkeypatch.setattr(store, "_insert_sync", recording_insert)
+        await store.store_event(Event(topic="test"))
+
+        assert threads[0].startswith("neurobus-store-w")
+        await store.close()
+
+    async def test_concurrent_reads_see_writes(self, tmp_path):
+        """Test reader connections observe rows written before the query."""
+        store = EventStore(db_path=tmp_path / "io.db", read_pool_size=2)
+        await store.initialize()
+
+        events = [Event(topic=f"test.{i}") for i in range(20)]
+        await asyncio.gather(*(store.store_event(event) for event in events))
+        found = await asyncio.gather(*(store.get_event(event.id) for event in events))
+
+        assert found == events
+        assert await store.count_events() == 20
+        await store.close()
+
+    async def test_reopen_after_close(self, tmp_path):
+        """Test a closed store can be initialized again."""
+        store = EventStore(db_path=tmp_path / "io.db")
+        await store.initialize()
+        await store.store_event(Event(topic="test"))
+        await store.close()
+
+        await store.initialize()
+        await store.store_event(Event(topic="test"))
+
+        assert await store.count_events() == 2
+        await store.close()
+
+
+class TestCausalQueries:
+    """Recursive parent_id queries."""
+
+    @staticmethod
+    def _tree() -> list[Event]:
+        """root -> (a -> (a1, a2), b -> b1)"""
+        root = Event(topic="root")
+        a, b = root.child_event("a"), root.child_event("b")
+        return [root, a, b, a.child_event("a1"), a.child_event("a2"), b.child_event("b1")]
+
+    @pytest.mark.parametrize("row_format", ["text", "compact"])
+    async def test_chain_root_and_descendants(self, tmp_path, row_format):
+        store = EventStore(db_path=tmp_path / "events.db", row_format=row_format)
+        events = self._tree()
+        await store.store_events(events)
+        root, a, b, a1, a2, b1 = events
+
+        chain = await store.get_causal_chain(a2.id)
+        assert [e.id for e in chain] == [root.id, a.id, a2.id]
+        assert (await store.get_root(str(b1.id))).id == root.id
+        descendants = [e.topic async for e in store.get_descendants(root.id, page_size=2)]
+        assert descendants == ["a", "b", "a1", "a2", "b1"]
+        await store.close()
+
+    async def test_depth_and_limit(self, temp_store):
+        events = self._tree()
+        await temp_store.store_events(events)
+        root, _, _, _, a2, _ = events
+
+        chain = await temp_store.get_causal_chain(a2.id, max_depth=1)
+        assert [e.topic for e in chain] == ["a", "a2"]
+        children = [e.topic async for e in temp_store.get_descendants(root.id, max_depth=1)]
+        assert children == ["a", "b"]
+        limited = [e async for e in temp_store.get_descendants(root.id, limit=3)]
+        assert len(limited) == 3
+
+    async def test_descendants_keyset_pages(self, temp_store, monkeypatch):
+        events = self._tree()
+        await temp_store.store_events(events)
+        root = events[0]
+        pages = []
+        fetch = temp_store._fetch_tuples
+
+        def spy(conn, query, params):
+            pages.append(fetch(conn, query, params))
+            return pages[-1]
+
+        monkeypatch.setattr(temp_store, "_fetch_tuples", spy)
+
+        topics = [e.topic async for e in temp_store.get_descendants(root.id, page_size=2)]
+        assert topics == ["a", "b", "a1", "a2", "b1"]
+        assert [len(page) for page in pages] == [2, 2, 1]
+
+        pages.clear()
+        limited = [e.topic async for e in temp_store.get_descendants(root.id, limit=3, page_size=2)]
+        assert limited == ["a", "b", "a1"]
+        assert [len(page) for page in pages] == [2, 1]
+
+    async def test_missing_events(self, temp_store):
+        root = Event(topic="root")
+        child = root.child_event("child")
+        await temp_store.store_event(child)
+
+        # The parent was never stored: the chain stops at the child, and
+        # its descendants are still found
+        assert [e.id for e in await temp_store.get_causal_chain(child.id)] == [child.id]
+        assert [e.id async for e in temp_store.get_descendants(root.id)] == [child.id]
+        assert await temp_store.get_causal_chain(uuid4()) == []
+        assert await temp_store.get_root("not-a-uuid") is None
+
+    async def test_cycles_stop_at_depth_limit(self, temp_store):
+        first, second = Event(topic="first"), Event(topic="second")
+        first.parent_id, second.parent_id = second.id, first.id
+        await temp_store.store_events([first, second])
+
+        chain = await temp_store.get_causal_chain(first.id, max_depth=5)
+        assert len(chain) == 6
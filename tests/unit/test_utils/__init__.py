@@ -0,0 +1 @@
+"""Utility module unit tests."""
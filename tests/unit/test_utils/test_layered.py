@@ -0,0 +1,67 @@
+"""Tests for LayeredContext."""
+
+import json
+
+import pytest
+
+from neurobus.utils.helpers import deep_merge
+from neurobus.utils.layered import LayeredContext, to_plain_dict
+
+
+class TestLayeredContext:
+    """Test cases for LayeredContext."""
+
+    def test_precedence(self):
+        """Test the first layer with a key wins."""
+        ctx = LayeredContext({"a": 1}, {"a": 2, "b": 2}, {"c": 3})
+
+        assert ctx["a"] == 1
+        assert ctx["b"] == 2
+        assert ctx["c"] == 3
+        assert "d" not in ctx
+        with pytest.raises(KeyError):
+            ctx["d"]
+
+    def test_matches_deep_merge(self):
+        """Test nested mappings merge like deep_merge, bottom layer first."""
+        base = {"prefs": {"theme": "dark", "lang": "en"}, "x": {"y": 1}, "keep": 1}
+        middle = {"prefs": {"lang": "fr"}, "x": 5}
+        top = {"prefs": {"tz": "UTC"}, "x": {"z": 2}}
+
+        ctx = LayeredContext(top, middle, base)
+
+        assert ctx == deep_merge(deep_merge(base, middle), top)
+        assert list(ctx) == list(deep_merge(deep_merge(base, middle), top))
+
+    def test_shallow_mode(self):
+        """Test deep=False replaces nested mappings wholesale."""
+        ctx = LayeredContext({"prefs": {"tz": "UTC"}}, {"prefs": {"lang": "en"}}, deep=False)
+
+        assert ctx["prefs"] == {"tz": "UTC"}
+
+    def test_writes_do_not_touch_layers(self):
+        """Test writes, nested writes and deletes stay in the view."""
+        base = {"a": 1, "nested": {"k": 1}}
+        ctx = LayeredContext(base)
+
+        ctx["a"] = 2
+        ctx["nested"]["k"] = 2
+        ctx["new"] = 3
+        del ctx["a"]
+
+        assert base == {"a": 1, "nested": {"k": 1}}
+        assert ctx == {"nested": {"k": 2}, "new": 3}
+        assert "a" not in ctx
+        with pytest.raises(KeyError):
+            del ctx["a"]
+
+    def test_to_plain_dict(self):
+        """Test flattening to JSON-serializable dicts."""
+        ctx = LayeredContext({"n": {"a": 1}}, {"n": {"b": 2}})
+        plain = to_plain_dict(ctx)
+
+        assert type(plain["n"]) is dict
+        assert json.loads(json.dumps(plain)) == {"n": {"b": 2, "a": 1}}
+
+        d = {"a": 1}
+        assert to_plain_dict(d) is d
@@ -0,0 +1,104 @@
+"""Tests for topic pattern utilities."""
+
+import random
+import re
+
+from neurobus.utils.patterns import (
+    PatternCache,
+    _wildcard_to_regex,
+    compile_matcher,
+    extract_variables,
+    wildcard_match,
+)
+
+
+class TestCompileMatcher:
+    """Test cases for compiled matchers."""
+
+    def test_literal_pattern(self):
+        """Test literal patterns compare exactly."""
+        matcher = compile_matcher("user.login")
+
+        assert matcher("user.login")
+        assert not matcher("user.logout")
+
+    def test_prefix_pattern(self):
+        """Test prefix-only patterns."""
+        matcher = compile_matcher("user.#")
+
+        assert matcher("user.login")
+        assert matcher("user.profile.update")
+        assert not matcher("user")
+        assert not matcher("users.login")
+
+    def test_single_segment_wildcard(self):
+        """Test * stays within one segment."""
+        matcher = compile_matcher("agent.*.status")
+
+        assert matcher("agent.1.status")
+        assert not matcher("agent.1.2.status")
+
+    def test_agrees_with_regex_translation(self):
+        """Test all fast paths agree with the regex semantics."""
+        rng = random.Random(7)
+        words = ["a", "b", "", "*", "#", "a*", "#b"]
+        topics = ["a", "b", "ab", "", "a\n"]
+
+        for _ in range(5000):
+            pattern = ".".join(rng.choice(words) for _ in range(rng.randint(1, 3)))
+            topic = ".".join(rng.choice(topics) for _ in range(rng.randint(1, 4)))
+            expected = re.match(_wildcard_to_regex(pattern), topic) is not None
+            assert compile_matcher(pattern)(topic) == expected, (pattern, topic)
+
+
+class TestPatternCache:
+    """Test cases for PatternCache."""
+
+    def test_hits_and_misses(self):
+        """Test hit/miss accounting."""
+        cache = PatternCache(max_size=10)
+
+        matcher = cache.get("user.*")
+        assert cache.get("user.*") is matcher
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """Test least recently used patterns are evicted."""
+        cache = PatternCache(max_size=2)
+
+        cache.get("a.*")
+        cache.get("b.*")
+        cache.get("a.*")
+        cache.get("c.*")
+
+        assert len(cache) == 2
+        assert cache.get_stats()["evictions"] == 1
+
+        cache.reset_stats()
+        cache.get("a.*")
+        assert cache.get_stats()["hits"] == 1
+
+    def test_wildcard_match_uses_cache(self):
+        """Test wildcard_match behaviour."""
+        assert wildcard_match("user.*", "user.login")
+        assert not wildcard_match("user.*", "user.profile.update")
+        assert wildcard_match("#", "anything.at.all")
+
+
+class TestExtractVariables:
+    """Test cases for extract_variables."""
+
+    def test_extract(self):
+        """Test extracting named segments."""
+        assert extract_variables("user.{user_id}.{action}", "user.123.login") == {
+            "user_id": "123",
+            "action": "login",
+        }
+
+    def test_no_match(self):
+        """Test non-matching topic."""
+        assert extract_variables("user.{user_id}", "system.error") is None
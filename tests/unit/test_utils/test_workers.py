@@ -0,0 +1,75 @@
+"""Tests for single-thread workers."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from neurobus.utils.workers import SerialWorker, SQLiteWorker
+
+
+class _KeyValueWorker(SQLiteWorker):
+    """Minimal SQLiteWorker with one table."""
+
+    def setup(self, conn: sqlite3.Connection) -> None:
+        conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT)")
+
+
+class TestSerialWorker:
+    """Test cases for SerialWorker."""
+
+    async def test_runs_on_one_named_thread(self):
+        """Test every call runs on the same worker thread."""
+        worker = SerialWorker("test-worker")
+        worker.start()
+
+        threads = {await worker.run(threading.current_thread) for _ in range(5)}
+        await worker.stop()
+
+        assert len(threads) == 1
+        thread = threads.pop()
+        assert thread is not threading.current_thread()
+        assert thread.name.startswith("test-worker")
+
+    async def test_run_requires_start(self):
+        """Test calls are rejected before start and after stop."""
+        worker = SerialWorker("test-worker")
+
+        with pytest.raises(RuntimeError):
+            await worker.run(len, [])
+
+        worker.start()
+        assert await worker.run(len, [1, 2]) == 2
+        await worker.stop()
+        await worker.stop()
+
+        assert not worker.is_running
+        with pytest.raises(RuntimeError):
+            await worker.run(len, [])
+
+
+class TestSQLiteWorker:
+    """Test cases for SQLiteWorker."""
+
+    async def test_open_setup_and_reopen(self, tmp_path):
+        """Test setup creates the schema and data survives a reopen."""
+        worker = _KeyValueWorker(tmp_path / "sub" / "kv.db", "test-sqlite")
+        await worker.open()
+        assert worker.is_open
+
+        def put() -> None:
+            worker.conn.execute("INSERT INTO kv VALUES ('a', '1')")
+            worker.conn.commit()
+
+        await worker.run(put)
+        await worker.close()
+
+        assert not worker.is_open
+        with pytest.raises(RuntimeError):
+            _ = worker.conn
+
+        await worker.open()
+        rows = await worker.run(lambda: worker.conn.execute("SELECT * FROM kv").fetchall())
+        await worker.close()
+
+        assert rows == [("a", "1")]